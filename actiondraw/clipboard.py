@@ -5,16 +5,16 @@ This module provides copy/paste functionality for diagram items and edges.
 
 from __future__ import annotations
 
-import base64
 import json
 import xml.etree.ElementTree as ET
-from typing import Any, Callable, Dict, List, Optional, TYPE_CHECKING
+from typing import Any, Callable, Dict, List, Optional, Tuple, TYPE_CHECKING
 
-from PySide6.QtCore import QByteArray, QBuffer, QIODevice, QMimeData, Signal, Slot
+from PySide6.QtCore import QByteArray, QMimeData, Qt, Signal, Slot
 from PySide6.QtGui import QGuiApplication
 from PySide6.QtQml import QJSValue
 
 from .constants import CLIPBOARD_MIME_TYPE
+from .markdown_image_paster import image_to_png_base64
 from .markdown_note_tabs import normalize_editor_tabs
 from .types import DiagramEdge, DiagramItem, DiagramItemType
 
@@ -32,10 +32,14 @@ class ClipboardMixin:
     # Attributes expected from DiagramModel
     _items: List[DiagramItem]
     _edges: List[DiagramEdge]
+    _edges_by_id: Dict[str, DiagramEdge]
+    _edges_by_pair: Dict[Tuple[str, str], DiagramEdge]
     _task_model: Any
     _id_source: Any
     _next_id: Callable[[str], str]
+    _next_edge_id: Callable[[], str]
     _append_item: Callable[[DiagramItem], None]
+    _append_edge: Callable[[DiagramEdge], None]
     addEdge: Callable[[str, str], None]
     getItem: Callable[[str], Optional[DiagramItem]]
 
@@ -242,7 +246,7 @@ class ClipboardMixin:
     def copyEdgeToClipboard(self, edge_id: str) -> bool:
         if not edge_id:
             return False
-        edge = next((edge for edge in self._edges if edge.id == edge_id), None)
+        edge = self._edges_by_id.get(edge_id)
         if edge is None:
             return False
         item_ids = [edge.from_id, edge.to_id]
@@ -508,11 +512,10 @@ class ClipboardMixin:
                 to_id = id_map[old_to]
                 if from_id == to_id:
                     continue
-                if any(edge.from_id == from_id and edge.to_id == to_id for edge in self._edges):
+                if (from_id, to_id) in self._edges_by_pair:
                     continue
-                edge_id = f"edge_{len(self._edges)}"
                 description = str(edge_data.get("description", ""))
-                self._edges.append(DiagramEdge(edge_id, from_id, to_id, description))
+                self._append_edge(DiagramEdge(self._next_edge_id(), from_id, to_id, description))
                 edges_added = True
         if edges_added:
             self.edgesChanged.emit()
@@ -541,25 +544,25 @@ class ClipboardMixin:
         if image.isNull():
             return ""
 
-        # Convert QImage to base64-encoded PNG
-        byte_array = QByteArray()
-        buffer = QBuffer(byte_array)
-        buffer.open(QIODevice.WriteOnly)
-        image.save(buffer, "PNG")
-        buffer.close()
-
-        image_data = base64.b64encode(byte_array.data()).decode("ascii")
-        if not image_data:
-            return ""
-
         # Calculate appropriate size (limit max dimension to 400px while preserving aspect ratio)
         max_dim = 400.0
         width = float(image.width())
         height = float(image.height())
         if width > max_dim or height > max_dim:
             scale = max_dim / max(width, height)
-            width = width * scale
-            height = height * scale
+            # Downscale before encoding so the stored PNG matches the display size.
+            image = image.scaled(
+                max(1, round(width * scale)),
+                max(1, round(height * scale)),
+                Qt.KeepAspectRatio,
+                Qt.SmoothTransformation,
+            )
+            width = float(image.width())
+            height = float(image.height())
+
+        image_data = image_to_png_base64(image)
+        if not image_data:
+            return ""
 
         item_id = self._next_id("image")
         item = DiagramItem(
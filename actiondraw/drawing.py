@@ -5,17 +5,67 @@ This module provides freehand drawing/stroke functionality.
 
 from __future__ import annotations
 
+from array import array
 from itertools import count
-from typing import Any, Dict, List, Optional, TYPE_CHECKING
+from typing import Any, Dict, List, Optional, Tuple, TYPE_CHECKING
 
-from PySide6.QtCore import Slot
+from PySide6.QtCore import QByteArray, QTimer, Slot
 
-from .types import DrawingPoint, DrawingStroke
+from .types import DrawingStroke
 
 if TYPE_CHECKING:
     from .model import DiagramModel
 
 
+# Coalesce drag-time drawingChanged emits to roughly one per display frame.
+DRAWING_EMIT_INTERVAL_MS = 16
+# Points closer than this to the previous point add nothing visible.
+MIN_POINT_DISTANCE = 0.5
+# Finished strokes drop points that lie within this distance of the simplified line.
+SIMPLIFY_TOLERANCE = 0.5
+
+
+def simplify_coords(coords: array, tolerance: float = SIMPLIFY_TOLERANCE) -> array:
+    """Return flat ``x, y`` coords reduced with the Ramer-Douglas-Peucker algorithm.
+
+    The first and last points are always kept; any other point survives only
+    if it is farther than ``tolerance`` from the segment between its kept
+    neighbours.
+    """
+    point_count = len(coords) // 2
+    if point_count <= 2:
+        return array("d", coords)
+    keep = [False] * point_count
+    keep[0] = keep[-1] = True
+    tolerance_sq = tolerance * tolerance
+    spans = [(0, point_count - 1)]
+    while spans:
+        first, last = spans.pop()
+        ax, ay = coords[2 * first], coords[2 * first + 1]
+        dx, dy = coords[2 * last] - ax, coords[2 * last + 1] - ay
+        length_sq = dx * dx + dy * dy
+        farthest, farthest_sq = -1, tolerance_sq
+        for index in range(first + 1, last):
+            px, py = coords[2 * index] - ax, coords[2 * index + 1] - ay
+            # Distance to the chord segment, so points that double back past
+            # either end of it are kept.
+            t = 0.0 if length_sq == 0.0 else min(1.0, max(0.0, (px * dx + py * dy) / length_sq))
+            ex, ey = px - t * dx, py - t * dy
+            dist_sq = ex * ex + ey * ey
+            if dist_sq > farthest_sq:
+                farthest, farthest_sq = index, dist_sq
+        if farthest >= 0:
+            keep[farthest] = True
+            spans.append((first, farthest))
+            spans.append((farthest, last))
+    simplified = array("d")
+    for index, kept in enumerate(keep):
+        if kept:
+            simplified.append(coords[2 * index])
+            simplified.append(coords[2 * index + 1])
+    return simplified
+
+
 class DrawingMixin:
     """Mixin providing freehand drawing operations.
 
@@ -30,15 +80,29 @@ class DrawingMixin:
     _brush_color: str
     _brush_width: float
     _stroke_id_source: count
+    _strokes_cache: Optional[List[Dict[str, Any]]]
+    _packed_strokes_cache: Optional[Tuple[List[Dict[str, Any]], QByteArray]]
+    _drawing_emit_timer: QTimer
 
     def _init_drawing(self) -> None:
         """Initialize drawing state. Call from DiagramModel.__init__."""
         self._strokes = []
+        self._strokes_cache = None
+        self._packed_strokes_cache = None
         self._current_stroke = None
         self._drawing_mode = False
         self._brush_color = "#ffffff"
         self._brush_width = 3.0
         self._stroke_id_source = count()
+        self._drawing_emit_timer = QTimer(self)
+        self._drawing_emit_timer.setSingleShot(True)
+        self._drawing_emit_timer.setInterval(DRAWING_EMIT_INTERVAL_MS)
+        self._drawing_emit_timer.timeout.connect(self.drawingChanged.emit)
+
+    def _emit_drawing_changed(self) -> None:
+        """Emit drawingChanged now, dropping any pending coalesced emit."""
+        self._drawing_emit_timer.stop()
+        self.drawingChanged.emit()
 
     def _get_drawing_mode(self) -> bool:
         return self._drawing_mode
@@ -78,16 +142,66 @@ class DrawingMixin:
         self._set_brush_width(width)
 
     def _get_strokes(self) -> List[Dict[str, Any]]:
-        """Return all strokes as a list of dicts for QML consumption."""
-        result = []
-        for stroke in self._strokes:
-            result.append({
-                "id": stroke.id,
-                "color": stroke.color,
-                "width": stroke.width,
-                "points": [{"x": pt.x, "y": pt.y} for pt in stroke.points],
-            })
-        return result
+        """Return all strokes as a list of dicts for QML consumption.
+
+        Each stroke's ``points`` is a flat ``[x0, y0, x1, y1, ...]`` list and
+        ``bounds`` is ``[min_x, min_y, max_x, max_y]`` for viewport culling.
+        The list is cached until the completed strokes change, so repaints
+        while a stroke is in progress do not re-serialize every point.
+        """
+        if self._strokes_cache is None:
+            self._strokes_cache = [
+                {
+                    "id": stroke.id,
+                    "color": stroke.color,
+                    "width": stroke.width,
+                    "points": stroke.coords.tolist(),
+                    "bounds": stroke.bounds,
+                }
+                for stroke in self._strokes
+            ]
+        return self._strokes_cache
+
+    def _invalidate_strokes_cache(self) -> None:
+        """Drop the serialized strokes after the completed strokes change."""
+        self._strokes_cache = None
+        self._packed_strokes_cache = None
+
+    def _packed_strokes(self) -> Tuple[List[Dict[str, Any]], QByteArray]:
+        """Return per-stroke headers and every stroke's points as one float32 buffer."""
+        if self._packed_strokes_cache is None:
+            headers: List[Dict[str, Any]] = []
+            coords = array("f")
+            for stroke in self._strokes:
+                headers.append(
+                    {
+                        "color": stroke.color,
+                        "width": stroke.width,
+                        "offset": len(coords),
+                        "count": len(stroke.coords),
+                        "bounds": stroke.bounds,
+                    }
+                )
+                coords.extend(stroke.coords.tolist())
+            self._packed_strokes_cache = (headers, QByteArray(coords.tobytes()))
+        return self._packed_strokes_cache
+
+    @Slot(result="QVariant")
+    def getStrokeHeaders(self) -> List[Dict[str, Any]]:
+        """Return color, width, bounds and coordinate ``offset``/``count`` per stroke.
+
+        ``offset`` and ``count`` index the floats of getStrokeCoords().
+        """
+        return self._packed_strokes()[0]
+
+    @Slot(result=QByteArray)
+    def getStrokeCoords(self) -> QByteArray:
+        """Return all completed strokes' flat coordinates as packed float32 values.
+
+        QML reads the bytes as an ArrayBuffer, so a full repaint fetches one
+        typed array instead of a list of per-point values for every stroke.
+        """
+        return self._packed_strokes()[1]
 
     @Slot(float, float)
     def startStroke(self, x: float, y: float) -> None:
@@ -95,49 +209,77 @@ class DrawingMixin:
         stroke_id = f"stroke_{next(self._stroke_id_source)}"
         self._current_stroke = DrawingStroke(
             id=stroke_id,
-            points=[DrawingPoint(x, y)],
+            coords=array("d", (x, y)),
             color=self._brush_color,
             width=self._brush_width,
         )
-        self.drawingChanged.emit()
+        self._emit_drawing_changed()
 
     @Slot(float, float)
     def continueStroke(self, x: float, y: float) -> None:
-        """Add a point to the current stroke."""
-        if self._current_stroke is not None:
-            self._current_stroke.points.append(DrawingPoint(x, y))
-            self.drawingChanged.emit()
+        """Add a point to the current stroke.
+
+        Sub-pixel moves are dropped and drawingChanged is emitted at most
+        once per frame while the stroke is being drawn.
+        """
+        if self._current_stroke is None:
+            return
+        coords = self._current_stroke.coords
+        if abs(x - coords[-2]) < MIN_POINT_DISTANCE and abs(y - coords[-1]) < MIN_POINT_DISTANCE:
+            return
+        self._current_stroke.add_point(x, y)
+        if not self._drawing_emit_timer.isActive():
+            self._drawing_emit_timer.start()
 
     @Slot()
     def endStroke(self) -> None:
-        """Finish the current stroke and add it to the strokes list."""
-        if self._current_stroke is not None and len(self._current_stroke.points) >= 2:
+        """Finish the current stroke and add it to the strokes list.
+
+        The stroke is simplified first, so its rendering and saved size follow
+        its shape rather than how many pointer events drew it.
+        """
+        if self._current_stroke is not None and self._current_stroke.point_count >= 2:
+            self._current_stroke.coords = simplify_coords(self._current_stroke.coords)
             self._strokes.append(self._current_stroke)
+            self._invalidate_strokes_cache()
         self._current_stroke = None
-        self.drawingChanged.emit()
+        self._emit_drawing_changed()
 
     @Slot(result="QVariant")
     def getCurrentStroke(self) -> Dict[str, Any]:
-        """Return current stroke being drawn, or empty dict."""
+        """Return current stroke being drawn, or empty dict.
+
+        Points use the same flat ``[x0, y0, x1, y1, ...]`` layout as strokes.
+        """
+        return self.getCurrentStrokeFrom(0)
+
+    @Slot(int, result="QVariant")
+    def getCurrentStrokeFrom(self, start: int) -> Dict[str, Any]:
+        """Return the current stroke with only the flat coordinates from ``start`` on.
+
+        Lets the canvas fetch just the points it has not painted yet.
+        """
         if self._current_stroke is None:
             return {}
         return {
             "id": self._current_stroke.id,
             "color": self._current_stroke.color,
             "width": self._current_stroke.width,
-            "points": [{"x": pt.x, "y": pt.y} for pt in self._current_stroke.points],
+            "points": self._current_stroke.coords[max(0, start):].tolist(),
         }
 
     @Slot()
     def clearStrokes(self) -> None:
         """Remove all drawing strokes."""
         self._strokes.clear()
+        self._invalidate_strokes_cache()
         self._current_stroke = None
-        self.drawingChanged.emit()
+        self._emit_drawing_changed()
 
     @Slot()
     def undoLastStroke(self) -> None:
         """Remove the most recent stroke."""
         if self._strokes:
             self._strokes.pop()
-            self.drawingChanged.emit()
+            self._invalidate_strokes_cache()
+            self._emit_drawing_changed()
@@ -0,0 +1,106 @@
+"""Image provider serving decoded pasted images to the diagram delegates."""
+
+from __future__ import annotations
+
+import threading
+from typing import Dict, Tuple
+
+from PySide6.QtCore import QByteArray, QSize, Qt
+from PySide6.QtGui import QImage
+from PySide6.QtQuick import QQuickImageProvider
+
+DIAGRAM_IMAGE_PROVIDER_ID = "diagramimg"
+
+
+class DiagramImageProvider(QQuickImageProvider):
+    """Decode each image item's base64 PNG once and hand out the QImage.
+
+    Requests look like ``image://diagramimg/<itemId>?v=<imageVersion>``; the
+    version only busts QML's URL cache, the provider compares payloads itself.
+    Qt may call :meth:`requestImage` from its image loader thread, so the
+    payloads are snapshotted on the GUI thread from the model's signals and
+    the loader thread never touches the model.
+    """
+
+    def __init__(self, diagram_model) -> None:
+        super().__init__(QQuickImageProvider.ImageType.Image)
+        self._diagram_model = diagram_model
+        self._payloads: Dict[str, str] = {}
+        self._decoded: Dict[str, Tuple[str, QImage]] = {}
+        self._lock = threading.Lock()
+        diagram_model.rowsInserted.connect(self._on_rows_inserted)
+        diagram_model.dataChanged.connect(self._on_data_changed)
+        # Removals shift rows, so they resnapshot everything like a reset.
+        diagram_model.rowsRemoved.connect(self._sync_all)
+        diagram_model.modelReset.connect(self._sync_all)
+        self._sync_all()
+
+    def requestImage(self, image_id: str, size: QSize, requested_size: QSize) -> QImage:  # type: ignore[override]
+        item_id = image_id.split("?", 1)[0]
+        image = self.decodedImage(item_id)
+        if image.isNull():
+            return image
+        size.setWidth(image.width())
+        size.setHeight(image.height())
+        # Only shrink: the scene graph upscales small images for free.
+        if (
+            requested_size.width() > 0
+            and requested_size.height() > 0
+            and (image.width() > requested_size.width() or image.height() > requested_size.height())
+        ):
+            return image.scaled(requested_size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        return image
+
+    def decodedImage(self, item_id: str) -> QImage:
+        """Return the decoded image for ``item_id``, decoding only on change."""
+        with self._lock:
+            image_data = self._payloads.get(item_id)
+            if not image_data:
+                return QImage()
+            cached = self._decoded.get(item_id)
+            if cached is not None and cached[0] == image_data:
+                return cached[1]
+        image = QImage.fromData(QByteArray.fromBase64(image_data.encode("ascii")), "PNG")
+        with self._lock:
+            # Keep the result only if the payload was not replaced meanwhile.
+            if self._payloads.get(item_id) == image_data:
+                self._decoded[item_id] = (image_data, image)
+        return image
+
+    def _row_payloads(self, first: int, last: int) -> Dict[str, str]:
+        model = self._diagram_model
+        payloads: Dict[str, str] = {}
+        for row in range(first, last + 1):
+            index = model.index(row, 0)
+            image_data = model.data(index, model.ImageDataRole)
+            if image_data:
+                payloads[model.data(index, model.IdRole)] = image_data
+        return payloads
+
+    def _on_rows_inserted(self, _parent, first: int, last: int) -> None:
+        payloads = self._row_payloads(first, last)
+        if payloads:
+            with self._lock:
+                self._payloads.update(payloads)
+
+    def _on_data_changed(self, top_left, bottom_right, roles) -> None:
+        model = self._diagram_model
+        if roles and model.ImageDataRole not in roles and model.ImageVersionRole not in roles:
+            return
+        first, last = top_left.row(), bottom_right.row()
+        payloads = self._row_payloads(first, last)
+        item_ids = [model.data(model.index(row, 0), model.IdRole) for row in range(first, last + 1)]
+        with self._lock:
+            for item_id in item_ids:
+                if item_id not in payloads:
+                    self._payloads.pop(item_id, None)
+                    self._decoded.pop(item_id, None)
+            self._payloads.update(payloads)
+
+    def _sync_all(self, *_args) -> None:
+        # Item removal, project loads and clear-all all end up here.
+        payloads = self._row_payloads(0, self._diagram_model.rowCount() - 1)
+        with self._lock:
+            self._payloads = payloads
+            for item_id in [item_id for item_id in self._decoded if item_id not in payloads]:
+                del self._decoded[item_id]
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import base64
 import hashlib
 import re
 from pathlib import Path
@@ -44,10 +43,10 @@ def image_to_png_base64(image: QImage) -> str:
     if not save_ok:
         return ""
 
-    raw = bytes(byte_array)
-    if not raw:
+    if byte_array.isEmpty():
         return ""
-    return base64.b64encode(raw).decode("ascii")
+    # toBase64() encodes in C++; .data() still copies the result into Python bytes.
+    return byte_array.toBase64().data().decode("ascii")
 
 
 def markdown_image_from_qimage(image: QImage, alt_text: str = "pasted image") -> str:
@@ -12,13 +12,18 @@ import re
 import subprocess
 import urllib.parse
 import webbrowser
+from array import array
+from bisect import insort
+from contextlib import contextmanager
 from itertools import count
-from typing import Any, Dict, List, Optional
+from operator import attrgetter
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Tuple
 
 from PySide6.QtCore import (
     QAbstractListModel,
     QModelIndex,
     Property,
+    QTimer,
     QUrl,
     Qt,
     Signal,
@@ -30,7 +35,29 @@ from .constants import ITEM_PRESETS
 from .drawing import DrawingMixin
 from .layout import LayoutMixin
 from .markdown_note_tabs import first_tab_text, normalize_editor_tabs
-from .types import DiagramEdge, DiagramItem, DiagramItemType, DrawingPoint, DrawingStroke
+from .types import DiagramEdge, DiagramItem, DiagramItemType, DrawingStroke
+
+# Delay used to coalesce bursts of tab model updates into one refresh.
+LINKED_SUBTAB_REFRESH_DELAY_MS = 100
+# Cell size of the uniform grid used for point hit-testing, in board pixels.
+HIT_GRID_CELL_SIZE = 200.0
+# (row, left, top, right, bottom) of an item as stored in the hit grid.
+HitEntry = Tuple[int, float, float, float, float]
+# (edge index, fromX, fromY, toX, toY) of an edge as stored in the edge hit grid.
+EdgeHitEntry = Tuple[int, float, float, float, float]
+# Numeric suffix of generated ids such as "box_12" or "edge_3".
+_ID_TAIL_RE = re.compile(r"_(\d+)\Z")
+
+
+def _finite_or(value: float, default: float) -> float:
+    """Return ``value``, or ``default`` if it is ``inf``/``nan``."""
+    return value if math.isfinite(value) else default
+
+
+def _next_id_number(obj_id: str) -> int:
+    """Return the counter value that follows ``obj_id``, or 0 without a numeric suffix."""
+    match = _ID_TAIL_RE.search(obj_id)
+    return int(match.group(1)) + 1 if match else 0
 
 
 class DiagramModel(
@@ -73,8 +100,51 @@ class DiagramModel(
     TaskContractPunishmentRole = Qt.UserRole + 30
     TextTabsRole = Qt.UserRole + 31
     TextTabIndexRole = Qt.UserRole + 32
+    ImageVersionRole = Qt.UserRole + 33
+
+    # Roles that change when an existing item is turned into a task item.
+    _TASK_DATA_ROLES = [TaskIndexRole, TypeRole, ColorRole, TextRole, TextColorRole]
+
+    # Role -> getter(model, item), so data() is a single dict lookup per call.
+    _ROLE_GETTERS: Dict[int, Callable[[DiagramModel, DiagramItem], Any]] = {
+        IdRole: lambda model, item: item.id,
+        TypeRole: lambda model, item: item.item_type.value,
+        XRole: lambda model, item: item.x,
+        YRole: lambda model, item: item.y,
+        WidthRole: lambda model, item: item.width,
+        HeightRole: lambda model, item: item.height,
+        TextRole: lambda model, item: item.text,
+        TaskIndexRole: lambda model, item: item.task_index,
+        ColorRole: lambda model, item: item.color,
+        TextColorRole: lambda model, item: item.text_color,
+        TaskCompletedRole: lambda model, item: model._is_task_completed(item.task_index),
+        ImageDataRole: lambda model, item: item.image_data,
+        TaskCurrentRole: lambda model, item: item.task_index >= 0 and item.task_index == model._current_task_index,
+        NoteMarkdownRole: lambda model, item: model._get_display_note_markdown(item),
+        ObstacleMarkdownRole: lambda model, item: model._get_display_obstacle_markdown(item),
+        TaskCountdownRemainingRole: lambda model, item: model._getTaskCountdownRemaining(item.task_index),
+        TaskCountdownProgressRole: lambda model, item: model._getTaskCountdownProgress(item.task_index),
+        TaskCountdownExpiredRole: lambda model, item: model._isTaskCountdownExpired(item.task_index),
+        TaskCountdownActiveRole: lambda model, item: model._isTaskCountdownActive(item.task_index),
+        FolderPathRole: lambda model, item: item.folder_path,
+        LinkedSubtabCompletionRole: lambda model, item: model._getLinkedSubtabCompletion(item.task_index),
+        LinkedSubtabActiveActionRole: lambda model, item: model._getLinkedSubtabActiveAction(item.task_index),
+        HasLinkedSubtabRole: lambda model, item: model._hasLinkedSubtab(item.task_index),
+        TaskReminderActiveRole: lambda model, item: model._isTaskReminderActive(item.task_index),
+        TaskReminderAtRole: lambda model, item: model._getTaskReminderAt(item.task_index),
+        TaskContractActiveRole: lambda model, item: model._isTaskContractActive(item.task_index),
+        TaskContractDeadlineRole: lambda model, item: model._getTaskContractDeadline(item.task_index),
+        TaskContractRemainingRole: lambda model, item: model._getTaskContractRemaining(item.task_index),
+        TaskContractBreachedRole: lambda model, item: model._isTaskContractBreached(item.task_index),
+        TaskContractPunishmentRole: lambda model, item: model._getTaskContractPunishment(item.task_index),
+        TextTabsRole: lambda model, item: normalize_editor_tabs(item.text_tabs, fallback_text=item.text),
+        TextTabIndexRole: lambda model, item: model._clamp_text_tab_index(item),
+        ImageVersionRole: lambda model, item: item.image_version,
+    }
 
     itemsChanged = Signal()
+    # Emitted when item count or geometry changes; drives the board bounds.
+    geometryChanged = Signal()
     edgesChanged = Signal()
     drawingChanged = Signal()
     drawingModeChanged = Signal()
@@ -86,17 +156,52 @@ class DiagramModel(
         super().__init__()
         self._items: List[DiagramItem] = []
         self._edges: List[DiagramEdge] = []
+        self._edges_cache: Optional[List[Dict[str, str]]] = None
+        self._edges_by_id: Dict[str, DiagramEdge] = {}
+        self._edges_by_pair: Dict[Tuple[str, str], DiagramEdge] = {}
+        # Item id -> edges touching it, in edge-list order.
+        self._edges_by_endpoint: Dict[str, List[DiagramEdge]] = {}
+        self._task_index_to_rows: Dict[int, List[int]] = {}
+        self._id_to_row: Dict[str, int] = {}
+        # Cached (min_x, min_y, max_x, max_y) over all items; recomputed when dirty.
+        self._bbox: List[float] = [0.0, 0.0, 0.0, 0.0]
+        # Ids of the items defining each side of _bbox, in the same order.
+        self._bbox_owners: List[str] = ["", "", "", ""]
+        self._bbox_dirty: bool = False
+        # Grid cell -> (row, left, top, right, bottom) of items overlapping it;
+        # built lazily for hit-testing.
+        self._hit_grid: Optional[Dict[Tuple[int, int], List[HitEntry]]] = None
+        # Grid cell -> edges whose segment passes near it; built lazily for edge hit-testing.
+        self._edge_hit_grid: Optional[Dict[Tuple[int, int], List[EdgeHitEntry]]] = None
+        # Cells holding each edge index and edge indices per item id, built with
+        # _edge_hit_grid so moving an item re-buckets only its own edges.
+        self._edge_hit_cells: Dict[int, List[Tuple[int, int]]] = {}
+        self._edge_hit_incident: Dict[str, List[int]] = {}
         self._current_task_index: int = -1
         self._edge_hover_target_id: str = ""
         self._drag_insert_edge_id: str = ""
         self._task_model = task_model
         self._tab_model = None
+        # Linked-subtab lookups, cleared whenever the tab model reports a change.
+        self._linked_tabs_by_name: Optional[Dict[str, Any]] = None
+        # Tab name -> (completion, active action), computed on first read.
+        self._linked_tab_values: Dict[str, Tuple[float, str]] = {}
+        # Tab names and values that may have been shown since the last
+        # linked-subtab refresh. A None value means more than one was seen.
+        self._stale_linked_tab_names: Set[str] = set()
+        self._stale_linked_tab_values: Dict[str, Optional[Tuple[float, str]]] = {}
         self._id_source = count()
+        self._edge_id_source = count()
         self._edge_source_id: Optional[str] = None
         self._renaming_in_progress = False
+        # Nesting depth of _batched_changes() and the change signals it holds back.
+        self._batch_depth: int = 0
+        self._pending_batch_signals: Dict[str, None] = {}
 
         # Initialize mixins
         self._init_drawing()
+        # Connected before any QML binding so readers never see a stale list.
+        self.edgesChanged.connect(self._invalidate_edges_cache)
 
         # Connect to task model's signals for bidirectional sync
         if self._task_model is not None:
@@ -109,11 +214,20 @@ class DiagramModel(
         self._edge_drag_x: float = 0.0
         self._edge_drag_y: float = 0.0
         self._is_dragging_edge: bool = False
+        # Tab model signals arrive in bursts (task list syncs, project loads);
+        # refresh the linked-subtab roles once per burst.
+        self._linked_subtab_refresh_timer = QTimer(self)
+        self._linked_subtab_refresh_timer.setSingleShot(True)
+        self._linked_subtab_refresh_timer.setInterval(LINKED_SUBTAB_REFRESH_DELAY_MS)
+        self._linked_subtab_refresh_timer.timeout.connect(self._emitLinkedSubtabDataChanged)
         self.setTabModel(tab_model)
 
     def _next_id(self, prefix: str) -> str:
         return f"{prefix}_{next(self._id_source)}"
 
+    def _next_edge_id(self) -> str:
+        return f"edge_{next(self._edge_id_source)}"
+
     def _build_item_from_preset(
         self,
         preset_name: str,
@@ -139,11 +253,399 @@ class DiagramModel(
             text_color=str(preset["text_color"]),
         )
 
+    @contextmanager
+    def _batched_changes(self) -> Iterator[None]:
+        """Coalesce change signals sent through _emit_changed into one emit each."""
+        self.beginBatch()
+        try:
+            yield
+        finally:
+            self.endBatch()
+
+    @Slot()
+    def beginBatch(self) -> None:
+        """Hold back change signals until the matching endBatch() call."""
+        self._batch_depth += 1
+
+    @Slot()
+    def endBatch(self) -> None:
+        """Close a batch, emitting each held-back change signal once."""
+        if self._batch_depth == 0:
+            return
+        self._batch_depth -= 1
+        if self._batch_depth == 0:
+            pending = list(self._pending_batch_signals)
+            self._pending_batch_signals.clear()
+            for name in pending:
+                getattr(self, name).emit()
+
+    def _emit_changed(self, name: str) -> None:
+        """Emit the named change signal, or defer it while a batch is open."""
+        if self._batch_depth:
+            if name == "edgesChanged":
+                # Keep the edges property fresh for reads inside the batch.
+                self._invalidate_edges_cache()
+            self._pending_batch_signals[name] = None
+            return
+        getattr(self, name).emit()
+
     def _append_item(self, item: DiagramItem) -> None:
-        self.beginInsertRows(QModelIndex(), len(self._items), len(self._items))
+        row = len(self._items)
+        self.beginInsertRows(QModelIndex(), row, row)
         self._items.append(item)
+        self._id_to_row[item.id] = row
+        self._expand_bbox(item, first=row == 0)
+        if self._hit_grid is not None:
+            self._add_to_hit_grid(self._hit_grid, row, item)
+        if item.task_index >= 0:
+            self._task_index_to_rows.setdefault(item.task_index, []).append(row)
         self.endInsertRows()
-        self.itemsChanged.emit()
+        self._emit_changed("itemsChanged")
+        self._emit_changed("geometryChanged")
+
+    def _expand_bbox(self, item: DiagramItem, first: bool = False) -> None:
+        """Grow the cached bounding box to cover an item's rectangle."""
+        if self._bbox_dirty:
+            return
+        right = item.x + item.width
+        bottom = item.y + item.height
+        if first:
+            self._bbox = [item.x, item.y, right, bottom]
+            self._bbox_owners = [item.id] * 4
+            return
+        bbox = self._bbox
+        owners = self._bbox_owners
+        if item.x < bbox[0]:
+            bbox[0] = item.x
+            owners[0] = item.id
+        if item.y < bbox[1]:
+            bbox[1] = item.y
+            owners[1] = item.id
+        if right > bbox[2]:
+            bbox[2] = right
+            owners[2] = item.id
+        if bottom > bbox[3]:
+            bbox[3] = bottom
+            owners[3] = item.id
+
+    def _update_bbox_for_change(self, item: DiagramItem) -> None:
+        """Update the cached bounding box after an item moved or resized.
+
+        The box is only marked dirty when the item owns an extremum and
+        retreated from it; otherwise growing it to the new rectangle is enough.
+        """
+        if self._bbox_dirty:
+            return
+        owners = self._bbox_owners
+        if item.id in owners:
+            min_x, min_y, max_x, max_y = self._bbox
+            if (
+                (owners[0] == item.id and item.x > min_x)
+                or (owners[1] == item.id and item.y > min_y)
+                or (owners[2] == item.id and item.x + item.width < max_x)
+                or (owners[3] == item.id and item.y + item.height < max_y)
+            ):
+                self._bbox_dirty = True
+                return
+        self._expand_bbox(item)
+
+    @staticmethod
+    def _add_to_hit_grid(grid: Dict[Tuple[int, int], List[HitEntry]], row: int, item: DiagramItem) -> None:
+        cell = HIT_GRID_CELL_SIZE
+        right = item.x + item.width
+        bottom = item.y + item.height
+        # inf/nan geometry has no grid cell (math.floor would raise), and no
+        # finite point can hit it, so such items are left out.
+        if not (math.isfinite(item.x) and math.isfinite(item.y) and math.isfinite(right) and math.isfinite(bottom)):
+            return
+        entry = (row, item.x, item.y, right, bottom)
+        first_col = math.floor(item.x / cell)
+        last_col = math.floor(right / cell)
+        first_row = math.floor(item.y / cell)
+        last_row = math.floor(bottom / cell)
+        for col in range(first_col, last_col + 1):
+            for grid_row in range(first_row, last_row + 1):
+                grid.setdefault((col, grid_row), []).append(entry)
+
+    def _hit_candidates(self, x: float, y: float, margin: float) -> List[HitEntry]:
+        """Return hit entries of items whose grid cells lie within ``margin`` of a point.
+
+        Entries are ``(row, left, top, right, bottom)`` tuples in row order, so
+        the hit tests compare plain floats instead of reading item attributes.
+        """
+        grid = self._hit_grid
+        if grid is None:
+            grid = {}
+            for row, item in enumerate(self._items):
+                self._add_to_hit_grid(grid, row, item)
+            self._hit_grid = grid
+        if not (math.isfinite(x) and math.isfinite(y) and math.isfinite(margin)):
+            return []
+        cell = HIT_GRID_CELL_SIZE
+        first_col = math.floor((x - margin) / cell)
+        last_col = math.floor((x + margin) / cell)
+        first_row = math.floor((y - margin) / cell)
+        last_row = math.floor((y + margin) / cell)
+        if first_col == last_col and first_row == last_row:
+            return grid.get((first_col, first_row), [])
+        entries: Set[HitEntry] = set()
+        for col in range(first_col, last_col + 1):
+            for grid_row in range(first_row, last_row + 1):
+                entries.update(grid.get((col, grid_row), ()))
+        return sorted(entries)
+
+    def _build_edge_hit_grid(self) -> Dict[Tuple[int, int], List[EdgeHitEntry]]:
+        """Bucket every edge segment into the hit grid cells it passes near."""
+        grid: Dict[Tuple[int, int], List[EdgeHitEntry]] = {}
+        self._edge_hit_cells = {}
+        self._edge_hit_incident = {}
+        for index, edge in enumerate(self._edges):
+            self._edge_hit_incident.setdefault(edge.from_id, []).append(index)
+            self._edge_hit_incident.setdefault(edge.to_id, []).append(index)
+            self._bucket_edge_hit(grid, index)
+        return grid
+
+    def _bucket_edge_hit(self, grid: Dict[Tuple[int, int], List[EdgeHitEntry]], index: int) -> None:
+        """Add one edge to the hit grid cells it passes near and record those cells."""
+        edge = self._edges[index]
+        from_item = self.getItem(edge.from_id)
+        to_item = self.getItem(edge.to_id)
+        if from_item is None or to_item is None:
+            return
+        cell = HIT_GRID_CELL_SIZE
+        # A segment crossing a cell lies within half a diagonal of its centre.
+        reach = cell * math.sqrt(0.5)
+        from_x, from_y = self._item_center(from_item)
+        to_x, to_y = self._item_center(to_item)
+        entry = (index, from_x, from_y, to_x, to_y)
+        cells = []
+        if not all(math.isfinite(value) for value in (from_x, from_y, to_x, to_y)):
+            # An edge to an item with inf/nan geometry cannot be hit; leave it unbucketed.
+            self._edge_hit_cells[index] = cells
+            return
+        for col in range(math.floor(min(from_x, to_x) / cell), math.floor(max(from_x, to_x) / cell) + 1):
+            for grid_row in range(math.floor(min(from_y, to_y) / cell), math.floor(max(from_y, to_y) / cell) + 1):
+                centre_x = (col + 0.5) * cell
+                centre_y = (grid_row + 0.5) * cell
+                if self._distance_to_segment(centre_x, centre_y, from_x, from_y, to_x, to_y) <= reach:
+                    grid.setdefault((col, grid_row), []).append(entry)
+                    cells.append((col, grid_row))
+        self._edge_hit_cells[index] = cells
+
+    def _rebucket_item_edges(self, item_id: str) -> None:
+        """Re-bucket the edges attached to a moved or resized item in the hit grid."""
+        grid = self._edge_hit_grid
+        if grid is None:
+            return
+        for index in self._edge_hit_incident.get(item_id, ()):
+            for key in self._edge_hit_cells.pop(index, ()):
+                remaining = [entry for entry in grid[key] if entry[0] != index]
+                if remaining:
+                    grid[key] = remaining
+                else:
+                    del grid[key]
+            self._bucket_edge_hit(grid, index)
+
+    def _item_bounds(self) -> List[float]:
+        """Return the cached bounding box, recomputing it if it is dirty."""
+        if self._bbox_dirty:
+            self._compute_bounds()
+            self._bbox_dirty = False
+        return self._bbox
+
+    def _compute_bounds(self) -> None:
+        """Recompute the bounding box and its owners over all items in a single pass."""
+        if not self._items:
+            self._bbox = [0.0, 0.0, 0.0, 0.0]
+            self._bbox_owners = ["", "", "", ""]
+            return
+        first = self._items[0]
+        min_x = first.x
+        min_y = first.y
+        max_x = first.x + first.width
+        max_y = first.y + first.height
+        owners = [first.id] * 4
+        for item in self._items:
+            x = item.x
+            y = item.y
+            if x < min_x:
+                min_x = x
+                owners[0] = item.id
+            if y < min_y:
+                min_y = y
+                owners[1] = item.id
+            right = x + item.width
+            if right > max_x:
+                max_x = right
+                owners[2] = item.id
+            bottom = y + item.height
+            if bottom > max_y:
+                max_y = bottom
+                owners[3] = item.id
+        self._bbox = [min_x, min_y, max_x, max_y]
+        self._bbox_owners = owners
+
+    def _append_edge(self, edge: DiagramEdge) -> None:
+        """Append an edge and index it. Callers emit edgesChanged."""
+        self._edges.append(edge)
+        self._index_edge(edge, self._edges_by_id, self._edges_by_pair, self._edges_by_endpoint)
+
+    @staticmethod
+    def _index_edge(
+        edge: DiagramEdge,
+        edges_by_id: Dict[str, DiagramEdge],
+        edges_by_pair: Dict[Tuple[str, str], DiagramEdge],
+        edges_by_endpoint: Dict[str, List[DiagramEdge]],
+    ) -> None:
+        edges_by_id.setdefault(edge.id, edge)
+        edges_by_pair[(edge.from_id, edge.to_id)] = edge
+        edges_by_endpoint.setdefault(edge.from_id, []).append(edge)
+        if edge.to_id != edge.from_id:
+            edges_by_endpoint.setdefault(edge.to_id, []).append(edge)
+
+    def _pop_edge(self, edge: DiagramEdge) -> None:
+        """Remove an indexed edge. Callers emit edgesChanged."""
+        for idx, existing in enumerate(self._edges):
+            if existing is edge:
+                del self._edges[idx]
+                break
+        self._unindex_edge(edge)
+
+    def _pop_edges_touching(self, item_id: str) -> bool:
+        """Remove every edge incident to an item. Callers emit edgesChanged.
+
+        Returns True if any edge was removed. Items without edges cost a
+        single dict lookup; otherwise the edge list is filtered once.
+        """
+        incident = self._edges_by_endpoint.get(item_id)
+        if not incident:
+            return False
+        doomed = {id(edge) for edge in incident}
+        self._edges = [edge for edge in self._edges if id(edge) not in doomed]
+        for edge in list(incident):
+            self._unindex_edge(edge)
+        return True
+
+    def _unindex_edge(self, edge: DiagramEdge) -> None:
+        """Drop an edge already removed from the edge list from the indexes."""
+        for endpoint in (edge.from_id, edge.to_id):
+            incident = self._edges_by_endpoint.get(endpoint)
+            if incident is None:
+                continue
+            for idx, existing in enumerate(incident):
+                if existing is edge:
+                    del incident[idx]
+                    break
+            if not incident:
+                del self._edges_by_endpoint[endpoint]
+        if self._edges_by_pair.get((edge.from_id, edge.to_id)) is edge:
+            del self._edges_by_pair[(edge.from_id, edge.to_id)]
+        if self._edges_by_id.get(edge.id) is edge:
+            del self._edges_by_id[edge.id]
+            # Older files may contain duplicate edge ids; keep the next one reachable.
+            for existing in self._edges:
+                if existing.id == edge.id:
+                    self._edges_by_id[edge.id] = existing
+                    break
+
+    def _reindex_edges(self) -> None:
+        edges_by_id: Dict[str, DiagramEdge] = {}
+        edges_by_pair: Dict[Tuple[str, str], DiagramEdge] = {}
+        edges_by_endpoint: Dict[str, List[DiagramEdge]] = {}
+        for edge in self._edges:
+            self._index_edge(edge, edges_by_id, edges_by_pair, edges_by_endpoint)
+        self._edges_by_id = edges_by_id
+        self._edges_by_pair = edges_by_pair
+        self._edges_by_endpoint = edges_by_endpoint
+
+    def _rebuild_id_rows(self) -> None:
+        """Recompute the item id -> row map after rows are removed or reset."""
+        self._id_to_row = {item.id: row for row, item in enumerate(self._items)}
+
+    def _rebuild_task_index_rows(self) -> None:
+        """Recompute the task index -> rows map after rows or task links change."""
+        task_index_to_rows: Dict[int, List[int]] = {}
+        for row, item in enumerate(self._items):
+            if item.task_index >= 0:
+                task_index_to_rows.setdefault(item.task_index, []).append(row)
+        self._task_index_to_rows = task_index_to_rows
+
+    def _remove_row_from_maps(self, row: int, removed_item: DiagramItem) -> None:
+        """Update the id and task index maps after ``removed_item`` left ``row``."""
+        id_to_row = self._id_to_row
+        id_to_row.pop(removed_item.id, None)
+        items = self._items
+        for later_row in range(row, len(items)):
+            id_to_row[items[later_row].id] = later_row
+        if removed_item.task_index >= 0:
+            self._unlink_task_row(row, removed_item.task_index)
+        for rows in self._task_index_to_rows.values():
+            for i, task_row in enumerate(rows):
+                if task_row > row:
+                    rows[i] = task_row - 1
+
+    def _unlink_task_row(self, row: int, task_index: int) -> None:
+        rows = self._task_index_to_rows.get(task_index)
+        if rows is None:
+            return
+        if row in rows:
+            rows.remove(row)
+        if not rows:
+            del self._task_index_to_rows[task_index]
+
+    def _set_item_task_index(self, row: int, task_index: int) -> None:
+        """Link the item at ``row`` to a task, keeping the task index map current."""
+        item = self._items[row]
+        if item.task_index >= 0:
+            self._unlink_task_row(row, item.task_index)
+        item.task_index = task_index
+        if task_index >= 0:
+            insort(self._task_index_to_rows.setdefault(task_index, []), row)
+
+    def _shift_task_indices_after(self, removed_task_index: int) -> List[int]:
+        """Decrement task links above a task removed from the TaskModel.
+
+        Returns the rows whose task index changed.
+        """
+        shifted_rows: List[int] = []
+        task_index_to_rows: Dict[int, List[int]] = {}
+        for task_index, rows in self._task_index_to_rows.items():
+            if task_index > removed_task_index:
+                for task_row in rows:
+                    self._items[task_row].task_index -= 1
+                shifted_rows.extend(rows)
+                task_index -= 1
+            existing = task_index_to_rows.get(task_index)
+            if existing is None:
+                task_index_to_rows[task_index] = rows
+            else:
+                existing.extend(rows)
+                existing.sort()
+        self._task_index_to_rows = task_index_to_rows
+        return shifted_rows
+
+    def _emit_rows_changed(self, rows: List[int], roles: List[int]) -> None:
+        """Emit a single dataChanged span covering all given rows."""
+        if not rows:
+            return
+        self.dataChanged.emit(self.index(min(rows), 0), self.index(max(rows), 0), roles)
+
+    def _emit_task_rows_changed(self, task_index: int, roles: List[int]) -> None:
+        """Emit dataChanged for the items linked to a task, if there are any."""
+        rows = self._task_index_to_rows.get(task_index)
+        if not rows:
+            return
+        self._emit_rows_changed(rows, roles)
+
+    def _emit_current_task_rows_changed(self, old_task_index: int, new_task_index: int) -> None:
+        """Emit TaskCurrentRole for the items of the previous and new current task.
+
+        Each task gets its own span, so far-apart task boxes never refresh the
+        rows between them.
+        """
+        for task_index in (old_task_index, new_task_index):
+            if task_index >= 0:
+                self._emit_task_rows_changed(task_index, [self.TaskCurrentRole])
 
     def _dimensions_for_connected_kind(self, item_kind: str) -> tuple[float, float]:
         kind = (item_kind or "").strip().lower()
@@ -208,72 +710,10 @@ class DiagramModel(
         if not index.isValid() or not (0 <= index.row() < len(self._items)):
             return None
 
-        item = self._items[index.row()]
-        if role == self.IdRole:
-            return item.id
-        if role == self.TypeRole:
-            return item.item_type.value
-        if role == self.XRole:
-            return item.x
-        if role == self.YRole:
-            return item.y
-        if role == self.WidthRole:
-            return item.width
-        if role == self.HeightRole:
-            return item.height
-        if role == self.TextRole:
-            return item.text
-        if role == self.TaskIndexRole:
-            return item.task_index
-        if role == self.ColorRole:
-            return item.color
-        if role == self.TextColorRole:
-            return item.text_color
-        if role == self.TaskCompletedRole:
-            return self._is_task_completed(item.task_index)
-        if role == self.ImageDataRole:
-            return item.image_data
-        if role == self.TaskCurrentRole:
-            return item.task_index >= 0 and item.task_index == self._current_task_index
-        if role == self.NoteMarkdownRole:
-            return self._get_display_note_markdown(item)
-        if role == self.ObstacleMarkdownRole:
-            return self._get_display_obstacle_markdown(item)
-        if role == self.TaskCountdownRemainingRole:
-            return self._getTaskCountdownRemaining(item.task_index)
-        if role == self.TaskCountdownProgressRole:
-            return self._getTaskCountdownProgress(item.task_index)
-        if role == self.TaskCountdownExpiredRole:
-            return self._isTaskCountdownExpired(item.task_index)
-        if role == self.TaskCountdownActiveRole:
-            return self._isTaskCountdownActive(item.task_index)
-        if role == self.FolderPathRole:
-            return item.folder_path
-        if role == self.LinkedSubtabCompletionRole:
-            return self._getLinkedSubtabCompletion(item.task_index)
-        if role == self.LinkedSubtabActiveActionRole:
-            return self._getLinkedSubtabActiveAction(item.task_index)
-        if role == self.HasLinkedSubtabRole:
-            return self._hasLinkedSubtab(item.task_index)
-        if role == self.TaskReminderActiveRole:
-            return self._isTaskReminderActive(item.task_index)
-        if role == self.TaskReminderAtRole:
-            return self._getTaskReminderAt(item.task_index)
-        if role == self.TaskContractActiveRole:
-            return self._isTaskContractActive(item.task_index)
-        if role == self.TaskContractDeadlineRole:
-            return self._getTaskContractDeadline(item.task_index)
-        if role == self.TaskContractRemainingRole:
-            return self._getTaskContractRemaining(item.task_index)
-        if role == self.TaskContractBreachedRole:
-            return self._isTaskContractBreached(item.task_index)
-        if role == self.TaskContractPunishmentRole:
-            return self._getTaskContractPunishment(item.task_index)
-        if role == self.TextTabsRole:
-            return normalize_editor_tabs(item.text_tabs, fallback_text=item.text)
-        if role == self.TextTabIndexRole:
-            return self._clamp_text_tab_index(item)
-        return None
+        getter = self._ROLE_GETTERS.get(role)
+        if getter is None:
+            return None
+        return getter(self, self._items[index.row()])
 
     def roleNames(self) -> Dict[int, bytes]:  # type: ignore[override]
         return {
@@ -309,6 +749,7 @@ class DiagramModel(
             self.TaskContractPunishmentRole: b"taskContractPunishment",
             self.TextTabsRole: b"textTabs",
             self.TextTabIndexRole: b"textTabIndex",
+            self.ImageVersionRole: b"imageVersion",
         }
 
     @staticmethod
@@ -328,6 +769,8 @@ class DiagramModel(
         self._disconnectTabModelSignals()
         self._tab_model = tab_model
         self._connectTabModelSignals()
+        self._invalidateLinkedSubtabCache()
+        self._linked_subtab_refresh_timer.stop()
         self._emitLinkedSubtabDataChanged()
 
     def _connectTabModelSignals(self) -> None:
@@ -337,6 +780,7 @@ class DiagramModel(
             self._tab_model.dataChanged.connect(self._onTabModelUpdated)
             self._tab_model.rowsInserted.connect(self._onTabModelUpdated)
             self._tab_model.rowsRemoved.connect(self._onTabModelUpdated)
+            self._tab_model.rowsMoved.connect(self._onTabModelUpdated)
             self._tab_model.modelReset.connect(self._onTabModelUpdated)
             self._tab_model.layoutChanged.connect(self._onTabModelUpdated)
         except (AttributeError, RuntimeError):
@@ -349,6 +793,7 @@ class DiagramModel(
             getattr(self._tab_model, "dataChanged", None),
             getattr(self._tab_model, "rowsInserted", None),
             getattr(self._tab_model, "rowsRemoved", None),
+            getattr(self._tab_model, "rowsMoved", None),
             getattr(self._tab_model, "modelReset", None),
             getattr(self._tab_model, "layoutChanged", None),
         ):
@@ -360,29 +805,101 @@ class DiagramModel(
                 pass
 
     def _onTabModelUpdated(self, *args) -> None:
-        self._emitLinkedSubtabDataChanged()
+        self._invalidateLinkedSubtabCache()
+        if not self._linked_subtab_refresh_timer.isActive():
+            self._linked_subtab_refresh_timer.start()
+
+    def flushLinkedSubtabRefresh(self) -> None:
+        """Emit a pending debounced linked-subtab refresh immediately."""
+        if self._linked_subtab_refresh_timer.isActive():
+            self._linked_subtab_refresh_timer.stop()
+            self._emitLinkedSubtabDataChanged()
+
+    def _invalidateLinkedSubtabCache(self) -> None:
+        if self._linked_tabs_by_name is not None:
+            self._stale_linked_tab_names.update(self._linked_tabs_by_name)
+        stale_values = self._stale_linked_tab_values
+        for name, values in self._linked_tab_values.items():
+            if name not in stale_values:
+                stale_values[name] = values
+            elif stale_values[name] != values:
+                stale_values[name] = None
+        self._linked_tabs_by_name = None
+        self._linked_tab_values.clear()
 
     def _emitLinkedSubtabDataChanged(self) -> None:
-        if not self._items:
+        """Refresh linked-subtab roles for items whose linked tab changed.
+
+        Only titles matching a tab before or after the update can change
+        value, and tabs whose completion and active action are unchanged
+        since they were last read are skipped.
+        """
+        old_names = self._stale_linked_tab_names
+        old_values = self._stale_linked_tab_values
+        self._stale_linked_tab_names = set()
+        self._stale_linked_tab_values = {}
+        tabs_by_name = self._linkedTabsByName() or {}
+        changed_names: Set[str] = set()
+        for name in old_names | set(tabs_by_name):
+            tab = tabs_by_name.get(name)
+            if (name in old_names) != (tab is not None):
+                changed_names.add(name)
+            elif tab is not None:
+                old = old_values.get(name)
+                if old is None or old != self._linkedTabValues(tab):
+                    changed_names.add(name)
+        if not changed_names:
             return
-        roles = [
-            self.LinkedSubtabCompletionRole,
-            self.LinkedSubtabActiveActionRole,
-            self.HasLinkedSubtabRole,
-        ]
-        for row, item in enumerate(self._items):
-            if item.task_index < 0:
-                continue
-            idx = self.index(row, 0)
-            self.dataChanged.emit(idx, idx, roles)
+        rows: List[int] = []
+        for task_index, task_rows in self._task_index_to_rows.items():
+            if self._linkedTaskTitle(task_index) in changed_names:
+                rows.extend(task_rows)
+        self._emit_rows_changed(
+            rows,
+            [
+                self.LinkedSubtabCompletionRole,
+                self.LinkedSubtabActiveActionRole,
+                self.HasLinkedSubtabRole,
+            ],
+        )
 
     # --- Properties exposed to QML -----------------------------------------
+    def _invalidate_edges_cache(self) -> None:
+        self._edges_cache = None
+        self._edge_hit_grid = None
+
     @Property(list, notify=edgesChanged)
     def edges(self) -> List[Dict[str, str]]:
-        return [
-            {"id": edge.id, "fromId": edge.from_id, "toId": edge.to_id, "description": edge.description}
-            for edge in self._edges
-        ]
+        if self._edges_cache is None:
+            self._edges_cache = [
+                {"id": edge.id, "fromId": edge.from_id, "toId": edge.to_id, "description": edge.description}
+                for edge in self._edges
+            ]
+        return self._edges_cache
+
+    @Slot(result="QVariant")
+    def getEdgeEndpoints(self) -> List[float]:
+        """Return edge centre points as a flat ``[fromX, fromY, toX, toY, ...]`` list.
+
+        Follows the order of ``edges``. An edge whose endpoint item is missing
+        gets NaN coordinates, so canvases can skip it without a snapshot lookup.
+        """
+        coords: List[float] = []
+        for edge in self._edges:
+            from_item = self.getItem(edge.from_id)
+            to_item = self.getItem(edge.to_id)
+            if from_item is None or to_item is None:
+                coords.extend((math.nan, math.nan, math.nan, math.nan))
+                continue
+            coords.extend(
+                (
+                    from_item.x + from_item.width / 2,
+                    from_item.y + from_item.height / 2,
+                    to_item.x + to_item.width / 2,
+                    to_item.y + to_item.height / 2,
+                )
+            )
+        return coords
 
     @Property(str, notify=itemsChanged)
     def edgeDrawingFrom(self) -> str:
@@ -412,33 +929,33 @@ class DiagramModel(
     def count(self) -> int:
         return len(self._items)
 
-    @Property(float, notify=itemsChanged)
+    @Property(float, notify=geometryChanged)
     def minItemX(self) -> float:
         """Return the leftmost x position of all items."""
         if not self._items:
             return 0.0
-        return min(item.x for item in self._items)
+        return self._item_bounds()[0]
 
-    @Property(float, notify=itemsChanged)
+    @Property(float, notify=geometryChanged)
     def minItemY(self) -> float:
         """Return the topmost y position of all items."""
         if not self._items:
             return 0.0
-        return min(item.y for item in self._items)
+        return self._item_bounds()[1]
 
-    @Property(float, notify=itemsChanged)
+    @Property(float, notify=geometryChanged)
     def maxItemX(self) -> float:
         """Return the rightmost edge of all items (x + width)."""
         if not self._items:
             return 0.0
-        return max(item.x + item.width for item in self._items)
+        return self._item_bounds()[2]
 
-    @Property(float, notify=itemsChanged)
+    @Property(float, notify=geometryChanged)
     def maxItemY(self) -> float:
         """Return the bottommost edge of all items (y + height)."""
         if not self._items:
             return 0.0
-        return max(item.y + item.height for item in self._items)
+        return self._item_bounds()[3]
 
     # --- Drawing properties (from DrawingMixin) ----------------------------
     @Property(bool, notify=drawingModeChanged)
@@ -496,17 +1013,28 @@ class DiagramModel(
     @Slot(str, str, float, float, str, result=str)
     def addPresetItemAndConnect(self, source_id: str, preset: str, x: float, y: float, text: str) -> str:
         """Create a new item of the given preset type and connect it with an edge from source_id."""
-        new_id = self._add_preset(preset, x, y, text)
-        if new_id and source_id:
-            self.addEdge(source_id, new_id)
+        with self._batched_changes():
+            new_id = self._add_preset(preset, x, y, text)
+            if new_id and source_id:
+                self.addEdge(source_id, new_id)
         return new_id
 
     @Slot(str, float, float, str, result=str)
     def addTaskFromTextAndConnect(self, source_id: str, x: float, y: float, text: str) -> str:
         """Create a new task in the task list, add it to the diagram, and connect with an edge."""
-        new_id = self.addTaskFromText(text, x, y)
-        if new_id and source_id:
-            self.addEdge(source_id, new_id)
+        with self._batched_changes():
+            new_id = self.addTaskFromText(text, x, y)
+            if new_id and source_id:
+                self.addEdge(source_id, new_id)
+        return new_id
+
+    @Slot(str, float, float, str, result=str)
+    def addTaskFromTextConnectedTo(self, target_id: str, x: float, y: float, text: str) -> str:
+        """Create a new task like addTaskFromTextAndConnect, with the edge pointing into target_id."""
+        with self._batched_changes():
+            new_id = self.addTaskFromText(text, x, y)
+            if new_id and target_id:
+                self.addEdge(new_id, target_id)
         return new_id
 
     def _find_task_chain_tail(self, source_id: str) -> str:
@@ -594,40 +1122,48 @@ class DiagramModel(
 
     @Slot(str, float, float)
     def moveItem(self, item_id: str, x: float, y: float) -> None:
-        for row, item in enumerate(self._items):
-            if item.id == item_id:
-                if item.x == x and item.y == y:
-                    return
-                item.x = x
-                item.y = y
-                index = self.index(row, 0)
-                self.dataChanged.emit(index, index, [self.XRole, self.YRole])
-                self.itemsChanged.emit()
-                return
+        row = self._id_to_row.get(item_id)
+        if row is None:
+            return
+        item = self._items[row]
+        # Snap to whole pixels so sub-pixel drag jitter does not emit updates.
+        x = float(round(x))
+        y = float(round(y))
+        if item.x == x and item.y == y:
+            return
+        item.x = x
+        item.y = y
+        self._update_bbox_for_change(item)
+        self._hit_grid = None
+        self._rebucket_item_edges(item_id)
+        index = self.index(row, 0)
+        self.dataChanged.emit(index, index, [self.XRole, self.YRole])
+        self._emit_changed("itemsChanged")
+        self._emit_changed("geometryChanged")
 
     @Slot(str, str)
     def setItemText(self, item_id: str, text: str) -> None:
-        for row, item in enumerate(self._items):
-            if item.id == item_id:
-                if item.text == text:
-                    return
-                item.text = text
-                if item.text_tabs:
-                    item.text_tabs = normalize_editor_tabs(item.text_tabs, fallback_text=text)
-                    item.text_tabs[0]["text"] = text
-                index = self.index(row, 0)
-                self.dataChanged.emit(
-                    index,
-                    index,
-                    [
-                        self.TextRole,
-                        self.LinkedSubtabCompletionRole,
-                        self.LinkedSubtabActiveActionRole,
-                        self.HasLinkedSubtabRole,
-                    ],
-                )
-                self.itemsChanged.emit()
-                return
+        row = self._id_to_row.get(item_id)
+        if row is None:
+            return
+        item = self._items[row]
+        if item.text == text:
+            return
+        item.text = text
+        if item.text_tabs:
+            item.text_tabs = normalize_editor_tabs(item.text_tabs, fallback_text=text)
+            item.text_tabs[0]["text"] = text
+        index = self.index(row, 0)
+        self.dataChanged.emit(
+            index,
+            index,
+            [
+                self.TextRole,
+                self.LinkedSubtabCompletionRole,
+                self.LinkedSubtabActiveActionRole,
+                self.HasLinkedSubtabRole,
+            ],
+        )
 
     @Slot(str, result="QVariantList")
     def getItemTextTabs(self, item_id: str) -> List[Dict[str, str]]:
@@ -645,74 +1181,72 @@ class DiagramModel(
 
     @Slot(str, int)
     def setItemTextTabIndex(self, item_id: str, tab_index: int) -> None:
-        for row, item in enumerate(self._items):
-            if item.id != item_id:
-                continue
-            next_index = self._clamp_tab_index(tab_index, normalize_editor_tabs(item.text_tabs, fallback_text=item.text))
-            if item.text_tab_index == next_index:
-                return
-            item.text_tab_index = next_index
-            index = self.index(row, 0)
-            self.dataChanged.emit(index, index, [self.TextTabIndexRole, self.TextTabsRole, self.TextRole])
-            self.itemsChanged.emit()
+        row = self._id_to_row.get(item_id)
+        if row is None:
             return
+        item = self._items[row]
+        next_index = self._clamp_tab_index(tab_index, normalize_editor_tabs(item.text_tabs, fallback_text=item.text))
+        if item.text_tab_index == next_index:
+            return
+        item.text_tab_index = next_index
+        index = self.index(row, 0)
+        self.dataChanged.emit(index, index, [self.TextTabIndexRole, self.TextTabsRole, self.TextRole])
 
     @Slot(str, str)
     def setItemMarkdown(self, item_id: str, markdown: str) -> None:
-        for row, item in enumerate(self._items):
-            if item.id == item_id:
-                if item.item_type == DiagramItemType.NOTE:
-                    if item.text == markdown and item.note_markdown == "":
-                        return
-                    # Notes now store canonical content directly in text.
-                    item.text = markdown
-                    item.note_markdown = ""
-                    item.note_tabs = normalize_editor_tabs(item.note_tabs, fallback_text=markdown)
-                    item.note_tabs[0]["text"] = markdown
-                    index = self.index(row, 0)
-                    self.dataChanged.emit(index, index, [self.TextRole, self.NoteMarkdownRole])
-                    self.itemsChanged.emit()
-                    return
-                if item.note_markdown == markdown:
-                    return
-                item.note_markdown = markdown
-                item.note_tabs = normalize_editor_tabs(item.note_tabs, fallback_text=markdown)
-                item.note_tabs[0]["text"] = markdown
-                index = self.index(row, 0)
-                self.dataChanged.emit(index, index, [self.NoteMarkdownRole])
-                self.itemsChanged.emit()
+        row = self._id_to_row.get(item_id)
+        if row is None:
+            return
+        item = self._items[row]
+        if item.item_type == DiagramItemType.NOTE:
+            if item.text == markdown and item.note_markdown == "":
                 return
+            # Notes now store canonical content directly in text.
+            item.text = markdown
+            item.note_markdown = ""
+            item.note_tabs = normalize_editor_tabs(item.note_tabs, fallback_text=markdown)
+            item.note_tabs[0]["text"] = markdown
+            index = self.index(row, 0)
+            self.dataChanged.emit(index, index, [self.TextRole, self.NoteMarkdownRole])
+            return
+        if item.note_markdown == markdown:
+            return
+        item.note_markdown = markdown
+        item.note_tabs = normalize_editor_tabs(item.note_tabs, fallback_text=markdown)
+        item.note_tabs[0]["text"] = markdown
+        index = self.index(row, 0)
+        self.dataChanged.emit(index, index, [self.NoteMarkdownRole])
 
     @Slot(str, result=str)
     def getItemMarkdown(self, item_id: str) -> str:
-        for item in self._items:
-            if item.id == item_id:
-                if item.item_type == DiagramItemType.NOTE:
-                    return item.text
-                return item.note_markdown
-        return ""
+        item = self.getItem(item_id)
+        if item is None:
+            return ""
+        if item.item_type == DiagramItemType.NOTE:
+            return item.text
+        return item.note_markdown
 
     @Slot(str, str)
     def setItemObstacleMarkdown(self, item_id: str, markdown: str) -> None:
-        for row, item in enumerate(self._items):
-            if item.id == item_id:
-                normalized = markdown or ""
-                if item.obstacle_markdown == normalized:
-                    return
-                item.obstacle_markdown = normalized
-                item.obstacle_tabs = normalize_editor_tabs(item.obstacle_tabs, fallback_text=normalized)
-                item.obstacle_tabs[0]["text"] = normalized
-                index = self.index(row, 0)
-                self.dataChanged.emit(index, index, [self.ObstacleMarkdownRole])
-                self.itemsChanged.emit()
-                return
+        row = self._id_to_row.get(item_id)
+        if row is None:
+            return
+        item = self._items[row]
+        normalized = markdown or ""
+        if item.obstacle_markdown == normalized:
+            return
+        item.obstacle_markdown = normalized
+        item.obstacle_tabs = normalize_editor_tabs(item.obstacle_tabs, fallback_text=normalized)
+        item.obstacle_tabs[0]["text"] = normalized
+        index = self.index(row, 0)
+        self.dataChanged.emit(index, index, [self.ObstacleMarkdownRole])
 
     @Slot(str, result=str)
     def getItemObstacleMarkdown(self, item_id: str) -> str:
-        for item in self._items:
-            if item.id == item_id:
-                return item.obstacle_markdown
-        return ""
+        item = self.getItem(item_id)
+        if item is None:
+            return ""
+        return item.obstacle_markdown
 
     def _get_display_note_markdown(self, item: DiagramItem) -> str:
         if item.item_type == DiagramItemType.NOTE:
@@ -737,46 +1271,44 @@ class DiagramModel(
         return normalize_editor_tabs(item.note_tabs, fallback_text=fallback_text)
 
     def setEditorTabs(self, item_id: str, editor_type: str, tabs: List[Dict[str, str]]) -> None:
-        for row, item in enumerate(self._items):
-            if item.id != item_id:
-                continue
-
-            editor_key = str(editor_type or "").strip().lower()
-            roles: List[int] = []
-            if editor_key == "obstacle":
-                normalized = normalize_editor_tabs(tabs, fallback_text=item.obstacle_markdown)
-                item.obstacle_tabs = normalized
-                item.obstacle_markdown = normalized[0]["text"]
-                roles = [self.ObstacleMarkdownRole]
-            elif editor_key == "freetext":
-                normalized = normalize_editor_tabs(tabs, fallback_text=item.text)
-                item.text_tabs = normalized
+        row = self._id_to_row.get(item_id)
+        if row is None:
+            return
+        item = self._items[row]
+        editor_key = str(editor_type or "").strip().lower()
+        roles: List[int] = []
+        if editor_key == "obstacle":
+            normalized = normalize_editor_tabs(tabs, fallback_text=item.obstacle_markdown)
+            item.obstacle_tabs = normalized
+            item.obstacle_markdown = normalized[0]["text"]
+            roles = [self.ObstacleMarkdownRole]
+        elif editor_key == "freetext":
+            normalized = normalize_editor_tabs(tabs, fallback_text=item.text)
+            item.text_tabs = normalized
+            item.text = normalized[0]["text"]
+            item.text_tab_index = self._clamp_tab_index(item.text_tab_index, normalized)
+            roles = [
+                self.TextRole,
+                self.LinkedSubtabCompletionRole,
+                self.LinkedSubtabActiveActionRole,
+                self.HasLinkedSubtabRole,
+                self.TextTabsRole,
+                self.TextTabIndexRole,
+            ]
+        else:
+            fallback_text = item.text if item.item_type == DiagramItemType.NOTE else item.note_markdown
+            normalized = normalize_editor_tabs(tabs, fallback_text=fallback_text)
+            item.note_tabs = normalized
+            if item.item_type == DiagramItemType.NOTE:
                 item.text = normalized[0]["text"]
-                item.text_tab_index = self._clamp_tab_index(item.text_tab_index, normalized)
-                roles = [
-                    self.TextRole,
-                    self.LinkedSubtabCompletionRole,
-                    self.LinkedSubtabActiveActionRole,
-                    self.HasLinkedSubtabRole,
-                    self.TextTabsRole,
-                    self.TextTabIndexRole,
-                ]
+                item.note_markdown = ""
+                roles = [self.TextRole, self.NoteMarkdownRole]
             else:
-                fallback_text = item.text if item.item_type == DiagramItemType.NOTE else item.note_markdown
-                normalized = normalize_editor_tabs(tabs, fallback_text=fallback_text)
-                item.note_tabs = normalized
-                if item.item_type == DiagramItemType.NOTE:
-                    item.text = normalized[0]["text"]
-                    item.note_markdown = ""
-                    roles = [self.TextRole, self.NoteMarkdownRole]
-                else:
-                    item.note_markdown = normalized[0]["text"]
-                    roles = [self.NoteMarkdownRole]
+                item.note_markdown = normalized[0]["text"]
+                roles = [self.NoteMarkdownRole]
 
-            index = self.index(row, 0)
-            self.dataChanged.emit(index, index, roles)
-            self.itemsChanged.emit()
-            return
+        index = self.index(row, 0)
+        self.dataChanged.emit(index, index, roles)
 
     @Slot(str, result=bool)
     def openChatGpt(self, item_id: str) -> bool:
@@ -795,23 +1327,23 @@ class DiagramModel(
     def setFolderPath(self, item_id: str, path: str) -> None:
         """Set the folder path for a diagram item."""
         path = self._normalize_local_path(path)
-        for row, item in enumerate(self._items):
-            if item.id == item_id:
-                if item.folder_path == path:
-                    return
-                item.folder_path = path
-                index = self.index(row, 0)
-                self.dataChanged.emit(index, index, [self.FolderPathRole])
-                self.itemsChanged.emit()
-                return
+        row = self._id_to_row.get(item_id)
+        if row is None:
+            return
+        item = self._items[row]
+        if item.folder_path == path:
+            return
+        item.folder_path = path
+        index = self.index(row, 0)
+        self.dataChanged.emit(index, index, [self.FolderPathRole])
 
     @Slot(str, result=str)
     def getFolderPath(self, item_id: str) -> str:
         """Get the folder path for a diagram item."""
-        for item in self._items:
-            if item.id == item_id:
-                return item.folder_path
-        return ""
+        item = self.getItem(item_id)
+        if item is None:
+            return ""
+        return item.folder_path
 
     @Slot(str, result=bool)
     def openFolder(self, item_id: str) -> bool:
@@ -870,61 +1402,57 @@ class DiagramModel(
             return
         if self._renaming_in_progress:
             return
-        for row, item in enumerate(self._items):
-            if item.id == item_id:
-                if item.text == new_text:
-                    return
-                item.text = new_text
-                index = self.index(row, 0)
-                self.dataChanged.emit(index, index, [self.TextRole])
-                self.itemsChanged.emit()
-                # Sync to task model if this is a task item
-                if item.task_index >= 0 and self._task_model is not None:
-                    self._renaming_in_progress = True
-                    try:
-                        self._task_model.renameTask(item.task_index, new_text)
-                    finally:
-                        self._renaming_in_progress = False
-                return
+        row = self._id_to_row.get(item_id)
+        if row is None:
+            return
+        item = self._items[row]
+        if item.text == new_text:
+            return
+        item.text = new_text
+        index = self.index(row, 0)
+        self.dataChanged.emit(index, index, [self.TextRole])
+        # Sync to task model if this is a task item
+        if item.task_index >= 0 and self._task_model is not None:
+            self._renaming_in_progress = True
+            try:
+                self._task_model.renameTask(item.task_index, new_text)
+            finally:
+                self._renaming_in_progress = False
 
     @Slot(int, str)
     def onTaskRenamed(self, task_index: int, new_title: str) -> None:
         """Handle task rename from the task list - update diagram items."""
         if self._renaming_in_progress:
             return
-        for row, item in enumerate(self._items):
-            if item.task_index == task_index:
-                if item.text == new_title:
-                    continue
-                item.text = new_title
-                index = self.index(row, 0)
-                self.dataChanged.emit(index, index, [self.TextRole])
-        self.itemsChanged.emit()
+        changed_rows: List[int] = []
+        for row in self._task_index_to_rows.get(task_index, ()):
+            item = self._items[row]
+            if item.text == new_title:
+                continue
+            item.text = new_title
+            changed_rows.append(row)
+        self._emit_rows_changed(changed_rows, [self.TextRole])
 
     @Slot(int, bool)
     def onTaskCompletionChanged(self, task_index: int, completed: bool) -> None:
         """Handle task completion updates from the task list."""
-        for row, item in enumerate(self._items):
-            if item.task_index == task_index:
-                index = self.index(row, 0)
-                self.dataChanged.emit(index, index, [self.TaskCompletedRole])
+        self._emit_task_rows_changed(task_index, [self.TaskCompletedRole])
         if completed and task_index == self._current_task_index:
             self._advanceCurrentTaskFromOutgoingEdges(task_index)
 
     def _advanceCurrentTaskFromOutgoingEdges(self, completed_task_index: int) -> None:
         """Advance current task to a unique incomplete outgoing task, else clear it."""
-        source_ids = {
-            item.id
-            for item in self._items
-            if item.task_index == completed_task_index
-        }
+        source_ids = [
+            self._items[row].id
+            for row in self._task_index_to_rows.get(completed_task_index, ())
+        ]
         candidate_task_indices: set[int] = set()
-        if source_ids:
-            task_by_item_id = {item.id: item.task_index for item in self._items if item.task_index >= 0}
-            for edge in self._edges:
-                if edge.from_id not in source_ids:
+        for source_id in source_ids:
+            for edge in self._edges_by_endpoint.get(source_id, ()):
+                if edge.from_id != source_id:
                     continue
-                to_task_index = task_by_item_id.get(edge.to_id, -1)
+                target = self.getItem(edge.to_id)
+                to_task_index = target.task_index if target is not None else -1
                 if to_task_index < 0:
                     continue
                 if self._is_task_completed(to_task_index):
@@ -941,48 +1469,36 @@ class DiagramModel(
 
         self._current_task_index = new_current_task_index
         self.currentTaskChanged.emit()
-        for row, item in enumerate(self._items):
-            if item.task_index == old_current_task_index or item.task_index == new_current_task_index:
-                index = self.index(row, 0)
-                self.dataChanged.emit(index, index, [self.TaskCurrentRole])
+        self._emit_current_task_rows_changed(old_current_task_index, new_current_task_index)
 
     @Slot(int)
     def onTaskCountdownChanged(self, task_index: int) -> None:
         """Handle countdown timer updates from the task list."""
-        for row, item in enumerate(self._items):
-            if item.task_index == task_index:
-                index = self.index(row, 0)
-                self.dataChanged.emit(index, index, [
-                    self.TaskCountdownRemainingRole,
-                    self.TaskCountdownProgressRole,
-                    self.TaskCountdownExpiredRole,
-                    self.TaskCountdownActiveRole
-                ])
+        self._emit_task_rows_changed(task_index, [
+            self.TaskCountdownRemainingRole,
+            self.TaskCountdownProgressRole,
+            self.TaskCountdownExpiredRole,
+            self.TaskCountdownActiveRole
+        ])
 
     @Slot(int)
     def onTaskReminderChanged(self, task_index: int) -> None:
         """Handle reminder updates from the task list."""
-        for row, item in enumerate(self._items):
-            if item.task_index == task_index:
-                index = self.index(row, 0)
-                self.dataChanged.emit(index, index, [
-                    self.TaskReminderActiveRole,
-                    self.TaskReminderAtRole,
-                ])
+        self._emit_task_rows_changed(task_index, [
+            self.TaskReminderActiveRole,
+            self.TaskReminderAtRole,
+        ])
 
     @Slot(int)
     def onTaskContractChanged(self, task_index: int) -> None:
         """Handle contract updates from the task list."""
-        for row, item in enumerate(self._items):
-            if item.task_index == task_index:
-                index = self.index(row, 0)
-                self.dataChanged.emit(index, index, [
-                    self.TaskContractActiveRole,
-                    self.TaskContractDeadlineRole,
-                    self.TaskContractRemainingRole,
-                    self.TaskContractBreachedRole,
-                    self.TaskContractPunishmentRole,
-                ])
+        self._emit_task_rows_changed(task_index, [
+            self.TaskContractActiveRole,
+            self.TaskContractDeadlineRole,
+            self.TaskContractRemainingRole,
+            self.TaskContractBreachedRole,
+            self.TaskContractPunishmentRole,
+        ])
 
     def _isTaskReminderActive(self, task_index: int) -> bool:
         """Return True if task has an active reminder."""
@@ -1149,188 +1665,179 @@ class DiagramModel(
         if not preset:
             return
 
-        for row, item in enumerate(self._items):
-            if item.id == item_id:
-                new_type = preset["type"]
-                # Skip if already the same type
-                if item.item_type == new_type:
-                    return
-
-                # Update item properties
-                item.item_type = new_type
-                item.color = str(preset["color"])
-                item.text_color = str(preset["text_color"])
-
-                # Clear task association if converting away from task
-                had_task = item.task_index >= 0
-                if had_task:
-                    removed_task_index = item.task_index
-                    old_current_index = self._current_task_index
-                    if (
-                        self._task_model is not None
-                        and 0 <= removed_task_index < self._task_model.rowCount()
-                    ):
-                        # Find item that was current task BEFORE decrementing indices
-                        old_current_item_row = None
-                        if old_current_index >= 0 and old_current_index != removed_task_index:
-                            for idx, other_item in enumerate(self._items):
-                                if other_item.task_index == old_current_index:
-                                    old_current_item_row = idx
-                                    break
-
-                        self._task_model.removeAt(removed_task_index)
-                        for idx, other_item in enumerate(self._items):
-                            if other_item.task_index > removed_task_index:
-                                other_item.task_index -= 1
-                                other_index = self.index(idx, 0)
-                                self.dataChanged.emit(other_index, other_index, [self.TaskIndexRole])
-                        if old_current_index == removed_task_index:
-                            self._current_task_index = -1
-                        elif old_current_index > removed_task_index:
-                            self._current_task_index = old_current_index - 1
-                        if self._current_task_index != old_current_index:
-                            self.currentTaskChanged.emit()
-                            # Emit TaskCurrentRole for the item that was the current task
-                            if old_current_item_row is not None:
-                                other_index = self.index(old_current_item_row, 0)
-                                self.dataChanged.emit(other_index, other_index, [self.TaskCurrentRole])
-                            # Emit for the new current task item if there is one
-                            if self._current_task_index >= 0:
-                                for idx, other_item in enumerate(self._items):
-                                    if other_item.task_index == self._current_task_index:
-                                        other_index = self.index(idx, 0)
-                                        self.dataChanged.emit(other_index, other_index, [self.TaskCurrentRole])
-                                        break
-                    item.task_index = -1
-
-                index = self.index(row, 0)
-                roles = [
-                    self.TypeRole,
-                    self.ColorRole,
-                    self.TextColorRole,
-                    self.TaskIndexRole,
-                ]
-                if had_task:
-                    roles.append(self.TaskCurrentRole)
-                self.dataChanged.emit(
-                    index,
-                    index,
-                    roles,
-                )
-                self.itemsChanged.emit()
-                return
+        row = self._id_to_row.get(item_id)
+        if row is None:
+            return
+        item = self._items[row]
+        new_type = preset["type"]
+        # Skip if already the same type
+        if item.item_type == new_type:
+            return
+
+        # Update item properties
+        item.item_type = new_type
+        item.color = str(preset["color"])
+        item.text_color = str(preset["text_color"])
+
+        # Clear task association if converting away from task
+        had_task = item.task_index >= 0
+        if had_task:
+            removed_task_index = item.task_index
+            old_current_index = self._current_task_index
+            if (
+                self._task_model is not None
+                and 0 <= removed_task_index < self._task_model.rowCount()
+            ):
+                # Find item that was current task BEFORE decrementing indices
+                old_current_item_row = None
+                if old_current_index >= 0 and old_current_index != removed_task_index:
+                    current_rows = self._task_index_to_rows.get(old_current_index)
+                    if current_rows:
+                        old_current_item_row = current_rows[0]
+
+                self._task_model.removeAt(removed_task_index)
+                shifted_rows = self._shift_task_indices_after(removed_task_index)
+                self._emit_rows_changed(shifted_rows, [self.TaskIndexRole])
+                if old_current_index == removed_task_index:
+                    self._current_task_index = -1
+                elif old_current_index > removed_task_index:
+                    self._current_task_index = old_current_index - 1
+                if self._current_task_index != old_current_index:
+                    self.currentTaskChanged.emit()
+                    # Emit TaskCurrentRole for the item that was the current task
+                    if old_current_item_row is not None:
+                        other_index = self.index(old_current_item_row, 0)
+                        self.dataChanged.emit(other_index, other_index, [self.TaskCurrentRole])
+                    # Emit for the new current task item if there is one
+                    new_current_rows = self._task_index_to_rows.get(self._current_task_index)
+                    if new_current_rows:
+                        other_index = self.index(new_current_rows[0], 0)
+                        self.dataChanged.emit(other_index, other_index, [self.TaskCurrentRole])
+            self._unlink_task_row(row, item.task_index)
+            item.task_index = -1
+
+        index = self.index(row, 0)
+        roles = [
+            self.TypeRole,
+            self.ColorRole,
+            self.TextColorRole,
+            self.TaskIndexRole,
+        ]
+        if had_task:
+            roles.append(self.TaskCurrentRole)
+        self.dataChanged.emit(
+            index,
+            index,
+            roles,
+        )
 
     def _convertToTask(self, item_id: str) -> None:
         """Convert an item to a task, creating an entry in the task list."""
         if not self._task_model:
             return
 
-        for row, item in enumerate(self._items):
-            if item.id == item_id:
-                # Skip if already a task
-                if item.item_type == DiagramItemType.TASK:
-                    return
-
-                # Use existing text or default
-                text = item.text.strip() if item.text else "Task"
-
-                # Add to the task model, ensuring we get the inserted index
-                add_task_with_parent = getattr(self._task_model, "addTaskWithParent", None)
-                if callable(add_task_with_parent):
-                    new_index = add_task_with_parent(text, -1)
-                    if new_index < 0:
-                        return
-                else:
-                    task_count_before = self._task_model.rowCount()
-                    self._task_model.addTask(text, -1)
-                    task_count_after = self._task_model.rowCount()
-                    if task_count_after == task_count_before:
-                        return
-                    new_index = task_count_after - 1
-
-                # Update item properties
-                item.item_type = DiagramItemType.TASK
-                item.task_index = new_index
-                item.color = "#82c3a5"
-                item.text_color = "#1b2028"
-                if not item.text.strip():
-                    item.text = text
-
-                index = self.index(row, 0)
-                self.dataChanged.emit(
-                    index,
-                    index,
-                    [
-                        self.TypeRole,
-                        self.TaskIndexRole,
-                        self.ColorRole,
-                        self.TextColorRole,
-                        self.TextRole,
-                    ],
-                )
-                self.itemsChanged.emit()
-                return
+        row = self._id_to_row.get(item_id)
+        if row is None:
+            return
+        item = self._items[row]
+        # Skip if already a task
+        if item.item_type == DiagramItemType.TASK:
+            return
+
+        # Use existing text or default
+        text = item.text.strip() if item.text else "Task"
+
+        new_index = self._add_top_level_task(text)
+        if new_index < 0:
+            return
+
+        # Update item properties
+        item.item_type = DiagramItemType.TASK
+        self._set_item_task_index(row, new_index)
+        item.color = "#82c3a5"
+        item.text_color = "#1b2028"
+        if not item.text.strip():
+            item.text = text
+
+        index = self.index(row, 0)
+        self.dataChanged.emit(index, index, self._TASK_DATA_ROLES)
 
     @Slot(str, float, float)
     def resizeItem(self, item_id: str, width: float, height: float) -> None:
-        new_width = max(40.0, width)
-        new_height = max(30.0, height)
-        for row, item in enumerate(self._items):
-            if item.id == item_id:
-                if item.width == new_width and item.height == new_height:
-                    return
-                item.width = new_width
-                item.height = new_height
-                index = self.index(row, 0)
-                self.dataChanged.emit(index, index, [self.WidthRole, self.HeightRole])
-                self.itemsChanged.emit()
-                return
+        new_width = max(40.0, float(round(width)))
+        new_height = max(30.0, float(round(height)))
+        row = self._id_to_row.get(item_id)
+        if row is None:
+            return
+        item = self._items[row]
+        if item.width == new_width and item.height == new_height:
+            return
+        item.width = new_width
+        item.height = new_height
+        self._update_bbox_for_change(item)
+        self._hit_grid = None
+        self._rebucket_item_edges(item_id)
+        index = self.index(row, 0)
+        self.dataChanged.emit(index, index, [self.WidthRole, self.HeightRole])
+        self._emit_changed("itemsChanged")
+        self._emit_changed("geometryChanged")
 
     @Slot(str, str)
     def addEdge(self, from_id: str, to_id: str) -> None:
-        if from_id == to_id:
+        if from_id == to_id or (from_id, to_id) in self._edges_by_pair:
             return
-        for edge in self._edges:
-            if edge.from_id == from_id and edge.to_id == to_id:
-                return
-        edge_id = f"edge_{len(self._edges)}"
-        self._edges.append(DiagramEdge(edge_id, from_id, to_id))
-        self.edgesChanged.emit()
+        self._append_edge(DiagramEdge(self._next_edge_id(), from_id, to_id))
+        self._emit_changed("edgesChanged")
+
+    def addEdges(self, pairs: List[Tuple[str, str]]) -> None:
+        """Add several edges and emit edgesChanged at most once.
+
+        Pairs naming an unknown item, a self-loop or an existing edge are skipped.
+        """
+        id_to_row = self._id_to_row
+        added = False
+        for from_id, to_id in pairs:
+            if (
+                from_id == to_id
+                or from_id not in id_to_row
+                or to_id not in id_to_row
+                or (from_id, to_id) in self._edges_by_pair
+            ):
+                continue
+            self._append_edge(DiagramEdge(self._next_edge_id(), from_id, to_id))
+            added = True
+        if added:
+            self._emit_changed("edgesChanged")
 
     def _find_edge(self, edge_id: str) -> Optional[DiagramEdge]:
-        for edge in self._edges:
-            if edge.id == edge_id:
-                return edge
-        return None
+        return self._edges_by_id.get(edge_id)
 
     @Slot(str)
     def removeEdge(self, edge_id: str) -> None:
         """Remove an edge by its ID."""
-        for idx, edge in enumerate(self._edges):
-            if edge.id == edge_id:
-                self._edges.pop(idx)
-                self.edgesChanged.emit()
-                return
+        edge = self._edges_by_id.get(edge_id)
+        if edge is None:
+            return
+        self._pop_edge(edge)
+        self.edgesChanged.emit()
 
     @Slot(str, str)
     def removeEdgeBetween(self, from_id: str, to_id: str) -> None:
         """Remove an edge between two items."""
-        for idx, edge in enumerate(self._edges):
-            if edge.from_id == from_id and edge.to_id == to_id:
-                self._edges.pop(idx)
-                self.edgesChanged.emit()
-                return
+        edge = self._edges_by_pair.get((from_id, to_id))
+        if edge is None:
+            return
+        self._pop_edge(edge)
+        self.edgesChanged.emit()
 
     @Slot(str, str)
     def setEdgeDescription(self, edge_id: str, description: str) -> None:
         """Set description text for an edge."""
-        for edge in self._edges:
-            if edge.id == edge_id:
-                if edge.description == description:
-                    return
-                edge.description = description
-                self.edgesChanged.emit()
-                return
+        edge = self._edges_by_id.get(edge_id)
+        if edge is None or edge.description == description:
+            return
+        edge.description = description
+        self.edgesChanged.emit()
 
     @Slot(str, result=str)
     def getEdgeDescription(self, edge_id: str) -> str:
@@ -1360,19 +1867,34 @@ class DiagramModel(
         return math.hypot(px - proj_x, py - proj_y)
 
     def _find_edge_at_position(self, x: float, y: float, excluded_item_id: str = "", threshold: float = 8.0) -> str:
-        for edge in reversed(self._edges):
+        """Return the topmost edge within ``threshold`` of a point, or an empty string.
+
+        Only edges bucketed in the grid cells around the point are measured.
+        Edges attached to ``excluded_item_id`` are ignored.
+        """
+        grid = self._edge_hit_grid
+        if grid is None:
+            grid = self._edge_hit_grid = self._build_edge_hit_grid()
+        if not (math.isfinite(x) and math.isfinite(y) and math.isfinite(threshold)):
+            return ""
+        cell = HIT_GRID_CELL_SIZE
+        entries: Set[EdgeHitEntry] = set()
+        for col in range(math.floor((x - threshold) / cell), math.floor((x + threshold) / cell) + 1):
+            for grid_row in range(math.floor((y - threshold) / cell), math.floor((y + threshold) / cell) + 1):
+                entries.update(grid.get((col, grid_row), ()))
+        for index, from_x, from_y, to_x, to_y in sorted(entries, reverse=True):
+            edge = self._edges[index]
             if excluded_item_id and (edge.from_id == excluded_item_id or edge.to_id == excluded_item_id):
                 continue
-            from_item = self.getItem(edge.from_id)
-            to_item = self.getItem(edge.to_id)
-            if from_item is None or to_item is None:
-                continue
-            from_x, from_y = self._item_center(from_item)
-            to_x, to_y = self._item_center(to_item)
             if self._distance_to_segment(x, y, from_x, from_y, to_x, to_y) <= threshold:
                 return edge.id
         return ""
 
+    @Slot(float, float, result=str)
+    def getEdgeAt(self, x: float, y: float) -> str:
+        """Return the topmost edge within 8px of a point, or an empty string."""
+        return self._find_edge_at_position(x, y)
+
     def _set_drag_insert_edge_id(self, edge_id: str) -> None:
         if self._drag_insert_edge_id == edge_id:
             return
@@ -1471,14 +1993,7 @@ class DiagramModel(
         description = edge.description
         self.removeEdge(edge_id)
 
-        filtered_edges = [
-            existing_edge
-            for existing_edge in self._edges
-            if existing_edge.from_id != item_id and existing_edge.to_id != item_id
-        ]
-        edges_removed = len(filtered_edges) != len(self._edges)
-        if edges_removed:
-            self._edges = filtered_edges
+        if self._pop_edges_touching(item_id):
             self.edgesChanged.emit()
 
         self.addEdge(from_id, item_id)
@@ -1496,32 +2011,33 @@ class DiagramModel(
     def removeItem(self, item_id: str) -> None:
         # Remove edges touching the item
         removed_task_index = -1
-        filtered = [edge for edge in self._edges if edge.from_id != item_id and edge.to_id != item_id]
-        if len(filtered) != len(self._edges):
-            self._edges = filtered
-            self.edgesChanged.emit()
+        if self._pop_edges_touching(item_id):
+            self._emit_changed("edgesChanged")
 
         removed = False
-        for row, item in enumerate(self._items):
-            if item.id == item_id:
-                removed_task_index = item.task_index
-                self.beginRemoveRows(QModelIndex(), row, row)
-                self._items.pop(row)
-                self.endRemoveRows()
-                self.itemsChanged.emit()
-                removed = True
-                break
+        row = self._id_to_row.get(item_id)
+        if row is not None:
+            removed_item = self._items[row]
+            removed_task_index = removed_item.task_index
+            self.beginRemoveRows(QModelIndex(), row, row)
+            self._items.pop(row)
+            if removed_item.id in self._bbox_owners:
+                self._bbox_dirty = True
+            self._remove_row_from_maps(row, removed_item)
+            self._hit_grid = None
+            self._edge_hit_grid = None
+            self.endRemoveRows()
+            self._emit_changed("itemsChanged")
+            self._emit_changed("geometryChanged")
+            removed = True
 
         # If the removed item was a task, also remove from TaskModel
         if removed_task_index >= 0 and self._task_model is not None:
             self._task_model.removeAt(removed_task_index)
             # Update task indices for all remaining items that referenced tasks after the deleted one
-            for row, item in enumerate(self._items):
-                if item.task_index > removed_task_index:
-                    item.task_index -= 1
-                    # Notify UI that this item's task reference changed
-                    idx = self.index(row, 0)
-                    self.dataChanged.emit(idx, idx, [self.TaskIndexRole])
+            shifted_rows = self._shift_task_indices_after(removed_task_index)
+            # Notify UI that these items' task references changed
+            self._emit_rows_changed(shifted_rows, [self.TaskIndexRole])
 
         if removed and self._edge_source_id == item_id:
             self._reset_edge_state()
@@ -1543,16 +2059,23 @@ class DiagramModel(
     def updateEdgeDragPosition(self, x: float, y: float) -> None:
         if not self._edge_source_id:
             return
-        self._edge_drag_x = x
-        self._edge_drag_y = y
-        self._is_dragging_edge = True
         # Find hover target with enlarged margin (20px) for easier drops
         hover_id = self.getItemAtWithMargin(x, y, 20.0) or ""
         # Don't hover on source item
         if hover_id == self._edge_source_id:
             hover_id = ""
+        if (
+            self._is_dragging_edge
+            and x == self._edge_drag_x
+            and y == self._edge_drag_y
+            and hover_id == self._edge_hover_target_id
+        ):
+            return
+        self._edge_drag_x = x
+        self._edge_drag_y = y
+        self._is_dragging_edge = True
         self._edge_hover_target_id = hover_id
-        self.itemsChanged.emit()
+        self._emit_changed("itemsChanged")
 
     @Slot(str, float, float)
     def updateDraggedTaskInsertTarget(self, item_id: str, x: float, y: float) -> None:
@@ -1577,36 +2100,37 @@ class DiagramModel(
     def cancelEdgeDrawing(self) -> None:
         self._reset_edge_state()
 
+    def _add_top_level_task(self, text: str) -> int:
+        """Add a top-level task to the task model and return its row, or -1 if none was added."""
+        add_task_with_parent = getattr(self._task_model, "addTaskWithParent", None)
+        if callable(add_task_with_parent):
+            return add_task_with_parent(text, -1)
+        task_count_before = self._task_model.rowCount()
+        self._task_model.addTask(text, -1)
+        task_count_after = self._task_model.rowCount()
+        if task_count_after == task_count_before:
+            return -1
+        return task_count_after - 1
+
     @Slot(str, str)
     def createTaskFromText(self, text: str, item_id: str) -> None:
         if not self._task_model:
             return
-        self._task_model.addTask(text, -1)
-        task_count = self._task_model.rowCount()
-        if task_count == 0:
+        # Resolve the item first so an unknown id does not leave an orphan task.
+        row = self._id_to_row.get(item_id)
+        if row is None:
             return
-        new_index = task_count - 1
-        for row, item in enumerate(self._items):
-            if item.id == item_id:
-                item.task_index = new_index
-                item.item_type = DiagramItemType.TASK
-                item.color = "#82c3a5"
-                item.text = text
-                item.text_color = "#1b2028"
-                index = self.index(row, 0)
-                self.dataChanged.emit(
-                    index,
-                    index,
-                    [
-                        self.TaskIndexRole,
-                        self.TypeRole,
-                        self.ColorRole,
-                        self.TextRole,
-                        self.TextColorRole,
-                    ],
-                )
-                self.itemsChanged.emit()
-                break
+        new_index = self._add_top_level_task(text)
+        if new_index < 0:
+            return
+        item = self._items[row]
+        self._set_item_task_index(row, new_index)
+        item.item_type = DiagramItemType.TASK
+        item.color = "#82c3a5"
+        item.text = text
+        item.text_color = "#1b2028"
+        index = self.index(row, 0)
+        self.dataChanged.emit(index, index, self._TASK_DATA_ROLES)
 
     @Slot(str, float, float, result=str)
     def addTaskFromText(self, text: str, x: float, y: float) -> str:
@@ -1616,13 +2140,10 @@ class DiagramModel(
             return ""
 
         # Add to the task model first
-        self._task_model.addTask(text, -1)
-        task_count = self._task_model.rowCount()
-        if task_count == 0:
+        new_index = self._add_top_level_task(text)
+        if new_index < 0:
             return ""
 
-        new_index = task_count - 1
-
         # Create diagram item for the task
         item_id = self._next_id("task")
         item = DiagramItem(
@@ -1666,8 +2187,9 @@ class DiagramModel(
             return
 
         # Collect incoming and outgoing edges before removing the item
-        incoming_edges = [(e.from_id, e.description) for e in self._edges if e.to_id == item_id]
-        outgoing_edges = [(e.to_id, e.description) for e in self._edges if e.from_id == item_id]
+        incident = self._edges_by_endpoint.get(item_id, [])
+        incoming_edges = [(e.from_id, e.description) for e in incident if e.to_id == item_id]
+        outgoing_edges = [(e.to_id, e.description) for e in incident if e.from_id == item_id]
 
         spacing = 40.0
         base_width = item.width
@@ -1701,20 +2223,18 @@ class DiagramModel(
             self.addEdge(from_id, first_new_id)
             if description:
                 # Find the newly added edge and set its description
-                for edge in self._edges:
-                    if edge.from_id == from_id and edge.to_id == first_new_id:
-                        edge.description = description
-                        break
+                edge = self._edges_by_pair.get((from_id, first_new_id))
+                if edge is not None:
+                    edge.description = description
 
         # Reconnect outgoing edges from the last new node
         last_new_id = new_ids[-1]
         for to_id, description in outgoing_edges:
             self.addEdge(last_new_id, to_id)
             if description:
-                for edge in self._edges:
-                    if edge.from_id == last_new_id and edge.to_id == to_id:
-                        edge.description = description
-                        break
+                edge = self._edges_by_pair.get((last_new_id, to_id))
+                if edge is not None:
+                    edge.description = description
 
         # Remove the original item (this also removes its edges)
         self.removeItem(item_id)
@@ -1732,17 +2252,14 @@ class DiagramModel(
     def setCurrentTask(self, task_index: int) -> None:
         """Set the current (focused) task, clearing any previous."""
         old_index = self._current_task_index
-        # Toggle off if same task
-        if task_index == old_index:
-            self._current_task_index = -1
-        else:
-            self._current_task_index = task_index
+        # Toggle off if same task; any negative index clears the selection.
+        new_index = -1 if task_index < 0 or task_index == old_index else task_index
+        if new_index == old_index:
+            return
+        self._current_task_index = new_index
         self.currentTaskChanged.emit()
-        # Notify all task items that their current state may have changed
-        for row, item in enumerate(self._items):
-            if item.task_index >= 0 and (item.task_index == old_index or item.task_index == self._current_task_index):
-                index = self.index(row, 0)
-                self.dataChanged.emit(index, index, [self.TaskCurrentRole])
+        # Notify the task items whose current state changed
+        self._emit_current_task_rows_changed(old_index, self._current_task_index)
 
     @Slot(int)
     def focusTask(self, task_index: int) -> None:
@@ -1756,11 +2273,7 @@ class DiagramModel(
             return
         self._current_task_index = task_index
         self.currentTaskChanged.emit()
-
-        for row, item in enumerate(self._items):
-            if item.task_index >= 0 and (item.task_index == old_index or item.task_index == self._current_task_index):
-                index = self.index(row, 0)
-                self.dataChanged.emit(index, index, [self.TaskCurrentRole])
+        self._emit_current_task_rows_changed(old_index, self._current_task_index)
 
     @Property(int, notify=currentTaskChanged)
     def currentTaskIndex(self) -> int:
@@ -1770,49 +2283,62 @@ class DiagramModel(
     @Slot(result="QVariant")
     def getCurrentTaskPosition(self) -> Optional[Dict[str, float]]:
         """Return the position of the current task item, or None if no current task."""
-        if self._current_task_index < 0:
+        rows = self._task_index_to_rows.get(self._current_task_index)
+        if not rows:
             return None
-        for item in self._items:
-            if item.task_index == self._current_task_index:
-                return {
-                    "x": item.x,
-                    "y": item.y,
-                    "width": item.width,
-                    "height": item.height,
-                }
-        return None
+        item = self._items[rows[0]]
+        return {
+            "x": item.x,
+            "y": item.y,
+            "width": item.width,
+            "height": item.height,
+        }
 
     # --- Utilities ----------------------------------------------------------
     def getItem(self, item_id: str) -> Optional[DiagramItem]:
-        for item in self._items:
-            if item.id == item_id:
-                return item
-        return None
+        row = self._id_to_row.get(item_id)
+        if row is None:
+            return None
+        return self._items[row]
 
     def _is_task_completed(self, task_index: int) -> bool:
         if self._task_model is None:
             return False
+        # Read the task list directly rather than building a QModelIndex per lookup.
+        return bool(self._task_model.isTaskCompleted(task_index))
+
+    def _linkedTaskTitle(self, task_index: int) -> str:
+        if self._task_model is None:
+            return ""
         if task_index < 0 or task_index >= self._task_model.rowCount():
-            return False
+            return ""
         idx = self._task_model.index(task_index, 0)
-        return bool(self._task_model.data(idx, self._task_model.CompletedRole))
+        return str(self._task_model.data(idx, self._task_model.TitleRole) or "").strip()
 
-    def _findLinkedSubtab(self, task_index: int):
-        if self._tab_model is None or self._task_model is None:
+    def _linkedTabsByName(self) -> Optional[Dict[str, Any]]:
+        if self._tab_model is None:
             return None
-        if task_index < 0 or task_index >= self._task_model.rowCount():
+        tabs_by_name = self._linked_tabs_by_name
+        if tabs_by_name is None:
+            get_all_tabs = getattr(self._tab_model, "getAllTabs", None)
+            if not callable(get_all_tabs):
+                return None
+            tabs_by_name = {}
+            for tab in get_all_tabs():
+                tabs_by_name.setdefault(getattr(tab, "name", ""), tab)
+            self._linked_tabs_by_name = tabs_by_name
+        return tabs_by_name
+
+    def _findLinkedSubtab(self, task_index: int):
+        if self._tab_model is None:
             return None
-        idx = self._task_model.index(task_index, 0)
-        title = str(self._task_model.data(idx, self._task_model.TitleRole) or "").strip()
+        title = self._linkedTaskTitle(task_index)
         if not title:
             return None
-        get_all_tabs = getattr(self._tab_model, "getAllTabs", None)
-        if not callable(get_all_tabs):
+        tabs_by_name = self._linkedTabsByName()
+        if tabs_by_name is None:
             return None
-        for tab in get_all_tabs():
-            if getattr(tab, "name", "") == title:
-                return tab
-        return None
+        return tabs_by_name.get(title)
 
     def _calculateLinkedTabCompletion(self, tab) -> float:
         tasks_payload = getattr(tab, "tasks", {})
@@ -1825,16 +2351,27 @@ class DiagramModel(
                 completed += 1
         return (completed / len(tasks)) * 100.0
 
+    def _linkedTabValues(self, tab) -> Tuple[float, str]:
+        name = getattr(tab, "name", "")
+        values = self._linked_tab_values.get(name)
+        if values is None:
+            values = (self._calculateLinkedTabCompletion(tab), self._calculateLinkedTabActiveAction(tab))
+            self._linked_tab_values[name] = values
+        return values
+
     def _getLinkedSubtabCompletion(self, task_index: int) -> float:
         tab = self._findLinkedSubtab(task_index)
         if tab is None:
             return -1.0
-        return self._calculateLinkedTabCompletion(tab)
+        return self._linkedTabValues(tab)[0]
 
     def _getLinkedSubtabActiveAction(self, task_index: int) -> str:
         tab = self._findLinkedSubtab(task_index)
         if tab is None:
             return ""
+        return self._linkedTabValues(tab)[1]
+
+    def _calculateLinkedTabActiveAction(self, tab) -> str:
         diagram_payload = getattr(tab, "diagram", {})
         if not isinstance(diagram_payload, dict):
             return ""
@@ -1881,9 +2418,9 @@ class DiagramModel(
         }
 
     def getItemAt(self, x: float, y: float) -> Optional[str]:
-        for item in reversed(self._items):
-            if item.x <= x <= item.x + item.width and item.y <= y <= item.y + item.height:
-                return item.id
+        for row, left, top, right, bottom in reversed(self._hit_candidates(x, y, 0.0)):
+            if left <= x <= right and top <= y <= bottom:
+                return self._items[row].id
         return None
 
     def getItemAtWithMargin(self, x: float, y: float, margin: float) -> Optional[str]:
@@ -1897,10 +2434,10 @@ class DiagramModel(
         Returns:
             Item ID if found, None otherwise.
         """
-        for item in reversed(self._items):
-            if (item.x - margin <= x <= item.x + item.width + margin and
-                    item.y - margin <= y <= item.y + item.height + margin):
-                return item.id
+        for row, left, top, right, bottom in reversed(self._hit_candidates(x, y, margin)):
+            if (left - margin <= x <= right + margin and
+                    top - margin <= y <= bottom + margin):
+                return self._items[row].id
         return None
 
     def _item_center(self, item: DiagramItem) -> tuple[float, float]:
@@ -1984,14 +2521,15 @@ class DiagramModel(
     def connectAllItems(self) -> None:
         if len(self._items) < 2:
             return
-        ordered = sorted(self._items, key=lambda item: (item.y, item.x))
-        for idx in range(len(ordered) - 1):
-            self.addEdge(ordered[idx].id, ordered[idx + 1].id)
+        # attrgetter builds the (y, x) keys in C instead of calling a lambda per item.
+        ordered = sorted(self._items, key=attrgetter("y", "x"))
+        self.addEdges([(a.id, b.id) for a, b in zip(ordered, ordered[1:])])
 
     def _reset_edge_state(self) -> None:
         changed = (
             self._edge_source_id is not None
             or self._is_dragging_edge
+            or bool(self._edge_hover_target_id)
             or bool(self._drag_insert_edge_id)
         )
         self._edge_source_id = None
@@ -2001,7 +2539,7 @@ class DiagramModel(
         self._edge_hover_target_id = ""
         self._drag_insert_edge_id = ""
         if changed:
-            self.itemsChanged.emit()
+            self._emit_changed("itemsChanged")
 
     # --- Serialization ------------------------------------------------------
     def to_dict(self) -> Dict[str, Any]:
@@ -2011,14 +2549,16 @@ class DiagramModel(
             Dictionary containing all diagram item and edge data.
         """
         items_data = []
+        append_item = items_data.append
         for item in self._items:
             item_dict = {
                 "id": item.id,
                 "item_type": item.item_type.value,
-                "x": item.x,
-                "y": item.y,
-                "width": item.width,
-                "height": item.height,
+                # Non-finite geometry saves as the defaults from_dict loads.
+                "x": _finite_or(item.x, 0.0),
+                "y": _finite_or(item.y, 0.0),
+                "width": _finite_or(item.width, 120.0),
+                "height": _finite_or(item.height, 60.0),
                 "text": item.text,
                 "task_index": item.task_index,
                 "color": item.color,
@@ -2044,25 +2584,27 @@ class DiagramModel(
                 item_dict["text_tab_index"] = self._clamp_text_tab_index(item)
             if item.folder_path:
                 item_dict["folder_path"] = item.folder_path
-            items_data.append(item_dict)
+            append_item(item_dict)
 
-        edges_data = []
-        for edge in self._edges:
-            edges_data.append({
+        edges_data = [
+            {
                 "id": edge.id,
                 "from_id": edge.from_id,
                 "to_id": edge.to_id,
                 "description": edge.description,
-            })
+            }
+            for edge in self._edges
+        ]
 
-        strokes_data = []
-        for stroke in self._strokes:
-            strokes_data.append({
+        strokes_data = [
+            {
                 "id": stroke.id,
                 "color": stroke.color,
                 "width": stroke.width,
-                "points": [{"x": pt.x, "y": pt.y} for pt in stroke.points],
-            })
+                "points": self._stroke_points_data(stroke.coords),
+            }
+            for stroke in self._strokes
+        ]
 
         return {
             "items": items_data,
@@ -2071,6 +2613,13 @@ class DiagramModel(
             "current_task_index": self._current_task_index,
         }
 
+    @staticmethod
+    def _stroke_points_data(coords: array) -> List[Dict[str, float]]:
+        """Return flat stroke coordinates as the saved ``[{"x": ..., "y": ...}]`` list."""
+        # Pair up coordinates with one shared iterator instead of two slice copies.
+        values = iter(coords.tolist())
+        return [{"x": x, "y": y} for x, y in zip(values, values)]
+
     def from_dict(self, data: Dict[str, Any]) -> None:
         """Load diagram from a dictionary.
 
@@ -2078,15 +2627,20 @@ class DiagramModel(
             data: Dictionary containing diagram data (from to_dict).
         """
         # Set current task index up front so new items render with correct state.
+        previous_task_index = self._current_task_index
         self._current_task_index = int(data.get("current_task_index", -1))
 
         # Clear existing items, edges, and strokes
         if self._items:
             self.beginRemoveRows(QModelIndex(), 0, len(self._items) - 1)
             self._items.clear()
+            self._id_to_row.clear()
             self.endRemoveRows()
+        self._hit_grid = None
+        self._edge_hit_grid = None
         self._edges.clear()
         self._strokes.clear()
+        self._invalidate_strokes_cache()
         self._current_stroke = None
 
         # Track highest ID number to resume ID generation
@@ -2099,12 +2653,9 @@ class DiagramModel(
             for item_data in items_data:
                 item_id = item_data.get("id", "")
                 # Extract numeric part from item ID to track max
-                try:
-                    id_parts = item_id.rsplit("_", 1)
-                    if len(id_parts) == 2:
-                        max_id = max(max_id, int(id_parts[1]) + 1)
-                except (ValueError, IndexError):
-                    pass
+                next_id = _next_id_number(item_id)
+                if next_id > max_id:
+                    max_id = next_id
 
                 item_type_str = item_data.get("item_type", "box")
                 try:
@@ -2145,21 +2696,32 @@ class DiagramModel(
             # Batch insert all items at once
             self.beginInsertRows(QModelIndex(), 0, len(new_items) - 1)
             self._items.extend(new_items)
+            self._rebuild_id_rows()
+            self._bbox_dirty = True
             self.endInsertRows()
+        self._rebuild_task_index_rows()
 
         # Update ID source to avoid collisions
         self._id_source = count(max_id)
 
         # Load edges
+        max_edge_id = 0
         edges_data = data.get("edges", [])
         for edge_data in edges_data:
+            edge_id = edge_data.get("id", "")
+            # Track max edge ID
+            next_id = _next_id_number(edge_id)
+            if next_id > max_edge_id:
+                max_edge_id = next_id
             edge = DiagramEdge(
-                id=edge_data.get("id", ""),
+                id=edge_id,
                 from_id=edge_data.get("from_id", ""),
                 to_id=edge_data.get("to_id", ""),
                 description=edge_data.get("description", ""),
             )
             self._edges.append(edge)
+        self._reindex_edges()
+        self._edge_id_source = count(max_edge_id)
 
         # Load strokes
         self._strokes.clear()
@@ -2168,31 +2730,30 @@ class DiagramModel(
         for stroke_data in strokes_data:
             stroke_id = stroke_data.get("id", "")
             # Track max stroke ID
-            try:
-                id_parts = stroke_id.rsplit("_", 1)
-                if len(id_parts) == 2:
-                    max_stroke_id = max(max_stroke_id, int(id_parts[1]) + 1)
-            except (ValueError, IndexError):
-                pass
+            next_id = _next_id_number(stroke_id)
+            if next_id > max_stroke_id:
+                max_stroke_id = next_id
 
-            points = []
-            for pt_data in stroke_data.get("points", []):
-                points.append(DrawingPoint(
-                    x=float(pt_data.get("x", 0.0)),
-                    y=float(pt_data.get("y", 0.0)),
-                ))
+            coords = array("d", [
+                float(value)
+                for pt_data in stroke_data.get("points", [])
+                for value in (pt_data.get("x", 0.0), pt_data.get("y", 0.0))
+            ])
 
             stroke = DrawingStroke(
                 id=stroke_id,
-                points=points,
+                coords=coords,
                 color=stroke_data.get("color", "#ffffff"),
                 width=float(stroke_data.get("width", 3.0)),
             )
             self._strokes.append(stroke)
+        self._invalidate_strokes_cache()
 
         self._stroke_id_source = count(max_stroke_id)
 
         self.itemsChanged.emit()
+        self.geometryChanged.emit()
         self.edgesChanged.emit()
         self.drawingChanged.emit()
-        self.currentTaskChanged.emit()
+        if self._current_task_index != previous_task_index:
+            self.currentTaskChanged.emit()
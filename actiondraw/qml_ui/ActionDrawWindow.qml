@@ -1,6 +1,7 @@
 import QtQuick 2.15
 import QtQuick.Controls 2.15
 import QtQuick.Layouts 1.15
+import QtQuick.Shapes 1.15
 import "components"
 ApplicationWindow {
     id: root
@@ -49,8 +50,7 @@ ApplicationWindow {
         mcpServerController: mcpServerControllerRef
         edgeCanvas: edgeCanvas
         viewport: viewport
-        saveDialog: dialogs.saveDialog
-        loadDialog: dialogs.loadDialog
+        dialogHost: dialogs
         taskDialog: dialogs.taskDialog
         notificationSettingsDialog: dialogs.notificationSettingsDialog
     }
@@ -286,7 +286,7 @@ ApplicationWindow {
         if (projectManager.hasCurrentFile()) {
             return projectManager.saveCurrentProject()
         } else {
-            dialogs.saveDialog.open()
+            dialogs.openSaveProjectDialog()
             return false
         }
     }
@@ -521,8 +521,6 @@ ApplicationWindow {
 
         root.zoomLevel = clampZoom(0.95)
 
-        if (gridCanvas)
-            gridCanvas.requestPaint()
         if (edgeCanvas)
             edgeCanvas.requestPaint()
 
@@ -732,6 +730,19 @@ ApplicationWindow {
         onActivated: root.navigateConnectedItem("down")
     }
 
+    // Wheel and pinch zoom arrive many times per frame; repaint the edge
+    // canvas at most once per ~16 ms while a zoom gesture is running.
+    Timer {
+        id: zoomRepaintTimer
+        interval: 16
+        repeat: false
+        onTriggered: {
+            if (edgeCanvas)
+                edgeCanvas.requestPaint()
+            root.refreshCulledCanvases()
+        }
+    }
+
     Timer {
         id: overviewRefreshTimer
         interval: 1000
@@ -969,12 +980,12 @@ ApplicationWindow {
         openQuickTaskDialog(diagramCenterPoint())
     }
 
+    function clamp(value, low, high) {
+        return Math.min(Math.max(value, low), high)
+    }
+
     function clampZoom(value) {
-        if (value < root.minZoom)
-            return root.minZoom
-        if (value > root.maxZoom)
-            return root.maxZoom
-        return value
+        return clamp(value, root.minZoom, root.maxZoom)
     }
 
     function snapValue(value) {
@@ -1022,6 +1033,32 @@ ApplicationWindow {
         return Qt.point(vx, vy)
     }
 
+    function paddedViewRect() {
+        // The visible diagram area grown by one viewport on every side, so culled
+        // canvases can pan that far before they need repainting.
+        var w = viewport.width / root.zoomLevel
+        var h = viewport.height / root.zoomLevel
+        var topLeft = viewportPointToDiagram(0, 0)
+        return Qt.rect(topLeft.x - w, topLeft.y - h, w * 3, h * 3)
+    }
+
+    function viewEscapes(paintedRect) {
+        if (!paintedRect)
+            return true
+        var topLeft = viewportPointToDiagram(0, 0)
+        return topLeft.x < paintedRect.x
+            || topLeft.y < paintedRect.y
+            || topLeft.x + viewport.width / root.zoomLevel > paintedRect.x + paintedRect.width
+            || topLeft.y + viewport.height / root.zoomLevel > paintedRect.y + paintedRect.height
+    }
+
+    function refreshCulledCanvases() {
+        if (edgeCanvas && viewEscapes(edgeCanvas.paintedRect))
+            edgeCanvas.requestPaint()
+        if (drawingCanvas && viewEscapes(drawingCanvas.paintedRect))
+            drawingCanvas.repaintAll()
+    }
+
     function clearTabDragPreview() {
         root.tabDragActive = false
         root.tabDragInsideViewport = false
@@ -1207,12 +1244,10 @@ ApplicationWindow {
         var newContentY = (focusDiagramY + root.originOffsetY) * root.zoomLevel - fy
         var maxX = Math.max(0, viewport.contentWidth - viewport.width)
         var maxY = Math.max(0, viewport.contentHeight - viewport.height)
-        viewport.contentX = Math.min(Math.max(newContentX, 0), maxX)
-        viewport.contentY = Math.min(Math.max(newContentY, 0), maxY)
-        if (gridCanvas)
-            gridCanvas.requestPaint()
-        if (edgeCanvas)
-            edgeCanvas.requestPaint()
+        viewport.contentX = clamp(newContentX, 0, maxX)
+        viewport.contentY = clamp(newContentY, 0, maxY)
+        if (!zoomRepaintTimer.running)
+            zoomRepaintTimer.start()
     }
 
     function applyZoomFactor(factor, focusX, focusY) {
@@ -1228,8 +1263,8 @@ ApplicationWindow {
         var targetY = (y + root.originOffsetY) * root.zoomLevel - viewport.height / 2
         var maxX = Math.max(0, viewport.contentWidth - viewport.width)
         var maxY = Math.max(0, viewport.contentHeight - viewport.height)
-        viewport.contentX = Math.min(Math.max(targetX, 0), maxX)
-        viewport.contentY = Math.min(Math.max(targetY, 0), maxY)
+        viewport.contentX = clamp(targetX, 0, maxX)
+        viewport.contentY = clamp(targetY, 0, maxY)
     }
 
     function focusPointWithinDiagramBounds(x, y, padding) {
@@ -1246,19 +1281,19 @@ ApplicationWindow {
         if (maxLeft < minLeft)
             targetLeft = minLeft
         else
-            targetLeft = Math.min(Math.max(targetLeft, minLeft), maxLeft)
+            targetLeft = clamp(targetLeft, minLeft, maxLeft)
 
         if (maxTop < minTop)
             targetTop = minTop
         else
-            targetTop = Math.min(Math.max(targetTop, minTop), maxTop)
+            targetTop = clamp(targetTop, minTop, maxTop)
 
         var targetX = (targetLeft + root.originOffsetX) * root.zoomLevel
         var targetY = (targetTop + root.originOffsetY) * root.zoomLevel
         var maxX = Math.max(0, viewport.contentWidth - viewport.width)
         var maxY = Math.max(0, viewport.contentHeight - viewport.height)
-        viewport.contentX = Math.min(Math.max(targetX, 0), maxX)
-        viewport.contentY = Math.min(Math.max(targetY, 0), maxY)
+        viewport.contentX = clamp(targetX, 0, maxX)
+        viewport.contentY = clamp(targetY, 0, maxY)
     }
 
     function resetView() {
@@ -1743,6 +1778,7 @@ ApplicationWindow {
             }
 
             Rectangle {
+            id: boardFrame
             Layout.fillWidth: true
             Layout.fillHeight: true
             radius: 14
@@ -1750,6 +1786,16 @@ ApplicationWindow {
             border.color: "#2f465b"
             border.width: 1
 
+            // Square, fully opaque interior: the scene graph draws it in the opaque
+            // pass and skips blending everything it covers. The rounded frame
+            // around it only shows at the border and corners.
+            Rectangle {
+                id: boardFill
+                anchors.fill: parent
+                anchors.margins: 5
+                color: boardFrame.color
+            }
+
             Rectangle {
                 id: linkingTabsPanel
                 visible: root.linkingTabsToCurrent && root.linkingTabsToCurrent.length > 0
@@ -1841,11 +1887,33 @@ ApplicationWindow {
             }
 
             MouseArea {
+                id: wheelZoomArea
                 anchors.fill: parent
                 acceptedButtons: Qt.NoButton
                 hoverEnabled: true
                 propagateComposedEvents: true
                 z: 10
+
+                // Wheel events can arrive several times per frame, so their steps are
+                // summed and applied as one zoom change once the event queue drains.
+                property real pendingZoomSteps: 0
+                property real pendingZoomX: 0
+                property real pendingZoomY: 0
+
+                function queueZoomSteps(steps, x, y) {
+                    pendingZoomSteps += steps
+                    pendingZoomX = x
+                    pendingZoomY = y
+                    Qt.callLater(flushZoomSteps)
+                }
+
+                function flushZoomSteps() {
+                    var steps = pendingZoomSteps
+                    pendingZoomSteps = 0
+                    if (steps !== 0)
+                        root.applyZoomFactor(Math.pow(1.1, steps), pendingZoomX, pendingZoomY)
+                }
+
                 onWheel: function(wheel) {
                     var zoomModifier = (wheel.modifiers & Qt.ControlModifier) || (wheel.modifiers & Qt.MetaModifier)
                     if (!zoomModifier) {
@@ -1860,8 +1928,7 @@ ApplicationWindow {
                     }
                     if (steps === 0)
                         return
-                    var factor = Math.pow(1.1, steps)
-                    root.applyZoomFactor(factor, wheel.x, wheel.y)
+                    queueZoomSteps(steps, wheel.x, wheel.y)
                     wheel.accepted = true
                 }
             }
@@ -1874,6 +1941,11 @@ ApplicationWindow {
                 clip: true
                 interactive: !diagramModel || !diagramModel.drawingMode
 
+                onContentXChanged: root.refreshCulledCanvases()
+                onContentYChanged: root.refreshCulledCanvases()
+                onWidthChanged: root.refreshCulledCanvases()
+                onHeightChanged: root.refreshCulledCanvases()
+
                 PinchHandler {
                     id: viewportPinch
                     target: null
@@ -1883,11 +1955,18 @@ ApplicationWindow {
                             lastScale = 1.0
                     }
                     onScaleChanged: {
-                        if (!active)
+                        if (active)
+                            applyScale(scale, centroid.position.x, centroid.position.y)
+                    }
+
+                    function applyScale(newScale, x, y) {
+                        // Ignore sub-1% changes; they accumulate against lastScale until
+                        // they are worth a zoom update.
+                        var factor = newScale / lastScale
+                        if (Math.abs(factor - 1) <= 0.01)
                             return
-                        var factor = scale / lastScale
-                        root.applyZoomFactor(factor, centroid.position.x, centroid.position.y)
-                        lastScale = scale
+                        root.applyZoomFactor(factor, x, y)
+                        lastScale = newScale
                     }
                 }
 
@@ -1905,299 +1984,314 @@ ApplicationWindow {
                     property string contextMenuItemId: ""
                     property string contextMenuEdgeId: ""
 
-                    Menu {
-                        id: canvasContextMenu
+                    LazyMenuLoader {
+                        id: canvasContextMenuLoader
 
-                        MenuItem {
-                            text: "Box"
-                            icon.name: "insert-object"
-                            onTriggered: {
-                                var snapped = root.snapPoint({x: diagramLayer.contextMenuX, y: diagramLayer.contextMenuY})
-                                diagramModel.addBox(snapped.x, snapped.y, "")
-                            }
-                        }
-                        MenuItem {
-                            text: "New Task"
-                            icon.name: "list-add"
-                            onTriggered: {
-                                var snapped = root.snapPoint({x: diagramLayer.contextMenuX, y: diagramLayer.contextMenuY})
-                                root.openQuickTaskDialog(snapped)
-                            }
-                        }
-                        MenuItem {
-                            text: "Free Text"
-                            icon.name: "accessories-text-editor"
-                            onTriggered: {
-                                var snapped = root.snapPoint({x: diagramLayer.contextMenuX, y: diagramLayer.contextMenuY})
-                                root.openFreeTextDialog(snapped, "", "")
-                            }
-                        }
-                        MenuItem {
-                            text: "Obstacle"
-                            icon.name: "dialog-warning"
-                            onTriggered: {
-                                var snapped = root.snapPoint({x: diagramLayer.contextMenuX, y: diagramLayer.contextMenuY})
-                                root.openPresetDialog("obstacle", snapped, "", undefined)
-                            }
-                        }
-                        MenuItem {
-                            text: "Wish"
-                            icon.name: "emblem-favorite"
-                            onTriggered: {
-                                var snapped = root.snapPoint({x: diagramLayer.contextMenuX, y: diagramLayer.contextMenuY})
-                                root.openPresetDialog("wish", snapped, "", undefined)
+                        sourceComponent: Component {
+                            Menu {
+                                id: canvasContextMenu
+
+                                MenuItem {
+                                    text: "Box"
+                                    icon.name: "insert-object"
+                                    onTriggered: {
+                                        var snapped = root.snapPoint({x: diagramLayer.contextMenuX, y: diagramLayer.contextMenuY})
+                                        diagramModel.addBox(snapped.x, snapped.y, "")
+                                    }
+                                }
+                                MenuItem {
+                                    text: "New Task"
+                                    icon.name: "list-add"
+                                    onTriggered: {
+                                        var snapped = root.snapPoint({x: diagramLayer.contextMenuX, y: diagramLayer.contextMenuY})
+                                        root.openQuickTaskDialog(snapped)
+                                    }
+                                }
+                                MenuItem {
+                                    text: "Free Text"
+                                    icon.name: "accessories-text-editor"
+                                    onTriggered: {
+                                        var snapped = root.snapPoint({x: diagramLayer.contextMenuX, y: diagramLayer.contextMenuY})
+                                        root.openFreeTextDialog(snapped, "", "")
+                                    }
+                                }
+                                MenuItem {
+                                    text: "Obstacle"
+                                    icon.name: "dialog-warning"
+                                    onTriggered: {
+                                        var snapped = root.snapPoint({x: diagramLayer.contextMenuX, y: diagramLayer.contextMenuY})
+                                        root.openPresetDialog("obstacle", snapped, "", undefined)
+                                    }
+                                }
+                                MenuItem {
+                                    text: "Wish"
+                                    icon.name: "emblem-favorite"
+                                    onTriggered: {
+                                        var snapped = root.snapPoint({x: diagramLayer.contextMenuX, y: diagramLayer.contextMenuY})
+                                        root.openPresetDialog("wish", snapped, "", undefined)
+                                    }
+                                }
                             }
                         }
                     }
 
-                    Menu {
-                        id: itemContextMenu
-
-                        MenuItem {
-                            id: renameNoteMenuItem
-                            text: "Rename Label..."
-                            icon.name: "edit-rename"
-                            visible: {
-                                if (!diagramModel || !diagramLayer.contextMenuItemId)
-                                    return false
-                                var item = diagramModel.getItemSnapshot(diagramLayer.contextMenuItemId)
-                                return item && (item.type === "note" || item.type === "wish" || item.type === "obstacle")
-                            }
-                            height: visible ? implicitHeight : 0
-                            onTriggered: {
-                                root.renameItemById(diagramLayer.contextMenuItemId)
-                            }
-                        }
-                        MenuItem {
-                            id: renameTaskMenuItem
-                            text: "Rename Task..."
-                            icon.name: "edit-rename"
-                            visible: {
-                                if (!diagramModel || !diagramLayer.contextMenuItemId)
-                                    return false
-                                var item = diagramModel.getItemSnapshot(diagramLayer.contextMenuItemId)
-                                return item && item.type === "task" && item.taskIndex >= 0
-                            }
-                            height: visible ? implicitHeight : 0
-                            onTriggered: {
-                                root.renameItemById(diagramLayer.contextMenuItemId)
-                            }
-                        }
-                        MenuItem {
-                            id: drillToTabMenuItem
-                            text: "Drill to Tab"
-                            icon.name: "go-next"
-                            visible: {
-                                if (!diagramModel || !projectManager || !tabModel || !diagramLayer.contextMenuItemId)
-                                    return false
-                                var item = diagramModel.getItemSnapshot(diagramLayer.contextMenuItemId)
-                                return item && item.type === "task" && item.taskIndex >= 0
-                            }
-                            height: visible ? implicitHeight : 0
-                            onTriggered: {
-                                var item = diagramModel.getItemSnapshot(diagramLayer.contextMenuItemId)
-                                if (item && item.taskIndex >= 0 && projectManager)
-                                    projectManager.drillToTab(item.taskIndex)
-                            }
-                        }
-                        MenuItem {
-                            id: addToKanbanMenuItem
-                            text: "Add to Kanban"
-                            icon.name: "view-list-details"
-                            visible: {
-                                if (!diagramModel || !projectManager || !tabModel || !diagramLayer.contextMenuItemId)
-                                    return false
-                                var item = diagramModel.getItemSnapshot(diagramLayer.contextMenuItemId)
-                                return item && item.type === "task" && item.taskIndex >= 0
-                            }
-                            height: visible ? implicitHeight : 0
-                            onTriggered: {
-                                var item = diagramModel.getItemSnapshot(diagramLayer.contextMenuItemId)
-                                if (item && item.taskIndex >= 0 && projectManager)
-                                    projectManager.addTaskToKanban(item.taskIndex)
-                            }
-                        }
-                        MenuItem {
-                            id: openChatGptMenuItem
-                            text: "Open ChatGPT"
-                            icon.name: "help-contents"
-                            visible: {
-                                if (!diagramModel || !diagramLayer.contextMenuItemId)
-                                    return false
-                                var item = diagramModel.getItemSnapshot(diagramLayer.contextMenuItemId)
-                                return item && item.type === "chatgpt"
-                            }
-                            height: visible ? implicitHeight : 0
-                            onTriggered: diagramModel.openChatGpt(diagramLayer.contextMenuItemId)
-                        }
-                        MenuItem {
-                            text: "Link Folder..."
-                            icon.name: "folder"
-                            onTriggered: dialogs.folderDialog.open()
-                        }
-                        MenuItem {
-                            id: openFolderMenuItem
-                            text: "Open Folder"
-                            icon.name: "folder-open"
-                            visible: {
-                                if (!diagramModel || !diagramLayer.contextMenuItemId)
-                                    return false
-                                var item = diagramModel.getItemSnapshot(diagramLayer.contextMenuItemId)
-                                return item && item.folderPath && item.folderPath !== ""
-                            }
-                            height: visible ? implicitHeight : 0
-                            onTriggered: diagramModel.openFolder(diagramLayer.contextMenuItemId)
-                        }
-                        MenuItem {
-                            id: clearFolderMenuItem
-                            text: "Clear Folder"
-                            icon.name: "edit-clear"
-                            visible: {
-                                if (!diagramModel || !diagramLayer.contextMenuItemId)
-                                    return false
-                                var item = diagramModel.getItemSnapshot(diagramLayer.contextMenuItemId)
-                                return item && item.folderPath && item.folderPath !== ""
-                            }
-                            height: visible ? implicitHeight : 0
-                            onTriggered: diagramModel.clearFolderPath(diagramLayer.contextMenuItemId)
-                        }
-                        MenuItem {
-                            id: breakDownMenuItem
-                            text: "Break Down..."
-                            icon.name: "view-list-details"
-                            visible: {
-                                if (!diagramModel || !diagramLayer.contextMenuItemId)
-                                    return false
-                                var item = diagramModel.getItemSnapshot(diagramLayer.contextMenuItemId)
-                                return item && item.type !== "image"
-                            }
-                            height: visible ? implicitHeight : 0
-                            onTriggered: {
-                                if (!diagramModel || !diagramLayer.contextMenuItemId)
-                                    return
-                                var item = diagramModel.getItemSnapshot(diagramLayer.contextMenuItemId)
-                                dialogs.breakdownDialog.sourceItemId = diagramLayer.contextMenuItemId
-                                dialogs.breakdownDialog.sourceTypeLabel = item && item.type ? item.type : ""
-                                dialogs.breakdownDialog.open()
-                            }
-                        }
-                        MenuItem {
-                            text: "Edit Note/Details...\t\tCtrl+M"
-                            icon.name: "document-edit"
-                            enabled: diagramModel !== null && diagramLayer.contextMenuItemId.length > 0
-                            onTriggered: {
-                                root.selectedItemId = diagramLayer.contextMenuItemId
-                                root.openMarkdownNoteForSelection()
-                            }
-                        }
-                        MenuItem {
-                            text: {
-                                if (!diagramModel || !diagramLayer.contextMenuItemId)
-                                    return "Add Obstacle..."
-                                var item = diagramModel.getItemSnapshot(diagramLayer.contextMenuItemId)
-                                if (item && item.obstacleMarkdown && String(item.obstacleMarkdown).trim().length > 0)
-                                    return "Edit Obstacle..."
-                                return "Add Obstacle..."
-                            }
-                            icon.name: "dialog-warning"
-                            visible: {
-                                if (!diagramModel || !diagramLayer.contextMenuItemId)
-                                    return false
-                                var item = diagramModel.getItemSnapshot(diagramLayer.contextMenuItemId)
-                                return item && item.type !== "image"
-                            }
-                            height: visible ? implicitHeight : 0
-                            onTriggered: {
-                                root.selectedItemId = diagramLayer.contextMenuItemId
-                                root.openObstacleForSelection()
-                            }
-                        }
-                        MenuSeparator {}
-                        Menu {
-                            title: "Convert to..."
-                            MenuItem {
-                                text: "Box"
-                                icon.name: "insert-object"
-                                onTriggered: diagramModel.convertItemType(diagramLayer.contextMenuItemId, "box")
-                            }
-                            MenuItem {
-                                text: "Task"
-                                icon.name: "view-task"
-                                onTriggered: diagramModel.convertItemType(diagramLayer.contextMenuItemId, "task")
-                            }
-                            MenuItem {
-                                text: "Database"
-                                icon.name: "server-database"
-                                onTriggered: diagramModel.convertItemType(diagramLayer.contextMenuItemId, "database")
-                            }
-                            MenuItem {
-                                text: "Server"
-                                icon.name: "network-server"
-                                onTriggered: diagramModel.convertItemType(diagramLayer.contextMenuItemId, "server")
-                            }
-                            MenuItem {
-                                text: "Cloud"
-                                icon.name: "network-workgroup"
-                                onTriggered: diagramModel.convertItemType(diagramLayer.contextMenuItemId, "cloud")
-                            }
-                            MenuItem {
-                                text: "Note"
-                                icon.name: "document-edit"
-                                onTriggered: diagramModel.convertItemType(diagramLayer.contextMenuItemId, "note")
-                            }
-                            MenuItem {
-                                text: "Free Text"
-                                icon.name: "accessories-text-editor"
-                                onTriggered: diagramModel.convertItemType(diagramLayer.contextMenuItemId, "freetext")
-                            }
-                            MenuItem {
-                                text: "Obstacle"
-                                icon.name: "dialog-warning"
-                                onTriggered: diagramModel.convertItemType(diagramLayer.contextMenuItemId, "obstacle")
-                            }
-                            MenuItem {
-                                text: "Wish"
-                                icon.name: "emblem-favorite"
-                                onTriggered: diagramModel.convertItemType(diagramLayer.contextMenuItemId, "wish")
-                            }
-                            MenuItem {
-                                text: "ChatGPT"
-                                icon.name: "help-contents"
-                                onTriggered: diagramModel.convertItemType(diagramLayer.contextMenuItemId, "chatgpt")
+                    LazyMenuLoader {
+                        id: itemContextMenuLoader
+
+                        sourceComponent: Component {
+                            Menu {
+                                id: itemContextMenu
+
+                                MenuItem {
+                                    id: renameNoteMenuItem
+                                    text: "Rename Label..."
+                                    icon.name: "edit-rename"
+                                    visible: {
+                                        if (!diagramModel || !diagramLayer.contextMenuItemId)
+                                            return false
+                                        var item = diagramModel.getItemSnapshot(diagramLayer.contextMenuItemId)
+                                        return item && (item.type === "note" || item.type === "wish" || item.type === "obstacle")
+                                    }
+                                    height: visible ? implicitHeight : 0
+                                    onTriggered: {
+                                        root.renameItemById(diagramLayer.contextMenuItemId)
+                                    }
+                                }
+                                MenuItem {
+                                    id: renameTaskMenuItem
+                                    text: "Rename Task..."
+                                    icon.name: "edit-rename"
+                                    visible: {
+                                        if (!diagramModel || !diagramLayer.contextMenuItemId)
+                                            return false
+                                        var item = diagramModel.getItemSnapshot(diagramLayer.contextMenuItemId)
+                                        return item && item.type === "task" && item.taskIndex >= 0
+                                    }
+                                    height: visible ? implicitHeight : 0
+                                    onTriggered: {
+                                        root.renameItemById(diagramLayer.contextMenuItemId)
+                                    }
+                                }
+                                MenuItem {
+                                    id: drillToTabMenuItem
+                                    text: "Drill to Tab"
+                                    icon.name: "go-next"
+                                    visible: {
+                                        if (!diagramModel || !projectManager || !tabModel || !diagramLayer.contextMenuItemId)
+                                            return false
+                                        var item = diagramModel.getItemSnapshot(diagramLayer.contextMenuItemId)
+                                        return item && item.type === "task" && item.taskIndex >= 0
+                                    }
+                                    height: visible ? implicitHeight : 0
+                                    onTriggered: {
+                                        var item = diagramModel.getItemSnapshot(diagramLayer.contextMenuItemId)
+                                        if (item && item.taskIndex >= 0 && projectManager)
+                                            projectManager.drillToTab(item.taskIndex)
+                                    }
+                                }
+                                MenuItem {
+                                    id: addToKanbanMenuItem
+                                    text: "Add to Kanban"
+                                    icon.name: "view-list-details"
+                                    visible: {
+                                        if (!diagramModel || !projectManager || !tabModel || !diagramLayer.contextMenuItemId)
+                                            return false
+                                        var item = diagramModel.getItemSnapshot(diagramLayer.contextMenuItemId)
+                                        return item && item.type === "task" && item.taskIndex >= 0
+                                    }
+                                    height: visible ? implicitHeight : 0
+                                    onTriggered: {
+                                        var item = diagramModel.getItemSnapshot(diagramLayer.contextMenuItemId)
+                                        if (item && item.taskIndex >= 0 && projectManager)
+                                            projectManager.addTaskToKanban(item.taskIndex)
+                                    }
+                                }
+                                MenuItem {
+                                    id: openChatGptMenuItem
+                                    text: "Open ChatGPT"
+                                    icon.name: "help-contents"
+                                    visible: {
+                                        if (!diagramModel || !diagramLayer.contextMenuItemId)
+                                            return false
+                                        var item = diagramModel.getItemSnapshot(diagramLayer.contextMenuItemId)
+                                        return item && item.type === "chatgpt"
+                                    }
+                                    height: visible ? implicitHeight : 0
+                                    onTriggered: diagramModel.openChatGpt(diagramLayer.contextMenuItemId)
+                                }
+                                MenuItem {
+                                    text: "Link Folder..."
+                                    icon.name: "folder"
+                                    onTriggered: dialogs.folderDialog.open()
+                                }
+                                MenuItem {
+                                    id: openFolderMenuItem
+                                    text: "Open Folder"
+                                    icon.name: "folder-open"
+                                    visible: {
+                                        if (!diagramModel || !diagramLayer.contextMenuItemId)
+                                            return false
+                                        var item = diagramModel.getItemSnapshot(diagramLayer.contextMenuItemId)
+                                        return item && item.folderPath && item.folderPath !== ""
+                                    }
+                                    height: visible ? implicitHeight : 0
+                                    onTriggered: diagramModel.openFolder(diagramLayer.contextMenuItemId)
+                                }
+                                MenuItem {
+                                    id: clearFolderMenuItem
+                                    text: "Clear Folder"
+                                    icon.name: "edit-clear"
+                                    visible: {
+                                        if (!diagramModel || !diagramLayer.contextMenuItemId)
+                                            return false
+                                        var item = diagramModel.getItemSnapshot(diagramLayer.contextMenuItemId)
+                                        return item && item.folderPath && item.folderPath !== ""
+                                    }
+                                    height: visible ? implicitHeight : 0
+                                    onTriggered: diagramModel.clearFolderPath(diagramLayer.contextMenuItemId)
+                                }
+                                MenuItem {
+                                    id: breakDownMenuItem
+                                    text: "Break Down..."
+                                    icon.name: "view-list-details"
+                                    visible: {
+                                        if (!diagramModel || !diagramLayer.contextMenuItemId)
+                                            return false
+                                        var item = diagramModel.getItemSnapshot(diagramLayer.contextMenuItemId)
+                                        return item && item.type !== "image"
+                                    }
+                                    height: visible ? implicitHeight : 0
+                                    onTriggered: {
+                                        if (!diagramModel || !diagramLayer.contextMenuItemId)
+                                            return
+                                        var item = diagramModel.getItemSnapshot(diagramLayer.contextMenuItemId)
+                                        dialogs.breakdownDialog.sourceItemId = diagramLayer.contextMenuItemId
+                                        dialogs.breakdownDialog.sourceTypeLabel = item && item.type ? item.type : ""
+                                        dialogs.breakdownDialog.open()
+                                    }
+                                }
+                                MenuItem {
+                                    text: "Edit Note/Details...\t\tCtrl+M"
+                                    icon.name: "document-edit"
+                                    enabled: diagramModel !== null && diagramLayer.contextMenuItemId.length > 0
+                                    onTriggered: {
+                                        root.selectedItemId = diagramLayer.contextMenuItemId
+                                        root.openMarkdownNoteForSelection()
+                                    }
+                                }
+                                MenuItem {
+                                    text: {
+                                        if (!diagramModel || !diagramLayer.contextMenuItemId)
+                                            return "Add Obstacle..."
+                                        var item = diagramModel.getItemSnapshot(diagramLayer.contextMenuItemId)
+                                        if (item && item.obstacleMarkdown && String(item.obstacleMarkdown).trim().length > 0)
+                                            return "Edit Obstacle..."
+                                        return "Add Obstacle..."
+                                    }
+                                    icon.name: "dialog-warning"
+                                    visible: {
+                                        if (!diagramModel || !diagramLayer.contextMenuItemId)
+                                            return false
+                                        var item = diagramModel.getItemSnapshot(diagramLayer.contextMenuItemId)
+                                        return item && item.type !== "image"
+                                    }
+                                    height: visible ? implicitHeight : 0
+                                    onTriggered: {
+                                        root.selectedItemId = diagramLayer.contextMenuItemId
+                                        root.openObstacleForSelection()
+                                    }
+                                }
+                                MenuSeparator {}
+                                Menu {
+                                    title: "Convert to..."
+                                    MenuItem {
+                                        text: "Box"
+                                        icon.name: "insert-object"
+                                        onTriggered: diagramModel.convertItemType(diagramLayer.contextMenuItemId, "box")
+                                    }
+                                    MenuItem {
+                                        text: "Task"
+                                        icon.name: "view-task"
+                                        onTriggered: diagramModel.convertItemType(diagramLayer.contextMenuItemId, "task")
+                                    }
+                                    MenuItem {
+                                        text: "Database"
+                                        icon.name: "server-database"
+                                        onTriggered: diagramModel.convertItemType(diagramLayer.contextMenuItemId, "database")
+                                    }
+                                    MenuItem {
+                                        text: "Server"
+                                        icon.name: "network-server"
+                                        onTriggered: diagramModel.convertItemType(diagramLayer.contextMenuItemId, "server")
+                                    }
+                                    MenuItem {
+                                        text: "Cloud"
+                                        icon.name: "network-workgroup"
+                                        onTriggered: diagramModel.convertItemType(diagramLayer.contextMenuItemId, "cloud")
+                                    }
+                                    MenuItem {
+                                        text: "Note"
+                                        icon.name: "document-edit"
+                                        onTriggered: diagramModel.convertItemType(diagramLayer.contextMenuItemId, "note")
+                                    }
+                                    MenuItem {
+                                        text: "Free Text"
+                                        icon.name: "accessories-text-editor"
+                                        onTriggered: diagramModel.convertItemType(diagramLayer.contextMenuItemId, "freetext")
+                                    }
+                                    MenuItem {
+                                        text: "Obstacle"
+                                        icon.name: "dialog-warning"
+                                        onTriggered: diagramModel.convertItemType(diagramLayer.contextMenuItemId, "obstacle")
+                                    }
+                                    MenuItem {
+                                        text: "Wish"
+                                        icon.name: "emblem-favorite"
+                                        onTriggered: diagramModel.convertItemType(diagramLayer.contextMenuItemId, "wish")
+                                    }
+                                    MenuItem {
+                                        text: "ChatGPT"
+                                        icon.name: "help-contents"
+                                        onTriggered: diagramModel.convertItemType(diagramLayer.contextMenuItemId, "chatgpt")
+                                    }
+                                }
+                                MenuItem {
+                                    text: "Delete"
+                                    icon.name: "edit-delete"
+                                    onTriggered: diagramModel.removeItem(diagramLayer.contextMenuItemId)
+                                }
                             }
                         }
-                        MenuItem {
-                            text: "Delete"
-                            icon.name: "edit-delete"
-                            onTriggered: diagramModel.removeItem(diagramLayer.contextMenuItemId)
-                        }
                     }
 
-                    Canvas {
-                        id: gridCanvas
+                    // The whole grid is one stroked path in a single Shape node, so
+                    // toggling or respacing it never creates per-line items or
+                    // rasterizes a board-sized texture.
+                    Shape {
+                        id: gridLayer
                         anchors.fill: parent
                         visible: root.showGrid
-                        opacity: root.showGrid ? 1 : 0
                         z: 0
+                        // 5% white pre-blended over the board fill, so the lines stay opaque.
+                        readonly property color lineColor: "#1c252f"
+                        readonly property int verticalLineCount: visible ? Math.floor(width / root.gridSpacing) + 1 : 0
+                        readonly property int horizontalLineCount: visible ? Math.floor(height / root.gridSpacing) + 1 : 0
+                        // Lines sit on pixel centres so the 1px stroke stays crisp.
+                        readonly property string linePath: {
+                            var segments = []
+                            for (var column = 0; column < verticalLineCount; ++column)
+                                segments.push("M" + (column * root.gridSpacing + 0.5) + " 0V" + height)
+                            for (var row = 0; row < horizontalLineCount; ++row)
+                                segments.push("M0 " + (row * root.gridSpacing + 0.5) + "H" + width)
+                            return segments.join("")
+                        }
 
-                        onPaint: {
-                            var ctx = getContext("2d")
-                            ctx.clearRect(0, 0, width, height)
-                            if (!root.showGrid)
-                                return
-                            var spacing = root.gridSpacing
-                            ctx.strokeStyle = "rgba(255, 255, 255, 0.05)"
-                            ctx.lineWidth = 1
-                            ctx.beginPath()
-                            for (var x = 0; x <= width; x += spacing) {
-                                ctx.moveTo(x, 0)
-                                ctx.lineTo(x, height)
-                            }
-                            for (var y = 0; y <= height; y += spacing) {
-                                ctx.moveTo(0, y)
-                                ctx.lineTo(width, y)
-                            }
-                            ctx.stroke()
+                        ShapePath {
+                            strokeColor: gridLayer.lineColor
+                            strokeWidth: 1
+                            fillColor: "transparent"
+                            capStyle: ShapePath.FlatCap
+                            PathSvg { path: gridLayer.linePath }
                         }
                     }
 
@@ -2230,7 +2324,6 @@ ApplicationWindow {
                                     diagramModel.removeEdge(diagramLayer.contextMenuEdgeId)
                                     edgeCanvas.selectedEdgeId = ""
                                     edgeCanvas.hoveredEdgeId = ""
-                                    edgeCanvas.requestPaint()
                                 }
                             }
                         }
@@ -2243,136 +2336,177 @@ ApplicationWindow {
                         property string hoveredEdgeId: ""
                         property string selectedEdgeId: ""
 
-                        function distanceToSegment(px, py, x1, y1, x2, y2) {
-                            var dx = x2 - x1
-                            var dy = y2 - y1
-                            var lengthSq = dx * dx + dy * dy
-                            if (lengthSq === 0)
-                                return Math.sqrt((px - x1) * (px - x1) + (py - y1) * (py - y1))
-                            var t = Math.max(0, Math.min(1, ((px - x1) * dx + (py - y1) * dy) / lengthSq))
-                            var projX = x1 + t * dx
-                            var projY = y1 + t * dy
-                            return Math.sqrt((px - projX) * (px - projX) + (py - projY) * (py - projY))
+                        // Diagram area covered by the last paint; edges outside it are culled.
+                        property var paintedRect: null
+
+                        // Hover and selection restyle only a few edges; edgeHighlightLayer
+                        // binds to them, so they never repaint this canvas.
+
+                        // Edge centre points as flat [fromX, fromY, toX, toY, ...] in
+                        // endpointEdges order, refetched only after items or edges change.
+                        property var endpointEdges: []
+                        property var endpointCoords: []
+                        property bool endpointsDirty: true
+
+                        function ensureEndpoints() {
+                            if (!endpointsDirty)
+                                return
+                            endpointsDirty = false
+                            endpointEdges = diagramModel ? diagramModel.edges : []
+                            endpointCoords = diagramModel ? diagramModel.getEdgeEndpoints() : []
+                        }
+
+                        function invalidateEndpoints() {
+                            endpointsDirty = true
+                            requestPaint()
+                            // The highlight overlay binds to the endpoint arrays, so refresh
+                            // them even when this canvas is not painted.
+                            Qt.callLater(ensureEndpoints)
                         }
 
-                        function findEdgeAt(mx, my) {
-                            if (!diagramModel)
-                                return ""
-                            var edges = diagramModel.edges
-                            var threshold = 8
-                            for (var i = edges.length - 1; i >= 0; --i) {
-                                var edge = edges[i]
-                                var fromItem = diagramModel.getItemSnapshot(edge.fromId)
-                                var toItem = diagramModel.getItemSnapshot(edge.toId)
-                                if ((!fromItem.x && fromItem.x !== 0) || (!toItem.x && toItem.x !== 0))
+                        // [fromX, fromY, toX, toY] of a drawable edge, or [] if it has none.
+                        // Reads the endpoint arrays without refreshing them, so bindings
+                        // can depend on it.
+                        function edgeSegment(edgeId) {
+                            var edges = endpointEdges
+                            var coords = endpointCoords
+                            if (!edgeId || edgeId.length === 0)
+                                return []
+                            for (var i = 0; i < edges.length; ++i) {
+                                if (edges[i].id !== edgeId)
                                     continue
-                                var fromX = fromItem.x + fromItem.width / 2
-                                var fromY = fromItem.y + fromItem.height / 2
-                                var toX = toItem.x + toItem.width / 2
-                                var toY = toItem.y + toItem.height / 2
-                                var dist = distanceToSegment(mx, my, fromX, fromY, toX, toY)
-                                if (dist <= threshold)
-                                    return edge.id
+                                var b = i * 4
+                                if (isNaN(coords[b]) || isNaN(coords[b + 2]))
+                                    return []
+                                return [coords[b], coords[b + 1], coords[b + 2], coords[b + 3]]
                             }
-                            return ""
+                            return []
+                        }
+
+                        readonly property real arrowCos: Math.cos(Math.PI / 6)
+                        readonly property real arrowSin: Math.sin(Math.PI / 6)
+
+                        function traceEdgeLine(ctx, coords, b) {
+                            ctx.moveTo(coords[b], coords[b + 1])
+                            ctx.lineTo(coords[b + 2], coords[b + 3])
+                        }
+
+                        // The two back corners of the arrow head as [x1, y1, x2, y2].
+                        function arrowCorners(coords, b) {
+                            var toX = coords[b + 2]
+                            var toY = coords[b + 3]
+                            // Rotate the unit edge direction by +/- the arrow angle with the
+                            // sum identities instead of calling atan2/cos/sin per edge.
+                            var dx = toX - coords[b]
+                            var dy = toY - coords[b + 1]
+                            var length = Math.sqrt(dx * dx + dy * dy)
+                            var c = length > 0 ? dx / length : 1
+                            var s = length > 0 ? dy / length : 0
+                            var arrowSize = 10
+                            return [
+                                toX - arrowSize * (c * arrowCos + s * arrowSin),
+                                toY - arrowSize * (s * arrowCos - c * arrowSin),
+                                toX - arrowSize * (c * arrowCos - s * arrowSin),
+                                toY - arrowSize * (s * arrowCos + c * arrowSin)
+                            ]
+                        }
+
+                        function traceArrowHead(ctx, coords, b) {
+                            var corners = arrowCorners(coords, b)
+                            ctx.moveTo(coords[b + 2], coords[b + 3])
+                            ctx.lineTo(corners[0], corners[1])
+                            ctx.lineTo(corners[2], corners[3])
+                            ctx.closePath()
+                        }
+
+                        property real lastHoverX: -1
+                        property real lastHoverY: -1
+
+                        function hoverAt(mx, my) {
+                            // Moves under 2px cannot meaningfully change which edge is within
+                            // the 8px hit threshold, so skip the hit test for them.
+                            if (lastHoverX >= 0 && Math.abs(mx - lastHoverX) + Math.abs(my - lastHoverY) < 2)
+                                return
+                            lastHoverX = mx
+                            lastHoverY = my
+                            hoveredEdgeId = findEdgeAt(mx, my)
+                        }
+
+                        function clearHover() {
+                            lastHoverX = -1
+                            lastHoverY = -1
+                            hoveredEdgeId = ""
+                        }
+
+                        function findEdgeAt(mx, my) {
+                            // The model keeps edges bucketed in a hit grid, so this measures
+                            // only the edges near the pointer instead of every edge.
+                            return diagramModel ? diagramModel.getEdgeAt(mx, my) : ""
                         }
 
                         onPaint: {
                             var ctx = getContext("2d")
                             ctx.clearRect(0, 0, width, height)
-                            if (!diagramModel)
-                                return
+                            if (diagramModel)
+                                paintEdges(ctx)
+                        }
 
-                            var edges = diagramModel.edges
+                        function paintEdges(ctx) {
+                            ensureEndpoints()
+                            var edges = endpointEdges
+                            var coords = endpointCoords
+                            var view = root.paddedViewRect()
+                            paintedRect = view
+                            var left = view.x - 10
+                            var top = view.y - 10
+                            var right = view.x + view.width + 10
+                            var bottom = view.y + view.height + 10
+                            var drawable = []
                             for (var i = 0; i < edges.length; ++i) {
-                                var edge = edges[i]
-                                var fromItem = diagramModel.getItemSnapshot(edge.fromId)
-                                var toItem = diagramModel.getItemSnapshot(edge.toId)
-                                if (!fromItem.x && fromItem.x !== 0)
+                                var b = i * 4
+                                if (isNaN(coords[b]) || isNaN(coords[b + 2]))
                                     continue
-                                if (!toItem.x && toItem.x !== 0)
+                                // Skip edges whose box (grown by the arrow size) misses the view.
+                                if (Math.max(coords[b], coords[b + 2]) < left
+                                        || Math.min(coords[b], coords[b + 2]) > right
+                                        || Math.max(coords[b + 1], coords[b + 3]) < top
+                                        || Math.min(coords[b + 1], coords[b + 3]) > bottom)
                                     continue
-
-                                var fromX = fromItem.x + fromItem.width / 2
-                                var fromY = fromItem.y + fromItem.height / 2
-                                var toX = toItem.x + toItem.width / 2
-                                var toY = toItem.y + toItem.height / 2
-
-                                var isHovered = edgeCanvas.hoveredEdgeId === edge.id
-                                var isSelected = edgeCanvas.selectedEdgeId === edge.id
-                                var isInsertTarget = diagramModel.dragInsertEdgeId === edge.id
-                                if (isInsertTarget) {
-                                    ctx.strokeStyle = "#82c3a5"
-                                    ctx.lineWidth = 4
-                                } else if (isSelected) {
-                                    ctx.strokeStyle = "#ff6b6b"
-                                    ctx.lineWidth = 3
-                                } else if (isHovered) {
-                                    ctx.strokeStyle = "#a8b8d8"
-                                    ctx.lineWidth = 3
-                                } else {
-                                    ctx.strokeStyle = "#7b88a8"
-                                    ctx.lineWidth = 2
-                                }
-
-                                ctx.beginPath()
-                                ctx.moveTo(fromX, fromY)
-                                ctx.lineTo(toX, toY)
-                                ctx.stroke()
-
-                                var angle = Math.atan2(toY - fromY, toX - fromX)
-                                var arrowSize = 10
-                                var arrowAngle = Math.PI / 6
-
-                                ctx.beginPath()
-                                ctx.moveTo(toX, toY)
-                                ctx.lineTo(
-                                    toX - arrowSize * Math.cos(angle - arrowAngle),
-                                    toY - arrowSize * Math.sin(angle - arrowAngle)
-                                )
-                                ctx.lineTo(
-                                    toX - arrowSize * Math.cos(angle + arrowAngle),
-                                    toY - arrowSize * Math.sin(angle + arrowAngle)
-                                )
-                                ctx.closePath()
-                                if (isInsertTarget) {
-                                    ctx.fillStyle = "#82c3a5"
-                                } else if (isSelected) {
-                                    ctx.fillStyle = "#ff6b6b"
-                                } else if (isHovered) {
-                                    ctx.fillStyle = "#a8b8d8"
-                                } else {
-                                    ctx.fillStyle = "#7b88a8"
-                                }
-                                ctx.fill()
-
-                                // Draw edge description text at midpoint
-                                if (edge.description && edge.description.length > 0) {
-                                    var midX = (fromX + toX) / 2
-                                    var midY = (fromY + toY) / 2
-                                    ctx.font = "12px sans-serif"
-                                    ctx.fillStyle = "#f5f6f8"
-                                    ctx.textAlign = "center"
-                                    ctx.textBaseline = "bottom"
-                                    // Offset text slightly above the line
-                                    var offsetY = -6
-                                    ctx.fillText(edge.description, midX, midY + offsetY)
-                                }
+                                drawable.push(i)
                             }
+                            if (drawable.length === 0)
+                                return
 
-                            if (diagramModel.edgeDrawingFrom.length > 0 && diagramModel.isDraggingEdge) {
-                                var origin = diagramModel.getItemSnapshot(diagramModel.edgeDrawingFrom)
-                                if (origin.x || origin.x === 0) {
-                                    var originX = origin.x + origin.width / 2
-                                    var originY = origin.y + origin.height / 2
-                                    ctx.setLineDash([6, 4])
-                                    ctx.strokeStyle = "#82c3a5"
-                                    ctx.beginPath()
-                                    ctx.moveTo(originX, originY)
-                                    ctx.lineTo(diagramModel.edgeDragX, diagramModel.edgeDragY)
-                                    ctx.stroke()
-                                    ctx.setLineDash([])
-                                }
+                            // Every edge shares one style, so all lines go out as a single
+                            // stroke and all arrowheads as a single fill.
+                            ctx.strokeStyle = "#7b88a8"
+                            ctx.lineWidth = 2
+                            ctx.beginPath()
+                            for (var j = 0; j < drawable.length; ++j)
+                                traceEdgeLine(ctx, coords, drawable[j] * 4)
+                            ctx.stroke()
+
+                            ctx.fillStyle = "#7b88a8"
+                            ctx.beginPath()
+                            for (j = 0; j < drawable.length; ++j)
+                                traceArrowHead(ctx, coords, drawable[j] * 4)
+                            ctx.fill()
+
+                            // Draw edge description text at midpoint
+                            ctx.font = "12px sans-serif"
+                            ctx.fillStyle = "#f5f6f8"
+                            ctx.textAlign = "center"
+                            ctx.textBaseline = "bottom"
+                            for (j = 0; j < drawable.length; ++j) {
+                                var edge = edges[drawable[j]]
+                                if (!edge.description || edge.description.length === 0)
+                                    continue
+                                b = drawable[j] * 4
+                                var midX = (coords[b] + coords[b + 2]) / 2
+                                var midY = (coords[b + 1] + coords[b + 3]) / 2
+                                // Offset text slightly above the line
+                                var offsetY = -6
+                                ctx.fillText(edge.description, midX, midY + offsetY)
                             }
                         }
 
@@ -2384,27 +2518,17 @@ ApplicationWindow {
                             z: -1
 
                             onPositionChanged: function(mouse) {
-                                var edgeId = edgeCanvas.findEdgeAt(mouse.x, mouse.y)
-                                if (edgeCanvas.hoveredEdgeId !== edgeId) {
-                                    edgeCanvas.hoveredEdgeId = edgeId
-                                    edgeCanvas.requestPaint()
-                                }
+                                edgeCanvas.hoverAt(mouse.x, mouse.y)
                             }
 
                             onExited: {
-                                if (edgeCanvas.hoveredEdgeId !== "") {
-                                    edgeCanvas.hoveredEdgeId = ""
-                                    edgeCanvas.requestPaint()
-                                }
+                                edgeCanvas.clearHover()
                             }
 
                             onClicked: function(mouse) {
                                 var edgeId = edgeCanvas.findEdgeAt(mouse.x, mouse.y)
                                 if (edgeId === "") {
-                                    if (edgeCanvas.selectedEdgeId !== "") {
-                                        edgeCanvas.selectedEdgeId = ""
-                                        edgeCanvas.requestPaint()
-                                    }
+                                    edgeCanvas.selectedEdgeId = ""
                                     mouse.accepted = false
                                     return
                                 }
@@ -2412,7 +2536,6 @@ ApplicationWindow {
                                     edgeCanvas.selectedEdgeId = edgeId
                                     root.selectedItemId = ""
                                     diagramLayer.contextMenuEdgeId = edgeId
-                                    edgeCanvas.requestPaint()
                                     edgeContextMenu.popup()
                                 } else {
                                     // Left-click to select/deselect
@@ -2422,7 +2545,6 @@ ApplicationWindow {
                                         edgeCanvas.selectedEdgeId = edgeId
                                     }
                                     root.selectedItemId = ""
-                                    edgeCanvas.requestPaint()
                                 }
                             }
 
@@ -2438,62 +2560,229 @@ ApplicationWindow {
                         }
                     }
 
-                    Connections {
-                        target: diagramModel
-                        function onEdgesChanged() { edgeCanvas.requestPaint() }
-                        function onItemsChanged() { edgeCanvas.requestPaint(); root.updateBoardBounds() }
-                        function onDrawingChanged() { drawingCanvas.requestPaint() }
-                    }
+                    // Hover, selection, insert-target and edge-drawing highlights. Each is a
+                    // zero-sized Shape whose paths bind to one edge's endpoints, so a change
+                    // rebuilds a few vertices instead of repainting a board-sized texture.
+                    Item {
+                        id: edgeHighlightLayer
+                        anchors.fill: parent
+                        z: 1
 
-                    Connections {
-                        target: root
-                        function onShowGridChanged() { gridCanvas.requestPaint() }
-                        function onGridSpacingChanged() { gridCanvas.requestPaint() }
-                    }
+                        component EdgeHighlight: Shape {
+                            id: highlight
+                            property string edgeId: ""
+                            property color color: "#ffffff"
+                            property real lineWidth: 3
+                            readonly property var segment: edgeCanvas.edgeSegment(edgeId)
+                            readonly property var corners: segment.length === 4 ? edgeCanvas.arrowCorners(segment, 0) : []
+                            visible: segment.length === 4
+
+                            ShapePath {
+                                strokeColor: highlight.color
+                                strokeWidth: highlight.lineWidth
+                                fillColor: "transparent"
+                                capStyle: ShapePath.FlatCap
+                                PathPolyline {
+                                    path: highlight.visible
+                                        ? [Qt.point(highlight.segment[0], highlight.segment[1]), Qt.point(highlight.segment[2], highlight.segment[3])]
+                                        : []
+                                }
+                            }
 
-                    Canvas {
-                        id: drawingCanvas
-                        anchors.fill: parent
-                        z: 2
+                            ShapePath {
+                                strokeColor: "transparent"
+                                strokeWidth: -1
+                                fillColor: highlight.color
+                                PathPolyline {
+                                    path: highlight.visible
+                                        ? [
+                                            Qt.point(highlight.segment[2], highlight.segment[3]),
+                                            Qt.point(highlight.corners[0], highlight.corners[1]),
+                                            Qt.point(highlight.corners[2], highlight.corners[3])
+                                        ]
+                                        : []
+                                }
+                            }
+                        }
 
-                        function drawStroke(ctx, stroke) {
-                            if (!stroke.points || stroke.points.length < 1)
-                                return
+                        // Later highlights win: insert target over selection over hover.
+                        EdgeHighlight {
+                            id: hoverEdgeHighlight
+                            edgeId: edgeCanvas.hoveredEdgeId
+                            color: "#a8b8d8"
+                        }
+
+                        EdgeHighlight {
+                            id: selectedEdgeHighlight
+                            edgeId: edgeCanvas.selectedEdgeId
+                            color: "#ff6b6b"
+                        }
+
+                        EdgeHighlight {
+                            id: insertEdgeHighlight
+                            edgeId: diagramModel ? diagramModel.dragInsertEdgeId : ""
+                            color: "#82c3a5"
+                            lineWidth: 4
+                        }
+
+                        Shape {
+                            id: edgeDrawingPreview
+                            readonly property var origin: diagramModel && diagramModel.isDraggingEdge && diagramModel.edgeDrawingFrom.length > 0
+                                ? diagramModel.getItemSnapshot(diagramModel.edgeDrawingFrom)
+                                : ({})
+                            visible: origin.x !== undefined
+
+                            ShapePath {
+                                strokeColor: "#82c3a5"
+                                strokeWidth: 2
+                                fillColor: "transparent"
+                                strokeStyle: ShapePath.DashLine
+                                // Dash lengths are in stroke widths: 6px on, 4px off.
+                                dashPattern: [3, 2]
+                                capStyle: ShapePath.FlatCap
+                                PathPolyline {
+                                    path: edgeDrawingPreview.visible
+                                        ? [
+                                            Qt.point(
+                                                edgeDrawingPreview.origin.x + edgeDrawingPreview.origin.width / 2,
+                                                edgeDrawingPreview.origin.y + edgeDrawingPreview.origin.height / 2
+                                            ),
+                                            Qt.point(diagramModel.edgeDragX, diagramModel.edgeDragY)
+                                        ]
+                                        : []
+                                }
+                            }
+                        }
+                    }
+
+                    Connections {
+                        target: diagramModel
+                        function onEdgesChanged() { edgeCanvas.invalidateEndpoints() }
+                        function onItemsChanged() { edgeCanvas.invalidateEndpoints() }
+                        // Bounds feed the board size bindings, so a burst of geometry
+                        // changes recomputes them once per event-loop pass.
+                        function onGeometryChanged() { Qt.callLater(root.updateBoardBounds) }
+                        function onDrawingChanged() {
+                            // Mid-stroke updates only append points; anything else may
+                            // remove or restyle strokes that are already painted.
+                            if (drawingMouseArea.isDrawing)
+                                drawingCanvas.requestPaint()
+                            else
+                                drawingCanvas.repaintAll()
+                        }
+                    }
+
+                    Canvas {
+                        id: drawingCanvas
+                        anchors.fill: parent
+                        z: 2
+                        // Flat coordinates of the in-progress stroke already on the canvas;
+                        // -1 makes the next paint clear and redraw every stroke.
+                        property int paintedCurrentCoords: -1
+                        // Diagram area covered by the last full repaint; strokes outside it
+                        // are culled.
+                        property var paintedRect: null
+                        // Unpainted end of a just-finished stroke. The rest of it is already
+                        // on the canvas, so ending a stroke does not repaint every stroke.
+                        property var finishedTail: null
+
+                        function repaintAll() {
+                            paintedCurrentCoords = -1
+                            requestPaint()
+                        }
+
+                        function finishStroke() {
+                            var start = Math.max(0, paintedCurrentCoords - 2)
+                            var tail = diagramModel.getCurrentStrokeFrom(start)
+                            var total = tail && tail.points ? start + tail.points.length : 0
+                            // endStroke drops single-point strokes, so their dot must be
+                            // cleared by a full repaint; so must a pending full repaint.
+                            var keepPixels = paintedCurrentCoords >= 0 && total >= 4
+                            if (keepPixels) {
+                                finishedTail = tail.points.length > 2 ? tail : null
+                                paintedCurrentCoords = 0
+                            }
+                            diagramModel.endStroke()
+                            if (keepPixels)
+                                requestPaint()
+                            else
+                                repaintAll()
+                        }
+
+                        onWidthChanged: repaintAll()
+                        onHeightChanged: repaintAll()
+
+                        function drawStroke(ctx, stroke, pts, begin, end) {
+                            // pts is a flat [x0, y0, x1, y1, ...] array; [begin, end) is this stroke
+                            if (!pts || end - begin < 2)
+                                return
                             ctx.strokeStyle = stroke.color
                             ctx.lineWidth = stroke.width
                             ctx.lineCap = "round"
                             ctx.lineJoin = "round"
                             ctx.beginPath()
-                            ctx.moveTo(stroke.points[0].x, stroke.points[0].y)
-                            if (stroke.points.length === 1) {
+                            ctx.moveTo(pts[begin], pts[begin + 1])
+                            if (end - begin === 2) {
                                 // Single point - draw a dot
-                                ctx.arc(stroke.points[0].x, stroke.points[0].y, stroke.width / 2, 0, 2 * Math.PI)
+                                ctx.arc(pts[begin], pts[begin + 1], stroke.width / 2, 0, 2 * Math.PI)
                                 ctx.fillStyle = stroke.color
                                 ctx.fill()
                             } else {
-                                for (var i = 1; i < stroke.points.length; ++i) {
-                                    ctx.lineTo(stroke.points[i].x, stroke.points[i].y)
+                                for (var i = begin + 2; i + 1 < end; i += 2) {
+                                    ctx.lineTo(pts[i], pts[i + 1])
                                 }
                                 ctx.stroke()
                             }
                         }
 
+                        function drawPointsStroke(ctx, stroke) {
+                            drawStroke(ctx, stroke, stroke.points, 0, stroke.points ? stroke.points.length : 0)
+                        }
+
                         onPaint: {
                             var ctx = getContext("2d")
-                            ctx.clearRect(0, 0, width, height)
-                            if (!diagramModel)
+                            if (!diagramModel) {
+                                ctx.clearRect(0, 0, width, height)
                                 return
+                            }
+
+                            if (paintedCurrentCoords < 0) {
+                                ctx.clearRect(0, 0, width, height)
+                                finishedTail = null
+                                // Draw the completed strokes whose bounds reach the view
+                                var view = root.paddedViewRect()
+                                paintedRect = view
+                                // One packed float32 buffer holds every completed stroke's points.
+                                var headers = diagramModel.getStrokeHeaders()
+                                var coords = new Float32Array(diagramModel.getStrokeCoords())
+                                for (var i = 0; i < headers.length; ++i) {
+                                    var stroke = headers[i]
+                                    var bounds = stroke.bounds
+                                    var pad = stroke.width / 2
+                                    if (bounds.length === 4
+                                            && (bounds[2] + pad < view.x
+                                                || bounds[0] - pad > view.x + view.width
+                                                || bounds[3] + pad < view.y
+                                                || bounds[1] - pad > view.y + view.height))
+                                        continue
+                                    drawStroke(ctx, stroke, coords, stroke.offset, stroke.offset + stroke.count)
+                                }
+                                paintedCurrentCoords = 0
+                            }
 
-                            // Draw all completed strokes
-                            var allStrokes = diagramModel.strokes
-                            for (var i = 0; i < allStrokes.length; ++i) {
-                                drawStroke(ctx, allStrokes[i])
+                            if (finishedTail) {
+                                drawPointsStroke(ctx, finishedTail)
+                                finishedTail = null
                             }
 
-                            // Draw current stroke being drawn
-                            var current = diagramModel.getCurrentStroke()
-                            if (current && current.points && current.points.length >= 1) {
-                                drawStroke(ctx, current)
+                            // Draw only the unpainted tail of the current stroke, starting
+                            // from its last painted point so the segments join up.
+                            var start = Math.max(0, paintedCurrentCoords - 2)
+                            var tail = diagramModel.getCurrentStrokeFrom(start)
+                            if (tail && tail.points && tail.points.length >= 2) {
+                                if (tail.points.length > 2 || paintedCurrentCoords === 0)
+                                    drawPointsStroke(ctx, tail)
+                                paintedCurrentCoords = start + tail.points.length
                             }
                         }
 
@@ -2506,11 +2795,27 @@ ApplicationWindow {
                             z: 100
 
                             property bool isDrawing: false
+                            property real lastStrokeX: 0
+                            property real lastStrokeY: 0
+
+                            function extendStroke(x, y) {
+                                // Moves under 1px add nothing visible, so they never reach the model.
+                                var dx = x - lastStrokeX
+                                var dy = y - lastStrokeY
+                                if (dx * dx + dy * dy < 1.0)
+                                    return
+                                lastStrokeX = x
+                                lastStrokeY = y
+                                diagramModel.continueStroke(x, y)
+                                drawingCanvas.requestPaint()
+                            }
 
                             onPressed: function(mouse) {
                                 if (!diagramModel || !diagramModel.drawingMode)
                                     return
                                 isDrawing = true
+                                lastStrokeX = mouse.x
+                                lastStrokeY = mouse.y
                                 diagramModel.startStroke(mouse.x, mouse.y)
                                 drawingCanvas.requestPaint()
                             }
@@ -2518,23 +2823,22 @@ ApplicationWindow {
                             onPositionChanged: function(mouse) {
                                 if (!diagramModel || !isDrawing)
                                     return
-                                diagramModel.continueStroke(mouse.x, mouse.y)
-                                drawingCanvas.requestPaint()
+                                extendStroke(mouse.x, mouse.y)
                             }
 
                             onReleased: function(mouse) {
                                 if (!diagramModel)
                                     return
+                                drawingCanvas.finishStroke()
                                 isDrawing = false
-                                diagramModel.endStroke()
-                                drawingCanvas.requestPaint()
                             }
 
                             onCanceled: {
-                                isDrawing = false
                                 if (diagramModel)
-                                    diagramModel.endStroke()
-                                drawingCanvas.requestPaint()
+                                    drawingCanvas.finishStroke()
+                                else
+                                    drawingCanvas.repaintAll()
+                                isDrawing = false
                             }
                         }
                     }
@@ -2555,7 +2859,7 @@ ApplicationWindow {
                                 var pos = mapToItem(diagramLayer, mouse.x, mouse.y)
                                 diagramLayer.contextMenuX = pos.x
                                 diagramLayer.contextMenuY = pos.y
-                                canvasContextMenu.popup()
+                                canvasContextMenuLoader.popup()
                             }
                         }
                     }
@@ -2572,6 +2876,22 @@ ApplicationWindow {
                             property bool taskCurrent: model.taskCurrent
                             property string folderPath: model.folderPath
                             property bool isTask: itemRect.itemType === "task" && itemRect.taskIndex >= 0
+                            readonly property bool isFreeText: itemRect.itemType === "freetext"
+                            readonly property bool isObstacle: itemRect.itemType === "obstacle"
+                            readonly property bool isWish: itemRect.itemType === "wish"
+                            readonly property bool isImage: itemRect.itemType === "image"
+                            readonly property bool isCloud: itemRect.itemType === "cloud"
+                            readonly property bool isDatabase: itemRect.itemType === "database"
+                            readonly property bool isServer: itemRect.itemType === "server"
+                            readonly property bool isNote: itemRect.itemType === "note"
+                            readonly property bool isChatGpt: itemRect.itemType === "chatgpt"
+                            readonly property bool showCenterLabel: !isFreeText && !isObstacle && !isWish && !isImage
+                            readonly property bool alertActive: itemRect.taskCountdownExpired || itemRect.taskContractBreached
+                            // Shades used by the fill and border bindings below. They re-run on
+                            // drag, hover-target and task state changes; these only on model.color.
+                            readonly property color completedColor: Qt.darker(model.color, 1.5)
+                            readonly property color dragBorderColor: Qt.lighter(model.color, 1.4)
+                            readonly property color restingBorderColor: Qt.darker(model.color, 1.6)
                             property real dragStartX: 0
                             property real dragStartY: 0
                             property real pinchStartWidth: model.width
@@ -2601,14 +2921,14 @@ ApplicationWindow {
                                 ? freeTextTabs[Math.max(0, Math.min(freeTextTabIndex, freeTextTabCount - 1))]
                                 : null
                             property string freeTextDisplayText: {
-                                if (itemRect.itemType !== "freetext")
+                                if (!itemRect.isFreeText)
                                     return model.text
                                 if (freeTextActiveTab && freeTextActiveTab.text !== undefined)
                                     return String(freeTextActiveTab.text || "")
                                 return model.text
                             }
                             property string freeTextActiveTabName: {
-                                if (itemRect.itemType !== "freetext")
+                                if (!itemRect.isFreeText)
                                     return ""
                                 if (freeTextActiveTab && freeTextActiveTab.name !== undefined) {
                                     var tabName = String(freeTextActiveTab.name || "").trim()
@@ -2618,7 +2938,7 @@ ApplicationWindow {
                                 return freeTextTabCount > 0 ? "Tab " + (Math.max(0, Math.min(freeTextTabIndex, freeTextTabCount - 1)) + 1) : ""
                             }
                             function cycleFreeTextTab(step) {
-                                if (!diagramModel || itemRect.itemType !== "freetext" || freeTextTabCount <= 1)
+                                if (!diagramModel || !itemRect.isFreeText || freeTextTabCount <= 1)
                                     return
                                 var nextIndex = freeTextTabIndex + step
                                 if (nextIndex < 0)
@@ -2629,7 +2949,7 @@ ApplicationWindow {
                             }
                             property real labelLeftInset: {
                                 var inset = 12
-                                if (itemRect.itemType === "chatgpt")
+                                if (itemRect.isChatGpt)
                                     inset = Math.max(inset, 40)
                                 return inset
                             }
@@ -2637,7 +2957,7 @@ ApplicationWindow {
                                 var inset = 12
                                 if (linkedSubtabBadge.visible)
                                     inset = Math.max(inset, linkedSubtabBadge.width + linkedSubtabBadge.anchors.rightMargin + 6)
-                                if (itemRect.itemType === "note")
+                                if (itemRect.isNote)
                                     inset = Math.max(inset, 34)
                                 return inset
                             }
@@ -2649,9 +2969,9 @@ ApplicationWindow {
                                     inset = Math.max(inset, noteBadge.height + noteBadge.anchors.topMargin + 4)
                                 if (linkedSubtabBadge.visible)
                                     inset = Math.max(inset, linkedSubtabBadge.height + linkedSubtabBadge.anchors.topMargin + 4)
-                                if (itemRect.itemType === "chatgpt")
+                                if (itemRect.isChatGpt)
                                     inset = Math.max(inset, 38)
-                                if (itemRect.itemType === "note")
+                                if (itemRect.isNote)
                                     inset = Math.max(inset, 32)
                                 return inset
                             }
@@ -2667,14 +2987,38 @@ ApplicationWindow {
                             y: model.y
                             width: model.width
                             height: model.height
-                            radius: itemRect.itemType === "cloud" ? Math.min(width, height) / 2 : 12
-                            color: itemRect.itemType === "image" ? "transparent" : (itemRect.isTask && itemRect.taskCompleted ? Qt.darker(model.color, 1.5) : model.color)
-                            border.width: (itemRect.taskCountdownExpired || itemRect.taskContractBreached) ? 4 : (itemRect.taskCurrent ? 4 : (isEdgeDropTarget ? 3 : 1))
-                            border.color: (itemRect.taskCountdownExpired || itemRect.taskContractBreached) ? "#e74c3c" : (itemRect.taskCurrent ? "#ffcc00" : (isEdgeDropTarget ? "#74d9a0" : (itemDrag.active ? Qt.lighter(model.color, 1.4) : Qt.darker(model.color, 1.6))))
+                            radius: itemRect.isCloud ? Math.min(width, height) / 2 : 12
+                            color: itemRect.isImage ? "transparent" : (itemRect.isTask && itemRect.taskCompleted ? itemRect.completedColor : model.color)
+                            border.width: 1
+                            border.color: itemRect.alertActive ? "#e74c3c" : (itemRect.taskCurrent ? "#ffcc00" : (isEdgeDropTarget ? "#74d9a0" : (itemDrag.active ? itemRect.dragBorderColor : itemRect.restingBorderColor)))
                             z: itemRect.taskCurrent ? 15 : (isEdgeDropTarget ? 10 : 5)
-                            scale: isEdgeDropTarget ? 1.08 : 1.0
+                            scale: 1.0
                             transformOrigin: Item.Center
 
+                            // Each emphasis combination is its own state, so every scale or border
+                            // change runs the shared transition; x/y follow the drag without easing.
+                            readonly property bool emphasised: itemRect.alertActive || itemRect.taskCurrent
+                            states: [
+                                State {
+                                    name: "emphasisedDropTarget"
+                                    when: itemRect.emphasised && itemRect.isEdgeDropTarget
+                                    PropertyChanges { target: itemRect; border.width: 4; scale: 1.08 }
+                                },
+                                State {
+                                    name: "emphasised"
+                                    when: itemRect.emphasised
+                                    PropertyChanges { target: itemRect; border.width: 4 }
+                                },
+                                State {
+                                    name: "dropTarget"
+                                    when: itemRect.isEdgeDropTarget
+                                    PropertyChanges { target: itemRect; border.width: 3; scale: 1.08 }
+                                }
+                            ]
+                            transitions: Transition {
+                                NumberAnimation { properties: "scale,border.width"; duration: 120; easing.type: Easing.OutQuad }
+                            }
+
                             // Glow effect for current task
                             Rectangle {
                                 visible: itemRect.taskCurrent
@@ -2703,24 +3047,25 @@ ApplicationWindow {
                                 color: "#e8a838"
                                 z: 25
 
-                                Canvas {
+                                Shape {
+                                    id: folderGlyph
                                     anchors.centerIn: parent
                                     width: 16
                                     height: 12
-                                    onPaint: {
-                                        var ctx = getContext("2d")
-                                        ctx.clearRect(0, 0, width, height)
-                                        ctx.fillStyle = "#ffffff"
-                                        // Folder tab
-                                        ctx.beginPath()
-                                        ctx.moveTo(0, 2)
-                                        ctx.lineTo(0, height)
-                                        ctx.lineTo(width, height)
-                                        ctx.lineTo(width, 4)
-                                        ctx.lineTo(7, 4)
-                                        ctx.lineTo(5.5, 2)
-                                        ctx.closePath()
-                                        ctx.fill()
+                                    preferredRendererType: Shape.CurveRenderer
+
+                                    // Folder tab
+                                    ShapePath {
+                                        fillColor: "#ffffff"
+                                        strokeColor: "transparent"
+                                        startX: 0
+                                        startY: 2
+                                        PathLine { x: 0; y: folderGlyph.height }
+                                        PathLine { x: folderGlyph.width; y: folderGlyph.height }
+                                        PathLine { x: folderGlyph.width; y: 4 }
+                                        PathLine { x: 7; y: 4 }
+                                        PathLine { x: 5.5; y: 2 }
+                                        PathLine { x: 0; y: 2 }
                                     }
                                 }
 
@@ -2777,14 +3122,12 @@ ApplicationWindow {
                                 }
                             }
 
-                            Behavior on scale { NumberAnimation { duration: 120; easing.type: Easing.OutQuad } }
-                            Behavior on border.width { NumberAnimation { duration: 120; easing.type: Easing.OutQuad } }
-                            Behavior on x { NumberAnimation { duration: 80; easing.type: Easing.OutQuad } }
-                            Behavior on y { NumberAnimation { duration: 80; easing.type: Easing.OutQuad } }
-
+                            // Drag shade; hidden rather than transparent so it leaves the scene graph.
                             Rectangle {
+                                id: dragShade
                                 anchors.fill: parent
-                                color: Qt.rgba(0, 0, 0, itemDrag.active ? 0.08 : 0)
+                                visible: itemDrag.active
+                                color: Qt.rgba(0, 0, 0, 0.08)
                                 radius: itemRect.radius
                             }
 
@@ -2809,12 +3152,14 @@ ApplicationWindow {
                                 border.width: 2
                                 z: 20
 
-                                Text {
+                                // Shared glyph images batch through the scene graph's texture atlas.
+                                Image {
                                     anchors.centerIn: parent
-                                    text: itemRect.taskCompleted ? "✓" : ""
-                                    color: itemRect.taskCompleted ? "#1b2028" : "#8a93a5"
-                                    font.pixelSize: 12
-                                    font.bold: true
+                                    visible: itemRect.taskCompleted
+                                    width: 12
+                                    height: 12
+                                    sourceSize: Qt.size(24, 24)
+                                    source: "icons/check_dark.svg"
                                 }
 
                                 MouseArea {
@@ -2842,12 +3187,12 @@ ApplicationWindow {
                                 border.width: 2
                                 z: 20
 
-                                Text {
+                                Image {
                                     anchors.centerIn: parent
-                                    text: "★"
-                                    color: itemRect.taskCurrent ? "#1b2028" : "#8a93a5"
-                                    font.pixelSize: 11
-                                    font.bold: true
+                                    width: 12
+                                    height: 12
+                                    sourceSize: Qt.size(24, 24)
+                                    source: itemRect.taskCurrent ? "icons/star_dark.svg" : "icons/star_muted.svg"
                                 }
 
                                 MouseArea {
@@ -2902,7 +3247,7 @@ ApplicationWindow {
 
                             Rectangle {
                                 id: noteBadge
-                                visible: itemRect.itemType !== "note" && itemRect.itemType !== "freetext" && itemRect.itemType !== "image"
+                                visible: !itemRect.isNote && !itemRect.isFreeText && !itemRect.isImage
                                 width: 18
                                 height: 18
                                 radius: 4
@@ -2935,7 +3280,7 @@ ApplicationWindow {
 
                             Rectangle {
                                 id: obstacleBadge
-                                visible: itemRect.itemType !== "image" && model.obstacleMarkdown && model.obstacleMarkdown.trim().length > 0
+                                visible: !itemRect.isImage && model.obstacleMarkdown && model.obstacleMarkdown.trim().length > 0
                                 width: 18
                                 height: 18
                                 radius: 9
@@ -3104,117 +3449,127 @@ ApplicationWindow {
                                 }
                             }
 
-                            Item {
+                            // Only items of this type build their decoration.
+                            Loader {
                                 anchors.fill: parent
-                                visible: itemRect.itemType === "database"
-
-                                Rectangle {
-                                    anchors.horizontalCenter: parent.horizontalCenter
-                                    anchors.top: parent.top
-                                    anchors.topMargin: 6
-                                    width: parent.width - 12
-                                    height: parent.height * 0.25
-                                    radius: height / 2
-                                    color: Qt.lighter(model.color, 1.3)
-                                    opacity: 0.9
-                                }
+                                active: itemRect.isDatabase
+                                sourceComponent: Component {
+                                    Item {
+                                        Rectangle {
+                                            anchors.horizontalCenter: parent.horizontalCenter
+                                            anchors.top: parent.top
+                                            anchors.topMargin: 6
+                                            width: parent.width - 12
+                                            height: parent.height * 0.25
+                                            radius: height / 2
+                                            color: Qt.lighter(model.color, 1.3)
+                                            opacity: 0.9
+                                        }
 
-                                Rectangle {
-                                    anchors.horizontalCenter: parent.horizontalCenter
-                                    anchors.bottom: parent.bottom
-                                    anchors.bottomMargin: 6
-                                    width: parent.width - 12
-                                    height: parent.height * 0.22
-                                    radius: height / 2
-                                    color: Qt.darker(model.color, 1.2)
-                                    opacity: 0.7
+                                        Rectangle {
+                                            anchors.horizontalCenter: parent.horizontalCenter
+                                            anchors.bottom: parent.bottom
+                                            anchors.bottomMargin: 6
+                                            width: parent.width - 12
+                                            height: parent.height * 0.22
+                                            radius: height / 2
+                                            color: Qt.darker(model.color, 1.2)
+                                            opacity: 0.7
+                                        }
+                                    }
                                 }
                             }
 
-                            Item {
+                            Loader {
                                 anchors.fill: parent
-                                visible: itemRect.itemType === "server"
-
-                                Column {
-                                    anchors.fill: parent
-                                    anchors.margins: 12
-                                    spacing: 8
+                                active: itemRect.isServer
+                                sourceComponent: Component {
+                                    Item {
+                                        Column {
+                                            anchors.fill: parent
+                                            anchors.margins: 12
+                                            spacing: 8
+
+                                            Rectangle {
+                                                height: 6
+                                                radius: 3
+                                                color: Qt.darker(model.color, 1.4)
+                                                opacity: 0.5
+                                            }
 
-                                    Rectangle {
-                                        height: 6
-                                        radius: 3
-                                        color: Qt.darker(model.color, 1.4)
-                                        opacity: 0.5
-                                    }
+                                            Row {
+                                                spacing: 8
+                                                anchors.horizontalCenter: parent.horizontalCenter
 
-                                    Row {
-                                        spacing: 8
-                                        anchors.horizontalCenter: parent.horizontalCenter
+                                                Rectangle {
+                                                    width: 12
+                                                    height: 12
+                                                    radius: 6
+                                                    color: "#5af58a"
+                                                }
 
-                                        Rectangle {
-                                            width: 12
-                                            height: 12
-                                            radius: 6
-                                            color: "#5af58a"
-                                        }
+                                                Rectangle {
+                                                    width: 12
+                                                    height: 12
+                                                    radius: 6
+                                                    color: "#ffe266"
+                                                }
 
-                                        Rectangle {
-                                            width: 12
-                                            height: 12
-                                            radius: 6
-                                            color: "#ffe266"
-                                        }
+                                                Rectangle {
+                                                    width: 12
+                                                    height: 12
+                                                    radius: 6
+                                                    color: "#f66d5a"
+                                                }
+                                            }
 
-                                        Rectangle {
-                                            width: 12
-                                            height: 12
-                                            radius: 6
-                                            color: "#f66d5a"
+                                            Rectangle {
+                                                height: 6
+                                                radius: 3
+                                                color: Qt.lighter(model.color, 1.2)
+                                                opacity: 0.5
+                                            }
                                         }
                                     }
-
-                                    Rectangle {
-                                        height: 6
-                                        radius: 3
-                                        color: Qt.lighter(model.color, 1.2)
-                                        opacity: 0.5
-                                    }
                                 }
                             }
 
-                            Item {
+                            Loader {
                                 anchors.fill: parent
-                                visible: itemRect.itemType === "cloud"
-
-                                Rectangle {
-                                    width: parent.width * 0.55
-                                    height: parent.height * 0.55
-                                    radius: height / 2
-                                    anchors.centerIn: parent
-                                    color: Qt.lighter(model.color, 1.25)
-                                    opacity: 0.9
-                                }
+                                active: itemRect.isCloud
+                                sourceComponent: Component {
+                                    Item {
+                                        Rectangle {
+                                            width: parent.width * 0.55
+                                            height: parent.height * 0.55
+                                            radius: height / 2
+                                            anchors.centerIn: parent
+                                            color: Qt.lighter(model.color, 1.25)
+                                            opacity: 0.9
+                                        }
 
-                                Rectangle {
-                                    width: parent.width * 0.45
-                                    height: parent.height * 0.45
-                                    radius: height / 2
-                                    anchors.verticalCenter: parent.verticalCenter
-                                    anchors.left: parent.left
-                                    anchors.leftMargin: parent.width * 0.08
-                                    color: Qt.lighter(model.color, 1.4)
-                                    opacity: 0.85
-                                }
+                                        Rectangle {
+                                            width: parent.width * 0.45
+                                            height: parent.height * 0.45
+                                            radius: height / 2
+                                            anchors.verticalCenter: parent.verticalCenter
+                                            anchors.left: parent.left
+                                            anchors.leftMargin: parent.width * 0.08
+                                            color: Qt.lighter(model.color, 1.4)
+                                            opacity: 0.85
+                                        }
 
-                                Rectangle {
-                                    width: parent.width * 0.45
-                                    height: parent.height * 0.45
-                                    radius: height / 2
-                                    anchors.verticalCenter: parent.verticalCenter
-                                    anchors.right: parent.right
-                                    anchors.rightMargin: parent.width * 0.08
-                                    color: Qt.lighter(model.color, 1.4)
-                                    opacity: 0.85
+                                        Rectangle {
+                                            width: parent.width * 0.45
+                                            height: parent.height * 0.45
+                                            radius: height / 2
+                                            anchors.verticalCenter: parent.verticalCenter
+                                            anchors.right: parent.right
+                                            anchors.rightMargin: parent.width * 0.08
+                                            color: Qt.lighter(model.color, 1.4)
+                                            opacity: 0.85
+                                        }
+                                    }
                                 }
                             }
 
@@ -3228,450 +3583,492 @@ ApplicationWindow {
                                 color: Qt.lighter(model.color, 1.3)
                                 border.color: Qt.darker(model.color, 1.2)
                                 rotation: 45
-                                visible: itemRect.itemType === "note"
+                                visible: itemRect.isNote
                                 radius: 2
                                 transformOrigin: Item.Center
                             }
 
-                            Item {
+                            Loader {
                                 anchors.fill: parent
-                                visible: itemRect.itemType === "obstacle"
-
-                                Rectangle {
-                                    id: flagPole
-                                    anchors.left: parent.left
-                                    anchors.leftMargin: 16
-                                    anchors.top: parent.top
-                                    anchors.topMargin: 10
-                                    anchors.bottom: parent.bottom
-                                    anchors.bottomMargin: 10
-                                    width: 4
-                                    radius: 2
-                                    color: Qt.darker(model.color, 1.5)
-                                }
+                                active: itemRect.isObstacle
+                                sourceComponent: Component {
+                                    Item {
+                                        Rectangle {
+                                            id: flagPole
+                                            anchors.left: parent.left
+                                            anchors.leftMargin: 16
+                                            anchors.top: parent.top
+                                            anchors.topMargin: 10
+                                            anchors.bottom: parent.bottom
+                                            anchors.bottomMargin: 10
+                                            width: 4
+                                            radius: 2
+                                            color: Qt.darker(model.color, 1.5)
+                                        }
 
-                                Rectangle {
-                                    anchors.left: flagPole.right
-                                    anchors.top: parent.top
-                                    anchors.topMargin: 12
-                                    width: parent.width * 0.55
-                                    height: parent.height * 0.45
-                                    color: Qt.lighter(model.color, 1.15)
-                                    border.color: Qt.darker(model.color, 1.2)
-                                    border.width: 1
-                                    radius: 4
-
-                                    Canvas {
-                                        anchors.fill: parent
-                                        onPaint: {
-                                            var ctx = getContext("2d")
-                                            ctx.clearRect(0, 0, width, height)
-                                            ctx.strokeStyle = Qt.darker(model.color, 1.3)
-                                            ctx.lineWidth = 1.5
-                                            ctx.beginPath()
-                                            ctx.moveTo(6, height * 0.3)
-                                            ctx.lineTo(width - 6, height * 0.3)
-                                            ctx.moveTo(6, height * 0.55)
-                                            ctx.lineTo(width - 6, height * 0.55)
-                                            ctx.moveTo(6, height * 0.8)
-                                            ctx.lineTo(width * 0.6, height * 0.8)
-                                            ctx.stroke()
+                                        Rectangle {
+                                            anchors.left: flagPole.right
+                                            anchors.top: parent.top
+                                            anchors.topMargin: 12
+                                            width: parent.width * 0.55
+                                            height: parent.height * 0.45
+                                            color: Qt.lighter(model.color, 1.15)
+                                            border.color: Qt.darker(model.color, 1.2)
+                                            border.width: 1
+                                            radius: 4
+
+                                            Shape {
+                                                id: flagLines
+                                                anchors.fill: parent
+                                                preferredRendererType: Shape.CurveRenderer
+
+                                                ShapePath {
+                                                    fillColor: "transparent"
+                                                    strokeColor: Qt.darker(model.color, 1.3)
+                                                    strokeWidth: 1.5
+                                                    capStyle: ShapePath.FlatCap
+                                                    PathMove { x: 6; y: flagLines.height * 0.3 }
+                                                    PathLine { x: flagLines.width - 6; y: flagLines.height * 0.3 }
+                                                    PathMove { x: 6; y: flagLines.height * 0.55 }
+                                                    PathLine { x: flagLines.width - 6; y: flagLines.height * 0.55 }
+                                                    PathMove { x: 6; y: flagLines.height * 0.8 }
+                                                    PathLine { x: flagLines.width * 0.6; y: flagLines.height * 0.8 }
+                                                }
+                                            }
                                         }
                                     }
                                 }
                             }
 
-                            Item {
+                            Loader {
                                 anchors.fill: parent
-                                visible: itemRect.itemType === "wish"
-
-                                Item {
-                                    anchors.horizontalCenter: parent.horizontalCenter
-                                    anchors.top: parent.top
-                                    anchors.topMargin: 8
-                                    width: Math.min(parent.width, parent.height) * 0.5
-                                    height: width
-
-                                    Rectangle {
-                                        anchors.fill: parent
-                                        radius: width / 2
-                                        color: Qt.lighter(model.color, 1.2)
-                                        border.color: Qt.darker(model.color, 1.3)
-                                        border.width: 2
-
-                                        Rectangle {
-                                            x: parent.width * 0.28
-                                            y: parent.height * 0.32
-                                            width: parent.width * 0.12
-                                            height: parent.height * 0.12
-                                            radius: width / 2
-                                            color: "#2d3436"
-                                        }
+                                active: itemRect.isWish
+                                sourceComponent: Component {
+                                    Item {
+                                        Item {
+                                            anchors.horizontalCenter: parent.horizontalCenter
+                                            anchors.top: parent.top
+                                            anchors.topMargin: 8
+                                            width: Math.min(parent.width, parent.height) * 0.5
+                                            height: width
+
+                                            Rectangle {
+                                                anchors.fill: parent
+                                                radius: width / 2
+                                                color: Qt.lighter(model.color, 1.2)
+                                                border.color: Qt.darker(model.color, 1.3)
+                                                border.width: 2
+
+                                                Rectangle {
+                                                    x: parent.width * 0.28
+                                                    y: parent.height * 0.32
+                                                    width: parent.width * 0.12
+                                                    height: parent.height * 0.12
+                                                    radius: width / 2
+                                                    color: "#2d3436"
+                                                }
 
-                                        Rectangle {
-                                            x: parent.width * 0.60
-                                            y: parent.height * 0.32
-                                            width: parent.width * 0.12
-                                            height: parent.height * 0.12
-                                            radius: width / 2
-                                            color: "#2d3436"
-                                        }
+                                                Rectangle {
+                                                    x: parent.width * 0.60
+                                                    y: parent.height * 0.32
+                                                    width: parent.width * 0.12
+                                                    height: parent.height * 0.12
+                                                    radius: width / 2
+                                                    color: "#2d3436"
+                                                }
 
-                                        Canvas {
-                                            anchors.fill: parent
-                                            onPaint: {
-                                                var ctx = getContext("2d")
-                                                ctx.clearRect(0, 0, width, height)
-                                                ctx.strokeStyle = "#2d3436"
-                                                ctx.lineWidth = 2.5
-                                                ctx.lineCap = "round"
-                                                ctx.beginPath()
-                                                var smileY = height * 0.58
-                                                var smileRadius = width * 0.25
-                                                ctx.arc(width / 2, smileY, smileRadius, 0.15 * Math.PI, 0.85 * Math.PI, false)
-                                                ctx.stroke()
+                                                Shape {
+                                                    id: wishSmile
+                                                    anchors.fill: parent
+                                                    preferredRendererType: Shape.CurveRenderer
+
+                                                    ShapePath {
+                                                        fillColor: "transparent"
+                                                        strokeColor: "#2d3436"
+                                                        strokeWidth: 2.5
+                                                        capStyle: ShapePath.RoundCap
+                                                        // 0.15 pi to 0.85 pi, clockwise
+                                                        PathAngleArc {
+                                                            centerX: wishSmile.width / 2
+                                                            centerY: wishSmile.height * 0.58
+                                                            radiusX: wishSmile.width * 0.25
+                                                            radiusY: wishSmile.width * 0.25
+                                                            startAngle: 27
+                                                            sweepAngle: 126
+                                                        }
+                                                    }
+                                                }
                                             }
                                         }
                                     }
                                 }
                             }
 
-                            Item {
+                            Loader {
                                 anchors.fill: parent
-                                visible: itemRect.itemType === "chatgpt"
-
-                                Rectangle {
-                                    width: 26
-                                    height: 26
-                                    radius: 13
-                                    anchors.left: parent.left
-                                    anchors.top: parent.top
-                                    anchors.leftMargin: 8
-                                    anchors.topMargin: 8
-                                    color: Qt.lighter(model.color, 1.25)
-                                    border.color: Qt.darker(model.color, 1.4)
-                                    border.width: 1
+                                active: itemRect.isChatGpt
+                                sourceComponent: Component {
+                                    Item {
+                                        Rectangle {
+                                            width: 26
+                                            height: 26
+                                            radius: 13
+                                            anchors.left: parent.left
+                                            anchors.top: parent.top
+                                            anchors.leftMargin: 8
+                                            anchors.topMargin: 8
+                                            color: Qt.lighter(model.color, 1.25)
+                                            border.color: Qt.darker(model.color, 1.4)
+                                            border.width: 1
+
+                                            Text {
+                                                anchors.centerIn: parent
+                                                text: "GPT"
+                                                color: model.textColor
+                                                font.pixelSize: 9
+                                                font.bold: true
+                                            }
+                                        }
 
-                                    Text {
-                                        anchors.centerIn: parent
-                                        text: "GPT"
-                                        color: model.textColor
-                                        font.pixelSize: 9
-                                        font.bold: true
+                                        Rectangle {
+                                            anchors.left: parent.left
+                                            anchors.top: parent.top
+                                            anchors.leftMargin: 40
+                                            anchors.topMargin: 14
+                                            width: parent.width * 0.5
+                                            height: 6
+                                            radius: 3
+                                            color: Qt.lighter(model.color, 1.35)
+                                            opacity: 0.8
+                                        }
                                     }
                                 }
-
-                                Rectangle {
-                                    anchors.left: parent.left
-                                    anchors.top: parent.top
-                                    anchors.leftMargin: 40
-                                    anchors.topMargin: 14
-                                    width: parent.width * 0.5
-                                    height: 6
-                                    radius: 3
-                                    color: Qt.lighter(model.color, 1.35)
-                                    opacity: 0.8
-                                }
                             }
 
-                            Item {
+                            Loader {
                                 anchors.fill: parent
-                                visible: itemRect.itemType === "freetext"
+                                active: itemRect.isFreeText
                                 z: 35
-
-                                Rectangle {
-                                    id: freeTextHeader
-                                    anchors.top: parent.top
-                                    anchors.left: parent.left
-                                    anchors.right: parent.right
-                                    height: 8
-                                    color: Qt.darker(model.color, 1.15)
-                                    radius: itemRect.radius
-                                    Rectangle {
-                                        anchors.bottom: parent.bottom
-                                        anchors.left: parent.left
-                                        anchors.right: parent.right
-                                        height: parent.radius
-                                        color: parent.color
-                                    }
-                                }
-
-                                Rectangle {
-                                    anchors.top: parent.top
-                                    anchors.left: parent.left
-                                    anchors.topMargin: 12
-                                    anchors.leftMargin: 10
-                                    width: 6
-                                    height: 6
-                                    radius: 3
-                                    color: "#e17055"
-                                }
-
-                                Rectangle {
-                                    anchors.top: parent.top
-                                    anchors.left: parent.left
-                                    anchors.topMargin: 12
-                                    anchors.leftMargin: 22
-                                    width: 6
-                                    height: 6
-                                    radius: 3
-                                    color: "#fdcb6e"
-                                }
-
-                                Rectangle {
-                                    anchors.top: parent.top
-                                    anchors.left: parent.left
-                                    anchors.topMargin: 12
-                                    anchors.leftMargin: 34
-                                    width: 6
-                                    height: 6
-                                    radius: 3
-                                    color: "#00b894"
-                                }
-
-                                Rectangle {
-                                    id: freeTextTabSwitcher
-                                    visible: itemRect.freeTextTabCount > 1
-                                    anchors.top: parent.top
-                                    anchors.right: parent.right
-                                    anchors.topMargin: 10
-                                    anchors.rightMargin: 10
-                                    radius: 8
-                                    color: "#172331"
-                                    border.color: "#4f657d"
-                                    border.width: 1
-                                    width: Math.max(118, Math.min(Math.max(118, parent.width - 52), freeTextTabLabel.implicitWidth + 54))
-                                    height: 24
-                                    z: 90
-
-                                    Row {
-                                        anchors.fill: parent
-                                        anchors.leftMargin: 4
-                                        anchors.rightMargin: 4
-                                        spacing: 2
-
+                                sourceComponent: Component {
+                                    Item {
                                         Rectangle {
-                                            width: 18
-                                            height: 18
-                                            radius: 5
-                                            anchors.verticalCenter: parent.verticalCenter
-                                            color: freeTextPrevMouse.containsMouse ? "#31485f" : "transparent"
-
-                                            Label {
-                                                anchors.centerIn: parent
-                                                text: "<"
-                                                color: "#d8e5f2"
-                                                font.pixelSize: 11
-                                                font.bold: true
-                                            }
-
-                                            MouseArea {
-                                                id: freeTextPrevMouse
-                                                anchors.fill: parent
-                                                hoverEnabled: true
-                                                onClicked: itemRect.cycleFreeTextTab(-1)
+                                            id: freeTextHeader
+                                            anchors.top: parent.top
+                                            anchors.left: parent.left
+                                            anchors.right: parent.right
+                                            height: 8
+                                            color: Qt.darker(model.color, 1.15)
+                                            radius: itemRect.radius
+                                            Rectangle {
+                                                anchors.bottom: parent.bottom
+                                                anchors.left: parent.left
+                                                anchors.right: parent.right
+                                                height: parent.radius
+                                                color: parent.color
                                             }
                                         }
 
-                                        Label {
-                                            id: freeTextTabLabel
-                                            anchors.verticalCenter: parent.verticalCenter
-                                            width: freeTextTabSwitcher.width - 48
-                                            horizontalAlignment: Text.AlignHCenter
-                                            elide: Text.ElideRight
-                                            text: itemRect.freeTextActiveTabName
-                                                + " (" + (itemRect.freeTextTabIndex + 1) + "/" + itemRect.freeTextTabCount + ")"
-                                            color: "#eef6ff"
-                                            font.pixelSize: 11
-                                            font.bold: true
+                                        Rectangle {
+                                            anchors.top: parent.top
+                                            anchors.left: parent.left
+                                            anchors.topMargin: 12
+                                            anchors.leftMargin: 10
+                                            width: 6
+                                            height: 6
+                                            radius: 3
+                                            color: "#e17055"
                                         }
 
                                         Rectangle {
-                                            width: 18
-                                            height: 18
-                                            radius: 5
-                                            anchors.verticalCenter: parent.verticalCenter
-                                            color: freeTextNextMouse.containsMouse ? "#31485f" : "transparent"
+                                            anchors.top: parent.top
+                                            anchors.left: parent.left
+                                            anchors.topMargin: 12
+                                            anchors.leftMargin: 22
+                                            width: 6
+                                            height: 6
+                                            radius: 3
+                                            color: "#fdcb6e"
+                                        }
 
-                                            Label {
-                                                anchors.centerIn: parent
-                                                text: ">"
-                                                color: "#d8e5f2"
-                                                font.pixelSize: 11
-                                                font.bold: true
-                                            }
+                                        Rectangle {
+                                            anchors.top: parent.top
+                                            anchors.left: parent.left
+                                            anchors.topMargin: 12
+                                            anchors.leftMargin: 34
+                                            width: 6
+                                            height: 6
+                                            radius: 3
+                                            color: "#00b894"
+                                        }
 
-                                            MouseArea {
-                                                id: freeTextNextMouse
+                                        Rectangle {
+                                            id: freeTextTabSwitcher
+                                            visible: itemRect.freeTextTabCount > 1
+                                            anchors.top: parent.top
+                                            anchors.right: parent.right
+                                            anchors.topMargin: 10
+                                            anchors.rightMargin: 10
+                                            radius: 8
+                                            color: "#172331"
+                                            border.color: "#4f657d"
+                                            border.width: 1
+                                            width: Math.max(118, Math.min(Math.max(118, parent.width - 52), freeTextTabLabel.implicitWidth + 54))
+                                            height: 24
+                                            z: 90
+
+                                            Row {
                                                 anchors.fill: parent
-                                                hoverEnabled: true
-                                                onClicked: itemRect.cycleFreeTextTab(1)
+                                                anchors.leftMargin: 4
+                                                anchors.rightMargin: 4
+                                                spacing: 2
+
+                                                Rectangle {
+                                                    width: 18
+                                                    height: 18
+                                                    radius: 5
+                                                    anchors.verticalCenter: parent.verticalCenter
+                                                    color: freeTextPrevMouse.containsMouse ? "#31485f" : "transparent"
+
+                                                    Label {
+                                                        anchors.centerIn: parent
+                                                        text: "<"
+                                                        color: "#d8e5f2"
+                                                        font.pixelSize: 11
+                                                        font.bold: true
+                                                    }
+
+                                                    MouseArea {
+                                                        id: freeTextPrevMouse
+                                                        anchors.fill: parent
+                                                        hoverEnabled: true
+                                                        onClicked: itemRect.cycleFreeTextTab(-1)
+                                                    }
+                                                }
+
+                                                Label {
+                                                    id: freeTextTabLabel
+                                                    anchors.verticalCenter: parent.verticalCenter
+                                                    width: freeTextTabSwitcher.width - 48
+                                                    horizontalAlignment: Text.AlignHCenter
+                                                    elide: Text.ElideRight
+                                                    text: itemRect.freeTextActiveTabName
+                                                        + " (" + (itemRect.freeTextTabIndex + 1) + "/" + itemRect.freeTextTabCount + ")"
+                                                    color: "#eef6ff"
+                                                    font.pixelSize: 11
+                                                    font.bold: true
+                                                }
+
+                                                Rectangle {
+                                                    width: 18
+                                                    height: 18
+                                                    radius: 5
+                                                    anchors.verticalCenter: parent.verticalCenter
+                                                    color: freeTextNextMouse.containsMouse ? "#31485f" : "transparent"
+
+                                                    Label {
+                                                        anchors.centerIn: parent
+                                                        text: ">"
+                                                        color: "#d8e5f2"
+                                                        font.pixelSize: 11
+                                                        font.bold: true
+                                                    }
+
+                                                    MouseArea {
+                                                        id: freeTextNextMouse
+                                                        anchors.fill: parent
+                                                        hoverEnabled: true
+                                                        onClicked: itemRect.cycleFreeTextTab(1)
+                                                    }
+                                                }
                                             }
                                         }
-                                    }
-                                }
 
-                                Rectangle {
-                                    id: freetextResizeHandle
-                                    anchors.bottom: parent.bottom
-                                    anchors.right: parent.right
-                                    anchors.bottomMargin: 2
-                                    anchors.rightMargin: 2
-                                    width: 24
-                                    height: 24
-                                    color: freetextResizeDrag.active || freetextResizeHover.containsMouse ? "#3a4555" : "transparent"
-                                    radius: 3
-                                    z: 100
+                                        Rectangle {
+                                            id: freetextResizeHandle
+                                            anchors.bottom: parent.bottom
+                                            anchors.right: parent.right
+                                            anchors.bottomMargin: 2
+                                            anchors.rightMargin: 2
+                                            width: 24
+                                            height: 24
+                                            color: freetextResizeDrag.active || freetextResizeHover.containsMouse ? "#3a4555" : "transparent"
+                                            radius: 3
+                                            z: 100
+
+                                            HoverHandler {
+                                                id: freetextResizeHover
+                                                cursorShape: Qt.SizeFDiagCursor
+                                            }
 
-                                    HoverHandler {
-                                        id: freetextResizeHover
-                                        cursorShape: Qt.SizeFDiagCursor
-                                    }
+                                            property real resizeStartWidth: 0
+                                            property real resizeStartHeight: 0
 
-                                    property real resizeStartWidth: 0
-                                    property real resizeStartHeight: 0
-
-                                    Canvas {
-                                        anchors.fill: parent
-                                        anchors.margins: 2
-                                        onPaint: {
-                                            var ctx = getContext("2d")
-                                            ctx.clearRect(0, 0, width, height)
-                                            ctx.strokeStyle = Qt.darker(model.color, 1.25)
-                                            ctx.lineWidth = 1.5
-                                            ctx.beginPath()
-                                            ctx.moveTo(0, height)
-                                            ctx.lineTo(width, 0)
-                                            ctx.moveTo(width * 0.4, height)
-                                            ctx.lineTo(width, height * 0.4)
-                                            ctx.stroke()
-                                        }
-                                    }
-
-                                    DragHandler {
-                                        id: freetextResizeDrag
-                                        target: null
-                                        acceptedButtons: Qt.LeftButton
-                                        cursorShape: Qt.SizeFDiagCursor
-                                        onActiveChanged: {
-                                            if (active) {
-                                                itemRect.resizing = true
-                                                freetextResizeHandle.resizeStartWidth = model.width
-                                                freetextResizeHandle.resizeStartHeight = model.height
-                                            } else {
-                                                itemRect.resizing = false
+                                            Shape {
+                                                id: freetextResizeGrip
+                                                anchors.fill: parent
+                                                anchors.margins: 2
+                                                preferredRendererType: Shape.CurveRenderer
+
+                                                ShapePath {
+                                                    fillColor: "transparent"
+                                                    strokeColor: Qt.darker(model.color, 1.25)
+                                                    strokeWidth: 1.5
+                                                    capStyle: ShapePath.FlatCap
+                                                    PathMove { x: 0; y: freetextResizeGrip.height }
+                                                    PathLine { x: freetextResizeGrip.width; y: 0 }
+                                                    PathMove { x: freetextResizeGrip.width * 0.4; y: freetextResizeGrip.height }
+                                                    PathLine { x: freetextResizeGrip.width; y: freetextResizeGrip.height * 0.4 }
+                                                }
                                             }
-                                        }
-                                        onTranslationChanged: {
-                                            if (!active || !diagramModel)
-                                                return
-                                            var deltaX = translation.x / root.zoomLevel
-                                            var deltaY = translation.y / root.zoomLevel
-                                            var newWidth = Math.max(60, freetextResizeHandle.resizeStartWidth + deltaX)
-                                            var newHeight = Math.max(40, freetextResizeHandle.resizeStartHeight + deltaY)
-                                            if (root.snapToGrid) {
-                                                newWidth = Math.max(root.gridSpacing, Math.round(newWidth / root.gridSpacing) * root.gridSpacing)
-                                                newHeight = Math.max(root.gridSpacing, Math.round(newHeight / root.gridSpacing) * root.gridSpacing)
+
+                                            DragHandler {
+                                                id: freetextResizeDrag
+                                                target: null
+                                                acceptedButtons: Qt.LeftButton
+                                                cursorShape: Qt.SizeFDiagCursor
+                                                onActiveChanged: {
+                                                    if (active) {
+                                                        itemRect.resizing = true
+                                                        freetextResizeHandle.resizeStartWidth = model.width
+                                                        freetextResizeHandle.resizeStartHeight = model.height
+                                                    } else {
+                                                        itemRect.resizing = false
+                                                    }
+                                                }
+                                                onTranslationChanged: {
+                                                    if (!active || !diagramModel)
+                                                        return
+                                                    var deltaX = translation.x / root.zoomLevel
+                                                    var deltaY = translation.y / root.zoomLevel
+                                                    var newWidth = Math.max(60, freetextResizeHandle.resizeStartWidth + deltaX)
+                                                    var newHeight = Math.max(40, freetextResizeHandle.resizeStartHeight + deltaY)
+                                                    if (root.snapToGrid) {
+                                                        newWidth = Math.max(root.gridSpacing, Math.round(newWidth / root.gridSpacing) * root.gridSpacing)
+                                                        newHeight = Math.max(root.gridSpacing, Math.round(newHeight / root.gridSpacing) * root.gridSpacing)
+                                                    }
+                                                    diagramModel.resizeItem(itemRect.itemId, newWidth, newHeight)
+                                                }
                                             }
-                                            diagramModel.resizeItem(itemRect.itemId, newWidth, newHeight)
-                                            edgeCanvas.requestPaint()
                                         }
                                     }
                                 }
                             }
 
-                            Item {
+                            Loader {
                                 anchors.fill: parent
-                                visible: itemRect.itemType === "image" && model.imageData.length > 0
-
-                                Image {
-                                    id: pastedImage
-                                    anchors.fill: parent
-                                    anchors.margins: 4
-                                    source: model.imageData.length > 0 ? "data:image/png;base64," + model.imageData : ""
-                                    fillMode: Image.PreserveAspectFit
-                                    smooth: true
-                                    mipmap: true
-                                }
-
-                                // Resize handle for images
-                                Rectangle {
-                                    id: imageResizeHandle
-                                    width: 16
-                                    height: 16
-                                    anchors.right: parent.right
-                                    anchors.bottom: parent.bottom
-                                    anchors.rightMargin: 2
-                                    anchors.bottomMargin: 2
-                                    color: "#3a4555"
-                                    border.color: "#5a6575"
-                                    radius: 3
-                                    visible: itemRect.itemType === "image" && (itemRect.hovered || itemRect.selected || itemRect.resizing)
-
-                                    Canvas {
-                                        anchors.fill: parent
-                                        onPaint: {
-                                            var ctx = getContext("2d")
-                                            ctx.clearRect(0, 0, width, height)
-                                            ctx.strokeStyle = "#8a93a5"
-                                            ctx.lineWidth = 1.5
-                                            ctx.beginPath()
-                                            ctx.moveTo(4, height - 4)
-                                            ctx.lineTo(width - 4, 4)
-                                            ctx.moveTo(8, height - 4)
-                                            ctx.lineTo(width - 4, 8)
-                                            ctx.stroke()
+                                active: itemRect.isImage && model.imageData.length > 0
+                                sourceComponent: Component {
+                                    Item {
+                                        Image {
+                                            id: pastedImage
+                                            anchors.fill: parent
+                                            anchors.margins: 4
+                                            // Decode for the sharpest zoom on this screen; the provider never
+                                            // upscales, so the source resolution caps it. Refreshed only
+                                            // once a resize ends, not on every drag step.
+                                            property size decodeSize: Qt.size(0, 0)
+                                            function refreshDecodeSize() {
+                                                if (itemRect.resizing)
+                                                    return
+                                                var decodeScale = root.maxZoom * Screen.devicePixelRatio
+                                                decodeSize = Qt.size(Math.ceil(width * decodeScale), Math.ceil(height * decodeScale))
+                                            }
+                                            onWidthChanged: refreshDecodeSize()
+                                            onHeightChanged: refreshDecodeSize()
+                                            Component.onCompleted: refreshDecodeSize()
+                                            source: decodeSize.width > 0 ? "image://diagramimg/" + itemRect.itemId + "?v=" + model.imageVersion : ""
+                                            asynchronous: true
+                                            sourceSize: decodeSize
+                                            fillMode: Image.PreserveAspectFit
+                                            smooth: true
+
+                                            Connections {
+                                                target: itemRect
+                                                function onResizingChanged() { pastedImage.refreshDecodeSize() }
+                                            }
                                         }
-                                    }
-
-                                    property real resizeStartWidth: 0
-                                    property real resizeStartHeight: 0
-                                    property point resizeStartPos: Qt.point(0, 0)
-                                    property real resizeAspectRatio: 1.0
 
-                                    DragHandler {
-                                        id: imageResizeDrag
-                                        target: null
-                                        acceptedButtons: Qt.LeftButton
-                                        cursorShape: Qt.SizeFDiagCursor
-                                        onActiveChanged: {
-                                            if (active) {
-                                                itemRect.resizing = true
-                                                imageResizeHandle.resizeStartWidth = model.width
-                                                imageResizeHandle.resizeStartHeight = model.height
-                                                imageResizeHandle.resizeAspectRatio = model.height > 0 ? model.width / model.height : 1.0
-                                            } else {
-                                                itemRect.resizing = false
+                                        // Resize handle for images
+                                        Rectangle {
+                                            id: imageResizeHandle
+                                            width: 16
+                                            height: 16
+                                            anchors.right: parent.right
+                                            anchors.bottom: parent.bottom
+                                            anchors.rightMargin: 2
+                                            anchors.bottomMargin: 2
+                                            color: "#3a4555"
+                                            border.color: "#5a6575"
+                                            radius: 3
+                                            visible: itemRect.hovered || itemRect.selected || itemRect.resizing
+
+                                            Shape {
+                                                id: imageResizeGrip
+                                                anchors.fill: parent
+                                                preferredRendererType: Shape.CurveRenderer
+
+                                                ShapePath {
+                                                    fillColor: "transparent"
+                                                    strokeColor: "#8a93a5"
+                                                    strokeWidth: 1.5
+                                                    capStyle: ShapePath.FlatCap
+                                                    PathMove { x: 4; y: imageResizeGrip.height - 4 }
+                                                    PathLine { x: imageResizeGrip.width - 4; y: 4 }
+                                                    PathMove { x: 8; y: imageResizeGrip.height - 4 }
+                                                    PathLine { x: imageResizeGrip.width - 4; y: 8 }
+                                                }
                                             }
-                                        }
-                                        onTranslationChanged: {
-                                            if (!active || !diagramModel)
-                                                return
-                                            var deltaX = translation.x / root.zoomLevel
-                                            var deltaY = translation.y / root.zoomLevel
-                                            var startWidth = Math.max(1, imageResizeHandle.resizeStartWidth)
-                                            var startHeight = Math.max(1, imageResizeHandle.resizeStartHeight)
-                                            var widthScale = (startWidth + deltaX) / startWidth
-                                            var heightScale = (startHeight + deltaY) / startHeight
-                                            var dominantByWidth = Math.abs(deltaX / startWidth) >= Math.abs(deltaY / startHeight)
-                                            var uniformScale = dominantByWidth ? widthScale : heightScale
-                                            var minScale = Math.max(60 / startWidth, 40 / startHeight)
-                                            uniformScale = Math.max(uniformScale, minScale)
-
-                                            var newWidth = Math.max(60, startWidth * uniformScale)
-                                            var newHeight = Math.max(40, startHeight * uniformScale)
-                                            if (root.snapToGrid) {
-                                                var aspect = Math.max(0.01, imageResizeHandle.resizeAspectRatio)
-                                                if (aspect >= 1.0) {
-                                                    newWidth = Math.max(root.gridSpacing, Math.round(newWidth / root.gridSpacing) * root.gridSpacing)
-                                                    newHeight = Math.max(40, newWidth / aspect)
-                                                } else {
-                                                    newHeight = Math.max(root.gridSpacing, Math.round(newHeight / root.gridSpacing) * root.gridSpacing)
-                                                    newWidth = Math.max(60, newHeight * aspect)
+
+                                            property real resizeStartWidth: 0
+                                            property real resizeStartHeight: 0
+                                            property point resizeStartPos: Qt.point(0, 0)
+                                            property real resizeAspectRatio: 1.0
+
+                                            DragHandler {
+                                                id: imageResizeDrag
+                                                target: null
+                                                acceptedButtons: Qt.LeftButton
+                                                cursorShape: Qt.SizeFDiagCursor
+                                                onActiveChanged: {
+                                                    if (active) {
+                                                        itemRect.resizing = true
+                                                        imageResizeHandle.resizeStartWidth = model.width
+                                                        imageResizeHandle.resizeStartHeight = model.height
+                                                        imageResizeHandle.resizeAspectRatio = model.height > 0 ? model.width / model.height : 1.0
+                                                    } else {
+                                                        itemRect.resizing = false
+                                                    }
+                                                }
+                                                onTranslationChanged: {
+                                                    if (!active || !diagramModel)
+                                                        return
+                                                    var deltaX = translation.x / root.zoomLevel
+                                                    var deltaY = translation.y / root.zoomLevel
+                                                    var startWidth = Math.max(1, imageResizeHandle.resizeStartWidth)
+                                                    var startHeight = Math.max(1, imageResizeHandle.resizeStartHeight)
+                                                    var widthScale = (startWidth + deltaX) / startWidth
+                                                    var heightScale = (startHeight + deltaY) / startHeight
+                                                    var dominantByWidth = Math.abs(deltaX / startWidth) >= Math.abs(deltaY / startHeight)
+                                                    var uniformScale = dominantByWidth ? widthScale : heightScale
+                                                    var minScale = Math.max(60 / startWidth, 40 / startHeight)
+                                                    uniformScale = Math.max(uniformScale, minScale)
+
+                                                    var newWidth = Math.max(60, startWidth * uniformScale)
+                                                    var newHeight = Math.max(40, startHeight * uniformScale)
+                                                    if (root.snapToGrid) {
+                                                        var aspect = Math.max(0.01, imageResizeHandle.resizeAspectRatio)
+                                                        if (aspect >= 1.0) {
+                                                            newWidth = Math.max(root.gridSpacing, Math.round(newWidth / root.gridSpacing) * root.gridSpacing)
+                                                            newHeight = Math.max(40, newWidth / aspect)
+                                                        } else {
+                                                            newHeight = Math.max(root.gridSpacing, Math.round(newHeight / root.gridSpacing) * root.gridSpacing)
+                                                            newWidth = Math.max(60, newHeight * aspect)
+                                                        }
+                                                    }
+                                                    // itemsChanged invalidates the edge canvas, which paints once per frame.
+                                                    diagramModel.resizeItem(itemRect.itemId, newWidth, newHeight)
                                                 }
                                             }
-                                            diagramModel.resizeItem(itemRect.itemId, newWidth, newHeight)
-                                            edgeCanvas.requestPaint()
                                         }
                                     }
                                 }
@@ -3680,7 +4077,7 @@ ApplicationWindow {
                             Item {
                                 id: resizeHandles
                                 anchors.fill: parent
-                                visible: itemRect.itemType !== "image" && (itemRect.hovered || itemRect.selected || itemDrag.active || itemRect.resizing)
+                                visible: !itemRect.isImage && (itemRect.hovered || itemRect.selected || itemDrag.active || itemRect.resizing)
                                 z: 30
                                 property real startX: 0
                                 property real startY: 0
@@ -3758,9 +4155,14 @@ ApplicationWindow {
                                         }
                                     }
 
-                                    diagramModel.moveItem(itemRect.itemId, left, top)
-                                    diagramModel.resizeItem(itemRect.itemId, right - left, bottom - top)
-                                    edgeCanvas.requestPaint()
+                                    // One batch, so the move and resize notify listeners once.
+                                    diagramModel.beginBatch()
+                                    try {
+                                        diagramModel.moveItem(itemRect.itemId, left, top)
+                                        diagramModel.resizeItem(itemRect.itemId, right - left, bottom - top)
+                                    } finally {
+                                        diagramModel.endBatch()
+                                    }
                                 }
 
                                 Rectangle {
@@ -3862,7 +4264,7 @@ ApplicationWindow {
 
                             Text {
                                 id: itemLabel
-                                visible: itemRect.itemType !== "freetext" && itemRect.itemType !== "obstacle" && itemRect.itemType !== "wish" && itemRect.itemType !== "image"
+                                visible: itemRect.showCenterLabel
                                 anchors.left: parent.left
                                 anchors.right: parent.right
                                 anchors.top: parent.top
@@ -3901,7 +4303,7 @@ ApplicationWindow {
                             }
 
                             Text {
-                                visible: itemRect.itemType === "obstacle"
+                                visible: itemRect.isObstacle
                                 anchors.right: parent.right
                                 anchors.bottom: parent.bottom
                                 anchors.rightMargin: 8
@@ -3924,7 +4326,7 @@ ApplicationWindow {
                             }
 
                             Text {
-                                visible: itemRect.itemType === "wish"
+                                visible: itemRect.isWish
                                 anchors.left: parent.left
                                 anchors.right: parent.right
                                 anchors.bottom: parent.bottom
@@ -3948,7 +4350,7 @@ ApplicationWindow {
 
                             Text {
                                 id: freeTextLabel
-                                visible: itemRect.itemType === "freetext"
+                                visible: itemRect.isFreeText
                                 anchors.fill: parent
                                 anchors.topMargin: itemRect.freeTextTabCount > 1 ? 40 : 24
                                 anchors.leftMargin: 12
@@ -3999,7 +4401,6 @@ ApplicationWindow {
                                         if (insertEdgeId && insertEdgeId.length > 0)
                                             diagramModel.insertExistingItemOnEdge(insertEdgeId, itemRect.itemId)
                                         diagramModel.clearDraggedTaskInsertTarget()
-                                        edgeCanvas.requestPaint()
                                     }
                                 }
                                 onTranslationChanged: {
@@ -4022,7 +4423,6 @@ ApplicationWindow {
                                             pointerPos.y
                                         )
                                     }
-                                    edgeCanvas.requestPaint()
                                 }
                             }
 
@@ -4045,7 +4445,6 @@ ApplicationWindow {
                                         newHeight = Math.max(root.gridSpacing, Math.round(newHeight / root.gridSpacing) * root.gridSpacing)
                                     }
                                     diagramModel.resizeItem(itemRect.itemId, newWidth, newHeight)
-                                    edgeCanvas.requestPaint()
                                 }
                             }
 
@@ -4058,13 +4457,13 @@ ApplicationWindow {
                                         edgeCanvas.selectedEdgeId = ""
                                 }
                                 onDoubleTapped: function(eventPoint) {
-                                    if (itemRect.itemType === "chatgpt") {
+                                    if (itemRect.isChatGpt) {
                                         diagramModel.openChatGpt(itemRect.itemId)
-                                    } else if (itemRect.itemType === "wish" || itemRect.itemType === "obstacle") {
+                                    } else if (itemRect.isWish || itemRect.isObstacle) {
                                         if (markdownNoteManager) {
                                             markdownNoteManager.openNote(itemRect.itemId)
                                         }
-                                    } else if (itemRect.itemType === "note") {
+                                    } else if (itemRect.isNote) {
                                         root.openPresetDialog("note", Qt.point(model.x, model.y), itemRect.itemId, model.text)
                                     } else if (itemRect.itemType === "task" && itemRect.taskIndex < 0) {
                                         // Task not yet linked to task list - create new task
@@ -4073,7 +4472,7 @@ ApplicationWindow {
                                         // Task linked to task list - drill into its tab
                                         if (projectManager)
                                             projectManager.drillToTab(itemRect.taskIndex)
-                                    } else if (itemRect.itemType === "freetext") {
+                                    } else if (itemRect.isFreeText) {
                                         // Free text uses dedicated dialog with TextArea
                                         root.openFreeTextDialog(Qt.point(model.x, model.y), itemRect.itemId, model.text)
                                     } else if (itemRect.itemType !== "task") {
@@ -4087,7 +4486,7 @@ ApplicationWindow {
                                 onTapped: {
                                     root.selectedItemId = itemRect.itemId
                                     diagramLayer.contextMenuItemId = itemRect.itemId
-                                    itemContextMenu.popup()
+                                    itemContextMenuLoader.popup()
                                 }
                             }
 
@@ -4166,7 +4565,6 @@ ApplicationWindow {
                                             edgeHandle.dragPoint = Qt.point(startPos.x, startPos.y)
                                             diagramModel.startEdgeDrawing(itemRect.itemId)
                                             diagramModel.updateEdgeDragPosition(edgeHandle.dragPoint.x, edgeHandle.dragPoint.y)
-                                            edgeCanvas.requestPaint()
                                         } else {
                                             var dropId = diagramModel.edgeHoverTargetId
                                             if (dropId && dropId !== itemRect.itemId) {
@@ -4180,7 +4578,6 @@ ApplicationWindow {
                                                 )
                                                 diagramModel.cancelEdgeDrawing()
                                             }
-                                            edgeCanvas.requestPaint()
                                         }
                                     }
                                     onCentroidChanged: {
@@ -4189,7 +4586,6 @@ ApplicationWindow {
                                         var pos = edgeHandle.mapToItem(diagramLayer, centroid.position.x, centroid.position.y)
                                         edgeHandle.dragPoint = Qt.point(pos.x, pos.y)
                                         diagramModel.updateEdgeDragPosition(edgeHandle.dragPoint.x, edgeHandle.dragPoint.y)
-                                        edgeCanvas.requestPaint()
                                     }
                                 }
 
@@ -4962,7 +5358,7 @@ ApplicationWindow {
                             root.forceCloseWithoutPrompt()
                     } else {
                         closeAfterSaveAsRequested = true
-                        dialogs.saveDialog.open()
+                        dialogs.openSaveProjectDialog()
                     }
                 }
             }
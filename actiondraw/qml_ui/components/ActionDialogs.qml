@@ -31,16 +31,14 @@ Item {
     property alias timerContextMenu: timerContextMenu
     property alias reminderDialog: reminderDialog
     property alias reminderContextMenu: reminderContextMenu
-    property alias notificationSettingsDialog: notificationSettingsDialog
+    property alias notificationSettingsDialog: notificationSettingsDialogLoader
     property alias contractDialog: contractDialog
     property alias contractContextMenu: contractContextMenu
     property alias edgeDropMenu: edgeDropMenu
     property alias edgeDropTaskDialog: edgeDropTaskDialog
-    property alias saveDialog: saveDialog
-    property alias loadDialog: loadDialog
     property alias folderDialog: folderDialog
     property alias clipboardPasteDialog: clipboardPasteDialog
-    property alias goalsDialog: goalsDialog
+    property alias goalsDialog: goalsDialogLoader
     property bool anyDialogVisible: (
         addDialog.visible
         || boxDialog.visible
@@ -52,18 +50,35 @@ Item {
         || taskRenameDialog.visible
         || timerDialog.visible
         || reminderDialog.visible
-        || notificationSettingsDialog.visible
+        || notificationSettingsDialogLoader.dialogVisible
         || contractDialog.visible
         || edgeDropTaskDialog.visible
         || clipboardPasteDialog.visible
-        || boxPdfDialog.visible
-        || saveDialog.visible
-        || loadDialog.visible
-        || goalsDialog.visible
+        || fileDialog.visible
+        || goalsDialogLoader.dialogVisible
     )
 
     anchors.fill: parent
 
+    // Grid-snapped drop targets, re-evaluated only when a target or the grid changes.
+    QtObject {
+        id: precalc
+        readonly property point addTarget: dialogHost.snappedPoint(addDialog.targetX, addDialog.targetY)
+        readonly property point boxTarget: dialogHost.snappedPoint(boxDialog.targetX, boxDialog.targetY)
+        readonly property point taskTarget: dialogHost.snappedPoint(taskDialog.targetX, taskDialog.targetY)
+        readonly property point quickTaskTarget: dialogHost.snappedPoint(quickTaskDialog.targetX, quickTaskDialog.targetY)
+        readonly property point edgeDropTarget: root && root.snapPoint
+            ? root.snapPoint(Qt.point(root.pendingEdgeDropX, root.pendingEdgeDropY))
+            : Qt.point(0, 0)
+        readonly property point edgeDropTaskTarget: dialogHost.snappedPoint(edgeDropTaskDialog.dropX, edgeDropTaskDialog.dropY)
+    }
+
+    function snappedPoint(x, y) {
+        if (root && root.snapPoint)
+            return root.snapPoint(Qt.point(x, y))
+        return Qt.point(x, y)
+    }
+
     function formatDateValue(dateObj) {
         return Qt.formatDateTime(dateObj, "yyyy-MM-dd")
     }
@@ -209,6 +224,67 @@ Item {
         reminderDialog.open()
     }
 
+    // All file pickers share one FileDialog; each opener supplies its own settings.
+    function openFileDialog(options) {
+        fileDialog.title = options.title
+        fileDialog.fileMode = options.fileMode
+        fileDialog.nameFilters = options.nameFilters
+        fileDialog.defaultSuffix = options.defaultSuffix || ""
+        fileDialog.acceptCallback = options.onAccepted || null
+        fileDialog.rejectCallback = options.onRejected || null
+        fileDialog.open()
+    }
+
+    function openSaveProjectDialog() {
+        openFileDialog({
+            title: "Save Project As",
+            fileMode: FileDialog.SaveFile,
+            nameFilters: ["Progress files (*.progress)", "All files (*)"],
+            defaultSuffix: "progress",
+            onAccepted: function(selectedFile) {
+                var saved = false
+                if (projectManager) {
+                    saved = projectManager.saveProjectAs(selectedFile)
+                }
+                if (root && root.handleSaveDialogAccepted)
+                    root.handleSaveDialogAccepted(saved)
+            },
+            onRejected: function() {
+                if (root && root.handleSaveDialogRejected)
+                    root.handleSaveDialogRejected()
+            }
+        })
+    }
+
+    function openLoadProjectDialog() {
+        openFileDialog({
+            title: "Load Project",
+            fileMode: FileDialog.OpenFile,
+            nameFilters: ["Progress files (*.progress)", "All files (*)"],
+            onAccepted: function(selectedFile) {
+                if (projectManager) {
+                    projectManager.loadProject(selectedFile)
+                }
+            }
+        })
+    }
+
+    function openBoxPdfDialog() {
+        openFileDialog({
+            title: "Save Markdown PDF",
+            fileMode: FileDialog.SaveFile,
+            nameFilters: ["PDF files (*.pdf)", "All files (*)"],
+            defaultSuffix: "pdf",
+            onAccepted: dialogHost.exportBoxDialogPdf
+        })
+    }
+
+    // Run a dialog's model write on the next event-loop pass, once the dialog
+    // has closed. Callers snapshot their fields first since onClosed resets them.
+    function afterClose(work) {
+        Qt.callLater(work)
+    }
+
     function exportBoxDialogPdf(selectedFile) {
         if (!markdownPdfExporter || !markdownPdfExporter.exportTabsToPdf)
             return false
@@ -518,72 +594,31 @@ Item {
         title: "Add to Diagram"
         property real targetX: 0
         property real targetY: 0
+        readonly property var presetList: [
+            { name: "box", label: "Box" },
+            { name: "database", label: "Database" },
+            { name: "server", label: "Server" },
+            { name: "cloud", label: "Cloud" },
+            { name: "note", label: "Note" },
+            { name: "obstacle", label: "Obstacle" },
+            { name: "wish", label: "Wish" },
+            { name: "chatgpt", label: "ChatGPT" }
+        ]
 
         contentItem: ColumnLayout {
             implicitWidth: 320
             spacing: 12
 
-            Button {
-                text: "Box"
-                onClicked: {
-                    addDialog.close()
-                    root.openPresetDialog("box", Qt.point(addDialog.targetX, addDialog.targetY), "", undefined)
-                }
-            }
+            Repeater {
+                model: addDialog.presetList
 
-            Button {
-                text: "Database"
-                onClicked: {
-                    addDialog.close()
-                    root.openPresetDialog("database", Qt.point(addDialog.targetX, addDialog.targetY), "", undefined)
-                }
-            }
-
-            Button {
-                text: "Server"
-                onClicked: {
-                    addDialog.close()
-                    root.openPresetDialog("server", Qt.point(addDialog.targetX, addDialog.targetY), "", undefined)
-                }
-            }
-
-            Button {
-                text: "Cloud"
-                onClicked: {
-                    addDialog.close()
-                    root.openPresetDialog("cloud", Qt.point(addDialog.targetX, addDialog.targetY), "", undefined)
-                }
-            }
-
-            Button {
-                text: "Note"
-                onClicked: {
-                    addDialog.close()
-                    root.openPresetDialog("note", Qt.point(addDialog.targetX, addDialog.targetY), "", undefined)
-                }
-            }
-
-            Button {
-                text: "Obstacle"
-                onClicked: {
-                    addDialog.close()
-                    root.openPresetDialog("obstacle", Qt.point(addDialog.targetX, addDialog.targetY), "", undefined)
-                }
-            }
-
-            Button {
-                text: "Wish"
-                onClicked: {
-                    addDialog.close()
-                    root.openPresetDialog("wish", Qt.point(addDialog.targetX, addDialog.targetY), "", undefined)
-                }
-            }
-
-            Button {
-                text: "ChatGPT"
-                onClicked: {
-                    addDialog.close()
-                    root.openPresetDialog("chatgpt", Qt.point(addDialog.targetX, addDialog.targetY), "", undefined)
+                delegate: Button {
+                    required property var modelData
+                    text: modelData.label
+                    onClicked: {
+                        addDialog.close()
+                        root.openPresetDialog(modelData.name, Qt.point(addDialog.targetX, addDialog.targetY), "", undefined)
+                    }
                 }
             }
 
@@ -593,8 +628,8 @@ Item {
                 onClicked: {
                     addDialog.close()
                     if (taskModel) {
-                        taskDialog.targetX = root.snapValue(addDialog.targetX)
-                        taskDialog.targetY = root.snapValue(addDialog.targetY)
+                        taskDialog.targetX = precalc.addTarget.x
+                        taskDialog.targetY = precalc.addTarget.y
                         taskDialog.open()
                     }
                 }
@@ -610,8 +645,7 @@ Item {
             }
         }
 
-        footer: DialogButtonBox {
-            standardButtons: DialogButtonBox.Cancel
+        footer: CancelOnlyFooter {
             onRejected: addDialog.close()
         }
     }
@@ -623,7 +657,7 @@ Item {
         property real targetX: 0
         property real targetY: 0
         property string editingItemId: ""
-        property string textValue: ""
+        property alias textValue: boxMarkdownEditor.textValue
         property string presetName: "box"
         property real dialogHeight: 180
         title: boxDialog.editingItemId.length === 0 ? root.presetTitle(boxDialog.presetName) : "Edit Label"
@@ -640,11 +674,6 @@ Item {
             onActivated: boxDialog.accept()
         }
 
-        onTextValueChanged: {
-            if (boxMarkdownEditor.textValue !== boxDialog.textValue)
-                boxMarkdownEditor.textValue = boxDialog.textValue
-        }
-
         onOpened: {
             boxMarkdownEditor.focusEditor()
             if (boxDialog.editingItemId.length > 0)
@@ -652,6 +681,7 @@ Item {
         }
 
         contentItem: ColumnLayout {
+            visible: boxDialog.opened
             width: boxDialog.width - 32
             Layout.fillWidth: true
             spacing: 12
@@ -668,12 +698,10 @@ Item {
                 id: boxMarkdownEditor
                 Layout.fillWidth: true
                 Layout.preferredHeight: boxDialog.dialogHeight
-                textValue: boxDialog.textValue
                 placeholderText: "Label"
                 allowCreateTask: true
                 allowCreateTab: true
                 sourceItemId: boxDialog.editingItemId
-                onTextValueChanged: boxDialog.textValue = textValue
                 onCreateTabRequested: function(selectedText) {
                     if (!projectManager || !projectManager.createTabFromMarkdownSelection)
                         return
@@ -686,8 +714,8 @@ Item {
                     if (sourceId.length === 0) {
                         sourceId = diagramModel.addPresetItemWithText(
                             boxDialog.presetName,
-                            root.snapValue(boxDialog.targetX),
-                            root.snapValue(boxDialog.targetY),
+                            precalc.boxTarget.x,
+                            precalc.boxTarget.y,
                             boxDialog.textValue
                         )
                         if (sourceId.length === 0)
@@ -707,7 +735,7 @@ Item {
 
             Button {
                 text: "Save PDF..."
-                onClicked: boxPdfDialog.open()
+                onClicked: dialogHost.openBoxPdfDialog()
             }
 
             Item {
@@ -729,17 +757,18 @@ Item {
         onAccepted: {
             if (!diagramModel)
                 return
-            if (boxDialog.editingItemId.length === 0) {
-                diagramModel.addPresetItemWithText(
-                    boxDialog.presetName,
-                    root.snapValue(boxDialog.targetX),
-                    root.snapValue(boxDialog.targetY),
-                    boxDialog.textValue
-                )
-            } else {
-                diagramModel.setItemText(boxDialog.editingItemId, boxDialog.textValue)
-            }
+            var editingItemId = boxDialog.editingItemId
+            var presetName = boxDialog.presetName
+            var targetX = precalc.boxTarget.x
+            var targetY = precalc.boxTarget.y
+            var text = boxDialog.textValue
             boxDialog.close()
+            dialogHost.afterClose(function() {
+                if (editingItemId.length === 0)
+                    diagramModel.addPresetItemWithText(presetName, targetX, targetY, text)
+                else
+                    diagramModel.setItemText(editingItemId, text)
+            })
         }
         onRejected: boxDialog.close()
 
@@ -755,7 +784,7 @@ Item {
         modal: true
         title: "Edge Description"
         property string edgeId: ""
-        property string descriptionValue: ""
+        property alias descriptionValue: edgeDescriptionField.text
 
         function openWithEdge(eId) {
             edgeId = eId
@@ -766,36 +795,33 @@ Item {
         onOpened: edgeDescriptionField.forceActiveFocus()
 
         contentItem: ColumnLayout {
+            visible: edgeDescriptionDialog.opened
             width: 320
             spacing: 12
 
             TextField {
                 id: edgeDescriptionField
                 Layout.fillWidth: true
-                text: edgeDescriptionDialog.descriptionValue
                 placeholderText: "Description (optional)"
                 selectByMouse: true
                 color: "#f5f6f8"
-                background: Rectangle {
-                    color: "#1b2028"
-                    radius: 4
-                    border.color: "#384458"
-                }
-                onTextChanged: edgeDescriptionDialog.descriptionValue = text
+                background: FieldBackground {}
                 Keys.onReturnPressed: edgeDescriptionDialog.accept()
                 Keys.onEnterPressed: edgeDescriptionDialog.accept()
             }
         }
 
-        footer: DialogButtonBox {
-            standardButtons: DialogButtonBox.Ok | DialogButtonBox.Cancel
-        }
+        footer: StdDialogFooter {}
 
         onAccepted: {
-            if (diagramModel && edgeDescriptionDialog.edgeId.length > 0) {
-                diagramModel.setEdgeDescription(edgeDescriptionDialog.edgeId, edgeDescriptionDialog.descriptionValue)
-            }
+            var edgeId = edgeDescriptionDialog.edgeId
+            var description = edgeDescriptionDialog.descriptionValue
             close()
+            if (diagramModel && edgeId.length > 0) {
+                dialogHost.afterClose(function() {
+                    diagramModel.setEdgeDescription(edgeId, description)
+                })
+            }
         }
         onRejected: close()
 
@@ -814,6 +840,7 @@ Item {
         property real targetY: 0
 
         contentItem: ColumnLayout {
+            visible: taskDialog.opened
             spacing: 12
 
             ListView {
@@ -823,15 +850,27 @@ Item {
                 Layout.preferredWidth: 420
                 Layout.preferredHeight: 320
                 model: taskModel
-                clip: true
+                // Only pay for clipping once the list scrolls past its frame.
+                clip: contentHeight > height
+                // Titles that fit one line, checked against shared font metrics, take the fixed
+                // row height without wrapping; only longer titles wrap and measure their layout.
+                readonly property int rowHeight: 40
+
+                FontMetrics {
+                    id: taskRowMetrics
+                    font.pixelSize: 14
+                }
 
                 delegate: Item {
+                    readonly property bool fitsOneLine: model.title.indexOf("\n") < 0
+                        && taskRowMetrics.advanceWidth(model.title) <= width - 24
                     width: taskListView.width
-                    height: Math.max(40, taskText.implicitHeight + 16)
+                    height: fitsOneLine ? taskListView.rowHeight : taskText.implicitHeight + 16
 
                     Rectangle {
+                        id: taskRowBackground
                         anchors.fill: parent
-                        color: mouseArea.containsMouse ? "#283346" : "#1a2230"
+                        color: "#1a2230"
                         border.color: "#30405a"
                     }
 
@@ -843,25 +882,34 @@ Item {
                         anchors.margins: 12
                         text: model.title
                         color: "#f5f6f8"
-                        font.pixelSize: 14
-                        wrapMode: Text.WordWrap
+                        font: taskRowMetrics.font
+                        wrapMode: parent.fitsOneLine ? Text.NoWrap : Text.WordWrap
                     }
 
-                    MouseArea {
-                        id: mouseArea
-                        anchors.fill: parent
-                        hoverEnabled: true
-                        onClicked: {
+                    HoverHandler {
+                        id: taskRowHover
+                    }
+
+                    TapHandler {
+                        onTapped: {
                             if (diagramModel) {
                                 diagramModel.addTask(
                                     index,
-                                    root.snapValue(taskDialog.targetX),
-                                    root.snapValue(taskDialog.targetY)
+                                    precalc.taskTarget.x,
+                                    precalc.taskTarget.y
                                 )
                             }
                             taskDialog.close()
                         }
                     }
+
+                    states: State {
+                        when: taskRowHover.hovered
+                        PropertyChanges {
+                            target: taskRowBackground
+                            color: "#283346"
+                        }
+                    }
                 }
             }
 
@@ -876,8 +924,7 @@ Item {
             }
         }
 
-        footer: DialogButtonBox {
-            standardButtons: DialogButtonBox.Cancel
+        footer: CancelOnlyFooter {
             onRejected: taskDialog.close()
         }
     }
@@ -887,7 +934,7 @@ Item {
         modal: true
         title: "Create Task"
         property string pendingItemId: ""
-        property string textValue: ""
+        property alias textValue: newTaskField.text
 
         function openWithItem(itemId, text) {
             pendingItemId = itemId
@@ -896,35 +943,31 @@ Item {
         }
 
         contentItem: ColumnLayout {
+            visible: newTaskDialog.opened
             width: 320
             spacing: 12
 
             TextField {
                 id: newTaskField
                 Layout.fillWidth: true
-                text: newTaskDialog.textValue
                 placeholderText: "Task name"
                 selectByMouse: true
                 color: "#f5f6f8"
-                background: Rectangle {
-                    color: "#1b2028"
-                    radius: 4
-                    border.color: "#384458"
-                }
-                onTextChanged: newTaskDialog.textValue = text
+                background: FieldBackground {}
                 Keys.onReturnPressed: newTaskDialog.accept()
                 Keys.onEnterPressed: newTaskDialog.accept()
             }
         }
 
-        footer: DialogButtonBox {
-            id: newTaskButtons
-            standardButtons: DialogButtonBox.Ok | DialogButtonBox.Cancel
-        }
+        footer: StdDialogFooter {}
 
         onAccepted: {
-            if (diagramModel && newTaskDialog.pendingItemId.length > 0) {
-                diagramModel.createTaskFromText(newTaskDialog.textValue, newTaskDialog.pendingItemId)
+            var pendingItemId = newTaskDialog.pendingItemId
+            var text = newTaskDialog.textValue
+            if (diagramModel && pendingItemId.length > 0) {
+                dialogHost.afterClose(function() {
+                    diagramModel.createTaskFromText(text, pendingItemId)
+                })
             }
         }
         onRejected: newTaskDialog.close()
@@ -949,6 +992,7 @@ Item {
         onOpened: quickTaskField.forceActiveFocus()
 
         contentItem: ColumnLayout {
+            visible: quickTaskDialog.opened
             width: 320
             spacing: 12
 
@@ -965,48 +1009,35 @@ Item {
                 placeholderText: "Task name"
                 selectByMouse: true
                 color: "#f5f6f8"
-                background: Rectangle {
-                    color: "#1b2028"
-                    radius: 4
-                    border.color: "#384458"
-                }
+                background: FieldBackground {}
                 Keys.onReturnPressed: quickTaskDialog.accept()
                 Keys.onEnterPressed: quickTaskDialog.accept()
             }
         }
 
-        footer: DialogButtonBox {
-            id: quickTaskButtons
-            standardButtons: DialogButtonBox.Ok | DialogButtonBox.Cancel
-        }
+        footer: StdDialogFooter {}
 
         onAccepted: {
-            if (diagramModel && quickTaskField.text.trim().length > 0) {
+            var text = quickTaskField.text
+            var targetX = precalc.quickTaskTarget.x
+            var targetY = precalc.quickTaskTarget.y
+            var edgeId = quickTaskDialog.edgeInsertMode ? quickTaskDialog.edgeId : ""
+            quickTaskDialog.close()
+            if (!diagramModel || text.trim().length === 0)
+                return
+            dialogHost.afterClose(function() {
                 var newId = ""
-                var targetX = root.snapValue(quickTaskDialog.targetX)
-                var targetY = root.snapValue(quickTaskDialog.targetY)
-                if (quickTaskDialog.edgeInsertMode && quickTaskDialog.edgeId.length > 0) {
-                    newId = diagramModel.insertTaskOnEdge(
-                        quickTaskDialog.edgeId,
-                        quickTaskField.text,
-                        targetX,
-                        targetY
-                    )
-                } else {
-                    newId = diagramModel.addTaskFromText(
-                        quickTaskField.text,
-                        targetX,
-                        targetY
-                    )
-                }
+                if (edgeId.length > 0)
+                    newId = diagramModel.insertTaskOnEdge(edgeId, text, targetX, targetY)
+                else
+                    newId = diagramModel.addTaskFromText(text, targetX, targetY)
                 if (newId && newId.length > 0) {
                     root.lastCreatedTaskId = newId
                     root.selectedItemId = newId
                     if (edgeCanvas)
                         edgeCanvas.selectedEdgeId = ""
                 }
-            }
-            quickTaskDialog.close()
+            })
         }
         onRejected: quickTaskDialog.close()
 
@@ -1049,23 +1080,21 @@ Item {
                 selectByMouse: true
                 color: "#f5f6f8"
                 wrapMode: TextEdit.Wrap
-                background: Rectangle {
-                    color: "#1b2028"
-                    radius: 4
-                    border.color: "#384458"
-                }
+                background: FieldBackground {}
             }
         }
 
-        footer: DialogButtonBox {
-            standardButtons: DialogButtonBox.Ok | DialogButtonBox.Cancel
-        }
+        footer: StdDialogFooter {}
 
         onAccepted: {
-            if (diagramModel && breakdownDialog.sourceItemId.length > 0) {
-                diagramModel.breakDownItem(breakdownDialog.sourceItemId, breakdownTextArea.text)
-            }
+            var sourceItemId = breakdownDialog.sourceItemId
+            var text = breakdownTextArea.text
             breakdownDialog.close()
+            if (diagramModel && sourceItemId.length > 0) {
+                dialogHost.afterClose(function() {
+                    diagramModel.breakDownItem(sourceItemId, text)
+                })
+            }
         }
         onRejected: breakdownDialog.close()
 
@@ -1081,7 +1110,7 @@ Item {
         modal: true
         title: "Rename Task"
         property string editingItemId: ""
-        property string textValue: ""
+        property alias textValue: taskRenameField.text
 
         onOpened: {
             taskRenameField.forceActiveFocus()
@@ -1095,6 +1124,7 @@ Item {
         }
 
         contentItem: ColumnLayout {
+            visible: taskRenameDialog.opened
             width: 320
             spacing: 12
 
@@ -1108,29 +1138,24 @@ Item {
             TextField {
                 id: taskRenameField
                 Layout.fillWidth: true
-                text: taskRenameDialog.textValue
                 placeholderText: "Task name"
                 selectByMouse: true
                 color: "#f5f6f8"
-                background: Rectangle {
-                    color: "#1b2028"
-                    radius: 4
-                    border.color: "#384458"
-                }
-                onTextChanged: taskRenameDialog.textValue = text
+                background: FieldBackground {}
                 Keys.onReturnPressed: taskRenameDialog.accept()
                 Keys.onEnterPressed: taskRenameDialog.accept()
             }
         }
 
-        footer: DialogButtonBox {
-            id: taskRenameButtons
-            standardButtons: DialogButtonBox.Ok | DialogButtonBox.Cancel
-        }
+        footer: StdDialogFooter {}
 
         onAccepted: {
-            if (diagramModel && taskRenameDialog.editingItemId.length > 0 && taskRenameDialog.textValue.trim().length > 0) {
-                diagramModel.renameTaskItem(taskRenameDialog.editingItemId, taskRenameDialog.textValue)
+            var editingItemId = taskRenameDialog.editingItemId
+            var text = taskRenameDialog.textValue
+            if (diagramModel && editingItemId.length > 0 && text.trim().length > 0) {
+                dialogHost.afterClose(function() {
+                    diagramModel.renameTaskItem(editingItemId, text)
+                })
             }
         }
         onRejected: taskRenameDialog.close()
@@ -1146,7 +1171,7 @@ Item {
         modal: true
         title: "Set Timer"
         property int taskIndex: -1
-        property string durationValue: ""
+        property alias durationValue: timerDurationField.text
 
         onOpened: timerDurationField.forceActiveFocus()
 
@@ -1164,16 +1189,10 @@ Item {
             TextField {
                 id: timerDurationField
                 Layout.fillWidth: true
-                text: timerDialog.durationValue
                 placeholderText: "e.g. 2m"
                 selectByMouse: true
                 color: "#f5f6f8"
-                background: Rectangle {
-                    color: "#1b2028"
-                    radius: 4
-                    border.color: "#384458"
-                }
-                onTextChanged: timerDialog.durationValue = text
+                background: FieldBackground {}
                 Keys.onReturnPressed: timerDialog.accept()
                 Keys.onEnterPressed: timerDialog.accept()
             }
@@ -1260,15 +1279,17 @@ Item {
             }
         }
 
-        footer: DialogButtonBox {
-            standardButtons: DialogButtonBox.Ok | DialogButtonBox.Cancel
-        }
+        footer: StdDialogFooter {}
 
         onAccepted: {
-            if (diagramModel && timerDialog.taskIndex >= 0 && timerDialog.durationValue.trim().length > 0) {
-                diagramModel.setTaskCountdownTimer(timerDialog.taskIndex, timerDialog.durationValue)
-            }
+            var taskIndex = timerDialog.taskIndex
+            var duration = timerDialog.durationValue
             timerDialog.close()
+            if (diagramModel && taskIndex >= 0 && duration.trim().length > 0) {
+                dialogHost.afterClose(function() {
+                    diagramModel.setTaskCountdownTimer(taskIndex, duration)
+                })
+            }
         }
         onRejected: timerDialog.close()
 
@@ -1301,199 +1322,193 @@ Item {
         }
     }
 
-    Dialog {
-        id: notificationSettingsDialog
-        modal: true
-        title: "Notification Settings"
-        property string serverValue: ""
-        property string topicValue: ""
-        property string tokenValue: ""
-        readonly property bool topicConfigured: topicValue.trim().length > 0
+    LazyDialogLoader {
+        id: notificationSettingsDialogLoader
 
-        onOpened: {
-            serverValue = (projectManager && projectManager.ntfyServer) ? projectManager.ntfyServer : "https://ntfy.sh"
-            topicValue = (projectManager && projectManager.ntfyTopic) ? projectManager.ntfyTopic : ""
-            tokenValue = (projectManager && projectManager.ntfyToken) ? projectManager.ntfyToken : ""
-            ntfyServerField.forceActiveFocus()
-        }
+        sourceComponent: Component {
+            Dialog {
+                id: notificationSettingsDialog
+                modal: true
+                title: "Notification Settings"
+                property string serverValue: ""
+                property string topicValue: ""
+                property string tokenValue: ""
+                readonly property bool topicConfigured: topicValue.trim().length > 0
 
-        contentItem: ColumnLayout {
-            width: 380
-            spacing: 12
+                onOpened: {
+                    serverValue = (projectManager && projectManager.ntfyServer) ? projectManager.ntfyServer : "https://ntfy.sh"
+                    topicValue = (projectManager && projectManager.ntfyTopic) ? projectManager.ntfyTopic : ""
+                    tokenValue = (projectManager && projectManager.ntfyToken) ? projectManager.ntfyToken : ""
+                    ntfyServerField.forceActiveFocus()
+                }
 
-            Label {
-                text: "Configure where due reminders should be published when 'Send notification' is enabled."
-                color: "#8a93a5"
-                wrapMode: Text.WordWrap
-                Layout.fillWidth: true
-            }
+                contentItem: ColumnLayout {
+                    width: 380
+                    spacing: 12
 
-            Rectangle {
-                id: ntfyHelpBox
-                Layout.fillWidth: true
-                implicitHeight: ntfyHelpContent.implicitHeight + 24
-                radius: 8
-                color: "#1a2633"
-                border.color: "#3f5870"
+                    Label {
+                        text: "Configure where due reminders should be published when 'Send notification' is enabled."
+                        color: "#8a93a5"
+                        wrapMode: Text.WordWrap
+                        Layout.fillWidth: true
+                    }
 
-                ColumnLayout {
-                    id: ntfyHelpContent
-                    anchors.fill: parent
-                    anchors.margins: 12
-                    spacing: 6
+                    Rectangle {
+                        id: ntfyHelpBox
+                        Layout.fillWidth: true
+                        implicitHeight: ntfyHelpContent.implicitHeight + 24
+                        radius: 8
+                        color: "#1a2633"
+                        border.color: "#3f5870"
+
+                        ColumnLayout {
+                            id: ntfyHelpContent
+                            anchors.fill: parent
+                            anchors.margins: 12
+                            spacing: 6
+
+                            Label {
+                                text: "What is ntfy?"
+                                color: "#f5f6f8"
+                                font.bold: true
+                            }
 
-                    Label {
-                        text: "What is ntfy?"
-                        color: "#f5f6f8"
-                        font.bold: true
+                            Label {
+                                Layout.fillWidth: true
+                                text: "ntfy is a simple push notification service. ActionDraw sends a message to your ntfy topic when a reminder is due."
+                                color: "#c9d7e6"
+                                wrapMode: Text.WordWrap
+                            }
+
+                            Label {
+                                Layout.fillWidth: true
+                                text: "Set a topic name here, subscribe to the same topic in the ntfy app or web client, and you will receive reminder notifications there."
+                                color: "#9fb3c8"
+                                wrapMode: Text.WordWrap
+                            }
+                        }
                     }
 
                     Label {
+                        text: "Server"
+                        color: "#d7e0ea"
+                    }
+
+                    TextField {
+                        id: ntfyServerField
                         Layout.fillWidth: true
-                        text: "ntfy is a simple push notification service. ActionDraw sends a message to your ntfy topic when a reminder is due."
-                        color: "#c9d7e6"
-                        wrapMode: Text.WordWrap
+                        text: notificationSettingsDialog.serverValue
+                        placeholderText: "https://ntfy.sh"
+                        selectByMouse: true
+                        color: "#f5f6f8"
+                        background: FieldBackground {}
+                        onTextChanged: notificationSettingsDialog.serverValue = text
                     }
 
                     Label {
+                        text: "Topic"
+                        color: "#d7e0ea"
+                    }
+
+                    TextField {
                         Layout.fillWidth: true
-                        text: "Set a topic name here, subscribe to the same topic in the ntfy app or web client, and you will receive reminder notifications there."
-                        color: "#9fb3c8"
-                        wrapMode: Text.WordWrap
+                        text: notificationSettingsDialog.topicValue
+                        placeholderText: "my-topic"
+                        selectByMouse: true
+                        color: "#f5f6f8"
+                        background: FieldBackground {}
+                        onTextChanged: notificationSettingsDialog.topicValue = text
                     }
-                }
-            }
 
-            Label {
-                text: "Server"
-                color: "#d7e0ea"
-            }
+                    Rectangle {
+                        Layout.fillWidth: true
+                        visible: !notificationSettingsDialog.topicConfigured
+                        radius: 6
+                        color: "#3a2418"
+                        border.color: "#b16a3c"
 
-            TextField {
-                id: ntfyServerField
-                Layout.fillWidth: true
-                text: notificationSettingsDialog.serverValue
-                placeholderText: "https://ntfy.sh"
-                selectByMouse: true
-                color: "#f5f6f8"
-                background: Rectangle {
-                    color: "#1b2028"
-                    radius: 4
-                    border.color: "#384458"
-                }
-                onTextChanged: notificationSettingsDialog.serverValue = text
-            }
+                        Label {
+                            anchors.fill: parent
+                            anchors.margins: 10
+                            text: "Notifications are not configured until you set an ntfy topic."
+                            color: "#ffd9bf"
+                            wrapMode: Text.WordWrap
+                        }
+                    }
 
-            Label {
-                text: "Topic"
-                color: "#d7e0ea"
-            }
+                    Label {
+                        text: "Bearer Token"
+                        color: "#d7e0ea"
+                    }
 
-            TextField {
-                Layout.fillWidth: true
-                text: notificationSettingsDialog.topicValue
-                placeholderText: "my-topic"
-                selectByMouse: true
-                color: "#f5f6f8"
-                background: Rectangle {
-                    color: "#1b2028"
-                    radius: 4
-                    border.color: "#384458"
+                    TextField {
+                        Layout.fillWidth: true
+                        text: notificationSettingsDialog.tokenValue
+                        placeholderText: "Optional"
+                        selectByMouse: true
+                        echoMode: TextInput.Password
+                        color: "#f5f6f8"
+                        background: FieldBackground {}
+                        onTextChanged: notificationSettingsDialog.tokenValue = text
+                    }
                 }
-                onTextChanged: notificationSettingsDialog.topicValue = text
-            }
 
-            Rectangle {
-                Layout.fillWidth: true
-                visible: !notificationSettingsDialog.topicConfigured
-                radius: 6
-                color: "#3a2418"
-                border.color: "#b16a3c"
-
-                Label {
-                    anchors.fill: parent
-                    anchors.margins: 10
-                    text: "Notifications are not configured until you set an ntfy topic."
-                    color: "#ffd9bf"
-                    wrapMode: Text.WordWrap
-                }
-            }
+                footer: Frame {
+                    padding: 12
 
-            Label {
-                text: "Bearer Token"
-                color: "#d7e0ea"
-            }
+                    contentItem: RowLayout {
+                        spacing: 8
 
-            TextField {
-                Layout.fillWidth: true
-                text: notificationSettingsDialog.tokenValue
-                placeholderText: "Optional"
-                selectByMouse: true
-                echoMode: TextInput.Password
-                color: "#f5f6f8"
-                background: Rectangle {
-                    color: "#1b2028"
-                    radius: 4
-                    border.color: "#384458"
-                }
-                onTextChanged: notificationSettingsDialog.tokenValue = text
-            }
-        }
+                        Button {
+                            text: "Test notification"
+                            enabled: !!projectManager && notificationSettingsDialog.topicConfigured
+                            onClicked: {
+                                if (!projectManager || !projectManager.sendTestNtfyNotification) {
+                                    return
+                                }
+                                var started = projectManager.sendTestNtfyNotification(
+                                    notificationSettingsDialog.serverValue,
+                                    notificationSettingsDialog.topicValue,
+                                    notificationSettingsDialog.tokenValue
+                                )
+                                if (started && root && root.showSaveNotification) {
+                                    root.showSaveNotification("Sending test notification...")
+                                }
+                            }
+                        }
 
-        footer: Frame {
-            padding: 12
+                        Item {
+                            Layout.fillWidth: true
+                        }
 
-            contentItem: RowLayout {
-                spacing: 8
+                        Button {
+                            text: "OK"
+                            onClicked: notificationSettingsDialog.accept()
+                        }
 
-                Button {
-                    text: "Test notification"
-                    enabled: !!projectManager && notificationSettingsDialog.topicConfigured
-                    onClicked: {
-                        if (!projectManager || !projectManager.sendTestNtfyNotification) {
-                            return
+                        Button {
+                            text: "Cancel"
+                            onClicked: notificationSettingsDialog.reject()
                         }
-                        var started = projectManager.sendTestNtfyNotification(
+                    }
+                }
+
+                onAccepted: {
+                    if (projectManager && projectManager.saveNtfySettings) {
+                        projectManager.saveNtfySettings(
                             notificationSettingsDialog.serverValue,
                             notificationSettingsDialog.topicValue,
                             notificationSettingsDialog.tokenValue
                         )
-                        if (started && root && root.showSaveNotification) {
-                            root.showSaveNotification("Sending test notification...")
-                        }
                     }
+                    if (!notificationSettingsDialog.topicConfigured && root && root.showSaveNotification) {
+                        root.showSaveNotification("Notifications are not configured until you set an ntfy topic")
+                    }
+                    notificationSettingsDialog.close()
                 }
-
-                Item {
-                    Layout.fillWidth: true
-                }
-
-                Button {
-                    text: "OK"
-                    onClicked: notificationSettingsDialog.accept()
-                }
-
-                Button {
-                    text: "Cancel"
-                    onClicked: notificationSettingsDialog.reject()
-                }
+                onRejected: notificationSettingsDialog.close()
             }
         }
-
-        onAccepted: {
-            if (projectManager && projectManager.saveNtfySettings) {
-                projectManager.saveNtfySettings(
-                    notificationSettingsDialog.serverValue,
-                    notificationSettingsDialog.topicValue,
-                    notificationSettingsDialog.tokenValue
-                )
-            }
-            if (!notificationSettingsDialog.topicConfigured && root && root.showSaveNotification) {
-                root.showSaveNotification("Notifications are not configured until you set an ntfy topic")
-            }
-            notificationSettingsDialog.close()
-        }
-        onRejected: notificationSettingsDialog.close()
     }
 
     Dialog {
@@ -1573,11 +1588,7 @@ Item {
                 placeholderText: "Reminder title"
                 selectByMouse: true
                 color: "#f5f6f8"
-                background: Rectangle {
-                    color: "#1b2028"
-                    radius: 4
-                    border.color: "#384458"
-                }
+                background: FieldBackground {}
                 onTextChanged: reminderDialog.standaloneTitle = text
             }
 
@@ -1617,7 +1628,7 @@ Item {
                         text: "Open Notification Settings"
                         onClicked: {
                             reminderDialog.close()
-                            notificationSettingsDialog.open()
+                            notificationSettingsDialogLoader.open()
                         }
                     }
                 }
@@ -1632,11 +1643,7 @@ Item {
                     color: "#f5f6f8"
                     verticalAlignment: Text.AlignVCenter
                 }
-                background: Rectangle {
-                    color: "#1b2028"
-                    radius: 4
-                    border.color: "#384458"
-                }
+                background: FieldBackground {}
                 onClicked: dialogHost.openDatePicker(reminderDialog)
             }
 
@@ -1652,11 +1659,7 @@ Item {
                         verticalAlignment: Text.AlignVCenter
                         horizontalAlignment: Text.AlignHCenter
                     }
-                    background: Rectangle {
-                        color: "#1b2028"
-                        radius: 4
-                        border.color: "#384458"
-                    }
+                    background: FieldBackground {}
                     onClicked: dialogHost.openTimePicker(reminderDialog)
                 }
 
@@ -1667,11 +1670,7 @@ Item {
                     placeholderText: "HH:MM"
                     selectByMouse: true
                     color: "#f5f6f8"
-                    background: Rectangle {
-                        color: "#1b2028"
-                        radius: 4
-                        border.color: "#384458"
-                    }
+                    background: FieldBackground {}
                     onTextChanged: reminderDialog.timeValue = text
                     Keys.onReturnPressed: reminderDialog.accept()
                     Keys.onEnterPressed: reminderDialog.accept()
@@ -1734,9 +1733,7 @@ Item {
             }
         }
 
-        footer: DialogButtonBox {
-            standardButtons: DialogButtonBox.Ok | DialogButtonBox.Cancel
-        }
+        footer: StdDialogFooter {}
 
         onAccepted: {
             if (reminderDialog.sendNotification && projectManager && !projectManager.ntfyConfigured) {
@@ -1938,11 +1935,7 @@ Item {
                     color: "#f5f6f8"
                     verticalAlignment: Text.AlignVCenter
                 }
-                background: Rectangle {
-                    color: "#1b2028"
-                    radius: 4
-                    border.color: "#384458"
-                }
+                background: FieldBackground {}
                 onClicked: dialogHost.openDatePicker(contractDialog)
             }
 
@@ -1958,11 +1951,7 @@ Item {
                         verticalAlignment: Text.AlignVCenter
                         horizontalAlignment: Text.AlignHCenter
                     }
-                    background: Rectangle {
-                        color: "#1b2028"
-                        radius: 4
-                        border.color: "#384458"
-                    }
+                    background: FieldBackground {}
                     onClicked: dialogHost.openTimePicker(contractDialog)
                 }
 
@@ -1973,11 +1962,7 @@ Item {
                     placeholderText: "HH:MM"
                     selectByMouse: true
                     color: "#f5f6f8"
-                    background: Rectangle {
-                        color: "#1b2028"
-                        radius: 4
-                        border.color: "#384458"
-                    }
+                    background: FieldBackground {}
                     onTextChanged: contractDialog.timeValue = text
                 }
             }
@@ -2047,11 +2032,7 @@ Item {
                 placeholderText: "Custom punishment if missed"
                 selectByMouse: true
                 color: "#f5f6f8"
-                background: Rectangle {
-                    color: "#1b2028"
-                    radius: 4
-                    border.color: "#384458"
-                }
+                background: FieldBackground {}
                 onTextChanged: {
                     if (contractDialog.punishmentMode === "custom")
                         contractDialog.punishmentValue = text
@@ -2087,9 +2068,7 @@ Item {
             }
         }
 
-        footer: DialogButtonBox {
-            standardButtons: DialogButtonBox.Ok | DialogButtonBox.Cancel
-        }
+        footer: StdDialogFooter {}
 
         onAccepted: {
             if (diagramModel && contractDialog.taskIndex >= 0) {
@@ -2156,15 +2135,41 @@ Item {
     Menu {
         id: edgeDropMenu
         title: "Create & Connect"
+        readonly property var primaryPresets: [
+            { name: "obstacle", label: "Obstacle", text: "Obstacle" },
+            { name: "wish", label: "Wish", text: "Wish" },
+            { name: "chatgpt", label: "ChatGPT", text: "Ask ChatGPT" }
+        ]
+        readonly property var shapePresets: [
+            { name: "box", label: "Box", text: "Box" },
+            { name: "note", label: "Note", text: "Note" },
+            { name: "database", label: "Database", text: "Database" },
+            { name: "server", label: "Server", text: "Server" },
+            { name: "cloud", label: "Cloud", text: "Cloud" }
+        ]
 
         function connectedDrop(itemKind) {
-            var baseX = root.snapValue(root.pendingEdgeDropX)
-            var baseY = root.snapValue(root.pendingEdgeDropY)
+            var baseX = precalc.edgeDropTarget.x
+            var baseY = precalc.edgeDropTarget.y
             if (root && root.resolveConnectedDrop)
                 return root.resolveConnectedDrop(root.pendingEdgeSourceId, itemKind, baseX, baseY)
             return Qt.point(baseX, baseY)
         }
 
+        function createConnected(itemKind, itemText) {
+            if (diagramModel && root.pendingEdgeSourceId) {
+                var drop = edgeDropMenu.connectedDrop(itemKind)
+                diagramModel.addPresetItemAndConnect(
+                    root.pendingEdgeSourceId,
+                    itemKind,
+                    drop.x,
+                    drop.y,
+                    itemText
+                )
+            }
+            root.pendingEdgeSourceId = ""
+        }
+
         MenuItem {
             text: "\u2192 Task"
             onTriggered: {
@@ -2176,142 +2181,33 @@ Item {
             }
         }
 
-        MenuItem {
-            text: "\u2192 Obstacle"
-            onTriggered: {
-                if (diagramModel && root.pendingEdgeSourceId) {
-                    var drop = edgeDropMenu.connectedDrop("obstacle")
-                    diagramModel.addPresetItemAndConnect(
-                        root.pendingEdgeSourceId,
-                        "obstacle",
-                        drop.x,
-                        drop.y,
-                        "Obstacle"
-                    )
-                }
-                root.pendingEdgeSourceId = ""
-            }
-        }
+        Instantiator {
+            model: edgeDropMenu.primaryPresets
 
-        MenuItem {
-            text: "\u2192 Wish"
-            onTriggered: {
-                if (diagramModel && root.pendingEdgeSourceId) {
-                    var drop = edgeDropMenu.connectedDrop("wish")
-                    diagramModel.addPresetItemAndConnect(
-                        root.pendingEdgeSourceId,
-                        "wish",
-                        drop.x,
-                        drop.y,
-                        "Wish"
-                    )
-                }
-                root.pendingEdgeSourceId = ""
+            delegate: MenuItem {
+                required property var modelData
+                text: "\u2192 " + modelData.label
+                onTriggered: edgeDropMenu.createConnected(modelData.name, modelData.text)
             }
-        }
 
-        MenuItem {
-            text: "\u2192 ChatGPT"
-            onTriggered: {
-                if (diagramModel && root.pendingEdgeSourceId) {
-                    var drop = edgeDropMenu.connectedDrop("chatgpt")
-                    diagramModel.addPresetItemAndConnect(
-                        root.pendingEdgeSourceId,
-                        "chatgpt",
-                        drop.x,
-                        drop.y,
-                        "Ask ChatGPT"
-                    )
-                }
-                root.pendingEdgeSourceId = ""
-            }
+            // Slot these in after "\u2192 Task", ahead of the separator.
+            onObjectAdded: function(index, object) { edgeDropMenu.insertItem(index + 1, object) }
+            onObjectRemoved: function(index, object) { edgeDropMenu.removeItem(object) }
         }
 
         MenuSeparator {}
 
-        MenuItem {
-            text: "\u2192 Box"
-            onTriggered: {
-                if (diagramModel && root.pendingEdgeSourceId) {
-                    var drop = edgeDropMenu.connectedDrop("box")
-                    diagramModel.addPresetItemAndConnect(
-                        root.pendingEdgeSourceId,
-                        "box",
-                        drop.x,
-                        drop.y,
-                        "Box"
-                    )
-                }
-                root.pendingEdgeSourceId = ""
-            }
-        }
-
-        MenuItem {
-            text: "\u2192 Note"
-            onTriggered: {
-                if (diagramModel && root.pendingEdgeSourceId) {
-                    var drop = edgeDropMenu.connectedDrop("note")
-                    diagramModel.addPresetItemAndConnect(
-                        root.pendingEdgeSourceId,
-                        "note",
-                        drop.x,
-                        drop.y,
-                        "Note"
-                    )
-                }
-                root.pendingEdgeSourceId = ""
-            }
-        }
+        Instantiator {
+            model: edgeDropMenu.shapePresets
 
-        MenuItem {
-            text: "\u2192 Database"
-            onTriggered: {
-                if (diagramModel && root.pendingEdgeSourceId) {
-                    var drop = edgeDropMenu.connectedDrop("database")
-                    diagramModel.addPresetItemAndConnect(
-                        root.pendingEdgeSourceId,
-                        "database",
-                        drop.x,
-                        drop.y,
-                        "Database"
-                    )
-                }
-                root.pendingEdgeSourceId = ""
+            delegate: MenuItem {
+                required property var modelData
+                text: "\u2192 " + modelData.label
+                onTriggered: edgeDropMenu.createConnected(modelData.name, modelData.text)
             }
-        }
 
-        MenuItem {
-            text: "\u2192 Server"
-            onTriggered: {
-                if (diagramModel && root.pendingEdgeSourceId) {
-                    var drop = edgeDropMenu.connectedDrop("server")
-                    diagramModel.addPresetItemAndConnect(
-                        root.pendingEdgeSourceId,
-                        "server",
-                        drop.x,
-                        drop.y,
-                        "Server"
-                    )
-                }
-                root.pendingEdgeSourceId = ""
-            }
-        }
-
-        MenuItem {
-            text: "\u2192 Cloud"
-            onTriggered: {
-                if (diagramModel && root.pendingEdgeSourceId) {
-                    var drop = edgeDropMenu.connectedDrop("cloud")
-                    diagramModel.addPresetItemAndConnect(
-                        root.pendingEdgeSourceId,
-                        "cloud",
-                        drop.x,
-                        drop.y,
-                        "Cloud"
-                    )
-                }
-                root.pendingEdgeSourceId = ""
-            }
+            onObjectAdded: function(index, object) { edgeDropMenu.addItem(object) }
+            onObjectRemoved: function(index, object) { edgeDropMenu.removeItem(object) }
         }
 
         onClosed: {
@@ -2322,17 +2218,31 @@ Item {
     Dialog {
         id: edgeDropTaskDialog
         modal: true
-        title: sourceType === "task" ? "Create Connected Task" : ("Create Connected " + sourceType.charAt(0).toUpperCase() + sourceType.slice(1))
+        title: "Create Connected " + sourceLabel
 
         property string sourceId: ""
         property string sourceType: "task"
+        readonly property var typeLabels: ({
+            task: "Task",
+            box: "Box",
+            obstacle: "Obstacle",
+            wish: "Wish",
+            note: "Note",
+            database: "Database",
+            server: "Server",
+            cloud: "Cloud",
+            freetext: "Freetext",
+            image: "Image",
+            chatgpt: "ChatGPT"
+        })
+        readonly property string sourceLabel: typeLabels[sourceType] || sourceType
         property real dropX: 0
         property real dropY: 0
         property bool reverseDirection: false
 
         function connectedDrop(itemKind) {
-            var baseX = root.snapValue(edgeDropTaskDialog.dropX)
-            var baseY = root.snapValue(edgeDropTaskDialog.dropY)
+            var baseX = precalc.edgeDropTaskTarget.x
+            var baseY = precalc.edgeDropTaskTarget.y
             if (root && root.resolveConnectedDrop)
                 return root.resolveConnectedDrop(edgeDropTaskDialog.sourceId, itemKind, baseX, baseY)
             return Qt.point(baseX, baseY)
@@ -2341,6 +2251,7 @@ Item {
         onOpened: edgeDropTaskField.forceActiveFocus()
 
         contentItem: ColumnLayout {
+            visible: edgeDropTaskDialog.opened
             width: 320
             spacing: 12
 
@@ -2362,62 +2273,40 @@ Item {
             TextField {
                 id: edgeDropTaskField
                 Layout.fillWidth: true
-                placeholderText: edgeDropTaskDialog.sourceType === "task" ? "Task name" : (edgeDropTaskDialog.sourceType.charAt(0).toUpperCase() + edgeDropTaskDialog.sourceType.slice(1) + " label")
+                placeholderText: edgeDropTaskDialog.sourceType === "task" ? "Task name" : edgeDropTaskDialog.sourceLabel + " label"
                 selectByMouse: true
                 color: "#f5f6f8"
-                background: Rectangle {
-                    color: "#1b2028"
-                    radius: 4
-                    border.color: "#384458"
-                }
+                background: FieldBackground {}
                 Keys.onReturnPressed: edgeDropTaskDialog.accept()
                 Keys.onEnterPressed: edgeDropTaskDialog.accept()
             }
         }
 
-        footer: DialogButtonBox {
-            standardButtons: DialogButtonBox.Ok | DialogButtonBox.Cancel
-        }
+        footer: StdDialogFooter {}
 
         onAccepted: {
-            if (diagramModel && edgeDropTaskDialog.sourceId && edgeDropTaskField.text.trim().length > 0) {
-                if (edgeDropTaskDialog.sourceType === "task" && taskModel) {
-                    var newId = ""
-                    var taskDrop = edgeDropTaskDialog.connectedDrop("task")
-                    if (edgeDropTaskDialog.reverseDirection) {
-                        newId = diagramModel.addTaskFromText(
-                            edgeDropTaskField.text,
-                            taskDrop.x,
-                            taskDrop.y
-                        )
-                        if (newId && newId.length > 0) {
-                            diagramModel.addEdge(newId, edgeDropTaskDialog.sourceId)
-                        }
-                    } else {
-                        newId = diagramModel.addTaskFromTextAndConnect(
-                            edgeDropTaskDialog.sourceId,
-                            taskDrop.x,
-                            taskDrop.y,
-                            edgeDropTaskField.text
-                        )
-                    }
-                    if (newId && newId.length > 0) {
-                        root.lastCreatedTaskId = newId
-                        root.selectedItemId = newId
-                    }
-                } else {
-                    var presetName = edgeDropTaskDialog.sourceType === "task" ? "box" : edgeDropTaskDialog.sourceType
-                    var presetDrop = edgeDropTaskDialog.connectedDrop(presetName)
-                    diagramModel.addPresetItemAndConnect(
-                        edgeDropTaskDialog.sourceId,
-                        presetName,
-                        presetDrop.x,
-                        presetDrop.y,
-                        edgeDropTaskField.text
-                    )
-                }
-            }
+            var sourceId = edgeDropTaskDialog.sourceId
+            var text = edgeDropTaskField.text
+            var createTask = edgeDropTaskDialog.sourceType === "task" && taskModel
+            var reverseDirection = edgeDropTaskDialog.reverseDirection
+            var presetName = edgeDropTaskDialog.sourceType === "task" ? "box" : edgeDropTaskDialog.sourceType
+            var drop = edgeDropTaskDialog.connectedDrop(createTask ? "task" : presetName)
             edgeDropTaskDialog.close()
+            if (!diagramModel || !sourceId || text.trim().length === 0)
+                return
+            dialogHost.afterClose(function() {
+                if (!createTask) {
+                    diagramModel.addPresetItemAndConnect(sourceId, presetName, drop.x, drop.y, text)
+                    return
+                }
+                var newId = reverseDirection
+                    ? diagramModel.addTaskFromTextConnectedTo(sourceId, drop.x, drop.y, text)
+                    : diagramModel.addTaskFromTextAndConnect(sourceId, drop.x, drop.y, text)
+                if (newId && newId.length > 0) {
+                    root.lastCreatedTaskId = newId
+                    root.selectedItemId = newId
+                }
+            })
         }
         onRejected: edgeDropTaskDialog.close()
 
@@ -2430,43 +2319,16 @@ Item {
     }
 
     FileDialog {
-        id: boxPdfDialog
-        title: "Save Markdown PDF"
-        fileMode: FileDialog.SaveFile
-        nameFilters: ["PDF files (*.pdf)", "All files (*)"]
-        defaultSuffix: "pdf"
-        onAccepted: dialogHost.exportBoxDialogPdf(selectedFile)
-    }
-
-    FileDialog {
-        id: saveDialog
-        title: "Save Project As"
-        fileMode: FileDialog.SaveFile
-        nameFilters: ["Progress files (*.progress)", "All files (*)"]
-        defaultSuffix: "progress"
+        id: fileDialog
+        property var acceptCallback: null
+        property var rejectCallback: null
         onAccepted: {
-            var saved = false
-            if (projectManager) {
-                saved = projectManager.saveProjectAs(selectedFile)
-            }
-            if (root && root.handleSaveDialogAccepted)
-                root.handleSaveDialogAccepted(saved)
+            if (acceptCallback)
+                acceptCallback(selectedFile)
         }
         onRejected: {
-            if (root && root.handleSaveDialogRejected)
-                root.handleSaveDialogRejected()
-        }
-    }
-
-    FileDialog {
-        id: loadDialog
-        title: "Load Project"
-        fileMode: FileDialog.OpenFile
-        nameFilters: ["Progress files (*.progress)", "All files (*)"]
-        onAccepted: {
-            if (projectManager) {
-                projectManager.loadProject(selectedFile)
-            }
+            if (rejectCallback)
+                rejectCallback()
         }
     }
 
@@ -2530,163 +2392,165 @@ Item {
         }
     }
 
-    Dialog {
-        id: goalsDialog
-        modal: true
-        title: "Outcome Goals"
-        anchors.centerIn: parent
-        width: 420
+    LazyDialogLoader {
+        id: goalsDialogLoader
 
-        property var currentGoals: []
+        sourceComponent: Component {
+            Dialog {
+                id: goalsDialog
+                modal: true
+                title: "Outcome Goals"
+                anchors.centerIn: parent
+                width: 420
 
-        function refresh() {
-            if (tabModel) {
-                currentGoals = tabModel.getGoals(tabModel.currentTabIndex)
-            }
-        }
+                property var currentGoals: []
 
-        function addGoalAction() {
-            var text = newGoalField.text.trim()
-            if (text.length === 0 || !tabModel) return
-            tabModel.addGoal(tabModel.currentTabIndex, text)
-            newGoalField.text = ""
-            refresh()
-        }
-
-        onOpened: {
-            refresh()
-            newGoalField.text = ""
-            newGoalField.forceActiveFocus()
-        }
-
-        contentItem: ColumnLayout {
-            width: 400
-            spacing: 12
-
-            RowLayout {
-                Layout.fillWidth: true
-                spacing: 8
-
-                TextField {
-                    id: newGoalField
-                    Layout.fillWidth: true
-                    placeholderText: "Enter a new goal..."
-                    selectByMouse: true
-                    color: "#f5f6f8"
-                    background: Rectangle {
-                        color: "#1b2028"
-                        radius: 4
-                        border.color: "#384458"
+                function refresh() {
+                    if (tabModel) {
+                        currentGoals = tabModel.getGoals(tabModel.currentTabIndex)
                     }
-                    Keys.onReturnPressed: goalsDialog.addGoalAction()
-                    Keys.onEnterPressed: goalsDialog.addGoalAction()
                 }
 
-                Button {
-                    text: "Add"
-                    onClicked: goalsDialog.addGoalAction()
-                    contentItem: Text {
-                        text: "Add"
-                        color: "#f5f6f8"
-                        font.pixelSize: 12
-                        font.bold: true
-                        horizontalAlignment: Text.AlignHCenter
-                        verticalAlignment: Text.AlignVCenter
-                    }
-                    background: Rectangle {
-                        radius: 4
-                        color: parent.hovered ? "#2d7ab3" : "#1c2e3e"
-                        border.color: "#355069"
-                        border.width: 1
-                    }
+                function addGoalAction() {
+                    var text = newGoalField.text.trim()
+                    if (text.length === 0 || !tabModel) return
+                    tabModel.addGoal(tabModel.currentTabIndex, text)
+                    newGoalField.text = ""
+                    refresh()
                 }
-            }
 
-            ListView {
-                id: goalsListView
-                Layout.fillWidth: true
-                Layout.preferredHeight: Math.min(contentHeight, 300)
-                Layout.maximumHeight: 300
-                model: goalsDialog.currentGoals
-                clip: true
-                spacing: 4
-
-                delegate: Rectangle {
-                    width: goalsListView.width
-                    height: goalRow.implicitHeight + 12
-                    radius: 4
-                    color: "#1b2028"
-                    border.color: "#384458"
-                    border.width: 1
+                onOpened: {
+                    refresh()
+                    newGoalField.text = ""
+                    newGoalField.forceActiveFocus()
+                }
+
+                contentItem: ColumnLayout {
+                    width: 400
+                    spacing: 12
 
                     RowLayout {
-                        id: goalRow
-                        anchors.fill: parent
-                        anchors.margins: 6
+                        Layout.fillWidth: true
                         spacing: 8
 
-                        CheckBox {
-                            id: goalCheck
-                            checked: modelData.checked || false
-                            onToggled: {
-                                if (tabModel) {
-                                    tabModel.toggleGoal(tabModel.currentTabIndex, index)
-                                    goalsDialog.refresh()
-                                }
-                            }
-                        }
-
-                        Label {
+                        TextField {
+                            id: newGoalField
                             Layout.fillWidth: true
-                            text: modelData.text || ""
-                            color: (modelData.checked) ? "#728699" : "#f5f6f8"
-                            font.strikeout: modelData.checked || false
-                            font.pixelSize: 13
-                            wrapMode: Text.WordWrap
+                            placeholderText: "Enter a new goal..."
+                            selectByMouse: true
+                            color: "#f5f6f8"
+                            background: FieldBackground {}
+                            Keys.onReturnPressed: goalsDialog.addGoalAction()
+                            Keys.onEnterPressed: goalsDialog.addGoalAction()
                         }
 
                         Button {
-                            text: "\u00d7"
-                            flat: true
-                            implicitWidth: 28
-                            implicitHeight: 28
+                            text: "Add"
+                            onClicked: goalsDialog.addGoalAction()
                             contentItem: Text {
-                                text: "\u00d7"
-                                color: parent.hovered ? "#ff6b6b" : "#728699"
-                                font.pixelSize: 16
+                                text: "Add"
+                                color: "#f5f6f8"
+                                font.pixelSize: 12
                                 font.bold: true
                                 horizontalAlignment: Text.AlignHCenter
                                 verticalAlignment: Text.AlignVCenter
                             }
                             background: Rectangle {
                                 radius: 4
-                                color: parent.hovered ? "#2a1a1a" : "transparent"
+                                color: parent.hovered ? "#2d7ab3" : "#1c2e3e"
+                                border.color: "#355069"
+                                border.width: 1
                             }
-                            onClicked: {
-                                if (tabModel) {
-                                    tabModel.removeGoal(tabModel.currentTabIndex, index)
-                                    goalsDialog.refresh()
+                        }
+                    }
+
+                    ListView {
+                        id: goalsListView
+                        Layout.fillWidth: true
+                        Layout.preferredHeight: Math.min(contentHeight, 300)
+                        Layout.maximumHeight: 300
+                        model: goalsDialog.currentGoals
+                        clip: true
+                        spacing: 4
+
+                        delegate: Rectangle {
+                            width: goalsListView.width
+                            height: goalRow.implicitHeight + 12
+                            radius: 4
+                            color: "#1b2028"
+                            border.color: "#384458"
+                            border.width: 1
+
+                            RowLayout {
+                                id: goalRow
+                                anchors.fill: parent
+                                anchors.margins: 6
+                                spacing: 8
+
+                                CheckBox {
+                                    id: goalCheck
+                                    checked: modelData.checked || false
+                                    onToggled: {
+                                        if (tabModel) {
+                                            tabModel.toggleGoal(tabModel.currentTabIndex, index)
+                                            goalsDialog.refresh()
+                                        }
+                                    }
+                                }
+
+                                Label {
+                                    Layout.fillWidth: true
+                                    text: modelData.text || ""
+                                    color: (modelData.checked) ? "#728699" : "#f5f6f8"
+                                    font.strikeout: modelData.checked || false
+                                    font.pixelSize: 13
+                                    wrapMode: Text.WordWrap
+                                }
+
+                                Button {
+                                    text: "\u00d7"
+                                    flat: true
+                                    implicitWidth: 28
+                                    implicitHeight: 28
+                                    contentItem: Text {
+                                        text: "\u00d7"
+                                        color: parent.hovered ? "#ff6b6b" : "#728699"
+                                        font.pixelSize: 16
+                                        font.bold: true
+                                        horizontalAlignment: Text.AlignHCenter
+                                        verticalAlignment: Text.AlignVCenter
+                                    }
+                                    background: Rectangle {
+                                        radius: 4
+                                        color: parent.hovered ? "#2a1a1a" : "transparent"
+                                    }
+                                    onClicked: {
+                                        if (tabModel) {
+                                            tabModel.removeGoal(tabModel.currentTabIndex, index)
+                                            goalsDialog.refresh()
+                                        }
+                                    }
                                 }
                             }
                         }
                     }
+
+                    Label {
+                        visible: goalsDialog.currentGoals.length === 0
+                        text: "No goals yet. Add one above."
+                        color: "#728699"
+                        font.italic: true
+                        Layout.fillWidth: true
+                        horizontalAlignment: Text.AlignHCenter
+                    }
                 }
-            }
 
-            Label {
-                visible: goalsDialog.currentGoals.length === 0
-                text: "No goals yet. Add one above."
-                color: "#728699"
-                font.italic: true
-                Layout.fillWidth: true
-                horizontalAlignment: Text.AlignHCenter
-            }
-        }
+                footer: DialogButtonBox {
+                    standardButtons: DialogButtonBox.Close
+                }
 
-        footer: DialogButtonBox {
-            standardButtons: DialogButtonBox.Close
+                onRejected: goalsDialog.close()
+            }
         }
-
-        onRejected: goalsDialog.close()
     }
 }
@@ -11,8 +11,7 @@ MenuBar {
     property var mcpServerController: null
     property var edgeCanvas: null
     property var viewport: null
-    property var saveDialog: null
-    property var loadDialog: null
+    property var dialogHost: null
     property var taskDialog: null
     property var notificationSettingsDialog: null
 
@@ -68,13 +67,13 @@ MenuBar {
         MenuItem {
             text: "Save As..."
             enabled: hasProjectManager()
-            onTriggered: saveDialog.open()
+            onTriggered: dialogHost.openSaveProjectDialog()
         }
 
         MenuItem {
             text: "Load..."
             enabled: hasProjectManager()
-            onTriggered: loadDialog.open()
+            onTriggered: dialogHost.openLoadProjectDialog()
         }
 
         MenuItem {
@@ -163,10 +162,15 @@ MenuBar {
             text: "Clear All Items"
             onTriggered: {
                 if (!diagramModel) return
-                for (var i = diagramModel.count - 1; i >= 0; --i) {
-                    var idx = diagramModel.index(i, 0)
-                    var itemId = diagramModel.data(idx, diagramModel.IdRole)
-                    diagramModel.removeItem(itemId)
+                diagramModel.beginBatch()
+                try {
+                    for (var i = diagramModel.count - 1; i >= 0; --i) {
+                        var idx = diagramModel.index(i, 0)
+                        var itemId = diagramModel.data(idx, diagramModel.IdRole)
+                        diagramModel.removeItem(itemId)
+                    }
+                } finally {
+                    diagramModel.endBatch()
                 }
                 root.resetView()
             }
@@ -0,0 +1,7 @@
+import QtQuick 2.15
+import QtQuick.Controls 2.15
+
+// Cancel-only footer for dialogs that act directly from their content.
+DialogButtonBox {
+    standardButtons: DialogButtonBox.Cancel
+}
@@ -0,0 +1,8 @@
+import QtQuick 2.15
+
+// Shared background for the dialogs' text fields and areas.
+Rectangle {
+    color: "#1b2028"
+    radius: 4
+    border.color: "#384458"
+}
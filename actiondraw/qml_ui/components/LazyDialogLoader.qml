@@ -0,0 +1,34 @@
+import QtQuick 2.15
+
+// Creates its dialog on first open() instead of at window load.
+Loader {
+    id: lazyDialogLoader
+    property bool openWhenLoaded: false
+    readonly property bool dialogVisible: item ? item.visible : false
+
+    function open() {
+        if (item) {
+            item.open()
+            return
+        }
+        openWhenLoaded = true
+        active = true
+    }
+
+    function close() {
+        openWhenLoaded = false
+        if (item)
+            item.close()
+    }
+
+    anchors.fill: parent
+    active: false
+    asynchronous: true
+
+    onLoaded: {
+        if (openWhenLoaded) {
+            openWhenLoaded = false
+            item.open()
+        }
+    }
+}
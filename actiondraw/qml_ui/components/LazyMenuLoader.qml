@@ -0,0 +1,37 @@
+import QtQuick 2.15
+
+// Creates its menu on first popup() or open() instead of at window load.
+// Loading is synchronous so the menu shows at once, where it was requested,
+// and Instantiator-built items keep their order.
+Loader {
+    id: lazyMenuLoader
+    // Name of the Menu method to call once the menu has loaded.
+    property string showWhenLoaded: ""
+
+    function show(method) {
+        if (item) {
+            item[method]()
+            return
+        }
+        showWhenLoaded = method
+        active = true
+    }
+
+    function popup() {
+        show("popup")
+    }
+
+    function open() {
+        show("open")
+    }
+
+    active: false
+
+    onLoaded: {
+        if (showWhenLoaded.length > 0) {
+            var method = showWhenLoaded
+            showWhenLoaded = ""
+            item[method]()
+        }
+    }
+}
@@ -602,13 +602,26 @@ Item {
         }
     }
 
+    // Re-parse the preview once typing pauses rather than on every keystroke.
+    Timer {
+        id: previewRefreshTimer
+        interval: 120
+        repeat: false
+        onTriggered: root.refreshPreviewBlocks()
+    }
+
     onTextValueChanged: {
         var incoming = root.normalizeLineBreaks(textValue)
         if (markdownImagePaster)
             incoming = markdownImagePaster.compactMarkdownImages(incoming)
-        if (root.normalizeLineBreaks(editor.text) !== incoming)
+        if (root.normalizeLineBreaks(editor.text) !== incoming) {
+            // Text set from outside the editor: show its preview right away.
             editor.text = incoming
-        root.refreshPreviewBlocks()
+            previewRefreshTimer.stop()
+            root.refreshPreviewBlocks()
+            return
+        }
+        previewRefreshTimer.restart()
     }
 
     Component.onCompleted: root.refreshPreviewBlocks()
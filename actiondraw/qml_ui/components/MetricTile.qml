@@ -0,0 +1,43 @@
+import QtQuick 2.15
+import QtQuick.Controls 2.15
+
+// Fixed-width stats tile: a bold value label next to a dim caption.
+Rectangle {
+    id: metricTile
+    property string valueText: ""
+    property string caption: ""
+    property color accentColor: "#ffffff"
+    property bool captionFirst: false
+    property bool compact: false
+
+    height: compact ? 34 : 44
+    radius: compact ? 8 : 10
+    color: "#14202b"
+    border.color: "#2c3f53"
+    border.width: 1
+
+    // Plain positioner with explicit geometry: no layout engine or anchors per tile.
+    Row {
+        x: Math.round((metricTile.width - width) / 2)
+        height: metricTile.height
+        spacing: metricTile.compact ? 5 : 6
+        layoutDirection: metricTile.captionFirst ? Qt.RightToLeft : Qt.LeftToRight
+
+        Label {
+            height: parent.height
+            verticalAlignment: Text.AlignVCenter
+            text: metricTile.valueText
+            font.pixelSize: metricTile.compact ? 12 : 13
+            font.bold: true
+            color: metricTile.accentColor
+        }
+
+        Label {
+            height: parent.height
+            verticalAlignment: Text.AlignVCenter
+            text: metricTile.caption
+            font.pixelSize: metricTile.compact ? 10 : 11
+            color: "#8da6bc"
+        }
+    }
+}
@@ -32,8 +32,7 @@ RowLayout {
             spacing: compact ? 8 : 10
 
             Label {
-                property real percentage: taskModel ? taskModel.percentageComplete : 0
-                text: percentage.toFixed(0) + "%"
+                text: taskModel ? taskModel.percentageCompleteText : "0%"
                 font.pixelSize: compact ? 14 : 16
                 font.bold: true
                 color: "#67b8ff"
@@ -59,62 +58,23 @@ RowLayout {
         }
     }
 
-    Rectangle {
+    MetricTile {
         visible: taskModel !== null
         width: compact ? 106 : 120
-        height: compact ? 34 : 44
-        radius: compact ? 8 : 10
-        color: "#14202b"
-        border.color: "#2c3f53"
-        border.width: 1
-
-        RowLayout {
-            anchors.centerIn: parent
-            spacing: compact ? 5 : 6
-
-            Label {
-                property real totalTime: taskModel ? taskModel.totalEstimatedTime : 0
-                text: root.formatTime(totalTime)
-                font.pixelSize: compact ? 12 : 13
-                font.bold: true
-                color: "#ffbf72"
-            }
-
-            Label {
-                text: "left"
-                font.pixelSize: compact ? 10 : 11
-                color: "#8da6bc"
-            }
-        }
+        compact: progressStats.compact
+        valueText: root.formatTime(taskModel ? taskModel.totalEstimatedTime : 0)
+        caption: "left"
+        accentColor: "#ffbf72"
     }
 
-    Rectangle {
+    MetricTile {
         visible: taskModel !== null
         width: compact ? 122 : 138
-        height: compact ? 34 : 44
-        radius: compact ? 8 : 10
-        color: "#14202b"
-        border.color: "#2c3f53"
-        border.width: 1
-
-        RowLayout {
-            anchors.centerIn: parent
-            spacing: compact ? 5 : 6
-
-            Label {
-                text: "ETA"
-                font.pixelSize: compact ? 10 : 11
-                color: "#8da6bc"
-            }
-
-            Label {
-                property string completionTime: taskModel ? taskModel.estimatedCompletionTimeOfDay : ""
-                text: completionTime !== "" ? completionTime : "N/A"
-                font.pixelSize: compact ? 12 : 13
-                font.bold: true
-                color: "#8fd8b1"
-            }
-        }
+        compact: progressStats.compact
+        valueText: taskModel ? taskModel.estimatedCompletionText : "N/A"
+        caption: "ETA"
+        captionFirst: true
+        accentColor: "#8fd8b1"
     }
 
     Item {
@@ -0,0 +1,7 @@
+import QtQuick 2.15
+import QtQuick.Controls 2.15
+
+// Ok/Cancel footer shared by the dialogs; Dialog wires accept/reject to it.
+DialogButtonBox {
+    standardButtons: DialogButtonBox.Ok | DialogButtonBox.Cancel
+}
@@ -132,57 +132,43 @@ Rectangle {
                     border.width: 1
                 }
             }
-            onClicked: colorMenu.open()
+            onClicked: colorMenuLoader.open()
 
-            Menu {
-                id: colorMenu
-                parent: colorPickerButton
-                y: colorPickerButton.height
+            readonly property var brushColors: [
+                { name: "White", color: "#ffffff" },
+                { name: "Red", color: "#ff5555" },
+                { name: "Orange", color: "#ff9944" },
+                { name: "Yellow", color: "#ffee55" },
+                { name: "Green", color: "#55ff55" },
+                { name: "Cyan", color: "#55ffff" },
+                { name: "Blue", color: "#5588ff" },
+                { name: "Purple", color: "#aa55ff" },
+                { name: "Pink", color: "#ff55aa" }
+            ]
 
-                MenuItem {
-                    text: "White"
-                    Rectangle { anchors.right: parent.right; anchors.rightMargin: 8; anchors.verticalCenter: parent.verticalCenter; width: 16; height: 16; radius: 8; color: "#ffffff" }
-                    onTriggered: diagramModel && diagramModel.setBrushColor("#ffffff")
-                }
-                MenuItem {
-                    text: "Red"
-                    Rectangle { anchors.right: parent.right; anchors.rightMargin: 8; anchors.verticalCenter: parent.verticalCenter; width: 16; height: 16; radius: 8; color: "#ff5555" }
-                    onTriggered: diagramModel && diagramModel.setBrushColor("#ff5555")
-                }
-                MenuItem {
-                    text: "Orange"
-                    Rectangle { anchors.right: parent.right; anchors.rightMargin: 8; anchors.verticalCenter: parent.verticalCenter; width: 16; height: 16; radius: 8; color: "#ff9944" }
-                    onTriggered: diagramModel && diagramModel.setBrushColor("#ff9944")
-                }
-                MenuItem {
-                    text: "Yellow"
-                    Rectangle { anchors.right: parent.right; anchors.rightMargin: 8; anchors.verticalCenter: parent.verticalCenter; width: 16; height: 16; radius: 8; color: "#ffee55" }
-                    onTriggered: diagramModel && diagramModel.setBrushColor("#ffee55")
-                }
-                MenuItem {
-                    text: "Green"
-                    Rectangle { anchors.right: parent.right; anchors.rightMargin: 8; anchors.verticalCenter: parent.verticalCenter; width: 16; height: 16; radius: 8; color: "#55ff55" }
-                    onTriggered: diagramModel && diagramModel.setBrushColor("#55ff55")
-                }
-                MenuItem {
-                    text: "Cyan"
-                    Rectangle { anchors.right: parent.right; anchors.rightMargin: 8; anchors.verticalCenter: parent.verticalCenter; width: 16; height: 16; radius: 8; color: "#55ffff" }
-                    onTriggered: diagramModel && diagramModel.setBrushColor("#55ffff")
-                }
-                MenuItem {
-                    text: "Blue"
-                    Rectangle { anchors.right: parent.right; anchors.rightMargin: 8; anchors.verticalCenter: parent.verticalCenter; width: 16; height: 16; radius: 8; color: "#5588ff" }
-                    onTriggered: diagramModel && diagramModel.setBrushColor("#5588ff")
-                }
-                MenuItem {
-                    text: "Purple"
-                    Rectangle { anchors.right: parent.right; anchors.rightMargin: 8; anchors.verticalCenter: parent.verticalCenter; width: 16; height: 16; radius: 8; color: "#aa55ff" }
-                    onTriggered: diagramModel && diagramModel.setBrushColor("#aa55ff")
-                }
-                MenuItem {
-                    text: "Pink"
-                    Rectangle { anchors.right: parent.right; anchors.rightMargin: 8; anchors.verticalCenter: parent.verticalCenter; width: 16; height: 16; radius: 8; color: "#ff55aa" }
-                    onTriggered: diagramModel && diagramModel.setBrushColor("#ff55aa")
+            LazyMenuLoader {
+                id: colorMenuLoader
+
+                sourceComponent: Component {
+                    Menu {
+                        id: colorMenu
+                        parent: colorPickerButton
+                        y: colorPickerButton.height
+
+                        Instantiator {
+                            model: colorPickerButton.brushColors
+
+                            delegate: MenuItem {
+                                required property var modelData
+                                text: modelData.name
+                                Rectangle { anchors.right: parent.right; anchors.rightMargin: 8; anchors.verticalCenter: parent.verticalCenter; width: 16; height: 16; radius: 8; color: modelData.color }
+                                onTriggered: diagramModel && diagramModel.setBrushColor(modelData.color)
+                            }
+
+                            onObjectAdded: function(index, object) { colorMenu.insertItem(index, object) }
+                            onObjectRemoved: function(index, object) { colorMenu.removeItem(object) }
+                        }
+                    }
                 }
             }
         }
@@ -205,8 +191,10 @@ Rectangle {
                 stepSize: 1
                 value: diagramModel ? diagramModel.brushWidth : 3
                 onValueChanged: {
-                    if (diagramModel && Math.abs(diagramModel.brushWidth - value) > 0.1)
-                        diagramModel.setBrushWidth(value)
+                    // Drags move the value continuously; only whole widths reach the model.
+                    var width = Math.round(value)
+                    if (diagramModel && diagramModel.brushWidth !== width)
+                        diagramModel.setBrushWidth(width)
                 }
             }
 
@@ -263,8 +251,10 @@ Rectangle {
                     stepSize: 0.01
                     value: root.zoomLevel
                     onValueChanged: {
-                        if (Math.abs(root.zoomLevel - value) > 0.0001) {
-                            root.setZoomDirect(value, viewport.width / 2, viewport.height / 2)
+                        // Quantize drags to stepSize so sub-step moves do not rezoom the board.
+                        var snapped = Math.round(value / stepSize) * stepSize
+                        if (Math.abs(root.zoomLevel - snapped) >= stepSize / 2) {
+                            root.setZoomDirect(snapped, viewport.width / 2, viewport.height / 2)
                         }
                     }
                 }
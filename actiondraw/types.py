@@ -6,10 +6,11 @@ ActionDraw diagramming system.
 
 from __future__ import annotations
 
+from array import array
 from dataclasses import dataclass
 from enum import Enum
-from dataclasses import field
-from typing import Dict, List
+from dataclasses import InitVar, field
+from typing import Dict, Iterable, List, Optional, Tuple
 
 
 class DiagramItemType(Enum):
@@ -51,6 +52,14 @@ class DiagramItem:
     text_tabs: List[Dict[str, str]] = field(default_factory=list)
     text_tab_index: int = 0
 
+    @property
+    def image_version(self) -> int:
+        """Return a cache-busting token for ``image_data``, or 0 when there is none."""
+        if not self.image_data:
+            return 0
+        # str hashes are cached on the object, so repeated role reads stay O(1).
+        return hash(self.image_data) & 0x7FFFFFFF
+
 
 @dataclass
 class DiagramEdge:
@@ -72,9 +81,51 @@ class DrawingPoint:
 
 @dataclass
 class DrawingStroke:
-    """A freehand drawing stroke on the canvas."""
+    """A freehand drawing stroke on the canvas.
+
+    Points are stored as interleaved ``x0, y0, x1, y1, ...`` doubles in
+    ``coords`` instead of one DrawingPoint object per point. A ``points``
+    sequence of DrawingPoint objects is still accepted by the constructor
+    and copied into ``coords``.
+    """
 
     id: str
-    points: List[DrawingPoint]
+    points: InitVar[Optional[Iterable[DrawingPoint]]] = None
     color: str = "#ffffff"
     width: float = 3.0
+    coords: array = field(default_factory=lambda: array("d"))
+
+    def __post_init__(self, points: Optional[Iterable[DrawingPoint]]) -> None:
+        if points is not None:
+            for point in points:
+                self.add_point(point.x, point.y)
+
+    @property
+    def point_count(self) -> int:
+        return len(self.coords) // 2
+
+    @property
+    def bounds(self) -> List[float]:
+        """Return ``[min_x, min_y, max_x, max_y]`` of the points, or ``[]`` if empty."""
+        coords = self.coords
+        if len(coords) < 2:
+            return []
+        xs = coords[0::2]
+        ys = coords[1::2]
+        return [min(xs), min(ys), max(xs), max(ys)]
+
+    def add_point(self, x: float, y: float) -> None:
+        self.coords.append(x)
+        self.coords.append(y)
+
+
+def _stroke_points(stroke: DrawingStroke) -> Tuple[DrawingPoint, ...]:
+    """Return a read-only snapshot of the stroke's points as DrawingPoint objects."""
+    coords = stroke.coords
+    return tuple(DrawingPoint(coords[i], coords[i + 1]) for i in range(0, len(coords) - 1, 2))
+
+
+# Attached after the dataclass is built: a property in the class body would
+# become the default value of the ``points`` constructor argument. Appending
+# to the returned tuple fails loudly; use ``add_point`` to grow a stroke.
+DrawingStroke.points = property(_stroke_points)
@@ -8,6 +8,7 @@ import sys
 from PySide6.QtCore import QUrl
 from PySide6.QtQml import QQmlApplicationEngine
 
+from .image_provider import DIAGRAM_IMAGE_PROVIDER_ID, DiagramImageProvider
 from .model import DiagramModel
 from .markdown_image_paster import MarkdownImagePaster
 from .markdown_preview_formatter import MarkdownPreviewFormatter
@@ -60,6 +61,8 @@ def create_actiondraw_window(
     engine._markdown_pdf_exporter = markdown_pdf_exporter
     engine._markdown_highlighter_bridge = markdown_highlighter_bridge
     engine._mcp_server_controller = mcp_server_controller
+    engine._diagram_image_provider = DiagramImageProvider(diagram_model)
+    engine.addImageProvider(DIAGRAM_IMAGE_PROVIDER_ID, engine._diagram_image_provider)
     engine.addImportPath(str(QML_DIR))
     engine.load(QUrl.fromLocalFile(str(ACTIONDRAW_QML_PATH)))
     return engine
@@ -30,6 +30,11 @@ except Exception:  # pragma: no cover - import availability depends on environme
     Type = None  # type: ignore[assignment]
     hash_secret_raw = None  # type: ignore[assignment]
 
+try:  # pragma: no cover - import availability depends on environment
+    import orjson
+except Exception:  # pragma: no cover - import availability depends on environment
+    orjson = None  # type: ignore[assignment]
+
 list_all_devices = None  # type: ignore[assignment]
 OtpConnection = None  # type: ignore[assignment]
 SLOT = None  # type: ignore[assignment]
@@ -230,7 +235,7 @@ def encrypt_project_data(
     aad = _build_aad("1.2", metadata)
     metadata["aad_b64"] = _b64encode(aad)
 
-    plaintext = json.dumps(project_data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    plaintext = _dump_project_json(project_data)
     ciphertext = AESGCM(key).encrypt(nonce, plaintext, aad)
 
     return {
@@ -319,7 +324,7 @@ def _decrypt_core(
         raise CryptoError("Unable to decrypt project: invalid credentials or corrupted file") from exc
 
     try:
-        payload = json.loads(plaintext.decode("utf-8"))
+        payload = load_project_json(plaintext)
     except (ValueError, UnicodeDecodeError) as exc:
         raise CryptoError(f"Decrypted payload is not valid JSON: {exc}") from exc
 
@@ -390,7 +395,7 @@ def encrypt_with_derived_key(
     aad = _build_aad("1.2", metadata)
     metadata["aad_b64"] = _b64encode(aad)
 
-    plaintext = json.dumps(project_data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    plaintext = _dump_project_json(project_data)
     ciphertext = AESGCM(subkey).encrypt(nonce, plaintext, aad)
 
     return {
@@ -567,6 +572,37 @@ def _require_crypto_dependencies() -> None:
         raise CryptoError("Missing dependency: argon2-cffi is required for encrypted project support")
 
 
+def _dump_project_json(project_data: Dict[str, Any]) -> bytes:
+    """Serialize project data to compact UTF-8 JSON, using orjson when available.
+
+    orjson writes ``inf``/``nan`` as ``null`` where the stdlib writes
+    ``Infinity``/``NaN``. The models' ``to_dict`` methods never emit
+    non-finite floats, so project payloads serialize to the same bytes either
+    way without scanning them here.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(project_data)
+        except TypeError:
+            # orjson rejects non-string keys and other types the stdlib coerces.
+            pass
+    return json.dumps(project_data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def load_project_json(raw: bytes) -> Any:
+    """Parse UTF-8 project JSON, using orjson when available.
+
+    Input orjson rejects but the stdlib accepts (such as ``NaN``) falls back to
+    ``json.loads``, so both paths accept the same files.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(raw.decode("utf-8"))
+
+
 def _build_aad(version: str, metadata: Dict[str, Any]) -> bytes:
     payload = {
         "version": version,
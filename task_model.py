@@ -45,6 +45,7 @@ from progress_crypto import (
     encrypt_with_derived_key,
     has_yubikey_cli,
     is_encrypted_envelope,
+    load_project_json,
     yubikey_support_guidance,
 )
 from actiondraw.markdown_tab_clipboard import parse_tabs_from_clipboard_text
@@ -163,6 +164,11 @@ def _parse_local_datetime(reminder_str: str) -> Optional[float]:
         return None
 
 
+def _finite_or_none(value: Optional[float]) -> Optional[float]:
+    """Return ``value``, or None if it is ``inf``/``nan`` so it saves as unset."""
+    return value if value is None or math.isfinite(value) else None
+
+
 def _format_short_countdown(total_seconds: float) -> str:
     """Format remaining seconds as M:SS or H:MM:SS for reminder countdowns."""
     total_secs = max(0, int(math.floor(float(total_seconds))))
@@ -523,6 +529,13 @@ class TaskModel(QAbstractListModel):
             return self._tasks[index].title
         return ""
 
+    @Slot(int, result=bool)
+    def isTaskCompleted(self, index: int) -> bool:
+        """Return whether the task at index is completed, False if out of range."""
+        if 0 <= index < len(self._tasks):
+            return self._tasks[index].completed
+        return False
+
     def data(self, index: QModelIndex, role: int = Qt.DisplayRole):  # type: ignore[override]
         if not index.isValid() or not (0 <= index.row() < len(self._tasks)):
             return None
@@ -620,6 +633,12 @@ class TaskModel(QAbstractListModel):
         completed = sum(1 for t in self._tasks if t.completed)
         return (completed / len(self._tasks)) * 100.0
 
+    @Property(str, notify=totalEstimateChanged)
+    def percentageCompleteText(self) -> str:
+        """Whole-number completion percentage, formatted for display."""
+        # Round half up, matching the JavaScript toFixed(0) the QML used before.
+        return f"{int(self.percentageComplete + 0.5)}%"
+
     @Property(str, notify=totalEstimateChanged)
     def currentActiveTaskTitle(self) -> str:
         """Get the title of the first incomplete task (currently being worked on)."""
@@ -638,6 +657,11 @@ class TaskModel(QAbstractListModel):
         future_time = datetime.now() + timedelta(minutes=total_time)
         return future_time.strftime("%H:%M")
 
+    @Property(str, notify=totalEstimateChanged)
+    def estimatedCompletionText(self) -> str:
+        """Completion time of day for display, or ``"N/A"`` with nothing left."""
+        return self.estimatedCompletionTimeOfDay or "N/A"
+
     def _estimateTaskTime(self, row: int) -> float:
         """Estimate time for a single task to complete."""
         task = self._tasks[row]
@@ -1248,6 +1272,8 @@ class TaskModel(QAbstractListModel):
                     # Default to minutes
                     minutes = float(estimate_str)
 
+                if not math.isfinite(minutes):
+                    return
                 self._tasks[row].custom_estimate = max(0.0, minutes)
             except ValueError:
                 # Invalid format, ignore
@@ -1327,7 +1353,8 @@ class TaskModel(QAbstractListModel):
             "time_spent": task.time_spent,
             "parent_index": task.parent_index if parent_index is None else parent_index,
             "indent_level": task.indent_level if indent_level is None else indent_level,
-            "custom_estimate": task.custom_estimate,
+            # Older files may hold Infinity/NaN estimates; save those as unset.
+            "custom_estimate": _finite_or_none(task.custom_estimate),
         }
         if task.countdown_duration is not None:
             task_dict["countdown_duration"] = task.countdown_duration
@@ -3678,8 +3705,8 @@ class ProjectManager(QObject):
         self.scrubProjectData()
 
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                project_data = json.load(f)
+            with open(file_path, "rb") as f:
+                project_data = load_project_json(f.read())
 
             if is_encrypted_envelope(project_data):
                 credentials = self._prompt_encryption_credentials("load", file_path, project_data)
@@ -1,13 +1,15 @@
 """Tests for the rewritten actiondraw module."""
 
 import json
+import math
 import os
 import time
+from array import array
 
 import pytest
-from PySide6.QtCore import QModelIndex, QObject, QDateTime, QPointF, Qt, QUrl, Slot
+from PySide6.QtCore import QModelIndex, QObject, QDateTime, QPoint, QPointF, Qt, QUrl, Slot
 from PySide6.QtGui import QGuiApplication
-from PySide6.QtQml import QQmlApplicationEngine, QQmlComponent, QQmlEngine
+from PySide6.QtQml import QQmlApplicationEngine, QQmlComponent, QQmlEngine, QQmlExpression
 from PySide6.QtQuick import QQuickItem
 from PySide6.QtTest import QTest
 
@@ -18,11 +20,14 @@ from actiondraw import (
     DiagramModel,
     DrawingPoint,
     DrawingStroke,
+    ITEM_PRESETS,
     create_actiondraw_window,
 )
 from actiondraw.markdown_tab_clipboard import MarkdownTabClipboard, parse_tabs_from_clipboard_text
+from actiondraw.drawing import simplify_coords
 from actiondraw.qml import QML_DIR
 from actiondraw.markdown_note_manager import MarkdownNoteManager
+from actiondraw.model import LINKED_SUBTAB_REFRESH_DELAY_MS
 from actiondraw.qml import load_actiondraw_qml
 from progress_crypto import CryptoError, EncryptionCredentials, yubikey_support_guidance
 from task_model import TaskModel
@@ -102,6 +107,62 @@ def diagram_model_with_task_model(app, task_model):
     return DiagramModel(task_model=task_model)
 
 
+def _evaluate_in_action_dialogs(window, code):
+    """Evaluate a QML expression where ActionDialogs.qml's ids are in scope."""
+    dialogs = next(
+        child for child in window.findChildren(QQuickItem)
+        if child.metaObject().className().startswith("ActionDialogs")
+    )
+    # Any item declared inside ActionDialogs.qml sees its ids.
+    inner = next(
+        child for child in dialogs.findChildren(QQuickItem)
+        if child.metaObject().className().startswith("LazyDialogLoader")
+    )
+    return _evaluate_in(inner, code)
+
+
+def _evaluate_in(item, code):
+    """Evaluate a QML expression in the context ``item`` was declared in."""
+    return QQmlExpression(QQmlEngine.contextForObject(item), item, code).evaluate()
+
+
+def _qml_value(item, code):
+    """Return the value of a QML expression evaluated in ``item``'s context."""
+    return _evaluate_in(item, code)[0]
+
+
+def _linear_edge_at(model, x, y, excluded_item_id="", threshold=8.0):
+    """Return the topmost edge near a point by measuring every edge."""
+    for edge in reversed(model.edges):
+        if excluded_item_id in (edge["fromId"], edge["toId"]):
+            continue
+        from_x, from_y = model._item_center(model.getItem(edge["fromId"]))
+        to_x, to_y = model._item_center(model.getItem(edge["toId"]))
+        if model._distance_to_segment(x, y, from_x, from_y, to_x, to_y) <= threshold:
+            return edge["id"]
+    return ""
+
+
+def _descendants(item):
+    """Yield every item below ``item`` in the visual tree."""
+    for child in item.childItems():
+        yield child
+        yield from _descendants(child)
+
+
+def _diagram_layer_child(window, name):
+    """Return the diagramLayer child item declared with the given QML id."""
+    diagram_layer, _ = _evaluate_in_action_dialogs(window, "diagramLayer")
+    context = QQmlEngine.contextForObject(diagram_layer)
+    return next(child for child in diagram_layer.childItems() if context.nameForObject(child) == name)
+
+
+def _item_rect(window, item_id):
+    """Return the diagram delegate showing the item with ``item_id``."""
+    diagram_layer, _ = _evaluate_in_action_dialogs(window, "diagramLayer")
+    return next(child for child in _descendants(diagram_layer) if child.property("itemId") == item_id)
+
+
 class TestDataClasses:
     def test_diagram_item_defaults(self):
         item = DiagramItem(id="box_1", item_type=DiagramItemType.BOX, x=10.0, y=20.0)
@@ -141,6 +202,25 @@ class TestDataClasses:
         assert stroke.color == "#ff0000"
         assert stroke.width == 10.0
 
+    def test_drawing_stroke_points_fill_flat_coords(self):
+        stroke = DrawingStroke("stroke_2", [DrawingPoint(1.0, 2.0), DrawingPoint(3.0, 4.0)])
+        assert stroke.coords == array("d", (1.0, 2.0, 3.0, 4.0))
+        assert stroke.point_count == 2
+        assert stroke.points == (DrawingPoint(1.0, 2.0), DrawingPoint(3.0, 4.0))
+
+        flat = DrawingStroke(id="stroke_3", coords=array("d", (5.0, 6.0)))
+        flat.add_point(7.0, 8.0)
+        assert flat.points == (DrawingPoint(5.0, 6.0), DrawingPoint(7.0, 8.0))
+
+    def test_drawing_stroke_points_are_read_only(self):
+        stroke = DrawingStroke(id="stroke_4", points=[DrawingPoint(0.0, 0.0)])
+        # The points view is a snapshot; mutating it must not silently drop data.
+        with pytest.raises(AttributeError):
+            stroke.points.append(DrawingPoint(1.0, 1.0))
+        with pytest.raises(AttributeError):
+            stroke.points = []
+        assert stroke.point_count == 1
+
 
 class TestDiagramModelBasics:
     def test_empty_model(self, empty_diagram_model):
@@ -226,6 +306,19 @@ class TestDiagramModelBasics:
         empty_diagram_model.addBox(0.0, 0.0, "Box")
         empty_diagram_model.moveItem("does_not_exist", 10.0, 10.0)
 
+    def test_move_and_resize_snap_to_pixels(self, empty_diagram_model):
+        item_id = empty_diagram_model.addBox(0.0, 0.0, "Box")
+        empty_diagram_model.moveItem(item_id, 100.2, 199.7)
+        empty_diagram_model.resizeItem(item_id, 150.4, 80.6)
+        item = empty_diagram_model.getItem(item_id)
+        assert (item.x, item.y, item.width, item.height) == (100.0, 200.0, 150.0, 81.0)
+
+        changed = []
+        empty_diagram_model.dataChanged.connect(lambda *args: changed.append(args))
+        empty_diagram_model.moveItem(item_id, 100.3, 200.1)
+        empty_diagram_model.resizeItem(item_id, 149.9, 80.8)
+        assert changed == []
+
     def test_set_item_text(self, empty_diagram_model):
         item_id = empty_diagram_model.addBox(0.0, 0.0, "Old")
         empty_diagram_model.setItemText(item_id, "New")
@@ -243,6 +336,47 @@ class TestDiagramModelBasics:
         assert empty_diagram_model.data(index, empty_diagram_model.WidthRole) == 200.0
         assert empty_diagram_model.data(index, empty_diagram_model.HeightRole) == 120.0
 
+    def test_only_geometry_changes_emit_geometry_changed(self, empty_diagram_model):
+        item_id = empty_diagram_model.addBox(0.0, 0.0, "Box")
+        items_changed = []
+        geometry_changed = []
+        empty_diagram_model.itemsChanged.connect(lambda: items_changed.append(True))
+        empty_diagram_model.geometryChanged.connect(lambda: geometry_changed.append(True))
+
+        empty_diagram_model.setItemText(item_id, "Renamed")
+        empty_diagram_model.setItemMarkdown(item_id, "Notes")
+        empty_diagram_model.setFolderPath(item_id, "/tmp")
+        assert items_changed == []
+        assert geometry_changed == []
+
+        empty_diagram_model.moveItem(item_id, 50.0, 60.0)
+        empty_diagram_model.resizeItem(item_id, 200.0, 100.0)
+        assert len(geometry_changed) == 2
+        assert len(items_changed) == 2
+
+    def test_every_role_name_has_a_data_getter(self, empty_diagram_model):
+        empty_diagram_model.addBox(0.0, 0.0, "Box")
+        index = empty_diagram_model.index(0, 0)
+        for role in empty_diagram_model.roleNames():
+            assert role in DiagramModel._ROLE_GETTERS
+            empty_diagram_model.data(index, role)
+        assert empty_diagram_model.data(index, Qt.DisplayRole) is None
+
+    def test_move_item_after_earlier_item_removed(self, empty_diagram_model):
+        first_id = empty_diagram_model.addBox(0.0, 0.0, "First")
+        second_id = empty_diagram_model.addBox(10.0, 10.0, "Second")
+        third_id = empty_diagram_model.addBox(20.0, 20.0, "Third")
+        empty_diagram_model.removeItem(first_id)
+
+        empty_diagram_model.moveItem(third_id, 300.0, 400.0)
+
+        assert empty_diagram_model.getItem(first_id) is None
+        assert empty_diagram_model.getItem(second_id).x == 10.0
+        index = empty_diagram_model.index(1, 0)
+        assert empty_diagram_model.data(index, empty_diagram_model.IdRole) == third_id
+        assert empty_diagram_model.data(index, empty_diagram_model.XRole) == 300.0
+        assert empty_diagram_model.data(index, empty_diagram_model.YRole) == 400.0
+
 
 class TestEdges:
     def test_add_edge(self, empty_diagram_model):
@@ -273,10 +407,75 @@ class TestEdges:
         assert empty_diagram_model.count == 1
         assert empty_diagram_model.edges == []
 
+    def test_remove_item_keeps_unrelated_edges(self, empty_diagram_model):
+        a = empty_diagram_model.addBox(0.0, 0.0, "A")
+        b = empty_diagram_model.addBox(50.0, 50.0, "B")
+        c = empty_diagram_model.addBox(100.0, 100.0, "C")
+        d = empty_diagram_model.addBox(150.0, 150.0, "D")
+        empty_diagram_model.addEdge(a, b)
+        empty_diagram_model.addEdge(c, b)
+        empty_diagram_model.addEdge(c, d)
+        empty_diagram_model.addEdge(b, d)
+        emitted = []
+        empty_diagram_model.edgesChanged.connect(lambda: emitted.append(True))
+
+        empty_diagram_model.removeItem(b)
+        assert [(edge["fromId"], edge["toId"]) for edge in empty_diagram_model.edges] == [(c, d)]
+        assert len(emitted) == 1
+
+        emitted.clear()
+        empty_diagram_model.removeItem(a)
+        assert emitted == []
+        empty_diagram_model.removeItem(d)
+        assert empty_diagram_model.edges == []
+
     def test_remove_item_invalid(self, empty_diagram_model):
         empty_diagram_model.addBox(0.0, 0.0, "A")
         empty_diagram_model.removeItem("missing")
 
+    def test_edge_ids_stay_unique_after_removal(self, empty_diagram_model):
+        a = empty_diagram_model.addBox(0.0, 0.0, "A")
+        b = empty_diagram_model.addBox(50.0, 50.0, "B")
+        c = empty_diagram_model.addBox(100.0, 100.0, "C")
+        empty_diagram_model.addEdge(a, b)
+        empty_diagram_model.addEdge(b, c)
+        empty_diagram_model.removeEdge(empty_diagram_model.edges[0]["id"])
+        empty_diagram_model.addEdge(a, c)
+
+        edge_ids = [edge["id"] for edge in empty_diagram_model.edges]
+        assert len(set(edge_ids)) == 2
+
+        empty_diagram_model.removeEdge(edge_ids[0])
+        assert [(edge["fromId"], edge["toId"]) for edge in empty_diagram_model.edges] == [(a, c)]
+
+    def test_edge_ids_resume_after_load(self, empty_diagram_model):
+        empty_diagram_model.from_dict({
+            "items": [
+                {"id": "box_0", "item_type": "box", "x": 0.0, "y": 0.0},
+                {"id": "box_1", "item_type": "box", "x": 50.0, "y": 0.0},
+                {"id": "box_2", "item_type": "box", "x": 100.0, "y": 0.0},
+            ],
+            "edges": [{"id": "edge_7", "from_id": "box_0", "to_id": "box_1"}],
+        })
+        empty_diagram_model.addEdge("box_1", "box_2")
+        assert empty_diagram_model.edges[1]["id"] == "edge_8"
+
+    def test_edge_can_be_readded_after_item_removal(self, empty_diagram_model):
+        a = empty_diagram_model.addBox(0.0, 0.0, "A")
+        b = empty_diagram_model.addBox(50.0, 50.0, "B")
+        c = empty_diagram_model.addBox(100.0, 100.0, "C")
+        empty_diagram_model.addEdge(a, b)
+        empty_diagram_model.addEdge(b, c)
+        empty_diagram_model.removeItem(c)
+        empty_diagram_model.removeEdgeBetween(a, b)
+        assert empty_diagram_model.edges == []
+
+        empty_diagram_model.addEdge(a, b)
+        assert len(empty_diagram_model.edges) == 1
+        edge_id = empty_diagram_model.edges[0]["id"]
+        empty_diagram_model.setEdgeDescription(edge_id, "again")
+        assert empty_diagram_model.getEdgeDescription(edge_id) == "again"
+
     def test_edge_drag_state(self, empty_diagram_model):
         a = empty_diagram_model.addBox(0.0, 0.0, "A")
         empty_diagram_model.startEdgeDrawing(a)
@@ -289,6 +488,23 @@ class TestEdges:
         assert empty_diagram_model.edgeDrawingFrom == ""
         assert empty_diagram_model.isDraggingEdge is False
 
+    def test_edge_drag_emits_only_on_change(self, empty_diagram_model):
+        a = empty_diagram_model.addBox(0.0, 0.0, "A")
+        empty_diagram_model.startEdgeDrawing(a)
+        emitted = []
+        empty_diagram_model.itemsChanged.connect(lambda: emitted.append(True))
+
+        empty_diagram_model.updateEdgeDragPosition(300.0, 300.0)
+        empty_diagram_model.updateEdgeDragPosition(300.0, 300.0)
+        assert len(emitted) == 1
+        empty_diagram_model.updateEdgeDragPosition(310.0, 300.0)
+        assert len(emitted) == 2
+
+        empty_diagram_model.cancelEdgeDrawing()
+        assert len(emitted) == 3
+        empty_diagram_model.cancelEdgeDrawing()
+        assert len(emitted) == 3
+
     def test_cancel_edge_drawing(self, empty_diagram_model):
         a = empty_diagram_model.addBox(0.0, 0.0, "A")
         empty_diagram_model.startEdgeDrawing(a)
@@ -412,6 +628,21 @@ class TestEdges:
         assert empty_diagram_model.getEdgeDescription(edge_id) == "connects to"
         assert empty_diagram_model.edges[0]["description"] == "connects to"
 
+    def test_edges_list_refreshes_after_change(self, empty_diagram_model):
+        """Cached edges list is reused between reads and rebuilt on change."""
+        a = empty_diagram_model.addBox(0.0, 0.0, "A")
+        b = empty_diagram_model.addBox(100.0, 0.0, "B")
+        c = empty_diagram_model.addBox(200.0, 0.0, "C")
+        empty_diagram_model.addEdge(a, b)
+        first_read = empty_diagram_model.edges
+        assert empty_diagram_model.edges is first_read
+
+        empty_diagram_model.addEdge(b, c)
+        assert [edge["toId"] for edge in empty_diagram_model.edges] == [b, c]
+
+        empty_diagram_model.removeItem(c)
+        assert [edge["toId"] for edge in empty_diagram_model.edges] == [b]
+
     def test_edge_description_default_empty(self, empty_diagram_model):
         """Edge description defaults to empty string."""
         a = empty_diagram_model.addBox(0.0, 0.0, "A")
@@ -454,6 +685,81 @@ class TestEdges:
         assert target != ""
         assert len(empty_diagram_model.edges) == 0
 
+    def test_edge_endpoints_follow_edge_order_and_item_centres(self, empty_diagram_model):
+        a = empty_diagram_model.addBox(0.0, 0.0, "A")
+        b = empty_diagram_model.addBox(200.0, 100.0, "B")
+        empty_diagram_model.addEdge(b, a)
+        empty_diagram_model.addEdge(a, b)
+        item_a = empty_diagram_model.getItem(a)
+        item_b = empty_diagram_model.getItem(b)
+        centre_a = (item_a.x + item_a.width / 2, item_a.y + item_a.height / 2)
+        centre_b = (item_b.x + item_b.width / 2, item_b.y + item_b.height / 2)
+
+        assert empty_diagram_model.getEdgeEndpoints() == [*centre_b, *centre_a, *centre_a, *centre_b]
+
+        empty_diagram_model.moveItem(b, 400.0, 100.0)
+        assert empty_diagram_model.getEdgeEndpoints()[0] == 400.0 + item_b.width / 2
+
+    def test_get_edge_at_matches_linear_edge_scan(self, empty_diagram_model):
+        ids = [
+            empty_diagram_model.addBox(float(x), float(y), "")
+            for x, y in [(0, 0), (450, 30), (90, 620), (700, 700), (-300, 250), (1200, -80)]
+        ]
+        for from_index, to_index in [(0, 1), (1, 3), (2, 3), (0, 4), (4, 2), (3, 5), (5, 0)]:
+            empty_diagram_model.addEdge(ids[from_index], ids[to_index])
+
+        for x in range(-400, 1400, 37):
+            for y in range(-200, 900, 23):
+                assert empty_diagram_model.getEdgeAt(float(x), float(y)) == (
+                    _linear_edge_at(empty_diagram_model, float(x), float(y))
+                )
+
+    def test_drag_insert_hit_test_rebuckets_only_moved_edges(self, empty_diagram_model):
+        ids = [
+            empty_diagram_model.addBox(float(x), float(y), "")
+            for x, y in [(0, 0), (450, 30), (90, 620), (700, 700), (-300, 250)]
+        ]
+        for from_index, to_index in [(0, 1), (1, 3), (2, 3), (0, 4), (4, 2)]:
+            empty_diagram_model.addEdge(ids[from_index], ids[to_index])
+        empty_diagram_model.getEdgeAt(0.0, 0.0)
+        grid = empty_diagram_model._edge_hit_grid
+
+        empty_diagram_model.moveItem(ids[3], 300.0, 400.0)
+        empty_diagram_model.resizeItem(ids[0], 300.0, 200.0)
+
+        assert empty_diagram_model._edge_hit_grid is grid
+        for x in range(-400, 1000, 41):
+            for y in range(-200, 900, 29):
+                for excluded in ("", ids[3]):
+                    assert empty_diagram_model._find_edge_at_position(
+                        float(x), float(y), excluded_item_id=excluded, threshold=12.0
+                    ) == _linear_edge_at(empty_diagram_model, float(x), float(y), excluded, 12.0)
+
+    def test_move_and_resize_notify_once_inside_a_batch(self, empty_diagram_model):
+        item_id = empty_diagram_model.addBox(0.0, 0.0, "A")
+        emitted = []
+        empty_diagram_model.itemsChanged.connect(lambda: emitted.append("items"))
+        empty_diagram_model.geometryChanged.connect(lambda: emitted.append("geometry"))
+
+        empty_diagram_model.beginBatch()
+        empty_diagram_model.moveItem(item_id, 60.0, 60.0)
+        empty_diagram_model.resizeItem(item_id, 200.0, 100.0)
+        assert emitted == []
+        empty_diagram_model.endBatch()
+
+        assert sorted(emitted) == ["geometry", "items"]
+
+    def test_get_edge_at_follows_moved_items(self, empty_diagram_model):
+        a = empty_diagram_model.addBox(0.0, 0.0, "A")
+        b = empty_diagram_model.addBox(600.0, 0.0, "B")
+        empty_diagram_model.addEdge(a, b)
+        _, y, _, _ = empty_diagram_model.getEdgeEndpoints()
+        edge_id = empty_diagram_model.edges[0]["id"]
+        assert empty_diagram_model.getEdgeAt(300.0, y) == edge_id
+
+        empty_diagram_model.moveItem(b, 0.0, 600.0)
+        assert empty_diagram_model.getEdgeAt(300.0, y) == ""
+
 
 class TestFolderLinks:
     def test_set_folder_path_normalizes_windows_file_url(self, empty_diagram_model, monkeypatch):
@@ -518,6 +824,53 @@ class TestQueries:
         # Outside even with margin
         assert empty_diagram_model.getItemAtWithMargin(80.0, 130.0, 10.0) is None
 
+    def test_get_item_at_follows_topmost_and_mutations(self, empty_diagram_model):
+        """Hit-testing picks the topmost item and tracks moves, resizes and removals."""
+        bottom = empty_diagram_model.addBox(150.0, 150.0, "Bottom")
+        top = empty_diagram_model.addBox(190.0, 190.0, "Top")
+        assert empty_diagram_model.getItemAt(200.0, 200.0) == top
+        assert empty_diagram_model.getItemAt(-500.0, -500.0) is None
+
+        empty_diagram_model.moveItem(top, -600.0, -600.0)
+        assert empty_diagram_model.getItemAt(200.0, 200.0) == bottom
+        assert empty_diagram_model.getItemAt(-500.0, -590.0) == top
+
+        empty_diagram_model.resizeItem(bottom, 400.0, 400.0)
+        assert empty_diagram_model.getItemAt(520.0, 520.0) == bottom
+        late = empty_diagram_model.addBox(500.0, 500.0, "Late")
+        assert empty_diagram_model.getItemAt(520.0, 520.0) == late
+        assert empty_diagram_model.getItemAtWithMargin(395.0, 420.0, 110.0) == late
+
+        empty_diagram_model.removeItem(late)
+        assert empty_diagram_model.getItemAt(520.0, 520.0) == bottom
+
+    def test_get_item_at_with_margin_across_grid_cells(self, empty_diagram_model):
+        """Items spanning several grid cells are matched once, topmost first."""
+        wide = empty_diagram_model.addBox(150.0, 150.0, "Wide")
+        empty_diagram_model.resizeItem(wide, 500.0, 500.0)
+        small = empty_diagram_model.addBox(390.0, 390.0, "Small")
+        assert empty_diagram_model.getItemAtWithMargin(385.0, 385.0, 250.0) == small
+        assert empty_diagram_model.getItemAtWithMargin(660.0, 660.0, 15.0) == wide
+        assert empty_diagram_model.getItemAtWithMargin(700.0, 700.0, 15.0) is None
+
+    def test_hit_tests_tolerate_non_finite_coordinates(self, empty_diagram_model):
+        model = empty_diagram_model
+        model.from_dict({
+            "items": [
+                {"id": "box_0", "item_type": "box", "x": 0.0, "y": 0.0, "width": 100.0, "height": 60.0},
+                {"id": "box_1", "item_type": "box", "x": math.nan, "y": 0.0, "width": 100.0, "height": 60.0},
+                {"id": "box_2", "item_type": "box", "x": 300.0, "y": 0.0, "width": math.inf, "height": 60.0},
+            ],
+            "edges": [{"id": "edge_0", "from_id": "box_0", "to_id": "box_1"}],
+        })
+
+        assert model.getItemAt(50.0, 30.0) == "box_0"
+        assert model.getItemAt(math.nan, 30.0) is None
+        assert model.getItemAtWithMargin(50.0, math.inf, 20.0) is None
+        assert model.getItemAt(350.0, 30.0) is None
+        assert model.getEdgeAt(50.0, 30.0) == ""
+        assert model.getEdgeAt(math.inf, 30.0) == ""
+
     def test_resolve_connected_placement_uses_base_when_free(self, empty_diagram_model):
         source_id = empty_diagram_model.addBox(0.0, 0.0, "Source")
         placement = empty_diagram_model.resolveConnectedPlacement(source_id, "task", 300.0, 120.0, 60.0)
@@ -708,6 +1061,45 @@ class TestUnlimitedBoardSize:
         empty_diagram_model.addBox(0.0, 500.0, "Box3")
         assert empty_diagram_model.minItemY == 200.0
 
+    def test_bounds_follow_move_resize_and_remove(self, empty_diagram_model):
+        """Cached bounds track items moving away from, resizing and leaving the edges."""
+        left = empty_diagram_model.addBox(0.0, 0.0, "Left")
+        right = empty_diagram_model.addBox(400.0, 300.0, "Right")
+        assert empty_diagram_model.minItemX == 0.0
+        assert empty_diagram_model.maxItemX == 400.0 + 120.0
+
+        empty_diagram_model.moveItem(left, 200.0, 100.0)
+        assert empty_diagram_model.minItemX == 200.0
+        assert empty_diagram_model.minItemY == 100.0
+
+        empty_diagram_model.resizeItem(right, 50.0, 40.0)
+        assert empty_diagram_model.maxItemX == 450.0
+        assert empty_diagram_model.maxItemY == 340.0
+
+        empty_diagram_model.moveItem(left, 900.0, 900.0)
+        assert empty_diagram_model.maxItemX == 900.0 + 120.0
+        assert empty_diagram_model.maxItemY == 900.0 + 60.0
+
+        empty_diagram_model.removeItem(left)
+        assert empty_diagram_model.minItemX == 400.0
+        assert empty_diagram_model.maxItemX == 450.0
+        assert empty_diagram_model.maxItemY == 340.0
+
+    def test_bounds_with_tied_extremum(self, empty_diagram_model):
+        """Moving or removing one of two items sharing an edge keeps the other's bound."""
+        first = empty_diagram_model.addBox(0.0, 0.0, "First")
+        second = empty_diagram_model.addBox(0.0, 100.0, "Second")
+        assert empty_diagram_model.minItemX == 0.0
+
+        empty_diagram_model.moveItem(second, 50.0, 100.0)
+        assert not empty_diagram_model._bbox_dirty
+        assert empty_diagram_model.minItemX == 0.0
+
+        empty_diagram_model.moveItem(second, 0.0, 100.0)
+        empty_diagram_model.removeItem(first)
+        assert empty_diagram_model.minItemX == 0.0
+        assert empty_diagram_model.minItemY == 100.0
+
 
 class TestTaskIntegration:
     def test_create_task_from_text(self, diagram_model_with_task_model):
@@ -718,6 +1110,35 @@ class TestTaskIntegration:
         index = diagram_model_with_task_model.index(0, 0)
         assert diagram_model_with_task_model.data(index, diagram_model_with_task_model.TypeRole) == "task"
 
+    def test_create_task_from_text_ignores_unknown_item(self, diagram_model_with_task_model):
+        task_model = diagram_model_with_task_model._task_model
+        original_count = task_model.rowCount()
+        diagram_model_with_task_model.createTaskFromText("Orphan", "missing")
+        assert task_model.rowCount() == original_count
+
+    def test_create_task_from_text_ignores_blank_text(self, diagram_model_with_task_model):
+        model = diagram_model_with_task_model
+        box_id = model.addBox(0.0, 0.0, "Temp")
+        original_count = model._task_model.rowCount()
+        model.createTaskFromText("   ", box_id)
+        assert model._task_model.rowCount() == original_count
+        assert model.getItem(box_id).task_index == -1
+
+    def test_create_task_from_text_emits_only_task_roles(self, diagram_model_with_task_model):
+        model = diagram_model_with_task_model
+        model.addBox(0.0, 0.0, "Other")
+        box_id = model.addBox(200.0, 0.0, "Temp")
+        changed = []
+        items_changed = []
+        model.dataChanged.connect(
+            lambda top, bottom, roles: changed.append((top.row(), bottom.row(), sorted(roles)))
+        )
+        model.itemsChanged.connect(lambda: items_changed.append(True))
+
+        model.createTaskFromText("New Task", box_id)
+        assert changed == [(1, 1, sorted(model._TASK_DATA_ROLES))]
+        assert items_changed == []
+
     def test_add_task_from_text(self, diagram_model_with_task_model):
         original_task_count = diagram_model_with_task_model._task_model.rowCount()
         item_id = diagram_model_with_task_model.addTaskFromText("Freetext Task", 100.0, 200.0)
@@ -753,6 +1174,20 @@ class TestTaskIntegration:
         task_count_after = diagram_model_with_task_model._task_model.rowCount()
         assert task_count_after == task_count_before + 1
 
+    def test_add_task_from_text_connected_to_points_edge_at_target(self, diagram_model_with_task_model):
+        target = diagram_model_with_task_model.addBox(0.0, 0.0, "Target")
+        emitted = []
+        diagram_model_with_task_model.itemsChanged.connect(lambda: emitted.append("items"))
+        diagram_model_with_task_model.edgesChanged.connect(lambda: emitted.append("edges"))
+
+        source = diagram_model_with_task_model.addTaskFromTextConnectedTo(
+            target, 200.0, 0.0, "Upstream Task"
+        )
+
+        assert source != ""
+        assert sorted(emitted) == ["edges", "items"]
+        assert [(e["fromId"], e["toId"]) for e in diagram_model_with_task_model.edges] == [(source, target)]
+
     def test_insert_task_on_edge(self, diagram_model_with_task_model):
         """Inserting a task on an edge replaces it with two connected edges."""
         source = diagram_model_with_task_model.addBox(0.0, 0.0, "Source")
@@ -989,6 +1424,125 @@ class TestTaskIntegration:
         assert task_model.data(task_model.index(0, 0), task_model.CompletedRole) is True
         assert diagram_model_with_task_model.data(index, diagram_model_with_task_model.TaskCompletedRole) is True
 
+    def test_task_model_is_task_completed(self, diagram_model_with_task_model):
+        task_model = diagram_model_with_task_model._task_model
+        assert task_model.isTaskCompleted(0) is False
+        task_model.toggleComplete(0, True)
+        assert task_model.isTaskCompleted(0) is True
+        assert task_model.isTaskCompleted(-1) is False
+        assert task_model.isTaskCompleted(task_model.rowCount()) is False
+
+    def test_task_model_percentage_complete_text_rounds_half_up(self, app):
+        task_model = TaskModel()
+        assert task_model.percentageCompleteText == "0%"
+        for number in range(8):
+            task_model.addTask(f"Task {number}", -1)
+        task_model.toggleComplete(0, True)
+        assert task_model.percentageComplete == 12.5
+        assert task_model.percentageCompleteText == "13%"
+
+    def test_task_model_estimated_completion_text_falls_back_to_na(self, app):
+        task_model = TaskModel()
+        assert task_model.estimatedCompletionText == "N/A"
+        task_model.addTask("Task", -1)
+        task_model.setCustomEstimate(0, "30")
+        hours, minutes = task_model.estimatedCompletionText.split(":")
+        assert (len(hours), len(minutes)) == (2, 2)
+
+    def test_task_model_ignores_non_finite_custom_estimates(self, app):
+        task_model = TaskModel()
+        task_model.addTask("Task", -1)
+        task_model.setCustomEstimate(0, "45m")
+        for estimate in ("inf", "-inf", "nan", "infh"):
+            task_model.setCustomEstimate(0, estimate)
+            assert task_model._tasks[0].custom_estimate == 45.0
+
+    def test_task_model_saves_non_finite_estimates_as_unset(self, app):
+        task_model = TaskModel()
+        task_model.addTask("Loaded", -1)
+        task_model.addTask("Estimated", -1)
+        # Files written by the stdlib serializer may load an Infinity estimate.
+        task_model._tasks[0].custom_estimate = math.inf
+        task_model._tasks[1].custom_estimate = 30.0
+
+        saved = task_model.to_dict()["tasks"]
+        assert [task["custom_estimate"] for task in saved] == [None, 30.0]
+
+    def test_task_index_map_tracks_removals(self, diagram_model_with_task_model):
+        model = diagram_model_with_task_model
+        box = model.addBox(0.0, 0.0, "Box")
+        first = model.addTask(0, 100.0, 0.0)
+        model.addTask(1, 200.0, 0.0)
+        model.addBox(300.0, 0.0, "Other")
+        model.addTask(2, 400.0, 0.0)
+
+        model.removeItem(box)
+        model.removeItem(first)
+
+        expected = {}
+        for row, item in enumerate(model._items):
+            if item.task_index >= 0:
+                expected.setdefault(item.task_index, []).append(row)
+        assert model._task_index_to_rows == expected == {0: [0], 1: [2]}
+        assert [model.getItem(item.id) is item for item in model._items] == [True, True, True]
+
+        model.onTaskRenamed(1, "Renamed")
+        assert model._items[2].text == "Renamed"
+
+    def test_task_signals_only_touch_linked_items(self, diagram_model_with_task_model):
+        model = diagram_model_with_task_model
+        model.addBox(0.0, 0.0, "Box")
+        model.addTask(0, 100.0, 0.0)
+        model.addTask(1, 200.0, 0.0)
+        changed = []
+        model.dataChanged.connect(
+            lambda top, bottom, roles: changed.append((top.row(), bottom.row(), list(roles)))
+        )
+
+        model.onTaskCountdownChanged(2)
+        model.onTaskReminderChanged(2)
+        assert changed == []
+
+        model.onTaskContractChanged(1)
+        assert [(top, bottom) for top, bottom, _ in changed] == [(2, 2)]
+
+        changed.clear()
+        model.setCurrentTask(0)
+        model.focusTask(1)
+        assert changed == [
+            (1, 1, [model.TaskCurrentRole]),
+            (1, 1, [model.TaskCurrentRole]),
+            (2, 2, [model.TaskCurrentRole]),
+        ]
+
+    def test_current_task_change_spans_each_task_separately(self, diagram_model_with_task_model):
+        model = diagram_model_with_task_model
+        model.addTask(0, 0.0, 0.0)
+        model.addBox(100.0, 0.0, "Box")
+        model.addTask(1, 200.0, 0.0)
+        model.setCurrentTask(0)
+        changed = []
+        model.dataChanged.connect(
+            lambda top, bottom, roles: changed.append((top.row(), bottom.row()))
+        )
+
+        model.setCurrentTask(1)
+        assert changed == [(0, 0), (2, 2)]
+
+    def test_set_current_task_skips_no_op_calls(self, diagram_model_with_task_model):
+        model = diagram_model_with_task_model
+        model.addTask(0, 0.0, 0.0)
+        emitted = []
+        model.currentTaskChanged.connect(lambda: emitted.append(model.currentTaskIndex))
+
+        model.setCurrentTask(-1)
+        model.setCurrentTask(-5)
+        assert emitted == []
+
+        model.setCurrentTask(0)
+        model.setCurrentTask(-3)
+        assert emitted == [0, -1]
+
     def test_completion_advances_current_task_when_single_outgoing(self, diagram_model_with_task_model):
         source = diagram_model_with_task_model.addTask(0, 0.0, 0.0)
         target = diagram_model_with_task_model.addTask(1, 100.0, 0.0)
@@ -1099,42 +1653,865 @@ class TestBidirectionalRename:
         assert diagram_model_with_task_model.getItem(item_id1).text == "Shared Update"
         assert diagram_model_with_task_model.getItem(item_id2).text == "Shared Update"
 
+    def test_on_task_renamed_emits_single_span(self, diagram_model_with_task_model):
+        """Renaming a task shared by several items should emit one dataChanged."""
+        model = diagram_model_with_task_model
+        model.addTask(0, 100.0, 100.0)
+        model.addBox(150.0, 150.0, "Unrelated")
+        model.addTask(0, 200.0, 200.0)
+
+        spans = []
+        model.dataChanged.connect(lambda top, bottom, roles: spans.append((top.row(), bottom.row())))
+        model.onTaskRenamed(0, "Batched")
+
+        assert spans == [(0, 2)]
+
+        spans.clear()
+        model.onTaskRenamed(0, "Batched")
+        assert spans == []
+
+    def test_on_task_renamed_after_item_removed(self, diagram_model_with_task_model):
+        """Row lookup should stay correct after rows shift."""
+        model = diagram_model_with_task_model
+        box_id = model.addBox(50.0, 50.0, "First")
+        task_item = model.addTask(0, 100.0, 100.0)
+        model.removeItem(box_id)
+
+        model.onTaskRenamed(0, "Shifted")
+
+        assert model.getItem(task_item).text == "Shifted"
+
+
+class TestConnectAll:
+    def test_connect_all_orders_by_position(self, empty_diagram_model):
+        a = empty_diagram_model.addBox(100.0, 100.0, "A")
+        b = empty_diagram_model.addBox(0.0, 0.0, "B")
+        c = empty_diagram_model.addBox(50.0, 50.0, "C")
+        empty_diagram_model.connectAllItems()
+        assert len(empty_diagram_model.edges) == 2
+        assert empty_diagram_model.edges[0]["fromId"] == b
+        assert empty_diagram_model.edges[0]["toId"] == c
+        assert empty_diagram_model.edges[1]["fromId"] == c
+        assert empty_diagram_model.edges[1]["toId"] == a
+
+    def test_connect_all_handles_existing_edges(self, empty_diagram_model):
+        a = empty_diagram_model.addBox(0.0, 0.0, "A")
+        b = empty_diagram_model.addBox(50.0, 0.0, "B")
+        c = empty_diagram_model.addBox(100.0, 0.0, "C")
+        empty_diagram_model.addEdge(a, b)
+        empty_diagram_model.connectAllItems()
+        assert len(empty_diagram_model.edges) == 2
+
+    def test_connect_all_emits_edges_changed_once(self, empty_diagram_model):
+        for offset in range(5):
+            empty_diagram_model.addBox(offset * 50.0, 0.0, f"Box {offset}")
+        emitted = []
+        empty_diagram_model.edgesChanged.connect(lambda: emitted.append(len(empty_diagram_model.edges)))
+        empty_diagram_model.connectAllItems()
+        assert emitted == [4]
+        empty_diagram_model.connectAllItems()
+        assert emitted == [4]
+
+    def test_add_edges_skips_invalid_pairs(self, empty_diagram_model):
+        a = empty_diagram_model.addBox(0.0, 0.0, "A")
+        b = empty_diagram_model.addBox(50.0, 0.0, "B")
+        c = empty_diagram_model.addBox(100.0, 0.0, "C")
+        empty_diagram_model.addEdge(a, b)
+        emitted = []
+        empty_diagram_model.edgesChanged.connect(lambda: emitted.append(True))
+
+        empty_diagram_model.addEdges([(a, b), (a, a), (b, "missing"), (b, c), (c, a)])
+        assert [(e["fromId"], e["toId"]) for e in empty_diagram_model.edges] == [(a, b), (b, c), (c, a)]
+        assert emitted == [True]
+
+        empty_diagram_model.addEdges([(a, b)])
+        assert emitted == [True]
+
+    def test_begin_end_batch_coalesces_removals(self, empty_diagram_model):
+        ids = [empty_diagram_model.addBox(offset * 50.0, 0.0, f"Box {offset}") for offset in range(4)]
+        empty_diagram_model.connectAllItems()
+        emitted = []
+        empty_diagram_model.itemsChanged.connect(lambda: emitted.append("items"))
+        empty_diagram_model.edgesChanged.connect(lambda: emitted.append("edges"))
+
+        empty_diagram_model.beginBatch()
+        empty_diagram_model.beginBatch()
+        for item_id in ids:
+            empty_diagram_model.removeItem(item_id)
+        empty_diagram_model.endBatch()
+        assert emitted == []
+        assert empty_diagram_model.edges == []
+        empty_diagram_model.endBatch()
+
+        assert sorted(emitted) == ["edges", "items"]
+        assert empty_diagram_model.count == 0
+        empty_diagram_model.endBatch()
+        assert sorted(emitted) == ["edges", "items"]
+
+    def test_add_preset_and_connect_emits_each_signal_once(self, empty_diagram_model):
+        source = empty_diagram_model.addBox(0.0, 0.0, "Source")
+        emitted = []
+        empty_diagram_model.itemsChanged.connect(lambda: emitted.append("items"))
+        empty_diagram_model.edgesChanged.connect(lambda: emitted.append("edges"))
+
+        new_id = empty_diagram_model.addPresetItemAndConnect(source, "note", 100.0, 0.0, "Note")
+
+        assert new_id
+        assert sorted(emitted) == ["edges", "items"]
+        assert [(e["fromId"], e["toId"]) for e in empty_diagram_model.edges] == [(source, new_id)]
+
+    def test_connect_all_ignores_small_sets(self, empty_diagram_model):
+        empty_diagram_model.connectAllItems()
+        assert empty_diagram_model.edges == []
+        empty_diagram_model.addBox(0.0, 0.0, "A")
+        empty_diagram_model.connectAllItems()
+        assert empty_diagram_model.edges == []
+
+
+class TestCreateActionDrawWindow:
+    def test_create_window(self, app, diagram_model_with_task_model):
+        engine = create_actiondraw_window(diagram_model_with_task_model, diagram_model_with_task_model._task_model)
+        assert isinstance(engine, QQmlApplicationEngine)
+        assert engine.rootObjects()
+        assert getattr(engine, "_markdown_pdf_exporter", None) is not None
+        assert getattr(engine, "_mcp_server_controller", None) is not None
+
+    def test_rarely_used_dialogs_load_on_first_open(self, app, diagram_model_with_task_model):
+        engine = create_actiondraw_window(diagram_model_with_task_model, diagram_model_with_task_model._task_model)
+        window = engine.rootObjects()[0]
+        loaders = [
+            child for child in window.findChildren(QQuickItem)
+            if child.metaObject().className().startswith("LazyDialogLoader")
+        ]
+        assert len(loaders) == 2
+        assert [loader.property("active") for loader in loaders] == [False, False]
+
+        loader = loaders[0]
+        loader.metaObject().invokeMethod(loader, "open")
+        for _ in range(100):
+            if loader.property("dialogVisible"):
+                break
+            QTest.qWait(20)
+        assert loader.property("dialogVisible") is True
+        assert loader.property("active") is True
+        assert loaders[1].property("active") is False
+
+        loader.metaObject().invokeMethod(loader, "close")
+        QTest.qWait(400)
+        assert loader.property("dialogVisible") is False
+
+    def test_dialog_drop_targets_snap_through_precalc(self, app, diagram_model_with_task_model):
+        engine = create_actiondraw_window(diagram_model_with_task_model, diagram_model_with_task_model._task_model)
+
+        result, failed = _evaluate_in_action_dialogs(
+            engine.rootObjects()[0],
+            "(function() { root.snapToGrid = true; quickTaskDialog.targetX = 33; quickTaskDialog.targetY = 47;"
+            " var first = precalc.quickTaskTarget.x + ',' + precalc.quickTaskTarget.y;"
+            " root.snapToGrid = false;"
+            " return first + ';' + precalc.quickTaskTarget.x + ',' + precalc.quickTaskTarget.y })()",
+        )
+
+        assert not failed
+        assert result == "60,60;33,47"
+
+    def test_task_list_clips_only_when_it_overflows(self, app, diagram_model_with_task_model):
+        task_model = diagram_model_with_task_model._task_model
+        engine = create_actiondraw_window(diagram_model_with_task_model, task_model)
+        window = engine.rootObjects()[0]
+        _evaluate_in_action_dialogs(window, "taskDialog.open()")
+        QTest.qWait(50)
+
+        assert _evaluate_in_action_dialogs(window, "taskListView.clip") == (False, False)
+
+        for number in range(30):
+            task_model.addTask(f"Task {number}", -1)
+        QTest.qWait(50)
+
+        assert _evaluate_in_action_dialogs(window, "taskListView.clip") == (True, False)
+
+    def test_task_list_rows_use_fixed_height_unless_wrapped(self, app, diagram_model_with_task_model):
+        task_model = diagram_model_with_task_model._task_model
+        task_model.addTask("Short", -1)
+        task_model.addTask(" ".join(["wrapping"] * 40), -1)
+        engine = create_actiondraw_window(diagram_model_with_task_model, task_model)
+        window = engine.rootObjects()[0]
+        _evaluate_in_action_dialogs(window, "taskDialog.open()")
+        QTest.qWait(50)
+
+        heights, failed = _evaluate_in_action_dialogs(
+            window,
+            "(function() { var rows = [];"
+            " for (var i = 0; i < taskListView.count; ++i) rows.push(taskListView.itemAtIndex(i).height);"
+            " return rows.join(','); })()",
+        )
+
+        assert not failed
+        rows = [float(value) for value in heights.split(",")]
+        assert rows[-2] == 40
+        assert rows[-1] > 40
+
+        fits, failed = _evaluate_in_action_dialogs(
+            window,
+            "(function() { var count = taskListView.count;"
+            " return [taskListView.itemAtIndex(count - 2).fitsOneLine,"
+            " taskListView.itemAtIndex(count - 1).fitsOneLine].join(','); })()",
+        )
+        assert (fits, failed) == ("true,false", False)
+
+    def test_edge_hover_updates_only_the_highlight_overlay(self, app, diagram_model_with_task_model):
+        source = diagram_model_with_task_model.addBox(0.0, 0.0, "A")
+        target = diagram_model_with_task_model.addBox(300.0, 0.0, "B")
+        diagram_model_with_task_model.addEdge(source, target)
+        engine = create_actiondraw_window(diagram_model_with_task_model, diagram_model_with_task_model._task_model)
+        window = engine.rootObjects()[0]
+        window.show()
+        QTest.qWait(100)
+
+        edge_canvas = _diagram_layer_child(window, "edgeCanvas")
+        paints = []
+        edge_canvas.painted.connect(lambda: paints.append(True))
+        assert _evaluate_in_action_dialogs(window, "hoverEdgeHighlight.visible")[0] is False
+
+        _evaluate_in_action_dialogs(window, "edgeCanvas.hoveredEdgeId = diagramModel.edges[0].id")
+        QTest.qWait(100)
+
+        assert paints == []
+        segment, failed = _evaluate_in_action_dialogs(window, "hoverEdgeHighlight.segment.join(',')")
+        assert not failed
+        assert [float(v) for v in segment.split(",")] == diagram_model_with_task_model.getEdgeEndpoints()
+        assert _evaluate_in_action_dialogs(window, "hoverEdgeHighlight.visible")[0] is True
+        assert _evaluate_in_action_dialogs(window, "selectedEdgeHighlight.visible")[0] is False
+
+    def test_edge_highlight_follows_moved_items(self, app, diagram_model_with_task_model):
+        model = diagram_model_with_task_model
+        source = model.addBox(0.0, 0.0, "A")
+        target = model.addBox(300.0, 0.0, "B")
+        model.addEdge(source, target)
+        engine = create_actiondraw_window(model, model._task_model)
+        window = engine.rootObjects()[0]
+        _evaluate_in_action_dialogs(window, "edgeCanvas.selectedEdgeId = diagramModel.edges[0].id")
+
+        model.moveItem(target, 300.0, 200.0)
+        QTest.qWait(20)
+
+        segment = _evaluate_in_action_dialogs(window, "selectedEdgeHighlight.segment.join(',')")[0]
+        assert [float(v) for v in segment.split(",")] == model.getEdgeEndpoints()
+
+        model.removeItem(target)
+        QTest.qWait(20)
+        assert _evaluate_in_action_dialogs(window, "selectedEdgeHighlight.visible")[0] is False
+
+    def test_edge_arrow_heads_match_angle_based_geometry(self, app, diagram_model_with_task_model):
+        engine = create_actiondraw_window(diagram_model_with_task_model, diagram_model_with_task_model._task_model)
+        window = engine.rootObjects()[0]
+
+        for from_x, from_y, to_x, to_y in [(0, 0, 100, 0), (10, 20, -30, 75), (5, 5, 5, -40)]:
+            value, failed = _evaluate_in_action_dialogs(
+                window,
+                "(function() {"
+                "  var points = [];"
+                "  var ctx = { moveTo: function() {}, closePath: function() {},"
+                "              lineTo: function(x, y) { points.push(x, y) } };"
+                f"  edgeCanvas.traceArrowHead(ctx, [{from_x}, {from_y}, {to_x}, {to_y}], 0);"
+                "  return points.join(',');"
+                "})()",
+            )
+            assert not failed
+            # The two lineTo calls are the arrow corners.
+            corners = [float(v) for v in value.split(",")]
+            angle = math.atan2(to_y - from_y, to_x - from_x)
+            expected = [
+                to_x - 10 * math.cos(angle - math.pi / 6),
+                to_y - 10 * math.sin(angle - math.pi / 6),
+                to_x - 10 * math.cos(angle + math.pi / 6),
+                to_y - 10 * math.sin(angle + math.pi / 6),
+            ]
+            assert corners == pytest.approx(expected)
+
+    def test_edge_canvas_strokes_and_fills_all_edges_at_once(self, app, diagram_model_with_task_model):
+        hub = diagram_model_with_task_model.addBox(0.0, 0.0, "Hub")
+        for index in range(3):
+            target = diagram_model_with_task_model.addBox(300.0, index * 150.0, f"T{index}")
+            diagram_model_with_task_model.addEdge(hub, target)
+        diagram_model_with_task_model.setEdgeDescription(diagram_model_with_task_model.edges[0]["id"], "first")
+        engine = create_actiondraw_window(diagram_model_with_task_model, diagram_model_with_task_model._task_model)
+        window = engine.rootObjects()[0]
+
+        value, failed = _evaluate_in_action_dialogs(
+            window,
+            "(function() {"
+            "  var calls = { beginPath: 0, moveTo: 0, stroke: 0, fill: 0, fillText: 0 };"
+            "  function count(name) { return function() { calls[name] += 1 } }"
+            "  var ctx = { beginPath: count('beginPath'), moveTo: count('moveTo'), stroke: count('stroke'),"
+            "              fill: count('fill'), fillText: count('fillText'),"
+            "              lineTo: function() {}, closePath: function() {} };"
+            "  edgeCanvas.paintEdges(ctx);"
+            "  return [calls.beginPath, calls.moveTo, calls.stroke, calls.fill, calls.fillText].join(',');"
+            "})()",
+        )
+
+        assert not failed
+        assert value == "2,6,1,1,1"
+
+    def test_edge_canvas_culls_edges_outside_the_view(self, app, diagram_model_with_task_model):
+        near_a = diagram_model_with_task_model.addBox(0.0, 0.0, "A")
+        near_b = diagram_model_with_task_model.addBox(300.0, 0.0, "B")
+        far_a = diagram_model_with_task_model.addBox(20000.0, 20000.0, "C")
+        far_b = diagram_model_with_task_model.addBox(20300.0, 20000.0, "D")
+        diagram_model_with_task_model.addEdge(near_a, near_b)
+        diagram_model_with_task_model.addEdge(far_a, far_b)
+        engine = create_actiondraw_window(diagram_model_with_task_model, diagram_model_with_task_model._task_model)
+        window = engine.rootObjects()[0]
+        count_lines = (
+            "(function() {"
+            "  var lines = 0;"
+            "  var ctx = { beginPath: function() {}, moveTo: function() {}, stroke: function() {},"
+            "              fill: function() {}, fillText: function() {}, closePath: function() {},"
+            "              lineTo: function() { lines += 1 } };"
+            "  edgeCanvas.paintEdges(ctx);"
+            "  return lines / 3;"
+            "})()"
+        )
+
+        _evaluate_in_action_dialogs(window, "root.centerOnPoint(150, 30)")
+        assert _evaluate_in_action_dialogs(window, count_lines) == (1, False)
+        assert _evaluate_in_action_dialogs(window, "root.viewEscapes(edgeCanvas.paintedRect)") == (False, False)
+
+        _evaluate_in_action_dialogs(window, "root.centerOnPoint(20150, 20030)")
+        assert _evaluate_in_action_dialogs(window, "root.viewEscapes(edgeCanvas.paintedRect)") == (True, False)
+        assert _evaluate_in_action_dialogs(window, count_lines) == (1, False)
+
+    def test_wheel_zoom_steps_apply_once_per_event_loop_pass(self, app, diagram_model_with_task_model):
+        engine = create_actiondraw_window(diagram_model_with_task_model, diagram_model_with_task_model._task_model)
+        window = engine.rootObjects()[0]
+        QTest.qWait(20)  # let the deferred default view settle first
+        _evaluate_in_action_dialogs(window, "root.setZoomDirect(1.0)")
+
+        for _ in range(3):
+            _evaluate_in_action_dialogs(window, "wheelZoomArea.queueZoomSteps(1, 100, 100)")
+        assert window.property("zoomLevel") == pytest.approx(1.0)
+
+        QTest.qWait(20)
+        assert window.property("zoomLevel") == pytest.approx(1.1 ** 3)
+
+    def test_pinch_zoom_ignores_sub_percent_scale_changes(self, app, diagram_model_with_task_model):
+        engine = create_actiondraw_window(diagram_model_with_task_model, diagram_model_with_task_model._task_model)
+        window = engine.rootObjects()[0]
+        _evaluate_in_action_dialogs(window, "root.setZoomDirect(1.0)")
+        _evaluate_in_action_dialogs(window, "viewportPinch.lastScale = 1.0")
+
+        _evaluate_in_action_dialogs(window, "viewportPinch.applyScale(1.005, 100, 100)")
+        assert window.property("zoomLevel") == pytest.approx(1.0)
+
+        _evaluate_in_action_dialogs(window, "viewportPinch.applyScale(1.02, 100, 100)")
+        assert window.property("zoomLevel") == pytest.approx(1.02)
+        assert _evaluate_in_action_dialogs(window, "viewportPinch.lastScale")[0] == pytest.approx(1.02)
+
+    def test_grid_lines_follow_spacing_and_visibility(self, app, diagram_model_with_task_model):
+        engine = create_actiondraw_window(diagram_model_with_task_model, diagram_model_with_task_model._task_model)
+        window = engine.rootObjects()[0]
+        grid_layer = _diagram_layer_child(window, "gridLayer")
+
+        def line_count():
+            path = grid_layer.property("linePath")
+            return path.count("V") + path.count("H")
+
+        spacing = window.property("gridSpacing")
+        expected = int(grid_layer.width() // spacing) + int(grid_layer.height() // spacing) + 2
+        assert line_count() == expected
+
+        window.setProperty("gridSpacing", spacing * 2)
+        assert line_count() == int(grid_layer.width() // (spacing * 2)) + int(grid_layer.height() // (spacing * 2)) + 2
+
+        window.setProperty("showGrid", False)
+        assert not grid_layer.isVisible()
+        assert line_count() == 0
+
+    def test_grid_draws_in_a_single_shape(self, app, diagram_model_with_task_model):
+        engine = create_actiondraw_window(diagram_model_with_task_model, diagram_model_with_task_model._task_model)
+        window = engine.rootObjects()[0]
+        grid_layer = _diagram_layer_child(window, "gridLayer")
+
+        # No per-line delegate items: one Shape holds every grid line.
+        assert grid_layer.metaObject().className().startswith("QQuickShape")
+        assert grid_layer.childItems() == []
+        path = grid_layer.property("linePath")
+        assert path.startswith("M0.5 0V")
+
+    def test_board_bounds_update_once_per_burst_of_geometry_changes(self, app, diagram_model_with_task_model):
+        model = diagram_model_with_task_model
+        item_id = model.addBox(0.0, 0.0, "A")
+        engine = create_actiondraw_window(model, model._task_model)
+        window = engine.rootObjects()[0]
+        QTest.qWait(20)
+        updates = []
+        window.currentMaxItemXChanged.connect(lambda: updates.append(window.property("currentMaxItemX")))
+
+        for x in (2000.0, 2500.0, 3000.0):
+            model.moveItem(item_id, x, 0.0)
+        assert updates == []
+
+        QTest.qWait(20)
+        assert updates == [model.maxItemX]
+
+    def test_board_fill_and_grid_lines_are_opaque(self, app, diagram_model_with_task_model):
+        engine = create_actiondraw_window(diagram_model_with_task_model, diagram_model_with_task_model._task_model)
+        window = engine.rootObjects()[0]
+
+        value, failed = _evaluate_in_action_dialogs(
+            window,
+            "[boardFill.color.a, boardFill.radius, boardFill.color === boardFrame.color, gridLayer.lineColor.a].join(',')",
+        )
+        assert not failed
+        assert value == "1,0,true,1"
+
+        # The opaque line colour matches 5% white blended over the board fill.
+        board = _evaluate_in_action_dialogs(window, "[boardFill.color.r, boardFill.color.g, boardFill.color.b].join(',')")[0]
+        line = _evaluate_in_action_dialogs(window, "[gridLayer.lineColor.r, gridLayer.lineColor.g, gridLayer.lineColor.b].join(',')")[0]
+        blended = [0.95 * float(channel) + 0.05 for channel in board.split(",")]
+        assert [float(channel) for channel in line.split(",")] == pytest.approx(blended, abs=1 / 255)
+
+    def test_drawing_canvas_paints_stroke_tail_incrementally(self, app, diagram_model_with_task_model):
+        model = diagram_model_with_task_model
+        engine = create_actiondraw_window(model, model._task_model)
+        window = engine.rootObjects()[0]
+        window.show()
+        QTest.qWait(100)
+        canvas = _diagram_layer_child(window, "drawingCanvas")
+
+        def red_at_stroke():
+            return _qml_value(canvas, "getContext('2d').getImageData(150, 100, 1, 1).data[0]")
+
+        model.setBrushColor("#ff0000")
+        model.setBrushWidth(6.0)
+        _qml_value(canvas, "drawingMouseArea.isDrawing = true")
+        model.startStroke(100.0, 100.0)
+        for step in range(1, 6):
+            model.continueStroke(100.0 + 20.0 * step, 100.0)
+            QTest.qWait(30)
+        QTest.qWait(50)
+        assert _qml_value(canvas, "paintedCurrentCoords") == 12
+        assert red_at_stroke() == 255
+
+        _qml_value(canvas, "drawingMouseArea.isDrawing = false")
+        model.endStroke()
+        QTest.qWait(50)
+        assert _qml_value(canvas, "paintedCurrentCoords") == 0
+        assert red_at_stroke() == 255
+
+        model.undoLastStroke()
+        QTest.qWait(50)
+        assert red_at_stroke() == 0
+
+    def test_drawing_skips_sub_pixel_pointer_moves(self, app, diagram_model_with_task_model):
+        model = diagram_model_with_task_model
+        engine = create_actiondraw_window(model, model._task_model)
+        window = engine.rootObjects()[0]
+        model.startStroke(100.0, 100.0)
+        _evaluate_in_action_dialogs(window, "drawingMouseArea.lastStrokeX = 100; drawingMouseArea.lastStrokeY = 100")
+
+        for x, y in [(100.5, 100.5), (100.9, 100.0), (101.0, 100.2), (101.5, 101.0), (102.0, 101.0)]:
+            _evaluate_in_action_dialogs(window, f"drawingMouseArea.extendStroke({x}, {y})")
+
+        assert model.getCurrentStroke()["points"] == [100.0, 100.0, 101.0, 100.2, 102.0, 101.0]
+
+    def test_finishing_a_stroke_keeps_the_painted_strokes(self, app, diagram_model_with_task_model):
+        model = diagram_model_with_task_model
+        model.setBrushColor("#ff0000")
+        engine = create_actiondraw_window(model, model._task_model)
+        window = engine.rootObjects()[0]
+        window.show()
+        QTest.qWait(100)
+        canvas = _diagram_layer_child(window, "drawingCanvas")
+
+        def green_at_marker():
+            # A full repaint clears the canvas, wiping this marker.
+            return _qml_value(canvas, "getContext('2d').getImageData(601, 601, 1, 1).data[1]")
+
+        _qml_value(canvas, "var ctx = getContext('2d'); ctx.fillStyle = '#00ff00'; ctx.fillRect(600, 600, 4, 4); requestPaint()")
+        QTest.qWait(50)
+        assert green_at_marker() == 255
+
+        _qml_value(canvas, "drawingMouseArea.isDrawing = true")
+        model.startStroke(100.0, 100.0)
+        model.continueStroke(150.0, 100.0)
+        QTest.qWait(50)
+        model.continueStroke(200.0, 100.0)
+        _qml_value(canvas, "finishStroke(); drawingMouseArea.isDrawing = false")
+        QTest.qWait(50)
+
+        assert len(model.strokes) == 1
+        assert _qml_value(canvas, "getContext('2d').getImageData(190, 100, 1, 1).data[0]") == 255
+        assert green_at_marker() == 255
+
+        _qml_value(canvas, "drawingMouseArea.isDrawing = true")
+        model.startStroke(400.0, 100.0)
+        QTest.qWait(50)
+        _qml_value(canvas, "finishStroke(); drawingMouseArea.isDrawing = false")
+        QTest.qWait(50)
+
+        # endStroke drops the single-point stroke, so its dot is repainted away.
+        assert len(model.strokes) == 1
+        assert _qml_value(canvas, "getContext('2d').getImageData(400, 100, 1, 1).data[0]") == 0
+        assert green_at_marker() == 0
+        assert _qml_value(canvas, "getContext('2d').getImageData(190, 100, 1, 1).data[0]") == 255
+
+    def test_edge_hit_testing_refetches_endpoints_after_items_move(self, app, diagram_model_with_task_model):
+        model = diagram_model_with_task_model
+        source = model.addBox(0.0, 0.0, "A")
+        target = model.addBox(300.0, 0.0, "B")
+        model.addEdge(source, target)
+        engine = create_actiondraw_window(model, model._task_model)
+        window = engine.rootObjects()[0]
+        edge_id = model.edges[0]["id"]
+        y = model.getEdgeEndpoints()[1]
+
+        assert _evaluate_in_action_dialogs(window, f"edgeCanvas.findEdgeAt(200, {y})") == (edge_id, False)
+
+        model.moveItem(target, 0.0, 400.0)
+        assert _evaluate_in_action_dialogs(window, f"edgeCanvas.findEdgeAt(200, {y})") == ("", False)
+
+    def test_edge_hover_skips_hit_tests_for_sub_two_pixel_moves(self, app, diagram_model_with_task_model):
+        model = diagram_model_with_task_model
+        source = model.addBox(0.0, 0.0, "A")
+        target = model.addBox(300.0, 0.0, "B")
+        model.addEdge(source, target)
+        engine = create_actiondraw_window(model, model._task_model)
+        window = engine.rootObjects()[0]
+        edge_id = model.edges[0]["id"]
+        y = model.getEdgeEndpoints()[1]
+
+        _evaluate_in_action_dialogs(window, f"edgeCanvas.hoverAt(200, {y})")
+        assert _evaluate_in_action_dialogs(window, "edgeCanvas.hoveredEdgeId") == (edge_id, False)
+
+        model.moveItem(target, 0.0, 400.0)
+        _evaluate_in_action_dialogs(window, f"edgeCanvas.hoverAt(201, {y})")
+        assert _evaluate_in_action_dialogs(window, "edgeCanvas.hoveredEdgeId") == (edge_id, False)
+
+        _evaluate_in_action_dialogs(window, f"edgeCanvas.hoverAt(204, {y})")
+        assert _evaluate_in_action_dialogs(window, "edgeCanvas.hoveredEdgeId") == ("", False)
+
+    def test_diagram_context_menus_load_on_first_popup(self, app, diagram_model_with_task_model):
+        engine = create_actiondraw_window(diagram_model_with_task_model, diagram_model_with_task_model._task_model)
+        window = engine.rootObjects()[0]
+        loaders = [_diagram_layer_child(window, name) for name in ("canvasContextMenuLoader", "itemContextMenuLoader")]
+        assert [loader.property("item") for loader in loaders] == [None, None]
+
+        canvas_loader = loaders[0]
+        _evaluate_in(canvas_loader, "canvasContextMenuLoader.popup()")
+
+        menu = canvas_loader.property("item")
+        assert menu is not None
+        assert menu.property("visible") is True
+        assert loaders[1].property("item") is None
+
+    def test_item_decorations_load_only_for_their_item_type(self, app, diagram_model_with_task_model):
+        diagram_model_with_task_model.addBox(0.0, 0.0, "Plain")
+        diagram_model_with_task_model.addPresetItem("database", 200.0, 0.0)
+        diagram_model_with_task_model.addPresetItem("freetext", 400.0, 0.0)
+        engine = create_actiondraw_window(diagram_model_with_task_model, diagram_model_with_task_model._task_model)
+        window = engine.rootObjects()[0]
+
+        def decoration_loaders(item):
+            for child in item.childItems():
+                if child.metaObject().className() == "QQuickLoader" and child.parentItem().property("itemType"):
+                    yield child
+                yield from decoration_loaders(child)
+
+        diagram_layer, _ = _evaluate_in_action_dialogs(window, "diagramLayer")
+        loaded = {}
+        for loader in decoration_loaders(diagram_layer):
+            item_type = loader.parentItem().property("itemType")
+            loaded.setdefault(item_type, []).append(loader.property("item") is not None)
+
+        assert loaded["box"] == [False] * 8
+        assert sorted(loaded["database"]) == [False] * 7 + [True]
+        assert sorted(loaded["freetext"]) == [False] * 7 + [True]
+
+    def test_shape_decorations_render_without_a_layer(self, app, diagram_model_with_task_model):
+        item_id = diagram_model_with_task_model.addPresetItem("cloud", 0.0, 0.0)
+        engine = create_actiondraw_window(diagram_model_with_task_model, diagram_model_with_task_model._task_model)
+        window = engine.rootObjects()[0]
+
+        item_rect = _item_rect(window, item_id)
+        loader = next(
+            child
+            for child in item_rect.childItems()
+            if child.metaObject().className() == "QQuickLoader" and child.property("item") is not None
+        )
+
+        # A few batched rectangles are cheaper than one offscreen texture per item.
+        assert _qml_value(loader, "item.layer.enabled") is False
+
+    def test_idle_overlays_are_hidden_instead_of_transparent(self, app, diagram_model_with_task_model):
+        item_id = diagram_model_with_task_model.addTask(0, 0.0, 0.0)
+        engine = create_actiondraw_window(diagram_model_with_task_model, diagram_model_with_task_model._task_model)
+        window = engine.rootObjects()[0]
+
+        item_rect = _item_rect(window, item_id)
+
+        assert _qml_value(item_rect, "dragShade.visible") is False
+        assert _qml_value(item_rect, "dragShade.color.a > 0") is True
+        assert _qml_value(item_rect, "taskCheck.children[0].visible") is False
+
+        diagram_model_with_task_model.setTaskCompleted(0, True)
+        assert _qml_value(item_rect, "taskCheck.children[0].visible") is True
+
+    def test_task_check_and_star_use_shared_glyph_images(self, app, diagram_model_with_task_model):
+        item_id = diagram_model_with_task_model.addTask(0, 0.0, 0.0)
+        diagram_model_with_task_model.setTaskCompleted(0, True)
+        engine = create_actiondraw_window(diagram_model_with_task_model, diagram_model_with_task_model._task_model)
+        window = engine.rootObjects()[0]
+
+        item_rect = _item_rect(window, item_id)
+
+        assert _qml_value(item_rect, "taskCheck.children[0].status === Image.Ready") is True
+        assert _qml_value(item_rect, "currentButton.children[0].status === Image.Ready") is True
+        assert _qml_value(item_rect, "currentButton.children[0].source.toString()").endswith("icons/star_muted.svg")
+
+        diagram_model_with_task_model.setCurrentTask(0)
+        assert _qml_value(item_rect, "currentButton.children[0].source.toString()").endswith("icons/star_dark.svg")
+        assert _qml_value(item_rect, "currentButton.children[0].status === Image.Ready") is True
+
+    def test_resize_burst_repaints_edges_once(self, app, diagram_model_with_task_model):
+        source = diagram_model_with_task_model.addBox(0.0, 0.0, "Source")
+        target = diagram_model_with_task_model.addBox(300.0, 0.0, "Target")
+        diagram_model_with_task_model.addEdge(source, target)
+        engine = create_actiondraw_window(diagram_model_with_task_model, diagram_model_with_task_model._task_model)
+        window = engine.rootObjects()[0]
+        QTest.qWait(50)
+
+        edge_canvas, _ = _evaluate_in_action_dialogs(window, "edgeCanvas")
+        paints = []
+        edge_canvas.painted.connect(lambda: paints.append(True))
+
+        for step in range(5):
+            diagram_model_with_task_model.resizeItem(source, 140.0 + step * 10, 80.0)
+        QTest.qWait(50)
+
+        assert len(paints) == 1
+
+    def test_item_border_uses_cached_colour_shades(self, app, diagram_model_with_task_model):
+        item_id = diagram_model_with_task_model.addBox(0.0, 0.0, "Plain")
+        engine = create_actiondraw_window(diagram_model_with_task_model, diagram_model_with_task_model._task_model)
+        window = engine.rootObjects()[0]
+
+        item_rect = _item_rect(window, item_id)
+
+        box_color = ITEM_PRESETS["box"]["color"]
+        assert _qml_value(item_rect, f"Qt.colorEqual(itemRect.border.color, Qt.darker('{box_color}', 1.6))") is True
+        assert _qml_value(item_rect, "Qt.colorEqual(itemRect.restingBorderColor, itemRect.border.color)") is True
+
+        diagram_model_with_task_model.convertItemType(item_id, "database")
+        database_color = ITEM_PRESETS["database"]["color"]
+        assert _qml_value(item_rect, f"Qt.colorEqual(itemRect.border.color, Qt.darker('{database_color}', 1.6))") is True
+
+    def test_item_type_flags_drive_center_label(self, app, diagram_model_with_task_model):
+        item_ids = {
+            preset: diagram_model_with_task_model.addPresetItem(preset, index * 200.0, 0.0)
+            for index, preset in enumerate(("box", "database", "wish", "freetext"))
+        }
+        engine = create_actiondraw_window(diagram_model_with_task_model, diagram_model_with_task_model._task_model)
+        window = engine.rootObjects()[0]
+
+        diagram_layer, _ = _evaluate_in_action_dialogs(window, "diagramLayer")
+        item_rects = {
+            child.property("itemId"): child
+            for child in _descendants(diagram_layer)
+            if child.property("itemType") and child.property("itemId")
+        }
+
+        flags = {
+            preset: (
+                item_rects[item_id].property("isDatabase"),
+                item_rects[item_id].property("isWish"),
+                item_rects[item_id].property("showCenterLabel"),
+            )
+            for preset, item_id in item_ids.items()
+        }
+        assert flags == {
+            "box": (False, False, True),
+            "database": (True, False, True),
+            "wish": (False, True, False),
+            "freetext": (False, False, False),
+        }
+
+        diagram_model_with_task_model.convertItemType(item_ids["wish"], "box")
+        assert item_rects[item_ids["wish"]].property("showCenterLabel") is True
+
+    def test_item_emphasis_animates_between_states(self, app, diagram_model_with_task_model):
+        item_id = diagram_model_with_task_model.addTask(0, 0.0, 0.0)
+        source_id = diagram_model_with_task_model.addBox(400.0, 0.0, "Source")
+        engine = create_actiondraw_window(diagram_model_with_task_model, diagram_model_with_task_model._task_model)
+        window = engine.rootObjects()[0]
+
+        item_rect = _item_rect(window, item_id)
+
+        assert _qml_value(item_rect, "itemRect.state") == ""
+        diagram_model_with_task_model.moveItem(item_id, 60.0, 40.0)
+        assert (item_rect.property("x"), item_rect.property("y")) == (60.0, 40.0)
+
+        diagram_model_with_task_model.setCurrentTask(0)
+        assert _qml_value(item_rect, "itemRect.state") == "emphasised"
+        QTest.qWait(400)
+        assert (_qml_value(item_rect, "itemRect.scale"), _qml_value(item_rect, "itemRect.border.width")) == (pytest.approx(1.0), 4)
+
+        # A current task that becomes a drop target still animates its scale.
+        diagram_model_with_task_model.startEdgeDrawing(source_id)
+        diagram_model_with_task_model.updateEdgeDragPosition(100.0, 80.0)
+        assert _qml_value(item_rect, "itemRect.state") == "emphasisedDropTarget"
+        assert _qml_value(item_rect, "itemRect.scale") < 1.08
+        QTest.qWait(400)
+        assert (_qml_value(item_rect, "itemRect.scale"), _qml_value(item_rect, "itemRect.border.width")) == (pytest.approx(1.08), 4)
+
+        diagram_model_with_task_model.cancelEdgeDrawing()
+        assert _qml_value(item_rect, "itemRect.state") == "emphasised"
+        assert _qml_value(item_rect, "itemRect.scale") > 1.0
+        QTest.qWait(400)
+        assert _qml_value(item_rect, "itemRect.scale") == pytest.approx(1.0)
+
+        diagram_model_with_task_model.setCurrentTask(-1)
+        QTest.qWait(400)
+        assert _qml_value(item_rect, "itemRect.state") == ""
+        assert _qml_value(item_rect, "itemRect.border.width") == 1
+
+        diagram_model_with_task_model.startEdgeDrawing(source_id)
+        diagram_model_with_task_model.updateEdgeDragPosition(100.0, 80.0)
+        assert _qml_value(item_rect, "itemRect.state") == "dropTarget"
+        QTest.qWait(400)
+        assert (_qml_value(item_rect, "itemRect.scale"), _qml_value(item_rect, "itemRect.border.width")) == (pytest.approx(1.08), 3)
+
+    def test_item_glyphs_are_shapes_instead_of_canvases(self, app, diagram_model_with_task_model):
+        for index, preset in enumerate(("obstacle", "wish", "freetext")):
+            diagram_model_with_task_model.addPresetItem(preset, index * 200.0, 0.0)
+        engine = create_actiondraw_window(diagram_model_with_task_model, diagram_model_with_task_model._task_model)
+        window = engine.rootObjects()[0]
+
+        diagram_layer, _ = _evaluate_in_action_dialogs(window, "diagramLayer")
+        class_names = [child.metaObject().className() for child in _descendants(diagram_layer)]
+
+        # Only the board-wide edge and drawing canvases remain.
+        canvases = [name for name in class_names if name.startswith("QQuickCanvasItem")]
+        assert len(canvases) == 2
+        assert sum(name.startswith("QQuickShape") for name in class_names) >= 3
+
+    def test_dialog_contents_stay_hidden_until_opened(self, app, diagram_model_with_task_model):
+        engine = create_actiondraw_window(diagram_model_with_task_model, diagram_model_with_task_model._task_model)
+        window = engine.rootObjects()[0]
+
+        assert _evaluate_in_action_dialogs(window, "quickTaskDialog.contentItem.visible") == (False, False)
+
+        _evaluate_in_action_dialogs(window, "quickTaskDialog.open()")
+        QTest.qWait(50)
+        assert _evaluate_in_action_dialogs(window, "quickTaskDialog.contentItem.visible") == (True, False)
+        assert _evaluate_in_action_dialogs(window, "quickTaskField.activeFocus") == (True, False)
+
+        _evaluate_in_action_dialogs(window, "quickTaskDialog.close()")
+        QTest.qWait(50)
+        assert _evaluate_in_action_dialogs(window, "quickTaskDialog.contentItem.visible") == (False, False)
+
+    def test_markdown_preview_refreshes_after_typing_pauses(self, app):
+        engine = QQmlEngine()
+        for name in ("markdownHighlighterBridge", "markdownImagePaster", "markdownPreviewFormatter"):
+            engine.rootContext().setContextProperty(name, None)
+        component = QQmlComponent(engine, QUrl.fromLocalFile(str(QML_DIR / "components" / "MarkdownEditorPane.qml")))
+        pane = component.create()
+        assert pane is not None, [err.toString() for err in component.errors()]
+
+        _qml_value(pane, "root.textValue = 'First'")
+        assert _qml_value(pane, "root._previewBlocks[0].text") == "First"
+
+        _qml_value(pane, "editor.text = 'Typed'")
+        assert pane.property("textValue") == "Typed"
+        assert _qml_value(pane, "root._previewBlocks[0].text") == "First"
+
+        QTest.qWait(200)
+        assert _qml_value(pane, "root._previewBlocks[0].text") == "Typed"
+        pane.deleteLater()
+        engine.deleteLater()
+
+    def test_file_pickers_share_one_file_dialog(self, app, diagram_model_with_task_model):
+        engine = create_actiondraw_window(diagram_model_with_task_model, diagram_model_with_task_model._task_model)
+        window = engine.rootObjects()[0]
+        describe = (
+            "fileDialog.title + '|' + fileDialog.defaultSuffix + '|' + fileDialog.nameFilters[0]"
+            " + '|' + (fileDialog.fileMode === FileDialog.SaveFile) + '|' + (fileDialog.rejectCallback !== null)"
+        )
+
+        _evaluate_in_action_dialogs(window, "dialogHost.openSaveProjectDialog()")
+        assert _evaluate_in_action_dialogs(window, describe) == (
+            "Save Project As|progress|Progress files (*.progress)|true|true", False
+        )
+        assert _evaluate_in_action_dialogs(window, "dialogHost.anyDialogVisible") == (True, False)
+
+        _evaluate_in_action_dialogs(window, "fileDialog.close(); dialogHost.openLoadProjectDialog()")
+        assert _evaluate_in_action_dialogs(window, describe) == (
+            "Load Project||Progress files (*.progress)|false|false", False
+        )
+
+        _evaluate_in_action_dialogs(window, "fileDialog.close(); dialogHost.openBoxPdfDialog()")
+        assert _evaluate_in_action_dialogs(window, describe) == (
+            "Save Markdown PDF|pdf|PDF files (*.pdf)|true|false", False
+        )
+        _evaluate_in_action_dialogs(window, "fileDialog.close()")
+
+    def test_task_list_rows_hover_and_tap_with_handlers(self, app, diagram_model_with_task_model):
+        engine = create_actiondraw_window(diagram_model_with_task_model, diagram_model_with_task_model._task_model)
+        window = engine.rootObjects()[0]
+        window.show()
+        _evaluate_in_action_dialogs(window, "taskDialog.open()")
+        QTest.qWait(100)
+        position, _ = _evaluate_in_action_dialogs(
+            window, "(function() { var p = taskListView.mapToItem(null, 20, 20); return p.x + ',' + p.y })()"
+        )
+        point = QPoint(*(int(float(value)) for value in position.split(",")))
+        row_color = "taskListView.itemAtIndex(0).children[0].color.toString()"
+
+        assert _evaluate_in_action_dialogs(window, row_color) == ("#1a2230", False)
+        QTest.mouseMove(window, point)
+        QTest.qWait(50)
+        assert _evaluate_in_action_dialogs(window, row_color) == ("#283346", False)
 
-class TestConnectAll:
-    def test_connect_all_orders_by_position(self, empty_diagram_model):
-        a = empty_diagram_model.addBox(100.0, 100.0, "A")
-        b = empty_diagram_model.addBox(0.0, 0.0, "B")
-        c = empty_diagram_model.addBox(50.0, 50.0, "C")
-        empty_diagram_model.connectAllItems()
-        assert len(empty_diagram_model.edges) == 2
-        assert empty_diagram_model.edges[0]["fromId"] == b
-        assert empty_diagram_model.edges[0]["toId"] == c
-        assert empty_diagram_model.edges[1]["fromId"] == c
-        assert empty_diagram_model.edges[1]["toId"] == a
+        QTest.mouseClick(window, Qt.LeftButton, Qt.NoModifier, point)
+        QTest.qWait(100)
+        assert diagram_model_with_task_model.count == 1
+        assert _evaluate_in_action_dialogs(window, "taskDialog.visible") == (False, False)
 
-    def test_connect_all_handles_existing_edges(self, empty_diagram_model):
-        a = empty_diagram_model.addBox(0.0, 0.0, "A")
-        b = empty_diagram_model.addBox(50.0, 0.0, "B")
-        c = empty_diagram_model.addBox(100.0, 0.0, "C")
-        empty_diagram_model.addEdge(a, b)
-        empty_diagram_model.connectAllItems()
-        assert len(empty_diagram_model.edges) == 2
+    def test_shared_ok_cancel_footer_accepts_its_dialog(self, app, diagram_model_with_task_model):
+        engine = create_actiondraw_window(diagram_model_with_task_model, diagram_model_with_task_model._task_model)
+        window = engine.rootObjects()[0]
+        _evaluate_in_action_dialogs(window, "quickTaskDialog.open()")
+        QTest.qWait(50)
 
-    def test_connect_all_ignores_small_sets(self, empty_diagram_model):
-        empty_diagram_model.connectAllItems()
-        assert empty_diagram_model.edges == []
-        empty_diagram_model.addBox(0.0, 0.0, "A")
-        empty_diagram_model.connectAllItems()
-        assert empty_diagram_model.edges == []
+        _evaluate_in_action_dialogs(
+            window,
+            "quickTaskField.text = 'Footer task'; quickTaskDialog.footer.standardButton(DialogButtonBox.Ok).click()",
+        )
+        QTest.qWait(50)
 
+        assert diagram_model_with_task_model.count == 1
+        assert _evaluate_in_action_dialogs(window, "quickTaskDialog.visible") == (False, False)
+        qml = (QML_DIR / "components" / "ActionDialogs.qml").read_text(encoding="utf-8")
+        assert qml.count("footer: StdDialogFooter {}") == 9
+        assert qml.count("footer: CancelOnlyFooter {") == 2
 
-class TestCreateActionDrawWindow:
-    def test_create_window(self, app, diagram_model_with_task_model):
-        engine = create_actiondraw_window(diagram_model_with_task_model, diagram_model_with_task_model._task_model)
-        assert isinstance(engine, QQmlApplicationEngine)
-        assert engine.rootObjects()
-        assert getattr(engine, "_markdown_pdf_exporter", None) is not None
-        assert getattr(engine, "_mcp_server_controller", None) is not None
+    def test_box_dialog_accept_writes_model_after_closing(self, app, diagram_model_with_task_model):
+        model = diagram_model_with_task_model
+        engine = create_actiondraw_window(model, model._task_model)
+        window = engine.rootObjects()[0]
+        _evaluate_in_action_dialogs(window, "boxDialog.presetName = 'note'; boxDialog.open()")
+        QTest.qWait(50)
+
+        result = _evaluate_in_action_dialogs(
+            window,
+            "boxDialog.textValue = 'Deferred'; boxDialog.accept();"
+            " boxDialog.visible + '|' + boxDialog.textValue + '|' + diagramModel.count",
+        )
+
+        assert result == ("false||0", False)
+        QTest.qWait(50)
+        assert model.count == 1
+        assert model.data(model.index(0, 0), model.TextRole) == "Deferred"
 
     def test_markdown_pdf_actions_are_present_in_qml(self):
         note_editor_qml = (QML_DIR / "MarkdownNoteEditorWindow.qml").read_text(encoding="utf-8")
@@ -1279,6 +2656,15 @@ class TestDiagramModelSerialization:
         assert "text_color" in item
         assert "note_markdown" not in item
 
+    def test_to_dict_replaces_non_finite_geometry(self, empty_diagram_model):
+        item_id = empty_diagram_model.addBox(10.0, 20.0, "Box")
+        item = empty_diagram_model.getItem(item_id)
+        item.x = math.nan
+        item.height = math.inf
+
+        saved = empty_diagram_model.to_dict()["items"][0]
+        assert (saved["x"], saved["y"], saved["height"]) == (0.0, 20.0, 60.0)
+
     def test_note_markdown_roundtrip(self, empty_diagram_model):
         item_id = empty_diagram_model.addPresetItem("note", 10.0, 20.0)
         empty_diagram_model.setItemMarkdown(item_id, "# Title\nBody")
@@ -1672,6 +3058,42 @@ class TestDiagramModelSerialization:
         id_num = int(new_id.split("_")[1])
         assert id_num >= 6
 
+    def test_from_dict_resumes_ids_past_irregular_suffixes(self, empty_diagram_model):
+        """Ids without a numeric suffix are ignored when resuming id generation."""
+        box = {"item_type": "box", "x": 0.0, "y": 0.0, "width": 120.0, "height": 60.0}
+        data = {
+            "items": [
+                dict(box, id="box_7"),
+                dict(box, id="legacy"),
+                dict(box, id="box_x"),
+            ],
+            "edges": [
+                {"id": "edge_4", "from_id": "box_7", "to_id": "legacy"},
+                {"id": "edge_", "from_id": "legacy", "to_id": "box_x"},
+            ],
+            "strokes": [
+                {"id": "stroke_9", "points": [{"x": 0.0, "y": 0.0}, {"x": 5.0, "y": 5.0}]},
+                {"id": "stroke", "points": [{"x": 0.0, "y": 0.0}, {"x": 5.0, "y": 5.0}]},
+            ],
+        }
+        empty_diagram_model.from_dict(data)
+
+        assert empty_diagram_model.addBox(300.0, 300.0, "New") == "box_8"
+        assert next(empty_diagram_model._edge_id_source) == 5
+        assert next(empty_diagram_model._stroke_id_source) == 10
+
+    def test_from_dict_emits_current_task_changed_only_on_change(self, empty_diagram_model):
+        """Reloading with the same current task index does not re-announce it."""
+        emitted = []
+        empty_diagram_model.currentTaskChanged.connect(lambda: emitted.append(True))
+
+        empty_diagram_model.from_dict({"items": [], "edges": [], "current_task_index": -1})
+        assert emitted == []
+
+        empty_diagram_model.from_dict({"items": [], "edges": [], "current_task_index": 2})
+        assert emitted == [True]
+        assert empty_diagram_model.currentTaskIndex == 2
+
 
 class TestDrawingFeature:
     """Tests for the freehand drawing functionality."""
@@ -1722,10 +3144,7 @@ class TestDrawingFeature:
         """Test starting a stroke."""
         empty_diagram_model.startStroke(100.0, 200.0)
         current = empty_diagram_model.getCurrentStroke()
-        assert current["points"] is not None
-        assert len(current["points"]) == 1
-        assert current["points"][0]["x"] == 100.0
-        assert current["points"][0]["y"] == 200.0
+        assert current["points"] == [100.0, 200.0]
 
     def test_continue_stroke(self, empty_diagram_model):
         """Test adding points to a stroke."""
@@ -1734,7 +3153,40 @@ class TestDrawingFeature:
         empty_diagram_model.continueStroke(20.0, 20.0)
 
         current = empty_diagram_model.getCurrentStroke()
-        assert len(current["points"]) == 3
+        assert current["points"] == [0.0, 0.0, 10.0, 10.0, 20.0, 20.0]
+
+    def test_current_stroke_from_returns_unpainted_tail(self, empty_diagram_model):
+        assert empty_diagram_model.getCurrentStrokeFrom(0) == {}
+        empty_diagram_model.startStroke(0.0, 0.0)
+        empty_diagram_model.continueStroke(10.0, 10.0)
+        empty_diagram_model.continueStroke(20.0, 20.0)
+
+        tail = empty_diagram_model.getCurrentStrokeFrom(2)
+        assert tail["points"] == [10.0, 10.0, 20.0, 20.0]
+        assert tail["color"] == empty_diagram_model.getCurrentStroke()["color"]
+
+    def test_continue_stroke_skips_sub_pixel_points(self, empty_diagram_model):
+        """Test that points within half a pixel of the previous one are dropped."""
+        empty_diagram_model.startStroke(0.0, 0.0)
+        empty_diagram_model.continueStroke(0.2, 0.3)
+        empty_diagram_model.continueStroke(5.0, 0.0)
+
+        current = empty_diagram_model.getCurrentStroke()
+        assert current["points"] == [0.0, 0.0, 5.0, 0.0]
+
+    def test_continue_stroke_coalesces_drawing_changed(self, empty_diagram_model):
+        """Test that drag points are coalesced and endStroke flushes immediately."""
+        emitted = []
+        empty_diagram_model.drawingChanged.connect(lambda: emitted.append(True))
+        empty_diagram_model.startStroke(0.0, 0.0)
+        emitted.clear()
+
+        for i in range(1, 20):
+            empty_diagram_model.continueStroke(float(i), float(i))
+        assert emitted == []
+
+        empty_diagram_model.endStroke()
+        assert len(emitted) == 1
 
     def test_end_stroke(self, empty_diagram_model):
         """Test finishing a stroke adds it to the strokes list."""
@@ -1744,8 +3196,7 @@ class TestDrawingFeature:
 
         strokes = empty_diagram_model.strokes
         assert len(strokes) == 1
-        assert strokes[0]["points"][0]["x"] == 0.0
-        assert strokes[0]["points"][1]["x"] == 50.0
+        assert strokes[0]["points"] == [0.0, 0.0, 50.0, 50.0]
 
     def test_stroke_uses_current_brush_settings(self, empty_diagram_model):
         """Test that strokes use the current brush color and width."""
@@ -1786,6 +3237,20 @@ class TestDrawingFeature:
         empty_diagram_model.undoLastStroke()
         assert len(empty_diagram_model.strokes) == 0
 
+    def test_strokes_list_cached_until_strokes_change(self, empty_diagram_model):
+        """Test that in-progress drawing does not rebuild the completed strokes."""
+        empty_diagram_model.startStroke(0.0, 0.0)
+        empty_diagram_model.continueStroke(10.0, 10.0)
+        empty_diagram_model.endStroke()
+        first_read = empty_diagram_model.strokes
+
+        empty_diagram_model.startStroke(20.0, 20.0)
+        empty_diagram_model.continueStroke(30.0, 30.0)
+        assert empty_diagram_model.strokes is first_read
+
+        empty_diagram_model.endStroke()
+        assert len(empty_diagram_model.strokes) == 2
+
     def test_undo_empty_strokes(self, empty_diagram_model):
         """Test that undoing on empty list doesn't crash."""
         empty_diagram_model.undoLastStroke()  # Should not raise
@@ -1809,7 +3274,7 @@ class TestDrawingFeature:
         empty_diagram_model.setBrushColor("#00ff00")
         empty_diagram_model.setBrushWidth(5.0)
         empty_diagram_model.startStroke(10.0, 20.0)
-        empty_diagram_model.continueStroke(30.0, 40.0)
+        empty_diagram_model.continueStroke(30.0, 45.0)
         empty_diagram_model.continueStroke(50.0, 60.0)
         empty_diagram_model.endStroke()
 
@@ -1848,7 +3313,73 @@ class TestDrawingFeature:
         assert len(strokes) == 1
         assert strokes[0]["color"] == "#ff00ff"
         assert strokes[0]["width"] == 7.0
-        assert len(strokes[0]["points"]) == 3
+        assert strokes[0]["points"] == [100.0, 100.0, 150.0, 150.0, 200.0, 100.0]
+
+    def test_strokes_round_trip_through_dict(self, empty_diagram_model):
+        """Stroke points survive to_dict/from_dict in order and as floats."""
+        empty_diagram_model.startStroke(1.0, 2.0)
+        empty_diagram_model.continueStroke(3.5, -4.0)
+        empty_diagram_model.continueStroke(-5.25, 6.0)
+        empty_diagram_model.endStroke()
+        data = empty_diagram_model.to_dict()
+        assert data["strokes"][0]["points"] == [
+            {"x": 1.0, "y": 2.0},
+            {"x": 3.5, "y": -4.0},
+            {"x": -5.25, "y": 6.0},
+        ]
+
+        data["strokes"][0]["points"][1] = {"x": 3}
+        empty_diagram_model.from_dict(data)
+        assert empty_diagram_model.strokes[0]["points"] == [1.0, 2.0, 3.0, 0.0, -5.25, 6.0]
+
+    def test_strokes_report_point_bounds(self, empty_diagram_model):
+        empty_diagram_model.startStroke(10.0, 40.0)
+        empty_diagram_model.continueStroke(-5.0, 60.0)
+        empty_diagram_model.continueStroke(30.0, 20.0)
+        empty_diagram_model.endStroke()
+
+        assert empty_diagram_model.strokes[0]["bounds"] == [-5.0, 20.0, 30.0, 60.0]
+
+    def test_stroke_coords_pack_every_stroke_as_float32(self, empty_diagram_model):
+        empty_diagram_model.setBrushColor("#ff0000")
+        empty_diagram_model.startStroke(1.5, 2.0)
+        empty_diagram_model.continueStroke(10.0, 20.25)
+        empty_diagram_model.endStroke()
+        empty_diagram_model.setBrushWidth(8.0)
+        empty_diagram_model.startStroke(-4.0, 5.0)
+        empty_diagram_model.continueStroke(6.0, 7.0)
+        empty_diagram_model.continueStroke(30.0, 1.0)
+        empty_diagram_model.endStroke()
+
+        headers = empty_diagram_model.getStrokeHeaders()
+        coords = array("f", bytes(empty_diagram_model.getStrokeCoords()))
+
+        assert [(h["color"], h["width"], h["offset"], h["count"]) for h in headers] == [
+            ("#ff0000", 3.0, 0, 4),
+            ("#ff0000", 8.0, 4, 6),
+        ]
+        assert headers[1]["bounds"] == [-4.0, 1.0, 30.0, 7.0]
+        assert list(coords) == [1.5, 2.0, 10.0, 20.25, -4.0, 5.0, 6.0, 7.0, 30.0, 1.0]
+
+        empty_diagram_model.undoLastStroke()
+        assert len(empty_diagram_model.getStrokeHeaders()) == 1
+        assert len(bytes(empty_diagram_model.getStrokeCoords())) == 4 * 4
+
+    def test_end_stroke_simplifies_redundant_points(self, empty_diagram_model):
+        empty_diagram_model.startStroke(0.0, 0.0)
+        for step in range(1, 11):
+            empty_diagram_model.continueStroke(10.0 * step, 0.2 * (step % 2))
+        for step in range(1, 6):
+            empty_diagram_model.continueStroke(100.0, 10.0 * step)
+        empty_diagram_model.continueStroke(60.0, 50.0)
+        empty_diagram_model.endStroke()
+
+        assert empty_diagram_model.strokes[0]["points"] == [0.0, 0.0, 100.0, 0.0, 100.0, 50.0, 60.0, 50.0]
+
+    def test_simplify_coords_keeps_points_that_double_back(self):
+        coords = array("d", [0.0, 0.0, 100.0, 0.0, 50.0, 0.0])
+        assert list(simplify_coords(coords)) == [0.0, 0.0, 100.0, 0.0, 50.0, 0.0]
+        assert list(simplify_coords(array("d", [5.0, 5.0, 5.0, 5.0, 5.0, 5.0]))) == [5.0, 5.0, 5.0, 5.0]
 
     def test_strokes_cleared_on_from_dict(self, empty_diagram_model):
         """Test that existing strokes are cleared when loading."""
@@ -1956,6 +3487,24 @@ class TestImagePaste:
         # Either returns empty string (no image) or a valid ID (if clipboard has image)
         assert isinstance(result, str)
 
+    def test_paste_large_image_is_downscaled_before_encoding(self, empty_diagram_model):
+        """Large clipboard images are stored at their display size."""
+        from PySide6.QtCore import QByteArray
+        from PySide6.QtGui import QColor, QImage
+
+        image = QImage(1600, 800, QImage.Format_RGB32)
+        image.fill(QColor("#336699"))
+        QGuiApplication.clipboard().setImage(image)
+        if not empty_diagram_model.hasClipboardImage():
+            pytest.skip("Clipboard image support unavailable on this platform")
+
+        item_id = empty_diagram_model.pasteImageFromClipboard(10.0, 20.0)
+        item = empty_diagram_model.getItem(item_id)
+        assert (item.width, item.height) == (400.0, 200.0)
+
+        stored = QImage.fromData(QByteArray.fromBase64(item.image_data.encode("ascii")), "PNG")
+        assert (stored.width(), stored.height()) == (400, 200)
+
     def test_image_data_role_exists(self, empty_diagram_model):
         """Test ImageDataRole exists in model."""
         assert hasattr(empty_diagram_model, "ImageDataRole")
@@ -1980,6 +3529,165 @@ class TestImagePaste:
         assert empty_diagram_model.data(index, empty_diagram_model.ImageDataRole) == "test_base64_data"
         assert empty_diagram_model.data(index, empty_diagram_model.TypeRole) == "image"
 
+    def test_image_provider_decodes_each_payload_once(self, empty_diagram_model):
+        """The image provider caches decoded images until the payload changes."""
+        from PySide6.QtCore import QSize
+        from PySide6.QtGui import QColor, QImage
+
+        from actiondraw import DiagramItem, DiagramItemType
+        from actiondraw.image_provider import DiagramImageProvider
+        from actiondraw.markdown_image_paster import image_to_png_base64
+
+        image = QImage(40, 20, QImage.Format_RGB32)
+        image.fill(QColor("#336699"))
+        empty_diagram_model._append_item(
+            DiagramItem(
+                id="image_cached",
+                item_type=DiagramItemType.IMAGE,
+                x=0.0,
+                y=0.0,
+                image_data=image_to_png_base64(image),
+            )
+        )
+        provider = DiagramImageProvider(empty_diagram_model)
+        index = empty_diagram_model.index(0, 0)
+        version = empty_diagram_model.data(index, empty_diagram_model.ImageVersionRole)
+        assert version > 0
+
+        size = QSize()
+        first = provider.requestImage(f"image_cached?v={version}", size, QSize())
+        assert (first.width(), first.height()) == (40, 20)
+        assert (size.width(), size.height()) == (40, 20)
+        assert provider.decodedImage("image_cached").cacheKey() == first.cacheKey()
+
+        scaled = provider.requestImage(f"image_cached?v={version}", QSize(), QSize(10, 10))
+        assert (scaled.width(), scaled.height()) == (10, 5)
+        unscaled = provider.requestImage(f"image_cached?v={version}", QSize(), QSize(400, 400))
+        assert unscaled.cacheKey() == first.cacheKey()
+
+        image.fill(QColor("#993366"))
+        empty_diagram_model.getItem("image_cached").image_data = image_to_png_base64(image)
+        assert empty_diagram_model.data(index, empty_diagram_model.ImageVersionRole) != version
+        # The provider only sees payloads announced through the model's signals.
+        assert provider.decodedImage("image_cached").cacheKey() == first.cacheKey()
+        empty_diagram_model.dataChanged.emit(index, index, [empty_diagram_model.ImageDataRole])
+        assert provider.decodedImage("image_cached").cacheKey() != first.cacheKey()
+
+        empty_diagram_model.removeItem("image_cached")
+        assert provider._decoded == {}
+        assert provider.requestImage("image_cached?v=0", QSize(), QSize()).isNull()
+
+    def test_image_provider_evicts_images_when_a_project_loads(self, empty_diagram_model):
+        """Loading a diagram removes the old rows, which drops their decoded images."""
+        from PySide6.QtGui import QColor, QImage
+
+        from actiondraw.image_provider import DiagramImageProvider
+        from actiondraw.markdown_image_paster import image_to_png_base64
+
+        image = QImage(40, 20, QImage.Format_RGB32)
+        image.fill(QColor("#336699"))
+        image_item = {
+            "id": "image_loaded",
+            "item_type": "image",
+            "x": 0.0,
+            "y": 0.0,
+            "image_data": image_to_png_base64(image),
+        }
+        empty_diagram_model.from_dict({"items": [image_item], "edges": []})
+        provider = DiagramImageProvider(empty_diagram_model)
+        assert not provider.decodedImage("image_loaded").isNull()
+        assert list(provider._decoded) == ["image_loaded"]
+
+        empty_diagram_model.from_dict({"items": [], "edges": []})
+        assert provider._decoded == {}
+
+    def test_image_provider_never_reads_the_model_on_request(self, empty_diagram_model, monkeypatch):
+        """Loader-thread requests are served from the GUI-thread payload snapshot."""
+        from PySide6.QtCore import QSize
+        from PySide6.QtGui import QColor, QImage
+
+        from actiondraw.image_provider import DiagramImageProvider
+        from actiondraw.markdown_image_paster import image_to_png_base64
+
+        provider = DiagramImageProvider(empty_diagram_model)
+        image = QImage(40, 20, QImage.Format_RGB32)
+        image.fill(QColor("#336699"))
+        empty_diagram_model.from_dict({
+            "items": [
+                {"id": "box_0", "item_type": "box", "x": 0.0, "y": 0.0},
+                {"id": "image_1", "item_type": "image", "x": 0.0, "y": 0.0, "image_data": image_to_png_base64(image)},
+            ],
+            "edges": [],
+        })
+        assert provider._payloads.keys() == {"image_1"}
+
+        def fail(*_args):
+            raise AssertionError("the provider read the model")
+
+        monkeypatch.setattr(empty_diagram_model, "getItem", fail)
+        monkeypatch.setattr(empty_diagram_model, "data", fail)
+        loaded = provider.requestImage("image_1?v=1", QSize(), QSize())
+        assert (loaded.width(), loaded.height()) == (40, 20)
+        assert provider.requestImage("box_0?v=0", QSize(), QSize()).isNull()
+
+    def test_image_item_loads_through_image_provider(self, app, empty_diagram_model):
+        """Image delegates resolve their picture through the diagram image provider."""
+        from PySide6.QtGui import QColor, QImage
+
+        from actiondraw import DiagramItem, DiagramItemType
+        from actiondraw.markdown_image_paster import image_to_png_base64
+
+        image = QImage(40, 20, QImage.Format_RGB32)
+        image.fill(QColor("#336699"))
+        empty_diagram_model._append_item(
+            DiagramItem(
+                id="image_shown",
+                item_type=DiagramItemType.IMAGE,
+                x=0.0,
+                y=0.0,
+                width=200.0,
+                height=100.0,
+                image_data=image_to_png_base64(image),
+            )
+        )
+        engine = create_actiondraw_window(empty_diagram_model, TaskModel())
+        window = engine.rootObjects()[0]
+
+        item_rect = _item_rect(window, "image_shown")
+        pasted = next(
+            child
+            for child in _descendants(item_rect)
+            if child.metaObject().className().startswith("QQuickImage")
+            and child.property("source").toString().startswith("image://diagramimg/")
+        )
+        assert pasted.property("source").toString().startswith("image://diagramimg/image_shown?v=")
+        assert pasted.property("asynchronous") is True
+
+        def is_ready():
+            return _qml_value(pasted, "pastedImage.status === Image.Ready")
+
+        for _ in range(100):
+            if is_ready():
+                break
+            QTest.qWait(20)
+        assert is_ready() is True
+        assert pasted.property("mipmap") is False
+        scale, _ = _evaluate_in_action_dialogs(window, "root.maxZoom * Screen.devicePixelRatio")
+
+        def source_size():
+            size = pasted.property("sourceSize")
+            return (size.width(), size.height())
+
+        assert source_size() == (math.ceil(192 * scale), math.ceil(92 * scale))
+        assert (pasted.property("implicitWidth"), pasted.property("implicitHeight")) == (40.0, 20.0)
+
+        item_rect.setProperty("resizing", True)
+        empty_diagram_model.resizeItem("image_shown", 120.0, 60.0)
+        assert source_size() == (math.ceil(192 * scale), math.ceil(92 * scale))
+
+        item_rect.setProperty("resizing", False)
+        assert source_size() == (math.ceil(112 * scale), math.ceil(52 * scale))
+
     def test_to_dict_includes_image_data(self, empty_diagram_model):
         """Test to_dict includes image_data for image items."""
         from actiondraw import DiagramItem, DiagramItemType
@@ -3594,6 +5302,53 @@ class TestActionDrawQmlTaskInteractions:
             root.deleteLater()
             engine.deleteLater()
 
+    def test_toolbar_color_menu_loads_palette_items_on_first_open(self, app, diagram_model_with_task_model):
+        engine = create_actiondraw_window(diagram_model_with_task_model, diagram_model_with_task_model._task_model)
+        window = engine.rootObjects()[0]
+        toolbar = next(
+            child for child in window.findChildren(QQuickItem)
+            if child.metaObject().className().startswith("ToolbarRow")
+        )
+        inner = toolbar.childItems()[0]
+
+        assert _evaluate_in(inner, "colorMenuLoader.item === null") == (True, False)
+        _evaluate_in(inner, "colorMenuLoader.open()")
+        QTest.qWait(100)
+        names, failed = _evaluate_in(inner, 
+            "(function() { var menu = colorMenuLoader.item; var names = [];"
+            " for (var i = 0; i < menu.count; i++) names.push(menu.itemAt(i).text);"
+            " var opened = menu.opened; menu.itemAt(1).triggered(); return opened + '|' + names.join('|') })()"
+        )
+
+        assert not failed
+        opened, *names = names.split("|")
+        assert opened == "true"
+        assert names == ["White", "Red", "Orange", "Yellow", "Green", "Cyan", "Blue", "Purple", "Pink"]
+        assert diagram_model_with_task_model.brushColor == "#ff5555"
+
+    def test_toolbar_sliders_skip_sub_step_model_writes(self, app, diagram_model_with_task_model):
+        model = diagram_model_with_task_model
+        engine = create_actiondraw_window(model, model._task_model)
+        window = engine.rootObjects()[0]
+        toolbar = next(
+            child for child in window.findChildren(QQuickItem)
+            if child.metaObject().className().startswith("ToolbarRow")
+        )
+        inner = toolbar.childItems()[0]
+
+        widths = []
+        model.brushWidthChanged.connect(lambda: widths.append(model.brushWidth))
+        _evaluate_in(inner, f"brushSizeSlider.value = {model.brushWidth + 0.3}")
+        assert widths == []
+        _evaluate_in(inner, f"brushSizeSlider.value = {model.brushWidth + 0.6}")
+        assert widths == [4.0]
+
+        zoom = window.property("zoomLevel")
+        _evaluate_in(inner, f"zoomSlider.value = {zoom + 0.004}")
+        assert window.property("zoomLevel") == zoom
+        _evaluate_in(inner, f"zoomSlider.value = {zoom + 0.013}")
+        assert window.property("zoomLevel") == pytest.approx(zoom + 0.01)
+
     def test_toolbar_does_not_expose_workspace_markdown_button(self):
         qml = (QML_DIR / "components" / "ToolbarRow.qml").read_text(encoding="utf-8")
 
@@ -3661,6 +5416,19 @@ class TestActionDrawQmlTaskInteractions:
         assert 'projectManager.switchTab(tabModel.tabCount - 1)' in sidebar_qml
         assert 'tabModel.renameTab(tabIndex, nextName)' in sidebar_qml
 
+    def test_progress_stats_time_tiles_share_metric_tile(self):
+        stats_qml = (QML_DIR / "components" / "ProgressStatsRow.qml").read_text(encoding="utf-8")
+        tile_qml = (QML_DIR / "components" / "MetricTile.qml").read_text(encoding="utf-8")
+
+        assert stats_qml.count("MetricTile {") == 2
+        assert 'caption: "left"' in stats_qml
+        assert 'caption: "ETA"' in stats_qml
+        assert "captionFirst: true" in stats_qml
+        assert "property string valueText" in tile_qml
+        assert "property color accentColor" in tile_qml
+        assert "anchors." not in tile_qml
+        assert "RowLayout" not in tile_qml
+
     def test_sidebar_exposes_paste_tabs_from_clipboard_action(self):
         sidebar_qml = (QML_DIR / "components" / "SidebarTabs.qml").read_text(encoding="utf-8")
 
@@ -3691,15 +5459,27 @@ class TestActionDrawQmlTaskInteractions:
         assert 'sidebar.openTabContextMenu(tabIndex)' in pinned_section
         assert 'sidebar.openTabContextMenu(index)' in all_tabs_section
 
-    def test_note_badge_excludes_freetext_items(self):
+    def test_note_badge_excludes_freetext_items(self, app, diagram_model_with_task_model):
         qml = load_actiondraw_qml()
 
         assert 'id: noteBadge' in qml
-        assert 'visible: itemRect.itemType !== "note" && itemRect.itemType !== "freetext" && itemRect.itemType !== "image"' in qml
-        assert 'visible: itemRect.itemType !== "note" && model.noteMarkdown && model.noteMarkdown.trim().length > 0' not in qml
+        assert 'visible: !itemRect.isNote && !itemRect.isFreeText && !itemRect.isImage' in qml
         assert 'color: model.noteMarkdown && model.noteMarkdown.trim().length > 0 ? "#6fd3ff" : "#f5d96b"' in qml
         assert 'border.color: model.noteMarkdown && model.noteMarkdown.trim().length > 0 ? "#3298c7" : "#d9b84f"' in qml
 
+        item_ids = {
+            preset: diagram_model_with_task_model.addPresetItem(preset, index * 200.0, 0.0)
+            for index, preset in enumerate(("box", "freetext", "note"))
+        }
+        engine = create_actiondraw_window(diagram_model_with_task_model, diagram_model_with_task_model._task_model)
+        window = engine.rootObjects()[0]
+
+        badge_visible = {
+            preset: _qml_value(_item_rect(window, item_id), "noteBadge.visible")
+            for preset, item_id in item_ids.items()
+        }
+        assert badge_visible == {"box": True, "freetext": False, "note": False}
+
     def test_freetext_tooltip_and_selection_use_freetext_flow(self):
         qml = load_actiondraw_qml()
 
@@ -3770,6 +5550,69 @@ class TestReminderDialogPresets:
         assert 'onClicked: reminderDialog.setToAfternoon()' in qml
         assert 'onClicked: reminderDialog.setToEvening()' in qml
 
+    def test_add_dialog_builds_preset_buttons_from_one_list(self):
+        qml = (QML_DIR / "components" / "ActionDialogs.qml").read_text(encoding="utf-8")
+        add_dialog = qml[qml.index("id: addDialog"):qml.index("id: boxDialog")]
+
+        for name, label in [
+            ("box", "Box"), ("database", "Database"), ("server", "Server"), ("cloud", "Cloud"),
+            ("note", "Note"), ("obstacle", "Obstacle"), ("wish", "Wish"), ("chatgpt", "ChatGPT"),
+        ]:
+            assert f'{{ name: "{name}", label: "{label}" }}' in add_dialog
+        assert "model: addDialog.presetList" in add_dialog
+        assert add_dialog.count("root.openPresetDialog(") == 1
+        assert 'text: "Task from List"' in add_dialog
+        assert 'text: "New Task (freetext)"' in add_dialog
+
+    def test_text_fields_share_field_background(self):
+        qml = (QML_DIR / "components" / "ActionDialogs.qml").read_text(encoding="utf-8")
+        field_background = (QML_DIR / "components" / "FieldBackground.qml").read_text(encoding="utf-8")
+
+        assert 'color: "#1b2028"' in field_background
+        assert 'border.color: "#384458"' in field_background
+        assert qml.count("background: FieldBackground {}") >= 6
+        assert 'color: "#1b2028"\n                    radius: 4\n' not in qml
+
+    def test_edge_drop_menu_keeps_item_order(self, action_dialogs_component):
+        labels, failed = _evaluate_in(
+            action_dialogs_component,
+            "(function() { var labels = []; for (var i = 0; i < edgeDropMenu.count; i++) {"
+            " var item = edgeDropMenu.itemAt(i); labels.push(item.text === undefined ? '-' : item.text) }"
+            " return labels.join('|') })()",
+        )
+
+        assert not failed
+        assert labels.split("|") == [
+            "\u2192 Task", "\u2192 Obstacle", "\u2192 Wish", "\u2192 ChatGPT", "-",
+            "\u2192 Box", "\u2192 Note", "\u2192 Database", "\u2192 Server", "\u2192 Cloud",
+        ]
+
+    def test_dialog_text_values_alias_their_fields(self, action_dialogs_component):
+        values, failed = _evaluate_in(
+            action_dialogs_component,
+            "(function() { newTaskDialog.textValue = 'Draft'; var seeded = newTaskField.text;"
+            " taskRenameField.text = 'Renamed'; edgeDescriptionField.text = 'because';"
+            " timerDurationField.text = '2m'; boxDialog.textValue = 'Label';"
+            " return [seeded, taskRenameDialog.textValue, edgeDescriptionDialog.descriptionValue,"
+            " timerDialog.durationValue, boxMarkdownEditor.textValue].join('|') })()",
+        )
+
+        assert not failed
+        assert values == "Draft|Renamed|because|2m|Label"
+
+    def test_edge_drop_task_dialog_labels_come_from_type_lookup(self, action_dialogs_component):
+        def labels(source_type):
+            return _qml_value(
+                action_dialogs_component,
+                f"edgeDropTaskDialog.sourceType = '{source_type}';"
+                " edgeDropTaskDialog.title + '|' + edgeDropTaskField.placeholderText",
+            )
+
+        assert labels("task") == "Create Connected Task|Task name"
+        assert labels("database") == "Create Connected Database|Database label"
+        assert labels("chatgpt") == "Create Connected ChatGPT|ChatGPT label"
+        assert labels("custom") == "Create Connected custom|custom label"
+
     def test_tomorrow_morning_preset_targets_next_day(self, action_dialogs_component):
         now = QDateTime.fromString("2026-03-25T14:30:00", Qt.ISODate)
 
@@ -5115,6 +6958,7 @@ class TestLinkedSubtabMetadata:
             {"tasks": [{"title": "Ship", "completed": True}]},
             {"items": [], "edges": [], "strokes": [], "current_task_index": 0},
         )
+        diagram_model.flushLinkedSubtabRefresh()
 
         index = diagram_model.index(0, 0)
         assert diagram_model.data(index, diagram_model.LinkedSubtabCompletionRole) == 100.0
@@ -5122,6 +6966,147 @@ class TestLinkedSubtabMetadata:
         assert any(diagram_model.LinkedSubtabCompletionRole in roles for roles in emitted_roles)
         assert any(diagram_model.LinkedSubtabActiveActionRole in roles for roles in emitted_roles)
 
+    def test_linked_subtab_refresh_coalesces_tab_model_bursts(self, app):
+        from task_model import Tab, TabModel
+
+        task_model = TaskModel()
+        task_model.addTask("Launch", -1)
+        diagram_model = DiagramModel(task_model=task_model)
+
+        tab_model = TabModel()
+        tab_model.setTabs(
+            [
+                Tab(name="Main", tasks={"tasks": []}, diagram={"items": [], "edges": [], "strokes": [], "current_task_index": -1}),
+                Tab(name="Launch", tasks={"tasks": []}, diagram={"items": [], "edges": [], "strokes": [], "current_task_index": -1}),
+            ],
+            active_tab=0,
+        )
+        diagram_model.setTabModel(tab_model)
+        diagram_model.addTask(0, 80.0, 90.0)
+
+        emitted = []
+        diagram_model.dataChanged.connect(lambda *_args: emitted.append(True))
+        for title in ("Prep", "Ship", "Review"):
+            tab_model.setTabData(
+                1,
+                {"tasks": [{"title": title, "completed": False}]},
+                {"items": [], "edges": [], "strokes": [], "current_task_index": 0},
+            )
+
+        # The burst waits for one deferred refresh.
+        assert emitted == []
+        assert diagram_model._linked_subtab_refresh_timer.interval() == LINKED_SUBTAB_REFRESH_DELAY_MS
+        diagram_model.flushLinkedSubtabRefresh()
+        assert len(emitted) == 1
+        diagram_model.flushLinkedSubtabRefresh()
+        assert len(emitted) == 1
+
+    def test_linked_subtab_lookup_follows_tab_rename(self, app):
+        from task_model import Tab, TabModel
+
+        task_model = TaskModel()
+        task_model.addTask("Research", -1)
+        diagram_model = DiagramModel(task_model=task_model)
+
+        tab_model = TabModel()
+        tab_model.setTabs(
+            [
+                Tab(name="Main", tasks={"tasks": []}, diagram={"items": [], "edges": [], "strokes": [], "current_task_index": -1}),
+                Tab(
+                    name="Research",
+                    tasks={"tasks": [{"title": "Read", "completed": True}]},
+                    diagram={"items": [], "edges": [], "strokes": [], "current_task_index": -1},
+                ),
+            ],
+            active_tab=0,
+        )
+        diagram_model.setTabModel(tab_model)
+        diagram_model.addTask(0, 10.0, 10.0)
+
+        index = diagram_model.index(0, 0)
+        assert diagram_model.data(index, diagram_model.LinkedSubtabCompletionRole) == 100.0
+
+        tab_model.renameTab(1, "Archive")
+        assert diagram_model.data(index, diagram_model.HasLinkedSubtabRole) is False
+        assert diagram_model.data(index, diagram_model.LinkedSubtabCompletionRole) == -1.0
+
+        tab_model.renameTab(1, "Research")
+        tab_model.setTabData(
+            1,
+            {"tasks": [{"title": "Read", "completed": True}, {"title": "Write", "completed": False}]},
+            {"items": [], "edges": [], "strokes": [], "current_task_index": -1},
+        )
+        assert diagram_model.data(index, diagram_model.LinkedSubtabCompletionRole) == 50.0
+
+    def test_linked_subtab_refresh_skips_unlinked_items(self, app):
+        from task_model import Tab, TabModel
+
+        task_model = TaskModel()
+        task_model.addTask("Unlinked", -1)
+        task_model.addTask("Design", -1)
+        diagram_model = DiagramModel(task_model=task_model)
+
+        tab_model = TabModel()
+        tab_model.setTabs(
+            [
+                Tab(name="Main", tasks={"tasks": []}, diagram={"items": [], "edges": [], "strokes": [], "current_task_index": -1}),
+                Tab(name="Design", tasks={"tasks": []}, diagram={"items": [], "edges": [], "strokes": [], "current_task_index": -1}),
+            ],
+            active_tab=0,
+        )
+        diagram_model.setTabModel(tab_model)
+        diagram_model.addTask(0, 0.0, 0.0)
+        diagram_model.addTask(1, 200.0, 0.0)
+        assert diagram_model.data(diagram_model.index(1, 0), diagram_model.HasLinkedSubtabRole) is True
+
+        changed_rows = []
+        diagram_model.dataChanged.connect(
+            lambda first, last, _roles: changed_rows.append((first.row(), last.row()))
+        )
+        tab_model.renameTab(1, "Archive")
+        diagram_model.flushLinkedSubtabRefresh()
+
+        # The renamed tab's old name still refreshes the item that showed it.
+        assert changed_rows == [(1, 1)]
+        assert diagram_model.data(diagram_model.index(1, 0), diagram_model.HasLinkedSubtabRole) is False
+
+    def test_linked_subtab_refresh_skips_unchanged_values(self, app):
+        from task_model import Tab, TabModel
+
+        task_model = TaskModel()
+        task_model.addTask("Design", -1)
+        diagram_model = DiagramModel(task_model=task_model)
+
+        tasks = {"tasks": [{"title": "Sketch", "completed": True}]}
+        diagram = {"items": [], "edges": [], "strokes": [], "current_task_index": -1}
+        tab_model = TabModel()
+        tab_model.setTabs(
+            [
+                Tab(name="Main", tasks={"tasks": []}, diagram=dict(diagram)),
+                Tab(name="Design", tasks=tasks, diagram=dict(diagram)),
+            ],
+            active_tab=0,
+        )
+        diagram_model.setTabModel(tab_model)
+        diagram_model.addTask(0, 0.0, 0.0)
+        index = diagram_model.index(0, 0)
+        assert diagram_model.data(index, diagram_model.LinkedSubtabCompletionRole) == 100.0
+
+        emitted = []
+        diagram_model.dataChanged.connect(lambda *args: emitted.append(args))
+        tab_model.setTabData(1, tasks, dict(diagram))
+        diagram_model.flushLinkedSubtabRefresh()
+        assert emitted == []
+
+        tab_model.setTabData(
+            1,
+            {"tasks": [{"title": "Sketch", "completed": True}, {"title": "Build", "completed": False}]},
+            dict(diagram),
+        )
+        diagram_model.flushLinkedSubtabRefresh()
+        assert len(emitted) == 1
+        assert diagram_model.data(index, diagram_model.LinkedSubtabCompletionRole) == 50.0
+
 
 class TestAddTaskWithParent:
     """Tests for TaskModel.addTaskWithParent method."""
@@ -3,8 +3,10 @@
 from __future__ import annotations
 
 import asyncio
+import gc
 import time
 
+import pytest
 from PySide6.QtCore import QCoreApplication
 from PySide6.QtGui import QGuiApplication
 
@@ -17,6 +19,13 @@ from actiondraw.mcp_server import (
 from task_model import ProjectManager, TabModel, TaskModel
 
 
+@pytest.fixture(autouse=True)
+def _collect_models_on_gui_thread():
+    """Destroy each test's Qt models here rather than on the server thread."""
+    yield
+    gc.collect()
+
+
 def _process_events_until(predicate, timeout: float = 2.0) -> None:
     deadline = time.time() + timeout
     while time.time() < deadline:
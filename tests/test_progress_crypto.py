@@ -1,3 +1,4 @@
+import math
 import os
 import types
 
@@ -44,6 +45,39 @@ def test_encrypt_decrypt_roundtrip_passphrase_and_yubikey(monkeypatch):
     assert len(provider.calls) == 2
 
 
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_project_json_roundtrip_with_and_without_orjson(monkeypatch, use_orjson):
+    if use_orjson and pc.orjson is None:
+        pytest.skip("orjson is not installed")
+    if not use_orjson:
+        monkeypatch.setattr(pc, "orjson", None)
+    payload = {"name": "caf\u00e9", "items": [{"x": 1.5, "y": -2}], "flag": True, "none": None}
+    plaintext = pc._dump_project_json(payload)
+    assert plaintext == b'{"name":"caf\xc3\xa9","items":[{"x":1.5,"y":-2}],"flag":true,"none":null}'
+    assert pc.load_project_json(plaintext) == payload
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_project_json_bytes_do_not_depend_on_orjson(monkeypatch, use_orjson):
+    if use_orjson and pc.orjson is None:
+        pytest.skip("orjson is not installed")
+    if not use_orjson:
+        monkeypatch.setattr(pc, "orjson", None)
+    payload = {"tasks": [{"title": "Café", "custom_estimate": None}, {"custom_estimate": 5.0, "completed": True}]}
+    plaintext = pc._dump_project_json(payload)
+    assert plaintext == '{"tasks":[{"title":"Café","custom_estimate":null},{"custom_estimate":5.0,"completed":true}]}'.encode()
+    assert pc.load_project_json(plaintext) == payload
+
+
+def test_project_json_falls_back_for_non_string_keys():
+    assert pc.load_project_json(pc._dump_project_json({1: "a"})) == {"1": "a"}
+
+
+def test_load_project_json_accepts_stdlib_only_constants():
+    payload = pc.load_project_json(b'{"x": NaN}')
+    assert math.isnan(payload["x"])
+
+
 def test_encrypt_requires_at_least_one_credential():
     with pytest.raises(pc.CryptoError, match="At least one credential is required"):
         pc.encrypt_project_data({"x": 1}, _credentials(passphrase=None, use_yubikey=False))